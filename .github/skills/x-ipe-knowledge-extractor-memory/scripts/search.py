@@ -3,7 +3,8 @@
 Search Engine for persistent memory ontology.
 
 Migrated from x-ipe-tool-ontology/scripts/search.py.
-Standalone — no dependency on ontology.py.
+Standalone — no dependency on ontology.py. Text matching uses the token
+index in text_index.py, persisted as instances/.search.index.
 
 Usage:
     python3 search.py --query TEXT --memory-dir PATH \
@@ -16,12 +17,33 @@ import re
 import sys
 from pathlib import Path
 
+from text_index import TextIndex, load_index
+
+SEARCH_INDEX_FILE = ".search.index"
 
 # ---------------------------------------------------------------------------
 # Data Loading (standalone — replaces `from ontology import load_graph`)
 # ---------------------------------------------------------------------------
 
 
+def _instance_files(ontology_dir: Path) -> list[Path]:
+    """Entity JSONL chunks in instances/ (excluding _ prefix), in load order."""
+    instances_dir = ontology_dir / "instances"
+    return sorted(
+        f for f in instances_dir.glob("*.jsonl") if not f.name.startswith("_")
+    )
+
+
+def _load_text_index(ontology_dir: Path, entities: dict) -> TextIndex:
+    """Persisted text index over the instance chunks (in memory for _index.json)."""
+    jsonl_files = _instance_files(ontology_dir)
+    if not jsonl_files:
+        return TextIndex.from_entities(entities)
+    return load_index(
+        ontology_dir / "instances" / SEARCH_INDEX_FILE, jsonl_files, entities
+    )
+
+
 def _load_entities(ontology_dir: Path) -> dict:
     """Load entities from instances/*.jsonl files (excluding _ prefix).
 
@@ -33,9 +55,7 @@ def _load_entities(ontology_dir: Path) -> dict:
         return entities
 
     # Primary: non-prefixed JSONL files
-    jsonl_files = sorted(
-        f for f in instances_dir.glob("*.jsonl") if not f.name.startswith("_")
-    )
+    jsonl_files = _instance_files(ontology_dir)
     if jsonl_files:
         for jf in jsonl_files:
             with open(jf, encoding="utf-8") as fh:
@@ -111,34 +131,12 @@ def _load_relations(ontology_dir: Path) -> list:
 
 
 def _text_match(entity: dict, query: str) -> list[str]:
-    """Case-insensitive substring match on label, description, dimensions.
+    """Token match of a single entity on label, description, dimensions.
 
-    Returns list of matched field names.
+    Same matching as the text index. Returns list of matched field names.
     """
-    props = entity.get("properties", {})
-    q = query.lower()
-    matched: list[str] = []
-
-    label = props.get("label", "")
-    if isinstance(label, str) and q in label.lower():
-        matched.append("label")
-
-    desc = props.get("description", "")
-    if isinstance(desc, str) and q in desc.lower():
-        matched.append("description")
-
-    dims = props.get("dimensions", {})
-    if isinstance(dims, dict):
-        for dim_name, dim_val in dims.items():
-            if isinstance(dim_val, str) and q in dim_val.lower():
-                matched.append(f"dimensions.{dim_name}")
-            elif isinstance(dim_val, list):
-                for v in dim_val:
-                    if isinstance(v, str) and q in v.lower():
-                        matched.append(f"dimensions.{dim_name}")
-                        break
-
-    return matched
+    hits = TextIndex.from_entities({"": entity}).search(query)
+    return hits[0][2] if hits else []
 
 
 def _bfs_subgraph(
@@ -181,19 +179,6 @@ def _bfs_subgraph(
     return visited, collected_edges
 
 
-def _score_match(match_fields: list[str]) -> float:
-    """Simple scoring: 1.0 for label, 0.5 for others. Sum capped at 1."""
-    if not match_fields:
-        return 0.0
-    score = 0.0
-    for field in match_fields:
-        if field == "label":
-            score += 1.0
-        else:
-            score += 0.5
-    return min(score, 1.0)
-
-
 # ---------------------------------------------------------------------------
 # Main Search Function
 # ---------------------------------------------------------------------------
@@ -224,6 +209,7 @@ def search(
 
     entities = _load_entities(ont_path)
     relations = _load_relations(ont_path)
+    text_index = _load_text_index(ont_path, entities)
 
     # Filter by class if specified
     if class_filter:
@@ -235,21 +221,22 @@ def search(
             or e.get("properties", {}).get("node_type", "").lower() == cf_lower
         }
 
-    # Search entities
+    # Search entities (best BM25 score first)
     all_matches: list[dict] = []
-    for eid, entity in entities.items():
-        match_fields = _text_match(entity, query)
-        if match_fields:
+    for eid, score, match_fields in text_index.search(query):
+        if eid in entities:
             all_matches.append(
                 {
-                    "entity": entity,
-                    "score": _score_match(match_fields),
+                    "entity": entities[eid],
+                    "score": score,
                     "match_fields": match_fields,
                 }
             )
 
-    # Sort by score descending
-    all_matches.sort(key=lambda m: m["score"], reverse=True)
+    # Scores are relative to the best match (0..1]
+    top_score = all_matches[0]["score"] if all_matches else 0
+    for m in all_matches:
+        m["score"] = round(m["score"] / top_score, 4) if top_score else 0.0
 
     # Pagination
     total_count = len(all_matches)
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Text Index: token index over entity label, description and dimensions.
+
+Copied from x-ipe-tool-ontology/scripts/text_index.py (keep in sync).
+
+Each entity's fields are split into lowercase word tokens. Postings map a
+token to the entities containing it, so a query only scores entities that
+share a token with it. Every query token must match (as a prefix, or within
+a small edit distance when nothing matches as a prefix), and results are
+ranked by BM25 with label matches weighted above the other fields.
+
+An index is persisted next to the JSONL log(s) it covers together with the
+log offsets it reflects. Records appended after those offsets are folded
+in when the index is next loaded; a rewritten log rebuilds it.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+INDEX_VERSION = 1
+INDEX_FLUSH_RECORDS = 1000  # Folded-in records before the file is rewritten
+INDEX_CHECK_BYTES = 4096
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# BM25 weights per field group ("dimensions.*" fields share one group)
+FIELD_WEIGHTS = {"label": 3.0, "description": 1.0, "dimensions": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+FUZZY_MIN_LENGTH = 4  # Shorter tokens only match exactly or as a prefix
+FUZZY_PENALTY = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def entity_fields(entity: dict) -> dict[str, str]:
+    """Searchable text of an entity by field name (label, description, dimensions.X)."""
+    props = entity.get("properties", {})
+    if not isinstance(props, dict):
+        return {}
+    fields: dict[str, str] = {}
+    for name in ("label", "description"):
+        if isinstance(props.get(name), str):
+            fields[name] = props[name]
+    dims = props.get("dimensions", {})
+    if isinstance(dims, dict):
+        for dim_name, dim_val in dims.items():
+            if isinstance(dim_val, str):
+                fields[f"dimensions.{dim_name}"] = dim_val
+            elif isinstance(dim_val, list):
+                fields[f"dimensions.{dim_name}"] = " ".join(v for v in dim_val if isinstance(v, str))
+    return fields
+
+
+def _field_group(field: str) -> str:
+    return field.split(".", 1)[0]
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """Levenshtein distance between a and b is at most `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class TextIndex:
+    """Inverted index with per-entity, per-field term frequencies."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, dict[str, int]]] = {}  # id -> field -> term -> tf
+        self.postings: dict[str, set[str]] = {}
+        self._group_tokens: Counter = Counter()  # Total tokens per field group
+        self._group_docs: Counter = Counter()  # Entities with text per field group
+        self._vocab: list[str] | None = None  # Sorted terms, rebuilt after changes
+
+    @classmethod
+    def from_entities(cls, entities: dict) -> "TextIndex":
+        index = cls()
+        for eid, entity in entities.items():
+            index.add(eid, entity)
+        return index
+
+    @classmethod
+    def from_docs(cls, docs: dict) -> "TextIndex":
+        index = cls()
+        for eid, fields in docs.items():
+            index._insert(eid, fields)
+        return index
+
+    def add(self, eid: str, entity: dict) -> None:
+        """Index (or re-index) one entity."""
+        self.remove(eid)
+        fields = {}
+        for name, text in entity_fields(entity).items():
+            counts = Counter(tokenize(text))
+            if counts:
+                fields[name] = dict(counts)
+        if fields:
+            self._insert(eid, fields)
+
+    def remove(self, eid: str) -> None:
+        fields = self.docs.pop(eid, None)
+        if fields is None:
+            return
+        for name, counts in fields.items():
+            group = _field_group(name)
+            self._group_tokens[group] -= sum(counts.values())
+            self._group_docs[group] -= 1
+            for term in counts:
+                ids = self.postings.get(term)
+                if ids is not None:
+                    ids.discard(eid)
+                    if not ids:
+                        del self.postings[term]
+                        self._vocab = None
+
+    def _insert(self, eid: str, fields: dict[str, dict[str, int]]) -> None:
+        self.docs[eid] = fields
+        for name, counts in fields.items():
+            group = _field_group(name)
+            self._group_tokens[group] += sum(counts.values())
+            self._group_docs[group] += 1
+            for term in counts:
+                ids = self.postings.get(term)
+                if ids is None:
+                    self.postings[term] = ids = set()
+                    self._vocab = None
+                ids.add(eid)
+
+    def _expand(self, token: str) -> list[tuple[str, float]]:
+        """Indexed terms matching a query token, with a weight per term."""
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        vocab = self._vocab
+        start = bisect.bisect_left(vocab, token)
+        end = bisect.bisect_left(vocab, token + "\U0010ffff", start)
+        if end > start:
+            return [(term, 1.0) for term in vocab[start:end]]
+        if len(token) < FUZZY_MIN_LENGTH:
+            return []
+        limit = 1 if len(token) < 8 else 2
+        return [(term, FUZZY_PENALTY) for term in vocab if _within_distance(token, term, limit)]
+
+    def search(self, query: str, corpus: "list[TextIndex] | None" = None) -> list[tuple[str, float, list[str]]]:
+        """Return (entity id, BM25 score, matched fields), best match first.
+
+        An entity matches when every query token matches one of its terms.
+        IDF and average field lengths are taken over `corpus` (this index
+        alone by default); pass every index being searched so that scores
+        from different indexes can be compared.
+        """
+        corpus = corpus or [self]
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.docs:
+            return []
+        expansions = []
+        for token in tokens:
+            terms = self._expand(token)
+            if not terms:
+                return []
+            expansions.append(terms)
+
+        # Intersect the smallest candidate sets first
+        candidate_sets = sorted(
+            (set().union(*(self.postings[term] for term, _ in terms)) for terms in expansions),
+            key=len,
+        )
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+
+        total = sum(len(index.docs) for index in corpus)
+        group_tokens = sum((index._group_tokens for index in corpus), Counter())
+        group_docs = sum((index._group_docs for index in corpus), Counter())
+        avg_length = {group: group_tokens[group] / group_docs[group] for group in group_docs}
+        idf = {}
+        results = []
+        for eid in candidates:
+            fields = self.docs[eid]
+            score = 0.0
+            matched: set[str] = set()
+            for terms in expansions:
+                best = 0.0
+                for term, weight in terms:
+                    if eid not in self.postings[term]:
+                        continue
+                    if term not in idf:
+                        df = sum(len(index.postings.get(term, ())) for index in corpus)
+                        idf[term] = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                    term_score = 0.0
+                    for name, counts in fields.items():
+                        tf = counts.get(term)
+                        if not tf:
+                            continue
+                        matched.add(name)
+                        group = _field_group(name)
+                        norm = sum(counts.values()) / avg_length.get(group, 1.0)
+                        term_score += FIELD_WEIGHTS.get(group, 1.0) * tf * (BM25_K1 + 1) / (
+                            tf + BM25_K1 * (1 - BM25_B + BM25_B * norm)
+                        )
+                    best = max(best, weight * idf[term] * term_score)
+                score += best
+            results.append((eid, score, [name for name in fields if name in matched]))
+        results.sort(key=lambda r: (-r[1], r[0]))
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+def index_path(graph_path: Path) -> Path:
+    """Index file of a single graph log."""
+    return graph_path.with_name(f".{graph_path.name}.index")
+
+
+def _tail_digest(f, offset: int) -> str:
+    """Digest of the log bytes just before `offset` (detects a rewritten log)."""
+    start = max(0, offset - INDEX_CHECK_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def _record_id(line: bytes) -> tuple[str | None, str | None]:
+    """(entity id, op) of a log record, or (None, None) for relations and bad lines."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None, None
+    if not isinstance(record, dict):
+        return None, None
+    entity = record.get("entity")
+    eid = (entity if isinstance(entity, dict) else record).get("id")
+    return (eid, record.get("op")) if isinstance(eid, str) else (None, None)
+
+
+def write_index(path: Path, logs: list[Path], entities: dict) -> TextIndex:
+    """Build an index of `entities` (the current state of `logs`) and persist it."""
+    index = TextIndex.from_entities(entities)
+    files = {}
+    for log in logs:
+        try:
+            with open(log, "rb") as f:
+                st = os.fstat(f.fileno())
+                files[log.name] = _log_position(f, st, _last_line_end(f, st.st_size))
+        except OSError:
+            continue
+    _save(path, files, index)
+    return index
+
+
+def load_index(path: Path, logs: list[Path], entities: dict) -> TextIndex:
+    """Load the index covering `logs`, folding in records appended since it was saved.
+
+    `entities` is the current state of the logs, loaded by the caller; the
+    entities of appended records are re-indexed from it. The index is
+    rebuilt if a log was rewritten or removed, and saved again once
+    INDEX_FLUSH_RECORDS or more records were folded in.
+    """
+    saved = _read(path)
+    rebuild = saved is None
+    index = None if rebuild else TextIndex.from_docs(saved["docs"])
+    saved_files = {} if rebuild else saved["files"]
+
+    files = {}
+    touched: dict[str, str | None] = {}
+    records = 0
+    for log in logs:
+        try:
+            f = open(log, "rb")
+        except OSError:
+            continue
+        with f:
+            st = os.fstat(f.fileno())
+            offset = 0
+            previous = saved_files.get(log.name)
+            if previous is not None:
+                if (previous["inode"] == st.st_ino and previous["offset"] <= st.st_size
+                        and _tail_digest(f, previous["offset"]) == previous["digest"]):
+                    offset = previous["offset"]
+                else:
+                    rebuild = True
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partially written record; fold it in next time
+                offset += len(line)
+                records += 1
+                eid, op = _record_id(line)
+                if eid is not None:
+                    touched[eid] = op
+            files[log.name] = _log_position(f, st, offset)
+    if set(saved_files) - set(files):
+        rebuild = True
+
+    if rebuild:
+        index = TextIndex.from_entities(entities)
+    else:
+        for eid in touched:
+            if eid in entities:
+                index.add(eid, entities[eid])
+            else:
+                index.remove(eid)
+
+    # A record whose entity the caller did not load was appended after the
+    # caller read the logs; saving now would skip it for good
+    consistent = all(eid in entities or op == "delete" for eid, op in touched.items())
+    if consistent and (rebuild or records >= INDEX_FLUSH_RECORDS):
+        _save(path, files, index)
+    return index
+
+
+def _last_line_end(f, size: int) -> int:
+    """Offset just past the last complete (newline-terminated) line."""
+    end = size
+    while end > 0:
+        f.seek(max(0, end - INDEX_CHECK_BYTES))
+        chunk = f.read(end - max(0, end - INDEX_CHECK_BYTES))
+        pos = chunk.rfind(b"\n")
+        if pos != -1:
+            return end - len(chunk) + pos + 1
+        end -= len(chunk)
+    return 0
+
+
+def _log_position(f, st: os.stat_result, offset: int) -> dict:
+    return {"inode": st.st_ino, "offset": offset, "digest": _tail_digest(f, offset)}
+
+
+def _read(path: Path) -> dict | None:
+    try:
+        saved = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(saved, dict) or saved.get("version") != INDEX_VERSION
+            or not isinstance(saved.get("files"), dict) or not isinstance(saved.get("docs"), dict)):
+        return None
+    return saved
+
+
+def _save(path: Path, files: dict, index: TextIndex) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as out:
+            json.dump({"version": INDEX_VERSION, "files": files, "docs": index.docs}, out, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)  # The index is only an optimization
@@ -6,9 +6,12 @@ JSON to stdout on success; JSON to stderr + exit 1 on error.
 from __future__ import annotations
 
 import argparse
+import fcntl
 import json
+import os
 import re
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -16,6 +19,8 @@ from init_memory import MEMORY_TIERS, bootstrap
 
 TYPE_PREFIX = {"episodic": "epi", "semantic": "sem", "procedural": "proc"}
 FRONTMATTER_SEP = "---"
+SEQUENCE_FILE = ".sequences.json"
+SEQUENCE_LOCK_FILE = ".sequences.lock"
 
 
 def _exit_error(error: str, message: str) -> None:
@@ -43,11 +48,24 @@ def _today() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d")
 
 
-def _next_sequence(memory_dir: Path, memory_type: str, prefix: str, date_str: str) -> str:
-    """Find next available 3-digit sequence for given prefix+date."""
+@contextmanager
+def _sequence_lock(memory_dir: Path):
+    """Serialize ID allocation and the write of the new entry."""
+    lock_path = memory_dir / SEQUENCE_LOCK_FILE
+    lock_path.touch(exist_ok=True)
+    with open(lock_path, "r") as lock_fd:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+def _scan_sequence(memory_dir: Path, memory_type: str, prefix: str, date_str: str) -> int:
+    """Highest sequence used for prefix+date, read from every entry's frontmatter."""
     tier_dir = memory_dir / memory_type
     if not tier_dir.is_dir():
-        return "001"
+        return 0
     pattern = f"{prefix}-{date_str}-"
     max_seq = 0
     for md_file in tier_dir.glob("*.md"):
@@ -59,7 +77,34 @@ def _next_sequence(memory_dir: Path, memory_type: str, prefix: str, date_str: st
                 max_seq = max(max_seq, seq)
             except ValueError:
                 pass
-    return f"{max_seq + 1:03d}"
+    return max_seq
+
+
+def _next_sequence(memory_dir: Path, memory_type: str, prefix: str, date_str: str) -> str:
+    """Allocate the next 3-digit sequence for given prefix+date.
+
+    The last sequence per tier is kept in .sequences.json. A tier's counter
+    only restarts at 001 on a new date once it exists; a tier without one
+    is scanned first, since its entries predate the counter file.
+    Must be called inside _sequence_lock.
+    """
+    counters_path = memory_dir / SEQUENCE_FILE
+    try:
+        counters = json.loads(counters_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        counters = {}
+    if not isinstance(counters, dict):
+        counters = {}
+    counter = counters.get(memory_type)
+    if isinstance(counter, dict) and isinstance(counter.get("last"), int):
+        last = counter["last"] if counter.get("date") == date_str else 0
+    else:
+        last = _scan_sequence(memory_dir, memory_type, prefix, date_str)
+    counters[memory_type] = {"date": date_str, "last": last + 1}
+    tmp_path = counters_path.with_name(counters_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(counters, indent=2), encoding="utf-8")
+    os.replace(tmp_path, counters_path)
+    return f"{last + 1:03d}"
 
 
 def _read_frontmatter(filepath: Path) -> dict:
@@ -181,12 +226,13 @@ def cmd_create(args: argparse.Namespace) -> None:
     metadata = json.loads(args.metadata) if args.metadata else {}
     prefix = TYPE_PREFIX[args.type]
     date_str = _today()
-    entry_id = f"{prefix}-{date_str}-{_next_sequence(memory_dir, args.type, prefix, date_str)}"
-    filepath = _resolve_slug(memory_dir, args.type, _slugify(args.title))
+    with _sequence_lock(memory_dir):
+        entry_id = f"{prefix}-{date_str}-{_next_sequence(memory_dir, args.type, prefix, date_str)}"
+        filepath = _resolve_slug(memory_dir, args.type, _slugify(args.title))
 
-    now = _now_iso()
-    fm = _build_frontmatter(entry_id, args.title, args.type, tags, metadata, now, now)
-    filepath.write_text(fm + "\n" + content, encoding="utf-8")
+        now = _now_iso()
+        fm = _build_frontmatter(entry_id, args.title, args.type, tags, metadata, now, now)
+        filepath.write_text(fm + "\n" + content, encoding="utf-8")
     _ok({"stored_path": str(filepath), "memory_entry_id": entry_id,
          "writes_to": f"{memory_dir / args.type}/"})
 
@@ -268,22 +314,24 @@ def cmd_promote(args: argparse.Namespace) -> None:
         _exit_error("INPUT_VALIDATION_FAILED", "'title' is required and must be non-empty")
 
     metadata = json.loads(args.metadata) if args.metadata else {}
-    dest = _resolve_slug(memory_dir, args.type, _slugify(args.title))
     existing_fm = _read_frontmatter(source)
     body = _read_body(source) if existing_fm else source.read_text(encoding="utf-8")
 
     prefix = TYPE_PREFIX[args.type]
     date_str = _today()
-    entry_id = f"{prefix}-{date_str}-{_next_sequence(memory_dir, args.type, prefix, date_str)}"
     old_meta = existing_fm.get("metadata", {})
     merged_meta = {**(old_meta if isinstance(old_meta, dict) else {}), **metadata}
     tags = existing_fm.get("tags", [])
 
-    now = _now_iso()
-    fm = _build_frontmatter(entry_id, args.title, args.type,
-                             tags if isinstance(tags, list) else [],
-                             merged_meta, existing_fm.get("created", now), now)
-    dest.write_text(fm + "\n" + body, encoding="utf-8")
+    with _sequence_lock(memory_dir):
+        entry_id = f"{prefix}-{date_str}-{_next_sequence(memory_dir, args.type, prefix, date_str)}"
+        dest = _resolve_slug(memory_dir, args.type, _slugify(args.title))
+
+        now = _now_iso()
+        fm = _build_frontmatter(entry_id, args.title, args.type,
+                                 tags if isinstance(tags, list) else [],
+                                 merged_meta, existing_fm.get("created", now), now)
+        dest.write_text(fm + "\n" + body, encoding="utf-8")
     source.unlink()
     _ok({"promoted_path": str(dest), "memory_entry_id": entry_id,
          "writes_to": f"{memory_dir / args.type}/"})
@@ -9,6 +9,7 @@ from __future__ import annotations
 import argparse
 import fcntl
 import json
+import os
 import re
 import sys
 from datetime import datetime, timezone
@@ -55,13 +56,6 @@ def _append_jsonl(path: Path, record: dict) -> None:
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
-def _count_lines(path: Path) -> int:
-    if not path.exists():
-        return 0
-    with open(path) as f:
-        return sum(1 for _ in f)
-
-
 def _load_jsonl_ids(path: Path) -> set[str]:
     """Replay JSONL events and return set of live entity IDs."""
     ids: set[str] = set()
@@ -186,9 +180,10 @@ def cmd_create_instance(args: argparse.Namespace) -> None:
     try:
         fcntl.flock(lock_fd, fcntl.LOCK_EX)
 
-        chunk_num = _resolve_chunk(instances_dir)
-        chunk_path = instances_dir / f"instance.{chunk_num:03d}.jsonl"
-        instance_id = _next_instance_id(instances_dir)
+        index = _load_index(instances_dir)
+        chunk_num = _resolve_chunk(index)
+        chunk_path = instances_dir / _chunk_name(chunk_num)
+        instance_id = _next_instance_id(index)
 
         props = {
             "label": args.label.strip(),
@@ -209,50 +204,49 @@ def cmd_create_instance(args: argparse.Namespace) -> None:
         }
 
         _append_jsonl(chunk_path, record)
-        _update_index(instances_dir, instance_id, chunk_num)
+        _update_index(instances_dir, index, instance_id, chunk_num)
     finally:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         lock_fd.close()
 
-    _ok({"instance_id": instance_id, "chunk": f"instance.{chunk_num:03d}.jsonl",
+    _ok({"instance_id": instance_id, "chunk": _chunk_name(chunk_num),
          "lifecycle": lifecycle, "writes_to": str(chunk_path)})
 
 
-def _resolve_chunk(instances_dir: Path) -> int:
-    """Find current chunk number; create next if current exceeds limit."""
-    existing = sorted(instances_dir.glob("instance.*.jsonl"))
-    if not existing:
-        return 1
-    last = existing[-1]
-    num_match = re.search(r"instance\.(\d+)\.jsonl", last.name)
-    current = int(num_match.group(1)) if num_match else 1
-    if _count_lines(last) >= CHUNK_LINE_LIMIT:
-        return current + 1
-    return current
+def _chunk_name(chunk_num: int) -> str:
+    return f"instance.{chunk_num:03d}.jsonl"
 
 
-def _next_instance_id(instances_dir: Path) -> str:
-    """Generate next sequential instance ID across all chunks.
-    
-    NOTE: Must be called while holding the instance lock (see cmd_create_instance).
-    """
-    max_seq = 0
-    for chunk in instances_dir.glob("instance.*.jsonl"):
-        for line in open(chunk):
+def _scan_chunk(path: Path, offset: int = 0) -> tuple[int, int, int]:
+    """Read a chunk from `offset`: (lines, highest inst- sequence, end offset)."""
+    lines = max_seq = 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            lines += 1
             try:
-                rid = json.loads(line.strip()).get("id", "")
-            except (json.JSONDecodeError, ValueError):
+                rid = json.loads(line).get("id", "")
+            except (json.JSONDecodeError, ValueError, AttributeError):
                 continue
-            if rid.startswith("inst-"):
+            if isinstance(rid, str) and rid.startswith("inst-"):
                 try:
                     max_seq = max(max_seq, int(rid[5:]))
                 except ValueError:
                     pass
-    return f"inst-{max_seq + 1:03d}"
+        return lines, max_seq, f.tell()
 
 
-def _update_index(instances_dir: Path, instance_id: str, chunk_num: int) -> None:
-    """Update _index.json. Must be called while holding the instance lock."""
+def _load_index(instances_dir: Path) -> dict:
+    """Load _index.json, reconciled with the chunk files on disk.
+
+    The index records the next instance sequence and the line and byte
+    counts of the current chunk, so only records appended to that chunk
+    since the index was saved (e.g. synthesis updates) are read. An index
+    without these fields, a chunk that shrank or a newer chunk the index
+    does not know about falls back to scanning every chunk.
+
+    NOTE: Must be called while holding the instance lock (see cmd_create_instance).
+    """
     index_path = instances_dir / "_index.json"
     index: dict = {}
     if index_path.exists():
@@ -260,12 +254,76 @@ def _update_index(instances_dir: Path, instance_id: str, chunk_num: int) -> None
             index = json.loads(index_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             index = {}
-    chunks = index.setdefault("chunks", {})
-    key = f"instance.{chunk_num:03d}.jsonl"
-    chunks.setdefault(key, {"instance_count": 0})
-    chunks[key]["instance_count"] = chunks[key].get("instance_count", 0) + 1
-    index.update({"latest_instance_id": instance_id, "updated": _now_iso()})
-    index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+    if not isinstance(index, dict):
+        index = {}
+    if not isinstance(index.get("chunks"), dict):
+        index["chunks"] = {}
+
+    seq = index.get("next_instance_seq")
+    current = index.get("current_chunk")
+    entry = index["chunks"].get(_chunk_name(current)) if isinstance(current, int) else None
+    if (isinstance(seq, int) and isinstance(entry, dict)
+            and isinstance(entry.get("lines"), int) and isinstance(entry.get("bytes"), int)
+            and not (instances_dir / _chunk_name(current + 1)).exists()):
+        chunk_path = instances_dir / _chunk_name(current)
+        size = chunk_path.stat().st_size if chunk_path.exists() else 0
+        if size == entry["bytes"]:
+            return index
+        if size > entry["bytes"]:
+            lines, max_seq, entry["bytes"] = _scan_chunk(chunk_path, entry["bytes"])
+            entry["lines"] += lines
+            index["next_instance_seq"] = max(seq, max_seq + 1)
+            return index
+
+    # Full scan: index missing, written by an older version, or out of date
+    max_seq = 0
+    current, lines, size = 1, 0, 0
+    for chunk in sorted(instances_dir.glob("instance.*.jsonl")):
+        num_match = re.search(r"instance\.(\d+)\.jsonl", chunk.name)
+        if not num_match:
+            continue
+        chunk_lines, chunk_max, chunk_size = _scan_chunk(chunk)
+        max_seq = max(max_seq, chunk_max)
+        current, lines, size = int(num_match.group(1)), chunk_lines, chunk_size
+    entry = index["chunks"].setdefault(_chunk_name(current), {"instance_count": 0})
+    entry.update({"lines": lines, "bytes": size})
+    index.update({"next_instance_seq": max_seq + 1, "current_chunk": current})
+    return index
+
+
+def _resolve_chunk(index: dict) -> int:
+    """Current chunk number from the index; the next one if the current is full."""
+    current = index["current_chunk"]
+    if index["chunks"][_chunk_name(current)]["lines"] >= CHUNK_LINE_LIMIT:
+        return current + 1
+    return current
+
+
+def _next_instance_id(index: dict) -> str:
+    """Next sequential instance ID across all chunks, from the index."""
+    return f"inst-{index['next_instance_seq']:03d}"
+
+
+def _update_index(instances_dir: Path, index: dict, instance_id: str, chunk_num: int) -> None:
+    """Record an appended instance and write _index.json atomically.
+
+    NOTE: Must be called while holding the instance lock (see cmd_create_instance).
+    """
+    key = _chunk_name(chunk_num)
+    entry = index["chunks"].setdefault(key, {"instance_count": 0})
+    entry["instance_count"] = entry.get("instance_count", 0) + 1
+    entry["lines"] = entry.get("lines", 0) + 1
+    entry["bytes"] = (instances_dir / key).stat().st_size
+    index.update({
+        "latest_instance_id": instance_id,
+        "next_instance_seq": index["next_instance_seq"] + 1,
+        "current_chunk": chunk_num,
+        "updated": _now_iso(),
+    })
+    index_path = instances_dir / "_index.json"
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, index_path)
 
 
 def cmd_add_vocabulary(args: argparse.Namespace) -> None:
@@ -11,6 +11,7 @@ from __future__ import annotations
 import argparse
 import fcntl
 import json
+import os
 import re
 import sys
 from datetime import datetime, timezone
@@ -78,13 +79,6 @@ def _append_jsonl(path: Path, record: dict) -> None:
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
-def _count_lines(path: Path) -> int:
-    if not path.exists():
-        return 0
-    with open(path) as f:
-        return sum(1 for _ in f)
-
-
 def _load_jsonl(path: Path) -> list[dict]:
     """Load all valid JSONL records from a file, skipping corrupt lines."""
     records: list[dict] = []
@@ -117,31 +111,119 @@ def _replay_entities(records: list[dict]) -> dict[str, dict]:
     return state
 
 
-def _resolve_relation_chunk(relations_dir: Path) -> int:
-    """Find current relation chunk number; create next if limit exceeded."""
-    existing = sorted(relations_dir.glob("_relations.*.jsonl"))
-    if not existing:
-        return 1
-    last = existing[-1]
-    num_match = re.search(r"_relations\.(\d+)\.jsonl", last.name)
-    current = int(num_match.group(1)) if num_match else 1
-    if _count_lines(last) >= CHUNK_LINE_LIMIT:
-        return current + 1
-    return current
+def _relation_chunk_name(chunk_num: int) -> str:
+    return f"_relations.{chunk_num:03d}.jsonl"
 
 
-def _next_relation_id(relations_dir: Path) -> str:
-    """Generate next sequential relation ID across all chunks."""
-    max_seq = 0
-    for chunk in relations_dir.glob("_relations.*.jsonl"):
-        for rec in _load_jsonl(chunk):
-            rid = rec.get("id", "")
-            if rid.startswith("rel-"):
+def _scan_relation_chunk(path: Path, offset: int = 0) -> tuple[int, int, int]:
+    """Read a chunk from `offset`: (lines, highest rel- sequence, end offset)."""
+    lines = max_seq = 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            lines += 1
+            try:
+                rid = json.loads(line).get("id", "")
+            except (json.JSONDecodeError, ValueError, AttributeError):
+                continue
+            if isinstance(rid, str) and rid.startswith("rel-"):
                 try:
                     max_seq = max(max_seq, int(rid[4:]))
                 except ValueError:
                     pass
-    return f"rel-{max_seq + 1:03d}"
+        return lines, max_seq, f.tell()
+
+
+def _load_relation_index(relations_dir: Path) -> dict:
+    """Load relations/_index.json, reconciled with the chunk files on disk.
+
+    The index records the next relation sequence and the line and byte
+    counts of the current chunk, so only records appended to that chunk
+    since the index was saved are read. A missing or out-of-date index
+    (a chunk that shrank, or a newer chunk it does not know about) falls
+    back to scanning every chunk.
+
+    NOTE: Must be called while holding the relations lock (see cmd_link).
+    """
+    index_path = relations_dir / "_index.json"
+    index: dict = {}
+    if index_path.exists():
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            index = {}
+    if not isinstance(index, dict):
+        index = {}
+    if not isinstance(index.get("chunks"), dict):
+        index["chunks"] = {}
+
+    seq = index.get("next_relation_seq")
+    current = index.get("current_chunk")
+    entry = (index["chunks"].get(_relation_chunk_name(current))
+             if isinstance(current, int) else None)
+    if (isinstance(seq, int) and isinstance(entry, dict)
+            and isinstance(entry.get("lines"), int) and isinstance(entry.get("bytes"), int)
+            and not (relations_dir / _relation_chunk_name(current + 1)).exists()):
+        chunk_path = relations_dir / _relation_chunk_name(current)
+        size = chunk_path.stat().st_size if chunk_path.exists() else 0
+        if size == entry["bytes"]:
+            return index
+        if size > entry["bytes"]:
+            lines, max_seq, entry["bytes"] = _scan_relation_chunk(chunk_path, entry["bytes"])
+            entry["lines"] += lines
+            index["next_relation_seq"] = max(seq, max_seq + 1)
+            return index
+
+    # Full scan: index missing or out of date
+    max_seq = 0
+    current, lines, size = 1, 0, 0
+    for chunk in sorted(relations_dir.glob("_relations.*.jsonl")):
+        num_match = re.search(r"_relations\.(\d+)\.jsonl", chunk.name)
+        if not num_match:
+            continue
+        chunk_lines, chunk_max, chunk_size = _scan_relation_chunk(chunk)
+        max_seq = max(max_seq, chunk_max)
+        current, lines, size = int(num_match.group(1)), chunk_lines, chunk_size
+    entry = index["chunks"].setdefault(_relation_chunk_name(current), {"relation_count": 0})
+    entry.update({"lines": lines, "bytes": size})
+    index.update({"next_relation_seq": max_seq + 1, "current_chunk": current})
+    return index
+
+
+def _resolve_relation_chunk(index: dict) -> int:
+    """Current relation chunk number; the next one if the current is full."""
+    current = index["current_chunk"]
+    if index["chunks"][_relation_chunk_name(current)]["lines"] >= CHUNK_LINE_LIMIT:
+        return current + 1
+    return current
+
+
+def _next_relation_id(index: dict) -> str:
+    """Next sequential relation ID across all chunks, from the index."""
+    return f"rel-{index['next_relation_seq']:03d}"
+
+
+def _record_relation(relations_dir: Path, index: dict, rel_id: str,
+                     chunk_num: int) -> None:
+    """Count an appended relation in the index (saved by _save_relation_index)."""
+    key = _relation_chunk_name(chunk_num)
+    entry = index["chunks"].setdefault(key, {"relation_count": 0})
+    entry["relation_count"] = entry.get("relation_count", 0) + 1
+    entry["lines"] = entry.get("lines", 0) + 1
+    entry["bytes"] = (relations_dir / key).stat().st_size
+    index.update({"latest_relation_id": rel_id,
+                  "next_relation_seq": index["next_relation_seq"] + 1,
+                  "current_chunk": chunk_num})
+
+
+def _save_relation_index(relations_dir: Path, index: dict) -> None:
+    """Write relations/_index.json atomically. Must hold the relations lock."""
+    index["updated"] = _now_iso()
+    index_path = relations_dir / "_index.json"
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(index, indent=2, ensure_ascii=False) + "\n",
+                        encoding="utf-8")
+    os.replace(tmp_path, index_path)
 
 
 def _load_existing_relations(relations_dir: Path) -> list[dict]:
@@ -542,10 +624,11 @@ def cmd_link(args: argparse.Namespace) -> None:
         try:
             fcntl.flock(lock_fd, fcntl.LOCK_EX)
 
+            index = _load_relation_index(relations_dir)
             for xref in cross_references:
-                chunk_num = _resolve_relation_chunk(relations_dir)
-                chunk_path = relations_dir / f"_relations.{chunk_num:03d}.jsonl"
-                rel_id = _next_relation_id(relations_dir)
+                chunk_num = _resolve_relation_chunk(index)
+                chunk_path = relations_dir / _relation_chunk_name(chunk_num)
+                rel_id = _next_relation_id(index)
 
                 record = {
                     "op": "create",
@@ -563,7 +646,9 @@ def cmd_link(args: argparse.Namespace) -> None:
                     },
                 }
                 _append_jsonl(chunk_path, record)
+                _record_relation(relations_dir, index, rel_id, chunk_num)
                 writes_to = str(chunk_path)
+            _save_relation_index(relations_dir, index)
         finally:
             fcntl.flock(lock_fd, fcntl.LOCK_UN)
             lock_fd.close()
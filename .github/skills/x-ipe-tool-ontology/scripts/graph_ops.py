@@ -7,7 +7,7 @@ Master store: _entities.jsonl (single source of truth)
 Named graphs: {cluster-root-label}.jsonl (derived views)
 
 Usage:
-    python3 graph_ops.py build --scope PATH --output PATH [--entities PATH]
+    python3 graph_ops.py build --scope PATH --output PATH [--entities PATH] [--full]
     python3 graph_ops.py prune --entities PATH
 """
 
@@ -19,10 +19,18 @@ import sys
 from pathlib import Path
 
 from ontology import (
+    SNAPSHOT_CHECK_BYTES,
+    _tail_digest,
     append_op,
     load_graph,
     validate_graph,
 )
+from text_index import index_path, write_index
+
+GRAPH_INDEX_FILE = ".graph-index.json"
+BUILD_STATE_FILE = ".build-state.json"
+BUILD_STATE_VERSION = 1
+PROTECTED_FILES = {"_entities.jsonl", ".dimension-registry.json"}
 
 
 def _slugify(text: str) -> str:
@@ -66,7 +74,8 @@ def detect_clusters(
     """Detect connected components using Union-Find.
 
     Returns dict mapping root_entity_id -> [member_entity_ids].
-    Root = entity with highest degree (most edges) in the cluster.
+    Root = entity with highest degree (most edges) in the cluster; ties go
+    to the earliest created, so the root does not depend on entity order.
     """
     uf = UnionFind()
 
@@ -95,19 +104,25 @@ def detect_clusters(
 
     result: dict[str, list[str]] = {}
     for _, members in groups.items():
-        hub = max(members, key=lambda m: degree.get(m, 0))
+        hub = min(
+            members,
+            key=lambda m: (-degree.get(m, 0), str(entities[m].get("created", "")), m),
+        )
         result[hub] = members
 
     return result
 
 
-def prune_stale(entities_path: str) -> dict:
+def prune_stale(entities_path: str, entities: dict | None = None) -> dict:
     """Check source_files of each entity; remove entities whose files are all gone.
 
     For entities with some existing files, update source_files to only existing ones.
+    When `entities` (the loaded state of entities_path) is given, the changes
+    are applied to it as well instead of reloading the file.
     Returns summary of pruned/updated entities.
     """
-    entities, relations = load_graph(entities_path)
+    if entities is None:
+        entities, _ = load_graph(entities_path)
     pruned = []
     updated = []
 
@@ -124,6 +139,7 @@ def prune_stale(entities_path: str) -> dict:
             # All source files gone — delete entity
             ts = datetime.now(timezone.utc).isoformat()
             append_op(entities_path, {"op": "delete", "id": eid, "timestamp": ts})
+            del entities[eid]
             pruned.append(eid)
         elif len(existing) < len(source_files):
             # Some files gone — update source_files
@@ -137,38 +153,178 @@ def prune_stale(entities_path: str) -> dict:
                     "timestamp": ts,
                 },
             )
+            entity["properties"] = {**entity["properties"], "source_files": existing}
             updated.append(eid)
 
     return {"pruned": pruned, "updated": updated}
 
 
+def _in_scope(entity: dict, scope: Path) -> bool:
+    """Whether any of the entity's source_files lies under `scope` (resolved)."""
+    for sf in entity.get("properties", {}).get("source_files", []):
+        try:
+            if str(Path(sf).resolve()).startswith(str(scope)):
+                return True
+        except (OSError, ValueError):
+            continue
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Build state: what the last build covered, so the next one can be incremental
+# ---------------------------------------------------------------------------
+
+
+def _log_end(f, size: int) -> int:
+    """Offset just past the last complete (newline-terminated) line of `f`."""
+    end = size
+    while end > 0:
+        start = max(0, end - SNAPSHOT_CHECK_BYTES)
+        f.seek(start)
+        pos = f.read(end - start).rfind(b"\n")
+        if pos != -1:
+            return start + pos + 1
+        end = start
+    return 0
+
+
+def _log_position(entities_path: str) -> dict | None:
+    """Position of the end of the master log, to resume reading it from."""
+    try:
+        with open(entities_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            offset = _log_end(f, st.st_size)
+            return {"inode": st.st_ino, "offset": offset, "digest": _tail_digest(f, offset)}
+    except OSError:
+        return None
+
+
+def _changes_since(entities_path: str, position: dict) -> set[str] | None:
+    """Ids of entities created, updated or deleted, or with relations added or
+    removed, after `position`; None if the log was rewritten since."""
+    touched: set[str] = set()
+    try:
+        with open(entities_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            offset = position["offset"]
+            if st.st_ino != position["inode"] or offset > st.st_size:
+                return None
+            if _tail_digest(f, offset) != position["digest"]:
+                return None
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                entity = record.get("entity")
+                if record.get("op") == "create" and isinstance(entity, dict):
+                    touched.add(entity.get("id", ""))
+                elif record.get("op") in ("update", "delete"):
+                    touched.add(record.get("id", ""))
+                elif record.get("op") in ("relate", "unrelate"):
+                    touched.update((record.get("from", ""), record.get("to", "")))
+    except (OSError, KeyError, TypeError):
+        return None
+    touched.discard("")
+    touched = {eid for eid in touched if isinstance(eid, str)}
+    return touched
+
+
+def _read_build_state(output_dir: Path, scope: Path, entities_path: str) -> dict | None:
+    """State of the last build into output_dir, if it can be built on."""
+    try:
+        state = json.loads((output_dir / BUILD_STATE_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("version") != BUILD_STATE_VERSION
+        or state.get("scope") != str(scope)
+        or state.get("entities_path") != str(Path(entities_path).resolve())
+        or not isinstance(state.get("log"), dict)
+        or not isinstance(state.get("members"), dict)
+    ):
+        return None
+    # Cluster files and manifest must still be as the last build left them
+    if not (output_dir / GRAPH_INDEX_FILE).exists():
+        return None
+    if not all((output_dir / name).exists() for name in set(state["members"].values())):
+        return None
+    return state
+
+
+def _write_build_state(
+    output_dir: Path, scope: Path, entities_path: str, position: dict | None, members: dict
+) -> None:
+    state_path = output_dir / BUILD_STATE_FILE
+    if position is None:
+        state_path.unlink(missing_ok=True)
+        return
+    state = {
+        "version": BUILD_STATE_VERSION,
+        "scope": str(scope),
+        "entities_path": str(Path(entities_path).resolve()),
+        "log": position,
+        "members": members,
+    }
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, state_path)
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+
 def build(
     scope_path: str,
     output_path: str,
     entities_path: str | None = None,
+    full: bool = False,
 ) -> dict:
     """Build named graph files from master entity store.
 
     Steps:
     1. Load _entities.jsonl
-    2. Filter entities with source_files under scope_path
-    3. Collect relations where both endpoints are in filtered set
-    4. Prune stale references
+    2. Prune stale references
+    3. Filter entities with source_files under scope_path
+    4. Collect relations where both endpoints are in filtered set
     5. Detect clusters (Union-Find)
     6. Clean old named .jsonl files in output dir
-    7. Save each cluster as {root-label-slugified}.jsonl
+    7. Save each cluster as {root-label-slugified}.jsonl with its text index
     8. Validate each output file
     9. Generate .graph-index.json manifest
     10. Return summary
+
+    A build records what it covered in .build-state.json. Unless `full` is
+    set, the next build into the same output dir with the same scope only
+    re-examines entities changed in the log since then (see
+    _build_incremental) and falls back to a full build when that state is
+    missing or the log was rewritten.
     """
     if entities_path is None:
         entities_path = str(Path(output_path) / "_entities.jsonl")
+    output_dir = Path(output_path)
+    scope = Path(scope_path).resolve()
+
+    # Taken before loading: records appended meanwhile are re-read next time
+    position = _log_position(entities_path)
+    state = None if full else _read_build_state(output_dir, scope, entities_path)
+    touched = _changes_since(entities_path, state["log"]) if state else None
 
     # Step 1: Load
     entities, relations = load_graph(entities_path)
 
     if not entities:
         # Write empty manifest
+        _write_build_state(output_dir, scope, entities_path, None, {})
         empty_manifest = _generate_graph_index(output_path, [], {}, [])
         return {
             "clusters": 0,
@@ -178,21 +334,19 @@ def build(
             "graph_index": empty_manifest,
         }
 
-    # Step 2: Filter by scope
-    scope = Path(scope_path).resolve()
-    filtered_ids: set[str] = set()
-    for eid, entity in entities.items():
-        source_files = entity.get("properties", {}).get("source_files", [])
-        for sf in source_files:
-            try:
-                sf_resolved = Path(sf).resolve()
-                if str(sf_resolved).startswith(str(scope)):
-                    filtered_ids.add(eid)
-                    break
-            except (OSError, ValueError):
-                continue
-
-    if not filtered_ids:
+    # Step 2: Prune stale (appends to the master file, applied to `entities`)
+    prune_result = prune_stale(entities_path, entities)
+
+    result = None
+    if touched is not None:
+        touched.update(prune_result["pruned"], prune_result["updated"])
+        result = _build_incremental(scope, output_dir, entities, relations, state, touched)
+    if result is None:
+        result = _build_full(scope, output_dir, entities, relations)
+    members = result.pop("members")
+    if members is None:
+        # Nothing in scope: empty manifest, earlier graph files left as they are
+        _write_build_state(output_dir, scope, entities_path, None, {})
         empty_manifest = _generate_graph_index(output_path, [], {}, [])
         return {
             "clusters": 0,
@@ -202,70 +356,219 @@ def build(
             "graph_index": empty_manifest,
         }
 
-    # Step 3: Filter relations
-    filtered_entities = {eid: entities[eid] for eid in filtered_ids}
+    # Step 8: Validate
+    validation_errors = []
+    for fc in result["files"]:
+        errs = validate_graph(str(output_dir / fc["file"]))
+        if errs:
+            validation_errors.extend(
+                [f"{fc['file']}: {e}" for e in errs]
+            )
+
+    _write_build_state(output_dir, scope, entities_path, position, members)
+
+    return {
+        "clusters": len(result["graph_index"]["graphs"]),
+        "entities_total": len(entities),
+        "entities_in_scope": len(members),
+        "files": result["files"],
+        "removed_files": result["removed_files"],
+        "incremental": result["incremental"],
+        "pruned": prune_result["pruned"],
+        "updated_stale": prune_result["updated"],
+        "validation_errors": validation_errors,
+        "graph_index": result["graph_index"],
+    }
+
+
+def _build_full(
+    scope: Path, output_dir: Path, entities: dict, relations: list
+) -> dict:
+    """Steps 3-9 over every entity; rewrites all named graph files."""
+    # Step 3: Filter by scope
+    filtered_entities = {
+        eid: entity for eid, entity in entities.items() if _in_scope(entity, scope)
+    }
+    if not filtered_entities:
+        return {"members": None}
+
+    # Step 4: Filter relations
     filtered_relations = [
         r
         for r in relations
-        if r["from"] in filtered_ids and r["to"] in filtered_ids
+        if r["from"] in filtered_entities and r["to"] in filtered_entities
     ]
 
-    # Step 4: Prune stale (operates on master file)
-    prune_result = prune_stale(entities_path)
-
-    # Reload after pruning to get updated state
-    if prune_result["pruned"] or prune_result["updated"]:
-        entities, relations = load_graph(entities_path)
-        filtered_ids = {eid for eid in filtered_ids if eid in entities}
-        filtered_entities = {eid: entities[eid] for eid in filtered_ids}
-        filtered_relations = [
-            r
-            for r in relations
-            if r["from"] in filtered_ids and r["to"] in filtered_ids
-        ]
-
     # Step 5: Detect clusters
     clusters = detect_clusters(filtered_entities, filtered_relations)
 
     # Step 6: Clean old named .jsonl files (not _entities.jsonl, not .dimension-registry.json)
-    output_dir = Path(output_path)
     output_dir.mkdir(parents=True, exist_ok=True)
-    protected = {"_entities.jsonl", ".dimension-registry.json"}
+    removed = []
     for f in output_dir.glob("*.jsonl"):
-        if f.name not in protected:
+        if f.name not in PROTECTED_FILES:
             f.unlink()
+            removed.append(f.name)
+    for suffix in (".snapshot", ".index"):
+        for f in output_dir.glob(f".*.jsonl{suffix}"):
+            if f.name[1:-len(suffix)] not in PROTECTED_FILES:
+                f.unlink()
     # Also remove old .graph-index.json (will be regenerated)
-    old_index = output_dir / ".graph-index.json"
+    old_index = output_dir / GRAPH_INDEX_FILE
     if old_index.exists():
         old_index.unlink()
 
     # Step 7: Save each cluster
+    files_created, members = _save_clusters(output_dir, clusters, filtered_entities, filtered_relations)
+
+    # Step 9: Generate .graph-index.json manifest
+    graph_index = _generate_graph_index(
+        str(output_dir), files_created, filtered_entities, filtered_relations
+    )
+    return {
+        "files": files_created,
+        "removed_files": sorted(set(removed) - set(members.values())),
+        "incremental": False,
+        "members": members,
+        "graph_index": graph_index,
+    }
+
+
+def _build_incremental(
+    scope: Path,
+    output_dir: Path,
+    entities: dict,
+    relations: list,
+    state: dict,
+    touched: set[str],
+) -> dict | None:
+    """Steps 3-9 for the clusters affected by `touched` entities only.
+
+    Only touched entities are re-checked against the scope. Affected are
+    the clusters holding a touched entity or a relation neighbour of one
+    (a new relation, or an entity entering the scope, can merge clusters);
+    their members plus the touched entities are re-clustered, and only
+    those cluster files and manifest entries are rewritten. Returns None
+    when a full build is needed instead.
+    """
+    previous: dict[str, str] = state["members"]  # entity id -> graph file
+
+    def in_scope(eid: str) -> bool:
+        if eid not in entities:
+            return False
+        if eid in touched:
+            return _in_scope(entities[eid], scope)
+        return eid in previous
+
+    seeds = set(touched)
+    for r in relations:
+        if r["from"] in touched or r["to"] in touched:
+            seeds.add(r["from"])
+            seeds.add(r["to"])
+    dirty_files = {previous[eid] for eid in seeds if eid in previous}
+
+    # Steps 3-4 over the affected entities
+    members_by_file: dict[str, list[str]] = {}
+    if dirty_files:
+        for eid, name in previous.items():
+            if name in dirty_files:
+                members_by_file.setdefault(name, []).append(eid)
+    affected = {eid for name in dirty_files for eid in members_by_file.get(name, [])}
+    affected.update(seeds)
+    sub_entities = {eid: entities[eid] for eid in affected if in_scope(eid)}
+    sub_relations = [
+        r for r in relations if r["from"] in sub_entities and r["to"] in sub_entities
+    ]
+
+    # Step 5: Re-cluster the affected entities
+    clusters = detect_clusters(sub_entities, sub_relations)
+
+    # Cluster files are named after their root label; a name clash with a
+    # cluster that is kept as is needs the full build's clean slate
+    kept_files = set(previous.values()) - dirty_files
+    names = [
+        f"{_slugify(sub_entities[root]['properties'].get('label', root))}.jsonl"
+        for root in clusters
+    ]
+    if len(set(names)) != len(names) or kept_files.intersection(names):
+        return None
+
+    # Step 6: Remove affected cluster files that no longer exist
+    removed = sorted(dirty_files - set(names))
+    for name in removed:
+        _remove_graph_file(output_dir / name)
+
+    # Step 7: Save the re-clustered entities
+    files_created, new_members = _save_clusters(output_dir, clusters, sub_entities, sub_relations)
+
+    members = {eid: name for eid, name in previous.items() if name not in dirty_files}
+    members.update(new_members)
+
+    # Step 9: Update the affected .graph-index.json entries in place
+    try:
+        manifest = json.loads((output_dir / GRAPH_INDEX_FILE).read_text())
+        graphs = [g for g in manifest["graphs"] if g.get("file") not in dirty_files]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if dirty_files or files_created:
+        graphs.extend(_graph_index_entry(str(output_dir), fc) for fc in files_created)
+        graph_index = _write_graph_index(str(output_dir), graphs)
+    else:
+        graph_index = manifest
+
+    return {
+        "files": files_created,
+        "removed_files": removed,
+        "incremental": True,
+        "members": members,
+        "graph_index": graph_index,
+    }
+
+
+def _remove_graph_file(path: Path) -> None:
+    """Remove a named graph file with its snapshot and text index."""
+    path.unlink(missing_ok=True)
+    for suffix in (".snapshot", ".index"):
+        path.with_name(f".{path.name}{suffix}").unlink(missing_ok=True)
+
+
+def _save_clusters(
+    output_dir: Path, clusters: dict, entities: dict, relations: list
+) -> tuple[list[dict], dict[str, str]]:
+    """Write one graph file per cluster; returns (file entries, entity id -> file)."""
+    from datetime import datetime, timezone
+
+    # Bucket relations by cluster once (both endpoints share a cluster)
+    cluster_of = {eid: root for root, member_ids in clusters.items() for eid in member_ids}
+    cluster_relations: dict[str, list[dict]] = {root: [] for root in clusters}
+    for rel in relations:
+        root = cluster_of.get(rel["from"])
+        if root is not None and cluster_of.get(rel["to"]) == root:
+            cluster_relations[root].append(rel)
+
     files_created = []
+    members: dict[str, str] = {}
     for root_id, member_ids in clusters.items():
-        root_label = filtered_entities[root_id]["properties"].get("label", root_id)
+        root_label = entities[root_id]["properties"].get("label", root_id)
         slug = _slugify(root_label)
         filename = f"{slug}.jsonl"
         filepath = output_dir / filename
 
         # Write cluster entities and relations
-        cluster_entities = {eid: filtered_entities[eid] for eid in member_ids}
-        cluster_relations = [
-            r
-            for r in filtered_relations
-            if r["from"] in cluster_entities and r["to"] in cluster_entities
-        ]
+        cluster_entities = {eid: entities[eid] for eid in member_ids}
+        rels = cluster_relations[root_id]
 
+        # Stale snapshot of an earlier file with this name
+        filepath.with_name(f".{filename}.snapshot").unlink(missing_ok=True)
         with open(filepath, "w") as f:
             for entity in cluster_entities.values():
-                from datetime import datetime, timezone
-
                 record = {
                     "op": "create",
                     "entity": entity,
                     "timestamp": entity.get("updated", datetime.now(timezone.utc).isoformat()),
                 }
                 f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            for rel in cluster_relations:
+            for rel in rels:
                 record = {
                     "op": "relate",
                     "from": rel["from"],
@@ -275,6 +578,7 @@ def build(
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
                 f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        write_index(index_path(filepath), [filepath], cluster_entities)
 
         files_created.append(
             {
@@ -282,34 +586,12 @@ def build(
                 "root": root_id,
                 "root_label": root_label,
                 "entity_count": len(cluster_entities),
-                "relation_count": len(cluster_relations),
+                "relation_count": len(rels),
             }
         )
+        members.update((eid, filename) for eid in member_ids)
 
-    # Step 8: Validate
-    validation_errors = []
-    for fc in files_created:
-        errs = validate_graph(str(output_dir / fc["file"]))
-        if errs:
-            validation_errors.extend(
-                [f"{fc['file']}: {e}" for e in errs]
-            )
-
-    # Step 9: Generate .graph-index.json manifest
-    graph_index = _generate_graph_index(
-        output_path, files_created, filtered_entities, filtered_relations
-    )
-
-    return {
-        "clusters": len(clusters),
-        "entities_total": len(entities),
-        "entities_in_scope": len(filtered_ids),
-        "files": files_created,
-        "pruned": prune_result["pruned"],
-        "updated_stale": prune_result["updated"],
-        "validation_errors": validation_errors,
-        "graph_index": graph_index,
-    }
+    return files_created, members
 
 
 def _generate_graph_index(
@@ -324,59 +606,65 @@ def _generate_graph_index(
     entity/relation counts, dimension keys, and root entity info.
     Written atomically (temp + rename) to prevent corruption.
     """
-    from datetime import datetime, timezone
+    return _write_graph_index(
+        output_path, [_graph_index_entry(output_path, cf) for cf in cluster_files]
+    )
 
-    graphs = []
-    for cf in cluster_files:
-        root_id = cf["root"]
-        root_label = cf["root_label"]
-
-        # Collect unique dimensions and entity labels from the cluster JSONL
-        cluster_path = Path(output_path) / cf["file"]
-        cluster_dims: set[str] = set()
-        cluster_labels: list[str] = []
-        cluster_entity_ids: set[str] = set()
-        if cluster_path.exists():
-            with open(cluster_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if record.get("op") == "create" and "entity" in record:
-                        ent = record["entity"]
-                        cluster_entity_ids.add(ent.get("id", ""))
-                        props = ent.get("properties", {})
-                        label = props.get("label", "")
-                        if label:
-                            cluster_labels.append(label)
-                        dims = props.get("dimensions", {})
-                        if isinstance(dims, dict):
-                            cluster_dims.update(dims.keys())
-
-        # Auto-generate description from root label + other labels
-        other_labels = [lb for lb in cluster_labels if lb != root_label][:5]
-        if other_labels:
-            description = (
-                f"Knowledge graph rooted at '{root_label}', "
-                f"covering: {', '.join(other_labels)}"
-            )
-        else:
-            description = f"Knowledge graph for '{root_label}'"
-
-        graphs.append({
-            "name": cf["file"].replace(".jsonl", ""),
-            "file": cf["file"],
-            "description": description,
-            "entity_count": cf["entity_count"],
-            "relation_count": cf["relation_count"],
-            "dimensions": sorted(cluster_dims),
-            "root_entity_id": root_id,
-            "root_label": root_label,
-        })
+
+def _graph_index_entry(output_path: str, cf: dict) -> dict:
+    """Manifest entry for one cluster file written by the build."""
+    root_id = cf["root"]
+    root_label = cf["root_label"]
+
+    # Collect unique dimensions and entity labels from the cluster JSONL
+    cluster_path = Path(output_path) / cf["file"]
+    cluster_dims: set[str] = set()
+    cluster_labels: list[str] = []
+    if cluster_path.exists():
+        with open(cluster_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("op") == "create" and "entity" in record:
+                    ent = record["entity"]
+                    props = ent.get("properties", {})
+                    label = props.get("label", "")
+                    if label:
+                        cluster_labels.append(label)
+                    dims = props.get("dimensions", {})
+                    if isinstance(dims, dict):
+                        cluster_dims.update(dims.keys())
+
+    # Auto-generate description from root label + other labels
+    other_labels = [lb for lb in cluster_labels if lb != root_label][:5]
+    if other_labels:
+        description = (
+            f"Knowledge graph rooted at '{root_label}', "
+            f"covering: {', '.join(other_labels)}"
+        )
+    else:
+        description = f"Knowledge graph for '{root_label}'"
+
+    return {
+        "name": cf["file"].replace(".jsonl", ""),
+        "file": cf["file"],
+        "description": description,
+        "entity_count": cf["entity_count"],
+        "relation_count": cf["relation_count"],
+        "dimensions": sorted(cluster_dims),
+        "root_entity_id": root_id,
+        "root_label": root_label,
+    }
+
+
+def _write_graph_index(output_path: str, graphs: list[dict]) -> dict:
+    """Atomically write .graph-index.json listing `graphs`."""
+    from datetime import datetime, timezone
 
     manifest = {
         "version": "1.0",
@@ -386,7 +674,7 @@ def _generate_graph_index(
     }
 
     # Atomic write: temp file + rename
-    index_path = Path(output_path) / ".graph-index.json"
+    index_path = Path(output_path) / GRAPH_INDEX_FILE
     index_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = index_path.with_suffix(".json.tmp")
     with open(tmp_path, "w") as f:
@@ -413,6 +701,9 @@ def main() -> None:
     p_build.add_argument("--scope", required=True, help="Scope path for filtering")
     p_build.add_argument("--output", required=True, help="Output directory")
     p_build.add_argument("--entities", default=None, help="Master entities JSONL path")
+    p_build.add_argument(
+        "--full", action="store_true", help="Rebuild every graph, not only changed clusters"
+    )
 
     p_prune = sub.add_parser("prune", help="Prune stale entity references")
     p_prune.add_argument("--entities", required=True)
@@ -421,7 +712,7 @@ def main() -> None:
 
     try:
         if args.command == "build":
-            result = build(args.scope, args.output, args.entities)
+            result = build(args.scope, args.output, args.entities, full=args.full)
             _output_json(result)
         elif args.command == "prune":
             result = prune_stale(args.entities)
@@ -17,15 +17,19 @@ Usage:
     python3 ontology.py find-path --from id1 --to id2 --graph path.jsonl
     python3 ontology.py validate --graph path.jsonl
     python3 ontology.py load --graph path.jsonl
+    python3 ontology.py compact --graph path.jsonl
     python3 ontology.py retag --scope /path/to/kb --ontology-dir /path/.ontology --intake-status /path/.intake-status.json
 """
 
 import argparse
 import fcntl
+import hashlib
 import json
+import os
 import sys
 import uuid
 from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -44,6 +48,13 @@ WEIGHT_MAX = 10
 WEIGHT_DEFAULT = 5
 ID_PREFIX = "know"
 
+# Snapshots: a load that replays at least SNAPSHOT_INTERVAL records past the
+# last snapshot materializes a new one; snapshots are checked against the
+# SNAPSHOT_CHECK_BYTES of log preceding their offset
+SNAPSHOT_VERSION = 1
+SNAPSHOT_INTERVAL = 1000
+SNAPSHOT_CHECK_BYTES = 4096
+
 
 def resolve_safe_path(
     user_path: str,
@@ -82,85 +93,242 @@ def generate_id(prefix: str = ID_PREFIX) -> str:
     return f"{prefix}_{suffix}"
 
 
+class _GraphReplay:
+    """Graph state rebuilt from log records.
+
+    Relations keep their log order (duplicates included) and are indexed by
+    (from, rel, to), so an unrelate only clears the matching slots.
+    """
+
+    def __init__(self, entities: dict | None = None, relations: list | None = None) -> None:
+        self.entities: dict[str, dict] = entities or {}
+        self._relations: list[dict | None] = []
+        self._index: dict[tuple, list[int]] = {}
+        for rel in relations or []:
+            self._add_relation(rel)
+
+    def _add_relation(self, rel: dict) -> None:
+        self._index.setdefault((rel["from"], rel["rel"], rel["to"]), []).append(len(self._relations))
+        self._relations.append(rel)
+
+    def apply(self, record: dict) -> None:
+        op = record.get("op")
+        if op == "create":
+            entity = record["entity"]
+            self.entities[entity["id"]] = entity
+        elif op == "update":
+            eid = record["id"]
+            if eid in self.entities:
+                self.entities[eid]["properties"].update(
+                    record.get("properties", {})
+                )
+                self.entities[eid]["updated"] = record.get("timestamp")
+        elif op == "delete":
+            self.entities.pop(record["id"], None)
+        elif op == "relate":
+            self._add_relation(
+                {
+                    "from": record["from"],
+                    "rel": record["rel"],
+                    "to": record["to"],
+                    "properties": record.get("properties", {}),
+                }
+            )
+        elif op == "unrelate":
+            for i in self._index.pop((record["from"], record["rel"], record["to"]), ()):
+                self._relations[i] = None
+
+    def relations(self) -> list[dict]:
+        return [r for r in self._relations if r is not None]
+
+
+def _snapshot_path(graph_path: Path) -> Path:
+    return graph_path.with_name(f".{graph_path.name}.snapshot")
+
+
+def _tail_digest(f, offset: int) -> str:
+    """Digest of the log bytes just before `offset` (detects a rewritten log)."""
+    start = max(0, offset - SNAPSHOT_CHECK_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def _read_snapshot(graph_path: Path, f, st: os.stat_result) -> dict | None:
+    """Return the snapshot of the open log `f`, or None if missing or stale."""
+    try:
+        snapshot = json.loads(_snapshot_path(graph_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    offset = snapshot.get("offset")
+    if snapshot.get("inode") != st.st_ino or not isinstance(offset, int) or offset > st.st_size:
+        return None
+    if _tail_digest(f, offset) != snapshot.get("tail_digest"):
+        return None
+    return snapshot
+
+
+def _write_snapshot(
+    graph_path: Path, f, inode: int, offset: int, lines: int, entities: dict, relations: list
+) -> None:
+    """Atomically materialize the state of the log up to `offset`."""
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "inode": inode,
+        "offset": offset,
+        "lines": lines,
+        "tail_digest": _tail_digest(f, offset),
+        "entities": entities,
+        "relations": relations,
+    }
+    snapshot_path = _snapshot_path(graph_path)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as out:
+            json.dump(snapshot, out, ensure_ascii=False)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)  # A snapshot is only an optimization
+
+
 def load_graph(path: str) -> tuple[dict, list]:
     """Load entities and relations from JSONL, replaying events to current state.
 
+    Starts from the graph's snapshot when it is current and replays only
+    the records appended after it; a load that replays SNAPSHOT_INTERVAL
+    or more records refreshes the snapshot.
+
     Skips corrupted/partial lines with a warning to stderr.
 
     Returns:
         (entities_dict, relations_list) where entities_dict maps id -> entity.
     """
-    entities: dict[str, dict] = {}
-    relations: list[dict] = []
-
     graph_path = Path(path)
-    if not graph_path.exists():
-        return entities, relations
-
-    with open(graph_path, "r") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
+    try:
+        f = open(graph_path, "rb")
+    except FileNotFoundError:
+        return {}, []
+
+    with f:
+        st = os.fstat(f.fileno())
+        snapshot = _read_snapshot(graph_path, f, st)
+        if snapshot is not None:
+            replay = _GraphReplay(snapshot["entities"], snapshot["relations"])
+            offset, line_num = snapshot["offset"], snapshot.get("lines", 0)
+        else:
+            replay = _GraphReplay()
+            offset, line_num = 0, 0
+
+        f.seek(offset)
+        end, applied, complete = offset, 0, True
+        for raw in f:
+            line_num += 1
+            end += len(raw)
+            complete = raw.endswith(b"\n")
+            line = raw.strip()
             if not line:
                 continue
             try:
                 record = json.loads(line)
-            except json.JSONDecodeError:
+            except ValueError:
                 print(
                     f"Warning: skipping corrupted line {line_num} in {path}",
                     file=sys.stderr,
                 )
                 continue
+            replay.apply(record)
+            applied += 1
 
-            op = record.get("op")
-            if op == "create":
-                entity = record["entity"]
-                entities[entity["id"]] = entity
-            elif op == "update":
-                eid = record["id"]
-                if eid in entities:
-                    entities[eid]["properties"].update(
-                        record.get("properties", {})
-                    )
-                    entities[eid]["updated"] = record.get("timestamp")
-            elif op == "delete":
-                entities.pop(record["id"], None)
-            elif op == "relate":
-                relations.append(
-                    {
-                        "from": record["from"],
-                        "rel": record["rel"],
-                        "to": record["to"],
-                        "properties": record.get("properties", {}),
-                    }
-                )
-            elif op == "unrelate":
-                relations = [
-                    r
-                    for r in relations
-                    if not (
-                        r["from"] == record["from"]
-                        and r["rel"] == record["rel"]
-                        and r["to"] == record["to"]
-                    )
-                ]
+        entities, relations = replay.entities, replay.relations()
+        # An unterminated last line may still be mid-append; never snapshot past it
+        if applied >= SNAPSHOT_INTERVAL and complete:
+            _write_snapshot(graph_path, f, st.st_ino, end, line_num, entities, relations)
 
     return entities, relations
 
 
+@contextmanager
+def _locked_log(graph_path: Path):
+    """Open the log for appending under an exclusive flock.
+
+    Reopens if the log was replaced (compacted) while waiting for the lock,
+    so nothing is appended to an unlinked file.
+    """
+    graph_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        f = open(graph_path, "a")
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                current = os.stat(graph_path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current == os.fstat(f.fileno()).st_ino:
+                yield f
+                return
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            f.close()
+
+
 def append_op(path: str, record: dict) -> None:
     """Append a JSON event line to the graph file (creates parent dirs).
 
     Uses fcntl.flock for write safety.
     """
+    with _locked_log(Path(path)) as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def compact_graph(path: str) -> dict:
+    """Rewrite a graph log to its current state and snapshot it.
+
+    Every live entity becomes one create record and every live relation
+    one relate record; updates, deletes and unrelates disappear. Appends
+    are blocked for the duration of the rewrite.
+
+    Returns summary: {"entities", "relations", "bytes_before", "bytes_after"}.
+    """
     graph_path = Path(path)
-    graph_path.parent.mkdir(parents=True, exist_ok=True)
+    if not graph_path.exists():
+        raise ValueError(f"Graph file not found: {path}")
+
+    with _locked_log(graph_path):
+        bytes_before = graph_path.stat().st_size
+        entities, relations = load_graph(path)
+        timestamp = datetime.now(timezone.utc).isoformat()
 
-    with open(graph_path, "a") as f:
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        tmp_path = graph_path.with_name(f".{graph_path.name}.compact.tmp")
         try:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            with open(tmp_path, "w+b") as out:
+                for entity in entities.values():
+                    record = {
+                        "op": "create",
+                        "entity": entity,
+                        "timestamp": entity.get("updated", timestamp),
+                    }
+                    out.write(json.dumps(record, ensure_ascii=False).encode() + b"\n")
+                for rel in relations:
+                    record = {"op": "relate", **rel, "timestamp": timestamp}
+                    out.write(json.dumps(record, ensure_ascii=False).encode() + b"\n")
+                out.flush()
+                # Snapshot the new log before it is renamed into place: once it
+                # is, appenders lock its inode (not ours) and may extend it
+                st = os.fstat(out.fileno())
+                lines = len(entities) + len(relations)
+                _write_snapshot(graph_path, out, st.st_ino, st.st_size, lines, entities, relations)
+            os.replace(tmp_path, graph_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    return {
+        "entities": len(entities),
+        "relations": len(relations),
+        "bytes_before": bytes_before,
+        "bytes_after": st.st_size,
+    }
 
 
 def _validate_node_properties(properties: dict) -> list[str]:
@@ -739,6 +907,10 @@ def main() -> None:
     p_load = sub.add_parser("load", help="Load and display graph state")
     p_load.add_argument("--graph", required=True)
 
+    # compact
+    p_compact = sub.add_parser("compact", help="Rewrite graph log to its current state")
+    p_compact.add_argument("--graph", required=True)
+
     # retag
     p_retag = sub.add_parser("retag", help="Re-tag filed-untagged files")
     p_retag.add_argument("--scope", required=True, help="KB folder path to scan")
@@ -809,6 +981,9 @@ def main() -> None:
                 }
             )
 
+        elif args.command == "compact":
+            _output_json(compact_graph(args.graph))
+
         elif args.command == "retag":
             result = retag_files(
                 scope=args.scope,
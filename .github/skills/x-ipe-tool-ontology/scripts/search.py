@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Search Engine: text matching, BFS subgraph extraction, cross-graph pagination.
+Search Engine: indexed text matching with BM25 ranking (text_index.py),
+BFS subgraph extraction, cross-graph pagination.
 
 Usage:
     python3 search.py --query TEXT --scope all|FILE[,FILE,...] \
@@ -13,37 +14,27 @@ import sys
 from pathlib import Path
 
 from ontology import load_graph
+from text_index import TextIndex, index_path, load_index
 
 
 def _text_match(entity: dict, query: str) -> list[str]:
-    """Case-insensitive substring match on label, description, dimensions.
+    """Token match of a single entity on label, description, dimensions.
 
-    Returns list of matched field names.
+    Same matching as the graph text index: every query token must match a
+    token of the entity as a prefix (or fuzzily). Returns list of matched
+    field names.
     """
-    props = entity.get("properties", {})
-    q = query.lower()
-    matched = []
+    hits = TextIndex.from_entities({"": entity}).search(query)
+    return hits[0][2] if hits else []
 
-    label = props.get("label", "")
-    if isinstance(label, str) and q in label.lower():
-        matched.append("label")
 
-    desc = props.get("description", "")
-    if isinstance(desc, str) and q in desc.lower():
-        matched.append("description")
-
-    dims = props.get("dimensions", {})
-    if isinstance(dims, dict):
-        for dim_name, dim_val in dims.items():
-            if isinstance(dim_val, str) and q in dim_val.lower():
-                matched.append(f"dimensions.{dim_name}")
-            elif isinstance(dim_val, list):
-                for v in dim_val:
-                    if isinstance(v, str) and q in v.lower():
-                        matched.append(f"dimensions.{dim_name}")
-                        break
-
-    return matched
+def build_adjacency(relations: list) -> dict[str, list[tuple[str, dict]]]:
+    """Undirected adjacency: entity id -> [(neighbor id, relation)]."""
+    adj: dict[str, list[tuple[str, dict]]] = {}
+    for rel in relations:
+        adj.setdefault(rel["from"], []).append((rel["to"], rel))
+        adj.setdefault(rel["to"], []).append((rel["from"], rel))
+    return adj
 
 
 def _bfs_subgraph(
@@ -51,16 +42,17 @@ def _bfs_subgraph(
     entities: dict,
     relations: list,
     depth: int,
+    adjacencies: list[dict] | None = None,
 ) -> tuple[set[str], list[dict]]:
     """BFS traversal from seed entities up to `depth` hops.
 
+    `adjacencies` are prebuilt per-graph adjacencies (see build_adjacency)
+    covering `relations`; without them one is built from `relations`.
+
     Returns (node_ids, edges) for the subgraph.
     """
-    # Build adjacency (undirected)
-    adj: dict[str, list[tuple[str, dict]]] = {}
-    for rel in relations:
-        adj.setdefault(rel["from"], []).append((rel["to"], rel))
-        adj.setdefault(rel["to"], []).append((rel["from"], rel))
+    if adjacencies is None:
+        adjacencies = [build_adjacency(relations)]
 
     visited: set[str] = set(seed_ids)
     frontier = set(seed_ids)
@@ -70,7 +62,9 @@ def _bfs_subgraph(
     for _ in range(depth):
         next_frontier: set[str] = set()
         for node in frontier:
-            for neighbor, rel in adj.get(node, []):
+            for neighbor, rel in (
+                pair for adj in adjacencies for pair in adj.get(node, ())
+            ):
                 edge_key = (rel["from"], rel["rel"], rel["to"])
                 if edge_key not in seen_edges:
                     seen_edges.add(edge_key)
@@ -87,19 +81,6 @@ def _bfs_subgraph(
     return visited, collected_edges
 
 
-def _score_match(match_fields: list[str]) -> float:
-    """Simple scoring: 1.0 for label, 0.5 for others. Sum normalized to max 1."""
-    if not match_fields:
-        return 0.0
-    score = 0.0
-    for field in match_fields:
-        if field == "label":
-            score += 1.0
-        else:
-            score += 0.5
-    return min(score, 1.0)
-
-
 def _find_components(seed_ids: set[str], edges: list[dict]) -> list[set[str]]:
     """Find connected components among seed_ids using the given edges.
 
@@ -175,6 +156,7 @@ def search(
     depth: int = 3,
     page_size: int = 20,
     page: int = 1,
+    graph_loader=None,
 ) -> dict:
     """Execute search across ontology graphs.
 
@@ -185,6 +167,10 @@ def search(
         depth: BFS traversal depth from matched nodes.
         page_size: Results per page.
         page: 1-based page number.
+        graph_loader: Optional callable mapping a graph file path to
+            (entities, relations, adjacency, text index), e.g. served from
+            a cache of already-loaded graphs. Defaults to load_graph and
+            the graph's persisted text index.
 
     Returns:
         Search result dict with matches, subgraph, pagination.
@@ -212,26 +198,41 @@ def search(
     all_matches: list[dict] = []
     all_entities: dict = {}
     all_relations: list = []
+    adjacencies: list[dict] = []
+    graphs: list[tuple[Path, dict, TextIndex]] = []
 
     for gf in graph_files:
-        entities, relations = load_graph(str(gf))
+        if graph_loader is not None:
+            entities, relations, adjacency, text_index = graph_loader(gf)
+        else:
+            entities, relations = load_graph(str(gf))
+            adjacency = build_adjacency(relations)
+            text_index = load_index(index_path(gf), [gf], entities)
         all_entities.update(entities)
         all_relations.extend(relations)
-
-        for eid, entity in entities.items():
-            match_fields = _text_match(entity, query)
-            if match_fields:
-                all_matches.append(
-                    {
-                        "entity": entity,
-                        "score": _score_match(match_fields),
-                        "provenance": gf.name,
-                        "match_fields": match_fields,
-                    }
-                )
-
-    # Sort by score descending
+        adjacencies.append(adjacency)
+        graphs.append((gf, entities, text_index))
+
+    # Score every graph against the same corpus statistics
+    corpus = [text_index for _, _, text_index in graphs]
+    for gf, entities, text_index in graphs:
+        for eid, score, match_fields in text_index.search(query, corpus):
+            if eid not in entities:
+                continue
+            all_matches.append(
+                {
+                    "entity": entities[eid],
+                    "score": score,
+                    "provenance": gf.name,
+                    "match_fields": match_fields,
+                }
+            )
+
+    # Sort by score descending; scores are relative to the best match (0..1]
     all_matches.sort(key=lambda m: m["score"], reverse=True)
+    top_score = all_matches[0]["score"] if all_matches else 0
+    for m in all_matches:
+        m["score"] = round(m["score"] / top_score, 4) if top_score else 0.0
 
     # Pagination
     total_count = len(all_matches)
@@ -243,7 +244,7 @@ def search(
     seed_ids = {m["entity"]["id"] for m in page_matches}
     if seed_ids:
         subgraph_nodes, subgraph_edges = _bfs_subgraph(
-            seed_ids, all_entities, all_relations, depth
+            seed_ids, all_entities, all_relations, depth, adjacencies
         )
         # CR-002: inject virtual hub if matches are disconnected
         subgraph_nodes, subgraph_edges, virtual_nodes = _inject_search_hub(
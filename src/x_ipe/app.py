@@ -212,6 +212,30 @@ def _init_services(app):
             print(f"[X-IPE] Cleaned up {deleted} old feedback entries (retention: {retention_days} days)")
 
 
+def start_file_watcher(app):
+    """
+    Start the watcher-fed project structure cache for the sidebar (FEATURE-001).
+
+    Called by the server entry points, not by create_app, so apps built for
+    tests or tools never watch the project. Without it (or when the watcher
+    fails) the structure API falls back to a full scan.
+    """
+    from x_ipe.services.file_service import FileWatcher, ProjectStructureCache
+    from x_ipe.services.workflow_manager_service import invalidate_dir_listings
+    project_root = app.config.get('PROJECT_ROOT', '.')
+    structure_cache = ProjectStructureCache(project_root)
+    file_watcher = FileWatcher(project_root, socketio=socketio, structure_cache=structure_cache,
+                               change_listeners=[invalidate_dir_listings])
+    try:
+        file_watcher.start()
+    except Exception as e:
+        print(f"[X-IPE] File watcher unavailable, serving full scans: {e}")
+        return None
+    app.config['PROJECT_STRUCTURE_CACHE'] = structure_cache
+    app.config['FILE_WATCHER'] = file_watcher
+    return file_watcher
+
+
 def _register_blueprints(app):
     """Register all Flask Blueprints."""
     from x_ipe.routes import main_bp, settings_bp, project_bp, ideas_bp, tools_bp, proxy_bp, config_bp, learn_bp
@@ -263,6 +287,12 @@ def _register_handlers():
 
 # Entry point for running directly
 if __name__ == '__main__':
+    import signal
+    import sys
+
     app = create_app()
+    start_file_watcher(app)
+    # Exit normally on SIGTERM so atexit handlers (deferred workflow writes) run
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     session_manager.start_cleanup_task()
     socketio.run(app, debug=True, use_reloader=False, host='0.0.0.0', port=5858)
@@ -725,9 +725,10 @@ def serve(ctx: click.Context, host: Optional[str], port: Optional[int],
         _kill_port(final_port)
         
         # Import the Flask app
-        from x_ipe.app import create_app, socketio
+        from x_ipe.app import create_app, socketio, start_file_watcher
         
         app = create_app()
+        start_file_watcher(app)
         
         # Ensure clean shutdown on signals
         def _shutdown(signum, frame):
@@ -4,6 +4,7 @@ X-IPE Core Modules
 Provides foundational utilities for:
 - Configuration management
 - File hashing
+- Gitignore matching
 - Path resolution
 - Project scaffolding
 - Skills management
@@ -11,6 +12,7 @@ Provides foundational utilities for:
 
 from .config import XIPEConfig
 from .hashing import hash_file, hash_directory
+from .gitignore import GitignoreMatcher
 from .paths import resolve_path, get_project_root
 from .scaffold import ScaffoldManager
 from .skills import SkillInfo, SkillsManager
@@ -19,6 +21,7 @@ __all__ = [
     'XIPEConfig',
     'hash_file',
     'hash_directory',
+    'GitignoreMatcher',
     'resolve_path',
     'get_project_root',
     'ScaffoldManager',
@@ -0,0 +1,307 @@
+"""
+X-IPE Gitignore Matching
+
+Compiles .gitignore files into regex matchers with full gitignore
+semantics (globs, ``**``, negation, anchored and directory-only patterns,
+nested .gitignore files) and walks directory trees without descending
+into ignored directories.
+"""
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+GITIGNORE_FILE = '.gitignore'
+
+# Never part of the working tree, whether or not a .gitignore lists it
+ALWAYS_IGNORED = ('.git',)
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob (already stripped of anchors/slashes) to a regex."""
+    regex = ''
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i):
+                at_start = i == 0 or pattern[i - 1] == '/'
+                at_end = i + 2 == n
+                if at_start and at_end:
+                    regex += '.*'
+                    i += 2
+                    continue
+                if at_start and pattern.startswith('**/', i):
+                    regex += '(?:.*/)?'
+                    i += 3
+                    continue
+            regex += '[^/]*'
+            while i < n and pattern[i] == '*':
+                i += 1
+            continue
+        if c == '?':
+            regex += '[^/]'
+        elif c == '[':
+            end = i + 1
+            if end < n and pattern[end] in '!^':
+                end += 1
+            if end < n and pattern[end] == ']':
+                end += 1
+            while end < n and pattern[end] != ']':
+                end += 1
+            if end >= n:
+                regex += re.escape(c)
+            else:
+                body = pattern[i + 1:end]
+                if body[0] in '!^':
+                    body = '^' + body[1:]
+                regex += '[' + body.replace('\\', '\\\\') + ']'
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(c)
+        i += 1
+    return regex
+
+
+def compile_pattern(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Compile one .gitignore line.
+
+    Args:
+        line: Raw line from a .gitignore file
+
+    Returns:
+        Tuple of (regex source, negated, directory_only), or None for
+        blank lines and comments.
+    """
+    line = line.rstrip('\n').rstrip('\r')
+    # Trailing spaces are ignored unless escaped
+    while line.endswith(' ') and not line.endswith('\\ '):
+        line = line[:-1]
+    if not line or line.startswith('#'):
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    elif line.startswith('\\#') or line.startswith('\\!'):
+        line = line[1:]
+
+    directory_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+
+    # A slash at the start or middle anchors the pattern to the .gitignore's directory
+    anchored = '/' in line
+    line = line.lstrip('/')
+
+    regex = _translate_glob(line)
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return regex, negated, directory_only
+
+
+class GitignoreSpec:
+    """
+    Compiled patterns of a single .gitignore file.
+
+    All patterns are folded into one alternation (in reverse order, so the
+    first alternative to match is the last matching line, as gitignore
+    requires). Directory-only patterns are excluded from the file regex.
+    """
+
+    def __init__(self, lines: List[str]):
+        compiled = [p for p in (compile_pattern(line) for line in lines) if p is not None]
+        self.is_empty = not compiled
+        self._dir_regex, self._dir_negated = self._combine(compiled)
+        self._file_regex, self._file_negated = self._combine(
+            [p for p in compiled if not p[2]]
+        )
+
+    @staticmethod
+    def _combine(compiled: List[Tuple[str, bool, bool]]):
+        if not compiled:
+            return None, []
+        ordered = list(reversed(compiled))
+        regex = re.compile('|'.join(f'({source})' for source, _, _ in ordered), re.DOTALL)
+        return regex, [negated for _, negated, _ in ordered]
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Match a path relative to this .gitignore's directory.
+
+        Returns:
+            True if ignored, False if re-included by a negation,
+            None if no pattern matches.
+        """
+        regex, negated = (
+            (self._dir_regex, self._dir_negated) if is_dir
+            else (self._file_regex, self._file_negated)
+        )
+        if regex is None:
+            return None
+        m = regex.fullmatch(rel_path)
+        if m is None:
+            return None
+        return not negated[m.lastindex - 1]
+
+
+class GitignoreMatcher:
+    """
+    Decides whether project paths are ignored, honoring every .gitignore
+    between the root and the path.
+
+    Directory decisions are cached, so checking many files in the same
+    folder costs one regex match per file. Nested .gitignore files are
+    loaded lazily the first time their directory is consulted.
+    """
+
+    def __init__(self, root: Optional[str] = None, root_patterns: Optional[List[str]] = None,
+                 always_ignored: Tuple[str, ...] = ALWAYS_IGNORED):
+        """
+        Initialize GitignoreMatcher.
+
+        Args:
+            root: Directory the .gitignore hierarchy is rooted at. When None,
+                paths are matched as given against root_patterns only.
+            root_patterns: Patterns for the root directory. When None, they
+                are read from <root>/.gitignore.
+            always_ignored: Names ignored at any depth regardless of patterns
+        """
+        self.root = Path(root) if root else None
+        self._root_patterns = root_patterns
+        self._always_ignored = set(always_ignored)
+        self._specs: Dict[str, Optional[GitignoreSpec]] = {}
+        self._dir_cache: Dict[str, bool] = {}
+
+    def relative(self, path) -> Optional[str]:
+        """Return the POSIX path relative to root, or None if outside it."""
+        path_obj = Path(path)
+        if self.root is None or not path_obj.is_absolute():
+            return path_obj.as_posix().strip('/')
+        try:
+            return path_obj.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def is_ignored(self, path, is_dir: Optional[bool] = None) -> bool:
+        """
+        Check whether a path is ignored.
+
+        Args:
+            path: Absolute path, or path relative to root
+            is_dir: Whether the path is a directory; checked on disk if None
+
+        Returns:
+            True if the path (or one of its parent directories) is ignored
+        """
+        rel_path = self.relative(path)
+        if not rel_path or rel_path == '.':
+            return False
+        if is_dir is None:
+            is_dir = self.root is not None and (self.root / rel_path).is_dir()
+
+        parent, _, _ = rel_path.rpartition('/')
+        if parent and self._is_dir_ignored(parent):
+            return True
+        return self._match(rel_path, is_dir)
+
+    def reload(self, gitignore_path) -> None:
+        """Re-read a changed .gitignore file and drop cached decisions."""
+        rel_dir = self.relative(Path(gitignore_path).parent)
+        if rel_dir is None:
+            return
+        rel_dir = '' if rel_dir == '.' else rel_dir
+        if rel_dir == '':
+            self._root_patterns = None  # The file on disk now wins
+        self._specs.pop(rel_dir, None)
+        self._dir_cache.clear()
+
+    def walk_files(self, start=None) -> Iterator[Path]:
+        """
+        Yield every non-ignored file below `start` (default: root).
+
+        Ignored directories are pruned and never listed.
+        """
+        base = Path(start) if start is not None else self.root
+        if base is None:
+            return
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [
+                d for d in dirnames
+                if not self.is_ignored(os.path.join(dirpath, d), is_dir=True)
+            ]
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                if not self.is_ignored(file_path, is_dir=False):
+                    yield Path(file_path)
+
+    def walk_dirs(self, start=None) -> Iterator[Path]:
+        """
+        Yield `start` (default: root) and every non-ignored directory below it.
+
+        Ignored directories are pruned and never listed.
+        """
+        base = Path(start) if start is not None else self.root
+        if base is None:
+            return
+        for dirpath, dirnames, _ in os.walk(base):
+            dirnames[:] = [
+                d for d in dirnames
+                if not self.is_ignored(os.path.join(dirpath, d), is_dir=True)
+            ]
+            yield Path(dirpath)
+
+    def _is_dir_ignored(self, rel_dir: str) -> bool:
+        cached = self._dir_cache.get(rel_dir)
+        if cached is None:
+            parent, _, _ = rel_dir.rpartition('/')
+            cached = bool(parent) and self._is_dir_ignored(parent)
+            if not cached:
+                cached = self._match(rel_dir, True)
+            self._dir_cache[rel_dir] = cached
+        return cached
+
+    def _match(self, rel_path: str, is_dir: bool) -> bool:
+        """Match against the applicable .gitignore files, deepest first."""
+        name = rel_path.rpartition('/')[2]
+        if name in self._always_ignored:
+            return True
+
+        directory = rel_path
+        while directory:
+            directory = directory.rpartition('/')[0]
+            spec = self._spec_for(directory)
+            if spec is not None:
+                sub_path = rel_path[len(directory) + 1:] if directory else rel_path
+                result = spec.match(sub_path, is_dir)
+                if result is not None:
+                    return result
+        return False
+
+    def _spec_for(self, rel_dir: str) -> Optional[GitignoreSpec]:
+        if rel_dir in self._specs:
+            return self._specs[rel_dir]
+
+        lines: Optional[List[str]] = None
+        if rel_dir == '' and self._root_patterns is not None:
+            lines = self._root_patterns
+        elif self.root is not None:
+            gitignore_path = self.root / rel_dir / GITIGNORE_FILE
+            try:
+                with open(gitignore_path, 'r', encoding='utf-8', errors='replace') as f:
+                    lines = f.readlines()
+            except OSError:
+                lines = None
+
+        spec = GitignoreSpec(lines) if lines else None
+        if spec is not None and spec.is_empty:
+            spec = None
+        self._specs[rel_dir] = spec
+        return spec
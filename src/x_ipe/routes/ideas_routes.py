@@ -104,7 +104,7 @@ def upload_ideas():
             kb_references = []
     
     # Convert to (filename, content) tuples
-    files = [(f.filename, f.read()) for f in uploaded_files if f.filename]
+    files = [(f.filename, f.stream) for f in uploaded_files if f.filename]
     
     result = service.upload(files, target_folder=target_folder, kb_references=kb_references)
     
@@ -4,9 +4,12 @@ FEATURE-049-A: KB Backend & Storage Foundation — Routes
 Flask Blueprint exposing REST API endpoints under /api/kb/ for Knowledge Base
 file/folder CRUD, config, tree, and search operations.
 """
+import time
+
 from flask import Blueprint, jsonify, request, current_app, send_file, make_response
 from pathlib import Path
 
+from x_ipe.services.kb_service import MAX_FILE_SIZE_BYTES, TEXT_EXTENSIONS
 from x_ipe.tracing import x_ipe_tracing
 from x_ipe.services.conversion_utils import convert_docx, convert_msg, sanitize_converted_html
 
@@ -22,6 +25,8 @@ def _add_cors_headers(response):
 
 CONVERTIBLE_EXTENSIONS = {'.docx', '.msg'}
 MAX_CONVERSION_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_PROGRESS_MIN_FILES = 50
+UPLOAD_PROGRESS_INTERVAL = 0.5  # seconds
 
 
 def _error(code: str, message: str, status: int):
@@ -449,25 +454,63 @@ def get_config():
 @x_ipe_tracing()
 def search_files():
     """
-    GET /api/kb/search?q={query}&tag={tag}&tag_type={lifecycle|domain}
+    GET /api/kb/search?q={query}&tag={tag}&tag_type={lifecycle|domain}&limit={n}&offset={n}
 
-    FEATURE-049-A: Search KB files by filename, frontmatter fields, and/or tag.
+    FEATURE-049-A: Full-text search of KB files (names, metadata and bodies)
+    and/or tag filter. Results are ranked and carry a highlighted snippet;
+    ``has_more`` reports whether another page exists after *offset + limit*.
     """
     svc = _get_kb_service_or_abort()
 
     q = request.args.get('q', '')
     tag = request.args.get('tag', '')
     tag_type = request.args.get('tag_type', '')
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', 0, type=int)
+    if (limit is not None and limit < 1) or offset < 0:
+        return _error('BAD_REQUEST', 'limit must be positive and offset non-negative', 400)
 
     try:
-        results = svc.search(query=q, tag=tag, tag_type=tag_type)
-        return jsonify({'results': [r.to_dict() for r in results]})
+        results = svc.search(query=q, tag=tag, tag_type=tag_type,
+                             limit=limit + 1 if limit is not None else None, offset=offset)
+        has_more = limit is not None and len(results) > limit
+        if has_more:
+            results = results[:limit]
+        return jsonify({'results': [r.to_dict() for r in results], 'has_more': has_more})
     except ValueError as exc:
         return _error('BAD_REQUEST', str(exc), 400)
     except Exception as exc:
         return _error('INTERNAL_ERROR', str(exc), 500)
 
 
+def _upload_progress_reporter(upload_id: str, filename: str):
+    """Return a progress callback that emits ``kb_upload_progress`` over Socket.IO.
+
+    Only archives with at least ``UPLOAD_PROGRESS_MIN_FILES`` files report,
+    at most every ``UPLOAD_PROGRESS_INTERVAL`` seconds (plus completion).
+    """
+    socketio = current_app.extensions.get('socketio')
+    if not socketio:
+        return None
+    last_emit = [0.0]
+
+    def report(done: int, total: int) -> None:
+        now = time.monotonic()
+        if total < UPLOAD_PROGRESS_MIN_FILES:
+            return
+        if done < total and now - last_emit[0] < UPLOAD_PROGRESS_INTERVAL:
+            return
+        last_emit[0] = now
+        socketio.emit('kb_upload_progress', {
+            'upload_id': upload_id,
+            'file': filename,
+            'done': done,
+            'total': total,
+        })
+
+    return report
+
+
 @kb_bp.route('/api/kb/upload', methods=['POST'])
 @x_ipe_tracing()
 def upload_files():
@@ -477,11 +520,14 @@ def upload_files():
     FEATURE-049-E: Upload files to KB. Accepts multipart/form-data.
     - files: one or more files
     - folder: destination folder path (default: root)
-    Automatically extracts .zip archives preserving internal structure.
+    - upload_id: optional client id echoed in ``kb_upload_progress`` events
+    Automatically extracts .zip/.7z archives preserving internal structure;
+    large archives report progress over Socket.IO.
     """
     svc = _get_kb_service_or_abort()
 
     folder = request.form.get('folder', '').strip()
+    upload_id = request.form.get('upload_id', '')
     uploaded_files = request.files.getlist('files')
 
     if not uploaded_files:
@@ -495,27 +541,25 @@ def upload_files():
             continue
 
         try:
-            content = f.read()
-
-            # Archive extraction for .zip
+            # Archive extraction streams entries from the uploaded file
             if f.filename.lower().endswith('.zip'):
-                extracted = svc.extract_zip(content, folder)
+                extracted = svc.extract_zip(f.stream, folder,
+                                            progress=_upload_progress_reporter(upload_id, f.filename))
                 results.extend(extracted)
             elif f.filename.lower().endswith('.7z'):
-                extracted = svc.extract_7z(content, folder)
+                extracted = svc.extract_7z(f.stream, folder,
+                                           progress=_upload_progress_reporter(upload_id, f.filename))
                 results.extend(extracted)
             else:
                 dest_path = f'{folder}/{f.filename}' if folder else f.filename
-                # Text files get frontmatter support; binary files stored as-is
-                TEXT_EXTS = {'.md', '.txt', '.json', '.yaml', '.yml', '.csv',
-                             '.html', '.htm', '.css', '.js', '.ts', '.xml',
-                             '.toml', '.ini', '.cfg', '.sh', '.bat', '.py',
-                             '.rb', '.java', '.go', '.rs', '.c', '.cpp', '.h'}
+                # Text files get frontmatter support; binary files are streamed as-is.
+                # Reads are capped just past the size limit so memory stays bounded.
                 ext = Path(f.filename).suffix.lower()
-                if ext in TEXT_EXTS:
+                if ext in TEXT_EXTENSIONS:
+                    content = f.stream.read(MAX_FILE_SIZE_BYTES + 1)
                     result = svc.create_file(dest_path, content.decode('utf-8', errors='replace'))
                 else:
-                    result = svc.create_binary_file(dest_path, content)
+                    result = svc.create_binary_file(dest_path, f.stream)
                 results.append(result)
         except (FileExistsError, ValueError) as exc:
             errors.append({'file': f.filename, 'error': str(exc)})
@@ -602,6 +646,27 @@ def get_kb_index():
         return _error('INTERNAL_ERROR', str(exc), 500)
 
 
+@kb_bp.route('/api/kb/index/query', methods=['GET'])
+@x_ipe_tracing()
+def query_kb_index():
+    """
+    GET /api/kb/index/query?tag=&tag_type=&type=&author=
+
+    Find index entries across all folders by tag, type and/or author.
+    """
+    svc = _get_kb_service_or_abort()
+    try:
+        entries = svc.query_index(
+            tag=request.args.get('tag', ''),
+            tag_type=request.args.get('tag_type', ''),
+            entry_type=request.args.get('type', ''),
+            author=request.args.get('author', ''),
+        )
+        return jsonify({'success': True, 'entries': entries, 'total': len(entries)})
+    except Exception as exc:
+        return _error('INTERNAL_ERROR', str(exc), 500)
+
+
 @kb_bp.route('/api/kb/index/entry', methods=['PUT'])
 @x_ipe_tracing()
 def set_kb_index_entry():
@@ -629,7 +694,7 @@ def set_kb_index_entry():
         if not folder_path.is_dir():
             return _error('FOLDER_NOT_FOUND', f'Folder not found: {folder}', 404)
         svc._set_index_entry(folder_path, name, entry)
-        svc._invalidate_cache()
+        svc.refresh_file_metadata(folder_path / name)
         return jsonify({'success': True, 'folder': folder or '/', 'name': name, 'entry': entry})
     except ValueError as exc:
         return _error('INVALID_PATH', str(exc), 400)
@@ -659,7 +724,7 @@ def remove_kb_index_entry():
         if not folder_path.is_dir():
             return _error('FOLDER_NOT_FOUND', f'Folder not found: {folder}', 404)
         svc._remove_index_entry(folder_path, name)
-        svc._invalidate_cache()
+        svc.refresh_file_metadata(folder_path / name)
         return jsonify({'success': True, 'folder': folder or '/', 'name': name, 'removed': True})
     except ValueError as exc:
         return _error('INVALID_PATH', str(exc), 400)
@@ -60,9 +60,15 @@ def workplace():
 @x_ipe_tracing()
 def get_project_structure():
     """
-    GET /api/project/structure
+    GET /api/project/structure?mode=<full|lazy>&limit=<n>
     
     Returns the project folder structure for sidebar navigation.
+    Served from the watcher-fed structure cache when it covers the current
+    project root, with an ETag so unchanged structures return 304.
+    
+    mode=lazy returns only the first level of each section (folders carry
+    child_count); deeper levels come from /api/project/directory. The
+    sidebar uses it and lists folders as they are expanded.
     """
     project_root = current_app.config.get('PROJECT_ROOT')
     
@@ -72,23 +78,142 @@ def get_project_structure():
             'project_root': project_root
         }), 400
     
+    cache = _get_structure_cache(project_root)
+    
+    if request.args.get('mode') == 'lazy':
+        limit = _get_page_limit()
+        if cache is None:
+            return jsonify(ProjectService(project_root).get_lazy_structure(limit=limit))
+        # Read the sequence first: deltas after it may already be reflected,
+        # and applying them again on the client is harmless
+        seq = cache.snapshot()[1]
+        response = jsonify(cache.get_lazy_structure(limit=limit))
+        response.headers['X-Structure-Seq'] = str(seq)
+        return response
+    
+    if cache is not None:
+        structure, seq = cache.snapshot()
+        etag = cache.etag_for(seq)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify(structure)
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        response.headers['X-Structure-Seq'] = str(seq)
+        return response
+    
     service = ProjectService(project_root)
     structure = service.get_structure()
     
     return jsonify(structure)
 
 
+@main_bp.route('/api/project/directory')
+@x_ipe_tracing()
+def get_project_directory():
+    """
+    GET /api/project/directory?path=<section path or folder>&cursor=<c>&limit=<n>
+    
+    Lazy sidebar listing: one directory level, paginated with an opaque
+    cursor. Returns {path, children, child_count, next_cursor}.
+    """
+    project_root = current_app.config.get('PROJECT_ROOT')
+    if not project_root or not os.path.exists(project_root):
+        return jsonify({'error': 'Project root not configured or does not exist'}), 400
+    
+    dir_path = request.args.get('path')
+    if not dir_path:
+        return jsonify({'error': 'Path parameter required'}), 400
+    
+    cache = _get_structure_cache(project_root)
+    source = cache if cache is not None else ProjectService(project_root)
+    try:
+        listing = source.list_directory(
+            dir_path,
+            cursor=request.args.get('cursor') or None,
+            limit=_get_page_limit()
+        )
+    except FileNotFoundError:
+        return jsonify({'error': 'Directory not found'}), 404
+    except PermissionError:
+        return jsonify({'error': 'Access denied'}), 403
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(listing)
+
+
+def _get_structure_cache(project_root):
+    """Return the structure cache if it covers the given project root and is kept current."""
+    cache = current_app.config.get('PROJECT_STRUCTURE_CACHE')
+    if cache is None or cache.project_root != Path(project_root).resolve():
+        return None
+    # Without a live watcher nothing patches the cache; scan instead
+    watcher = current_app.config.get('FILE_WATCHER')
+    if watcher is None or not watcher.is_running:
+        return None
+    return cache
+
+
+def _get_page_limit() -> int:
+    """Read the lazy listing page size from the request, clamped to the maximum."""
+    limit = request.args.get('limit', ProjectService.DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, ProjectService.MAX_PAGE_SIZE))
+
+
+@main_bp.route('/api/project/structure/deltas')
+@x_ipe_tracing()
+def get_project_structure_deltas():
+    """
+    GET /api/project/structure/deltas?since=<seq>
+    
+    Resync endpoint for clients that missed a 'structure_delta' message.
+    Returns {seq, messages} with the missed delta messages in order, or
+    {seq, structure} with the full tree when the history no longer covers
+    `since`.
+    """
+    project_root = current_app.config.get('PROJECT_ROOT')
+    cache = _get_structure_cache(project_root) if project_root else None
+    if cache is None:
+        return jsonify({'error': 'Structure deltas not available'}), 404
+    
+    since = request.args.get('since', type=int)
+    messages = cache.deltas_since(since) if since is not None else None
+    if messages is not None:
+        return jsonify({'seq': messages[-1]['seq'] if messages else since, 'messages': messages})
+    
+    structure, seq = cache.snapshot()
+    return jsonify({'seq': seq, 'structure': structure})
+
+
 @main_bp.route('/api/file/content')
 @x_ipe_tracing()
 def get_file_content():
     """
-    GET /api/file/content?path=<relative_path>&raw=<true/false>
+    GET /api/file/content?path=<relative_path>&raw=<true/false>&preview=<true/false>
+        [&cursor=<byte>&start_line=<n>&lines=<n>] [&offset=<byte>&length=<n>]
     
     Returns the content of a file with metadata for rendering.
-    If raw=true or file is binary (images, etc.), serves the raw file content.
+    If raw=true or file is binary (images, etc.), serves the raw file content
+    as a streamed response that honors HTTP Range requests.
+    
+    Text files are returned whole unless paging is asked for. With
+    preview=true (viewers only), large text files come back as a first
+    page with truncated=true and a next_cursor; pass it back as cursor to
+    load more. offset/length read an arbitrary byte range instead.
     """
     file_path = request.args.get('path')
     raw = request.args.get('raw', 'false').lower() == 'true'
+    preview = request.args.get('preview', 'false').lower() == 'true'
+    
+    try:
+        cursor = _get_int_arg('cursor')
+        start_line = _get_int_arg('start_line')
+        max_lines = _get_int_arg('lines')
+        offset = _get_int_arg('offset')
+        length = _get_int_arg('length')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     if not file_path:
         return jsonify({'error': 'Path parameter required'}), 400
@@ -146,19 +271,43 @@ def get_file_content():
             }
             mime_type = mime_types.get(ext, 'application/octet-stream')
             
-            return send_file(full_path, mimetype=mime_type)
+            return send_file(full_path, mimetype=mime_type, conditional=True)
         
         service = ContentService(project_root)
-        result = service.get_content(file_path)
+        if offset is not None or length is not None:
+            result = service.read_byte_range(
+                file_path, offset or 0, length if length is not None else ContentService.MAX_CHUNK_BYTES
+            )
+        else:
+            result = service.get_content(
+                file_path, cursor=cursor, start_line=start_line, max_lines=max_lines,
+                preview=preview
+            )
         return jsonify(result)
     except FileNotFoundError:
         return jsonify({'error': 'File not found'}), 404
     except PermissionError:
         return jsonify({'error': 'Access denied'}), 403
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _get_int_arg(name):
+    """Read an optional non-negative integer query parameter."""
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+    if number < 0:
+        raise ValueError(f'{name} must not be negative')
+    return number
+
+
 @main_bp.route('/api/file/raw')
 @x_ipe_tracing()
 def get_file_raw():
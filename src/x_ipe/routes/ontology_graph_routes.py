@@ -5,7 +5,7 @@ Blueprint exposing REST API endpoints under /api/kb/ontology/ for
 listing graphs, fetching graph data as Cytoscape.js JSON, searching nodes,
 and BFS graph traversal search.
 """
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app
 
 from x_ipe.tracing import x_ipe_tracing
 
@@ -50,16 +50,38 @@ def get_all_graphs():
     FEATURE-059-F: Returns merged nodes + edges from all graphs plus cross-graph
     relations from .ontology/relations/_relations.NNN.jsonl. Used by the viewer
     for auto-load-all behavior after sidebar removal.
+
+    Served from a precomputed payload: gzip-encoded when the client accepts
+    it, with a strong ETag so unchanged graphs return 304.
+
+    Query params:
+        lod: "clusters" returns one summary node per graph instead
+             (see OntologyGraphService.get_cluster_summary)
     """
     svc = _get_service_or_abort()
     try:
         if not svc.has_ontology:
             return _error('ONTOLOGY_NOT_FOUND', 'No .ontology/ directory found in knowledge base', 404)
-        result = svc.get_all_graphs()
-        return jsonify(result)
+        mode = 'clusters' if request.args.get('lod') == 'clusters' else 'full'
+        payload = svc.get_all_graphs_payload(mode)
     except Exception as exc:
         return _error('INTERNAL_ERROR', str(exc), 500)
 
+    # Each content-coding gets its own strong ETag; either one validates
+    gzipped = request.accept_encodings['gzip'] > 0
+    etag = f'{payload.etag}-gz' if gzipped else payload.etag
+    if request.if_none_match.contains(payload.etag) or request.if_none_match.contains(f'{payload.etag}-gz'):
+        response = Response(status=304)
+    elif gzipped:
+        response = Response(payload.gzip_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(payload.body, mimetype='application/json')
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = True
+    return response
+
 
 @ontology_graph_bp.route('/api/kb/ontology/graph/<name>', methods=['GET'])
 @x_ipe_tracing()
@@ -9,12 +9,13 @@ Provides REST endpoints for:
 - POST /api/tracing/stop - Stop tracing immediately
 - GET /api/tracing/logs - List trace log files
 - DELETE /api/tracing/logs - Delete all trace logs
+- GET /api/tracing/logs/<trace_id>/text - Get a trace as a text log
 """
 from flask import Blueprint, request, jsonify, current_app
 from pathlib import Path
 
 from x_ipe.services.tracing_service import TracingService
-from x_ipe.tracing import x_ipe_tracing
+from x_ipe.tracing import x_ipe_tracing, get_trace_writer
 
 
 tracing_bp = Blueprint('tracing', __name__, url_prefix='/api/tracing')
@@ -41,12 +42,15 @@ def get_status():
             "log_path": "instance/traces/",
             "retention_hours": 24,
             "ignored_apis": [],
-            "active": true
+            "segment_files": false,
+            "active": true,
+            "writer": {"queued": 0, "written": 12, "dropped": 0}
         }
     """
     service = get_service()
     config = service.get_config()
     config["active"] = service.is_active()
+    config["writer"] = get_trace_writer().stats()
     return jsonify(config)
 
 
@@ -105,22 +109,29 @@ def stop_tracing():
 @x_ipe_tracing()
 def list_logs():
     """
-    GET /api/tracing/logs
+    GET /api/tracing/logs?api=<text>&status=<SUCCESS|ERROR>&limit=<n>
     
-    List all trace log files.
+    List trace logs, newest first, optionally filtered.
     
     Response:
         [
             {
                 "trace_id": "abc-123",
+                "api": "POST /api/orders",
                 "filename": "20260201-033000-post-api-orders-abc-123.log",
                 "size": 1234,
-                "timestamp": "2026-02-01T03:30:00"
+                "timestamp": "2026-02-01T03:30:00",
+                "status": "SUCCESS",
+                "duration_ms": 245
             }
         ]
     """
     service = get_service()
-    logs = service.list_logs()
+    logs = service.list_logs(
+        api=request.args.get('api') or None,
+        status=request.args.get('status') or None,
+        limit=request.args.get('limit', type=int)
+    )
     return jsonify(logs)
 
 
@@ -187,6 +198,28 @@ def get_trace(trace_id):
     return jsonify(result)
 
 
+@tracing_bp.route('/logs/<trace_id>/text', methods=['GET'])
+@x_ipe_tracing()
+def get_trace_text(trace_id):
+    """
+    GET /api/tracing/logs/<trace_id>/text
+    
+    Get a trace as a human-readable text log, rendering JSONL traces on demand.
+    
+    Response: text/plain trace log
+        
+    Errors:
+        404 - Trace not found
+    """
+    service = get_service()
+    text = service.get_trace_text(trace_id)
+    
+    if text is None:
+        return jsonify({"error": f"Trace not found: {trace_id}"}), 404
+    
+    return current_app.response_class(text, mimetype='text/plain')
+
+
 @tracing_bp.route('/ignored', methods=['GET'])
 @x_ipe_tracing()
 def get_ignored_apis():
@@ -116,6 +116,8 @@ def update_action(name):
     error = result.get('error', '')
     if error == 'NOT_FOUND':
         return jsonify(result), 404
+    if error == 'CONFLICT':
+        return jsonify(result), 409
     return jsonify(result), 400
 
 
@@ -18,6 +18,7 @@ from .file_service import (
     FileNode,
     Section,
     ProjectService,
+    ProjectStructureCache,
     FileWatcherHandler,
     FileWatcher,
     ContentService,
@@ -88,6 +89,7 @@ __all__ = [
     'FileNode',
     'Section',
     'ProjectService',
+    'ProjectStructureCache',
     'FileWatcherHandler',
     'FileWatcher',
     'ContentService',
@@ -6,17 +6,27 @@ FEATURE-003: Content Editor
 FileNode: Represents a file or folder in the project structure
 Section: Represents a top-level section in the sidebar
 ProjectService: Scans project directory and returns structure
+ProjectStructureCache: In-memory project structure patched from FileWatcher events
 FileWatcherHandler: Handler for file system events
 FileWatcher: Monitors file system changes and emits WebSocket events
 ContentService: Reads file content and detects file types
 """
+import base64
+import bisect
+import codecs
+import json
+import mmap
+import os
 import threading
+import uuid
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from watchfiles import Change, watch
 
+from x_ipe.core.gitignore import GITIGNORE_FILE, GitignoreMatcher
 from x_ipe.tracing import x_ipe_tracing
 
 
@@ -28,6 +38,7 @@ class FileNode:
     path: str
     children: Optional[List['FileNode']] = None
     mtime: Optional[float] = None  # Modification time for files (FEATURE-009 bug fix)
+    child_count: Optional[int] = None  # Lazy listings: folder children not included
 
     def to_dict(self) -> Dict:
         result = {
@@ -39,9 +50,55 @@ class FileNode:
             result['children'] = [c.to_dict() for c in self.children]
         if self.mtime is not None:
             result['mtime'] = self.mtime
+        if self.child_count is not None:
+            result['child_count'] = self.child_count
         return result
 
 
+def _node_sort_key(node: FileNode) -> Tuple[bool, str, str]:
+    """Folders first, then case-insensitive name; exact name breaks ties."""
+    return (node.type == 'file', node.name.lower(), node.name)
+
+
+def encode_cursor(node: FileNode) -> str:
+    """Opaque keyset cursor pointing just after `node`."""
+    raw = json.dumps([node.type == 'file', node.name], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[bool, str, str]:
+    """
+    Decode a cursor produced by encode_cursor into a sort key.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        is_file, name = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(is_file, bool) or not isinstance(name, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return (is_file, name.lower(), name)
+
+
+def paginate_nodes(nodes: List[FileNode], cursor: Optional[str], limit: int) -> Tuple[List[FileNode], Optional[str]]:
+    """
+    Return one page of nodes after `cursor` plus the cursor of the next page.
+
+    Keyset pagination keeps pages stable when entries are added or removed
+    between requests.
+    """
+    ordered = sorted(nodes, key=_node_sort_key)
+    start = 0
+    if cursor:
+        after = decode_cursor(cursor)
+        start = bisect.bisect_right(ordered, after, key=_node_sort_key)
+    page = ordered[start:start + limit]
+    has_more = start + limit < len(ordered)
+    return page, encode_cursor(page[-1]) if has_more and page else None
+
+
 @dataclass
 class Section:
     """Represents a top-level section in the sidebar"""
@@ -119,6 +176,10 @@ class ProjectService:
         '.py', '.js', '.ts', '.html', '.css', '.jsx', '.tsx'  # Code
     }
 
+    # Lazy listing page sizes
+    DEFAULT_PAGE_SIZE = 200
+    MAX_PAGE_SIZE = 1000
+
     def __init__(self, project_root: str, sections: Optional[List[Dict]] = None):
         """
         Initialize ProjectService.
@@ -138,33 +199,157 @@ class ProjectService:
         Returns:
             Dict with 'project_root' and 'sections' containing the tree structure
         """
-        sections = []
+        return {
+            'project_root': str(self.project_root),
+            'sections': [section.to_dict() for section in self.build_sections()]
+        }
+
+    def build_sections(self) -> List[Section]:
+        """
+        Scan every configured section into Section objects.
         
-        for section_config in self.sections_config:
-            section_path = self.project_root / section_config['path']
+        Returns:
+            List of Section objects in configuration order
+        """
+        return [self.build_section(section_config) for section_config in self.sections_config]
+
+    def build_section(self, section_config: Dict) -> Section:
+        """
+        Scan a single configured section.
+        
+        Args:
+            section_config: Section configuration dict (id, label, path, icon)
             
-            if section_path.exists() and section_path.is_dir():
-                children = self._scan_directory(section_path, section_config['path'])
-                exists = True
-            else:
-                children = []
-                exists = False
+        Returns:
+            Section with its scanned children
+        """
+        section_path = self.project_root / section_config['path']
+        
+        if section_path.exists() and section_path.is_dir():
+            children = self._scan_directory(section_path, section_config['path'])
+            exists = True
+        else:
+            children = []
+            exists = False
+        
+        return Section(
+            id=section_config['id'],
+            label=section_config['label'],
+            path=section_config['path'],
+            icon=section_config['icon'],
+            children=children,
+            exists=exists
+        )
+
+    @x_ipe_tracing(level="INFO")
+    def get_lazy_structure(self, limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Get the sections with only their first directory level.
+        
+        Args:
+            limit: Maximum children returned per section
             
-            section = Section(
-                id=section_config['id'],
-                label=section_config['label'],
-                path=section_config['path'],
-                icon=section_config['icon'],
-                children=children,
-                exists=exists
-            )
-            sections.append(section.to_dict())
+        Returns:
+            Dict with 'project_root', 'mode' and 'sections'; folder nodes carry
+            'child_count' instead of 'children', sections carry 'child_count'
+            and 'next_cursor'
+        """
+        return build_lazy_structure(self, self.list_directory, limit)
+
+    @x_ipe_tracing(level="INFO")
+    def list_directory(self, relative_path: str, cursor: Optional[str] = None,
+                       limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        List a single directory level of a section, one page at a time.
         
+        Args:
+            relative_path: Section path or a folder inside a section
+            cursor: Cursor returned by the previous page, if any
+            limit: Maximum number of entries in this page
+            
+        Returns:
+            Dict with 'path', 'children', 'child_count' and 'next_cursor'
+            
+        Raises:
+            FileNotFoundError: If the directory doesn't exist
+            PermissionError: If the path is outside the configured sections
+            ValueError: If the cursor is malformed
+        """
+        relative_path = self.resolve_listing_path(relative_path)
+        directory = self.project_root / relative_path
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Directory not found: {relative_path}")
+        
+        nodes = self._list_level(directory, relative_path)
+        page, next_cursor = paginate_nodes(nodes, cursor, limit)
         return {
-            'project_root': str(self.project_root),
-            'sections': sections
+            'path': relative_path,
+            'children': [node.to_dict() for node in page],
+            'child_count': len(nodes),
+            'next_cursor': next_cursor
         }
 
+    def resolve_listing_path(self, relative_path: str) -> str:
+        """
+        Normalize a lazy listing path and check it lies inside a section.
+        
+        Raises:
+            PermissionError: If the path escapes the configured sections
+        """
+        parts = [p for p in (relative_path or '').replace('\\', '/').split('/') if p and p != '.']
+        if any(p == '..' or p.startswith('.') for p in parts):
+            raise PermissionError("Access denied: invalid path")
+        normalized = '/'.join(parts)
+        for section_config in self.sections_config:
+            section_path = section_config['path']
+            if normalized == section_path or normalized.startswith(section_path + '/'):
+                return normalized
+        raise PermissionError("Access denied: path outside project sections")
+
+    def _list_level(self, directory: Path, relative_base: str) -> List[FileNode]:
+        """Scan one directory level; folders get a child count instead of children."""
+        items = []
+        try:
+            entries = list(os.scandir(directory))
+        except (PermissionError, FileNotFoundError):
+            return items
+        
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            relative_path = f"{relative_base}/{entry.name}"
+            if entry.is_dir():
+                items.append(FileNode(
+                    name=entry.name,
+                    type='folder',
+                    path=relative_path,
+                    child_count=self._count_children(entry.path)
+                ))
+            elif entry.is_file() and Path(entry.name).suffix.lower() in self.SUPPORTED_EXTENSIONS:
+                items.append(FileNode(
+                    name=entry.name,
+                    type='file',
+                    path=relative_path,
+                    mtime=entry.stat().st_mtime
+                ))
+        return items
+
+    def _count_children(self, directory: str) -> int:
+        """Count the entries a folder would show in the sidebar."""
+        count = 0
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        count += 1
+                    elif entry.is_file() and Path(entry.name).suffix.lower() in self.SUPPORTED_EXTENSIONS:
+                        count += 1
+        except (PermissionError, FileNotFoundError):
+            pass
+        return count
+
     @x_ipe_tracing(level="DEBUG")
     def _scan_directory(self, directory: Path, relative_base: str) -> List[FileNode]:
         """
@@ -216,14 +401,427 @@ class ProjectService:
         return items
 
 
+def build_lazy_structure(service: ProjectService, list_directory, limit: int) -> Dict[str, Any]:
+    """Assemble the lazy structure response from a list_directory implementation."""
+    sections = []
+    for section_config in service.sections_config:
+        section_path = service.project_root / section_config['path']
+        exists = section_path.is_dir()
+        if exists:
+            page = list_directory(section_config['path'], limit=limit)
+        else:
+            page = {'children': [], 'child_count': 0, 'next_cursor': None}
+        sections.append({
+            'id': section_config['id'],
+            'label': section_config['label'],
+            'path': section_config['path'],
+            'icon': section_config['icon'],
+            'children': page['children'],
+            'child_count': page['child_count'],
+            'next_cursor': page['next_cursor'],
+            'exists': exists
+        })
+    return {
+        'project_root': str(service.project_root),
+        'mode': 'lazy',
+        'sections': sections
+    }
+
+
+class ProjectStructureCache:
+    """
+    In-memory project structure for the sidebar.
+
+    The tree is scanned once on first access and then patched incrementally
+    from FileWatcher events instead of re-walking every section per request.
+    Each change bumps a generation counter exposed as an ETag so unchanged
+    structures can be answered with 304 Not Modified. The generation doubles
+    as the sequence number of the per-batch delta messages pushed to clients.
+    """
+
+    # Number of recent delta messages kept for clients that missed a sequence
+    DELTA_HISTORY = 256
+
+    def __init__(self, project_root: str, sections: Optional[List[Dict]] = None):
+        """
+        Initialize ProjectStructureCache.
+
+        Args:
+            project_root: Absolute path to the project root directory
+            sections: Optional custom section configuration
+        """
+        self._service = ProjectService(project_root, sections)
+        self.project_root = self._service.project_root
+        self._lock = threading.RLock()
+        self._sections: Optional[List[Section]] = None
+        self._payload: Optional[Dict[str, Any]] = None
+        self._generation = 0
+        self._history: deque = deque(maxlen=self.DELTA_HISTORY)
+        # Distinguishes generations of different processes/caches in ETags
+        self._instance_id = uuid.uuid4().hex[:8]
+
+    @property
+    def generation(self) -> int:
+        """Monotonic counter bumped on every structural or mtime change."""
+        return self._generation
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag value (unquoted) for the current generation."""
+        return self.etag_for(self._generation)
+
+    def etag_for(self, generation: int) -> str:
+        """Strong ETag value (unquoted) for a given generation."""
+        return f"{self._instance_id}-{generation}"
+
+    @x_ipe_tracing(level="INFO")
+    def get_structure(self) -> Dict[str, Any]:
+        """
+        Get the project structure, scanning only on first access.
+
+        Returns:
+            Same shape as ProjectService.get_structure(). The dict is shared
+            between callers until the next change and must not be mutated.
+        """
+        return self.snapshot()[0]
+
+    def snapshot(self) -> Tuple[Dict[str, Any], int]:
+        """
+        Get the structure together with the generation it reflects.
+
+        Returns:
+            Tuple of (structure dict, generation)
+        """
+        with self._lock:
+            if self._sections is None:
+                self._sections = self._service.build_sections()
+                self._generation += 1
+            if self._payload is None:
+                self._payload = {
+                    'project_root': str(self.project_root),
+                    'sections': [section.to_dict() for section in self._sections]
+                }
+            return self._payload, self._generation
+
+    @x_ipe_tracing(level="INFO")
+    def get_lazy_structure(self, limit: int = ProjectService.DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """Lazy structure (see ProjectService.get_lazy_structure) served from memory."""
+        return build_lazy_structure(self._service, self.list_directory, limit)
+
+    @x_ipe_tracing(level="INFO")
+    def list_directory(self, relative_path: str, cursor: Optional[str] = None,
+                       limit: int = ProjectService.DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """One page of a directory level (see ProjectService.list_directory) served from memory."""
+        relative_path = self._service.resolve_listing_path(relative_path)
+        self.snapshot()  # Ensure the tree is built
+        with self._lock:
+            nodes = self._find_folder_children(relative_path)
+            if nodes is None:
+                raise FileNotFoundError(f"Directory not found: {relative_path}")
+            page, next_cursor = paginate_nodes(nodes, cursor, limit)
+            children = [
+                FileNode(name=n.name, type=n.type, path=n.path, mtime=n.mtime,
+                         child_count=len(n.children) if n.type == 'folder' else None).to_dict()
+                for n in page
+            ]
+            return {
+                'path': relative_path,
+                'children': children,
+                'child_count': len(nodes),
+                'next_cursor': next_cursor
+            }
+
+    def _find_folder_children(self, relative_path: str) -> Optional[List[FileNode]]:
+        """Children of a section or folder in the cached tree, or None if absent."""
+        for section in self._sections:
+            if relative_path == section.path:
+                return section.children if section.exists else None
+            if relative_path.startswith(section.path + '/'):
+                children = section.children
+                for part in relative_path[len(section.path) + 1:].split('/'):
+                    folder = self._find_child(children, part)
+                    if folder is None or folder.type != 'folder':
+                        return None
+                    children = folder.children
+                return children
+        return None
+
+    def invalidate(self) -> None:
+        """Drop the cached tree so the next access rescans every section."""
+        with self._lock:
+            self._sections = None
+            self._payload = None
+            self._generation += 1
+
+    @x_ipe_tracing(level="DEBUG")
+    def apply_event(self, action: str, path: str) -> bool:
+        """
+        Patch the cached tree for a single file system event.
+
+        Args:
+            action: 'created', 'modified' or 'deleted'
+            path: Absolute (or project-relative) path of the changed entry
+
+        Returns:
+            True if the cached structure changed
+        """
+        return self.apply_events([(action, path)]) is not None
+
+    @x_ipe_tracing(level="DEBUG")
+    def apply_events(self, events: List[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+        """
+        Patch the cached tree for a batch of file system events.
+
+        Args:
+            events: List of (action, path) tuples as produced by FileWatcher
+
+        Returns:
+            Delta message {'seq', 'base_seq', 'deltas'} or None if nothing changed.
+            Each delta is one of:
+            - {'op': 'add', 'path', 'node'}
+            - {'op': 'remove', 'path'}
+            - {'op': 'rename', 'from', 'to', 'node'}
+            - {'op': 'mtime', 'path', 'mtime'}
+            - {'op': 'section', 'section'} (whole section rescanned)
+        """
+        with self._lock:
+            if self._sections is None:
+                return None  # Not built yet; the first scan will see the changes
+
+            changes: List[Tuple[str, str, Any]] = []
+            for action, path in events:
+                rel_path = self._to_relative(path)
+                if rel_path is not None:
+                    changes.extend(self._apply(action, rel_path))
+            if not changes:
+                return None
+
+            base_seq = self._generation
+            self._payload = None
+            self._generation += 1
+            message = {
+                'seq': self._generation,
+                'base_seq': base_seq,
+                'deltas': self._to_deltas(changes),
+            }
+            self._history.append(message)
+            return message
+
+    def deltas_since(self, seq: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the delta messages a client at sequence `seq` missed.
+
+        Args:
+            seq: Last sequence number the client applied
+
+        Returns:
+            Ordered list of delta messages (empty if up to date), or None if
+            the history no longer covers `seq` and a full resync is needed.
+        """
+        with self._lock:
+            if seq == self._generation:
+                return []
+            missed = []
+            expected = seq
+            for message in self._history:
+                if message['seq'] <= seq:
+                    continue
+                if message['base_seq'] != expected:
+                    return None
+                missed.append(message)
+                expected = message['seq']
+            if expected != self._generation:
+                return None
+            return missed
+
+    def _to_relative(self, path: str) -> Optional[str]:
+        """Convert an event path to a POSIX path relative to the project root."""
+        path_obj = Path(path)
+        if not path_obj.is_absolute():
+            return path_obj.as_posix().strip('/') or None
+        try:
+            return path_obj.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def _apply(self, action: str, rel_path: str) -> List[Tuple[str, str, Any]]:
+        """Apply one event; returns raw (op, path, payload) changes."""
+        changes = []
+        for index, section in enumerate(self._sections):
+            in_section = rel_path.startswith(section.path + '/')
+            # Rescan when the section root (or an ancestor) changed, or it just appeared
+            if rel_path == section.path or section.path.startswith(rel_path + '/') or (
+                in_section and not section.exists
+            ):
+                section = self._service.build_section(self._service.sections_config[index])
+                self._sections[index] = section
+                changes.append(('section', section.path, section))
+            elif in_section:
+                changes.extend(self._patch_section(section, action, rel_path))
+        return changes
+
+    def _patch_section(self, section: Section, action: str, rel_path: str) -> List[Tuple[str, str, Any]]:
+        """Apply a created/modified/deleted event inside an existing section."""
+        parts = rel_path[len(section.path) + 1:].split('/')
+        # Hidden entries are never part of the tree
+        if any(part.startswith('.') for part in parts):
+            return []
+
+        full_path = self.project_root / rel_path
+        if action == 'deleted' or not full_path.exists():
+            return self._remove_node(section, parts)
+
+        # Walk down to the parent folder; a missing folder is scanned whole
+        # so files that arrived with it (e.g. a renamed directory) come along
+        children = section.children
+        current_path = section.path
+        folder_parts = parts if full_path.is_dir() else parts[:-1]
+        for part in folder_parts:
+            current_path = f"{current_path}/{part}"
+            folder = self._find_child(children, part)
+            if folder is None or folder.type != 'folder':
+                changes = []
+                if folder is not None:
+                    children.remove(folder)
+                    changes.append(('remove', folder.path, folder))
+                folder = FileNode(
+                    name=part,
+                    type='folder',
+                    path=current_path,
+                    children=self._service._scan_directory(self.project_root / current_path, current_path)
+                )
+                self._insert_child(children, folder)
+                changes.append(('add', folder.path, folder))
+                return changes
+            children = folder.children
+
+        if full_path.is_dir():
+            return []
+
+        name = parts[-1]
+        if full_path.suffix.lower() not in ProjectService.SUPPORTED_EXTENSIONS:
+            return []
+
+        try:
+            mtime = full_path.stat().st_mtime
+        except OSError:
+            return self._remove_node(section, parts)
+
+        node = self._find_child(children, name)
+        if node is not None and node.type == 'file':
+            if node.mtime == mtime:
+                return []
+            node.mtime = mtime
+            return [('mtime', node.path, mtime)]
+
+        changes = []
+        if node is not None:
+            children.remove(node)
+            changes.append(('remove', node.path, node))
+        node = FileNode(name=name, type='file', path=f"{current_path}/{name}", mtime=mtime)
+        self._insert_child(children, node)
+        changes.append(('add', node.path, node))
+        return changes
+
+    def _remove_node(self, section: Section, parts: List[str]) -> List[Tuple[str, str, Any]]:
+        """Remove a node and prune ancestor folders that no longer exist on disk."""
+        lineage = [(None, section.children)]
+        children = section.children
+        for part in parts[:-1]:
+            folder = self._find_child(children, part)
+            if folder is None or folder.type != 'folder':
+                return []
+            lineage.append((folder, folder.children))
+            children = folder.children
+
+        node = self._find_child(children, parts[-1])
+        if node is None:
+            return []
+        children.remove(node)
+
+        # Walk up removing folders whose directory vanished with the node
+        for depth in range(len(lineage) - 1, 0, -1):
+            folder, _ = lineage[depth]
+            if (self.project_root / folder.path).is_dir():
+                break
+            lineage[depth - 1][1].remove(folder)
+            node = folder
+        return [('remove', node.path, node)]
+
+    def _to_deltas(self, changes: List[Tuple[str, str, Any]]) -> List[Dict[str, Any]]:
+        """Serialize raw changes, folding matching remove/add pairs into renames."""
+        removed = {path: node for op, path, node in changes if op == 'remove'}
+        renamed_from: Dict[str, str] = {}
+        for op, path, node in changes:
+            if op != 'add':
+                continue
+            for old_path, old_node in removed.items():
+                if old_path != path and self._same_content(old_node, node):
+                    renamed_from[path] = old_path
+                    del removed[old_path]
+                    break
+
+        consumed = set(renamed_from.values())
+        deltas = []
+        for op, path, payload in changes:
+            if op == 'remove':
+                if path not in consumed:
+                    deltas.append({'op': 'remove', 'path': path})
+            elif op == 'add':
+                if path in renamed_from:
+                    deltas.append({'op': 'rename', 'from': renamed_from[path], 'to': path,
+                                   'node': payload.to_dict()})
+                else:
+                    deltas.append({'op': 'add', 'path': path, 'node': payload.to_dict()})
+            elif op == 'mtime':
+                deltas.append({'op': 'mtime', 'path': path, 'mtime': payload})
+            else:
+                deltas.append({'op': 'section', 'section': payload.to_dict()})
+        return deltas
+
+    @classmethod
+    def _same_content(cls, old: FileNode, new: FileNode) -> bool:
+        """Whether two nodes look like the same entry under a different path."""
+        if old.type != new.type:
+            return False
+        if old.type == 'file':
+            return old.mtime == new.mtime
+        if len(old.children) != len(new.children):
+            return False
+        return all(
+            a.name == b.name and cls._same_content(a, b)
+            for a, b in zip(old.children, new.children)
+        )
+
+    @staticmethod
+    def _find_child(children: List[FileNode], name: str) -> Optional[FileNode]:
+        for child in children:
+            if child.name == name:
+                return child
+        return None
+
+    @staticmethod
+    def _insert_child(children: List[FileNode], node: FileNode) -> None:
+        """Insert keeping the folders-first, case-insensitive order of _scan_directory."""
+        sort_key = lambda n: (n.type == 'file', n.name.lower())
+        index = bisect.bisect_right(children, sort_key(node), key=sort_key)
+        children.insert(index, node)
+
+
 class FileWatcherHandler:
     """Handler for file system events with debouncing and gitignore support"""
 
-    def __init__(self, callback, debounce_seconds: float = 0.1, ignore_patterns: List[str] = None, project_root: str = None):
+    def __init__(self, callback, debounce_seconds: float = 0.1, ignore_patterns: List[str] = None, project_root: str = None,
+                 batch_callback=None):
         self.callback = callback
+        # Optional: receives each debounced batch as a list instead of per-event calls
+        self.batch_callback = batch_callback
         self.debounce_seconds = debounce_seconds
         self.ignore_patterns = ignore_patterns or []
         self.project_root = Path(project_root) if project_root else None
+        # Root patterns come from the caller, or the root .gitignore when none are
+        # given; nested .gitignore files are read on demand
+        self._matcher = GitignoreMatcher(project_root, root_patterns=self.ignore_patterns or None)
         self._pending_events: Dict[str, Dict] = {}
         self._lock = threading.Lock()
         self._timer: Optional[threading.Timer] = None
@@ -234,45 +832,12 @@ class FileWatcherHandler:
         if not self.project_root or not self.project_root.exists():
             return set()
 
-        known_files: set[str] = set()
-        for path in self.project_root.rglob('*'):
-            if path.is_file():
-                path_str = str(path)
-                if not self._should_ignore(path_str):
-                    known_files.add(path_str)
-        return known_files
+        # Ignored directories (node_modules, .venv, ...) are pruned, never walked
+        return {str(path) for path in self._matcher.walk_files()}
 
     def _should_ignore(self, path: str) -> bool:
-        """Check if path matches any gitignore pattern."""
-        if not self.ignore_patterns:
-            return False
-        
-        # Get relative path from project root
-        try:
-            if self.project_root:
-                rel_path = Path(path).relative_to(self.project_root)
-            else:
-                rel_path = Path(path)
-        except ValueError:
-            rel_path = Path(path)
-        
-        path_str = str(rel_path)
-        path_parts = rel_path.parts
-        
-        for pattern in self.ignore_patterns:
-            # Strip trailing slash for directory patterns
-            clean_pattern = pattern.rstrip('/')
-            
-            # Check if any part of the path matches the pattern
-            for part in path_parts:
-                if part == clean_pattern:
-                    return True
-            
-            # Also check if path starts with the pattern
-            if path_str.startswith(clean_pattern + '/') or path_str == clean_pattern:
-                return True
-        
-        return False
+        """Check if path is ignored by the project's .gitignore files."""
+        return self._matcher.is_ignored(path)
 
     def _schedule_callback(self):
         """Schedule debounced callback"""
@@ -288,6 +853,11 @@ class FileWatcherHandler:
             events = list(self._pending_events.values())
             self._pending_events.clear()
         
+        if self.batch_callback is not None:
+            if events:
+                self.batch_callback(events)
+            return
+
         for event in events:
             self.callback(event)
 
@@ -314,13 +884,25 @@ class FileWatcherHandler:
         for path, change_set in grouped_changes.items():
             path_obj = Path(path)
 
+            if path_obj.name == GITIGNORE_FILE:
+                self._matcher.reload(path)
+
             if Change.deleted in change_set:
                 if path in self._known_files or Change.modified in change_set:
                     self._known_files.discard(path)
                     self._add_event('deleted', path)
+                else:
+                    # A removed/renamed directory only reports its own path
+                    prefix = path.rstrip('/') + '/'
+                    nested = [known for known in self._known_files if known.startswith(prefix)]
+                    if nested:
+                        self._known_files.difference_update(nested)
+                        self._add_event('deleted', path)
                 continue
 
             if path_obj.exists() and path_obj.is_dir():
+                if Change.added in change_set:
+                    self._add_directory_files(path_obj)
                 continue
 
             if Change.modified in change_set:
@@ -333,6 +915,17 @@ class FileWatcherHandler:
                 self._known_files.add(path)
                 self._add_event(event_type, path)
 
+    def _add_directory_files(self, directory: Path) -> None:
+        """Report files of a directory that appeared in one piece (e.g. a rename target)."""
+        if self._should_ignore(str(directory)):
+            return
+        for file_path in self._matcher.walk_files(directory):
+            path_str = str(file_path)
+            if path_str in self._known_files:
+                continue
+            self._known_files.add(path_str)
+            self._add_event('created', path_str)
+
     def on_created(self, event: Any):
         if not event.is_directory:
             self._add_event('created', event.src_path)
@@ -359,7 +952,9 @@ class FileWatcher:
     Respects .gitignore patterns to avoid monitoring ignored directories.
     """
 
-    def __init__(self, project_root: str, socketio=None, debounce_seconds: float = 0.1):
+    def __init__(self, project_root: str, socketio=None, debounce_seconds: float = 0.1,
+                 structure_cache: Optional[ProjectStructureCache] = None,
+                 change_listeners: Optional[List[Callable[[List[str]], None]]] = None):
         """
         Initialize FileWatcher.
         
@@ -367,14 +962,19 @@ class FileWatcher:
             project_root: Absolute path to the project root directory
             socketio: Flask-SocketIO instance for emitting events
             debounce_seconds: Debounce time for rapid file changes
+            structure_cache: Optional ProjectStructureCache patched on every event
+            change_listeners: Optional callables given the absolute paths of each batch
         """
         self.project_root = Path(project_root).resolve()
         self.socketio = socketio
+        self.structure_cache = structure_cache
+        self.change_listeners = list(change_listeners or [])
         self.debounce_seconds = debounce_seconds
         self.observer: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._ready_event = threading.Event()
         self._running = False
+        self.error: Optional[BaseException] = None  # Why the watch loop stopped, if it failed
         self.ignore_patterns = self._load_gitignore()
 
     @x_ipe_tracing(level="DEBUG")
@@ -396,6 +996,38 @@ class FileWatcher:
         
         return patterns
 
+    @x_ipe_tracing(level="DEBUG")
+    def _emit_events(self, events: List[Dict]):
+        """
+        Apply a debounced batch to the structure cache and emit it.
+
+        Pushes one 'structure_delta' message per batch (when a structure cache
+        is attached) so clients patch their tree instead of refetching it.
+        The per-file structure_changed/content_changed events are emitted
+        only for batches no delta message covered, so clients are not
+        notified twice.
+        """
+        delta = None
+        if self.structure_cache is not None:
+            delta = self.structure_cache.apply_events(
+                [(event.get('action', 'modified'), event['path']) for event in events]
+            )
+            if delta and self.socketio:
+                self.socketio.emit('structure_delta', delta)
+
+        if self.change_listeners:
+            paths = [event['path'] for event in events]
+            for listener in self.change_listeners:
+                try:
+                    listener(paths)
+                except Exception:
+                    pass  # A failing listener must not stop event delivery
+
+        if delta and self.socketio:
+            return
+        for event_data in events:
+            self._emit_event(event_data)
+
     @x_ipe_tracing(level="DEBUG")
     def _emit_event(self, event_data: Dict):
         """Emit file system event via WebSocket"""
@@ -421,12 +1053,19 @@ class FileWatcher:
 
     @x_ipe_tracing(level="INFO")
     def start(self):
-        """Start watching project directories"""
+        """
+        Start watching project directories.
+
+        Raises:
+            RuntimeError: If the watch loop failed while starting (e.g. the
+                OS file watch limit was reached)
+        """
         if self._running:
             return
 
         self._stop_event = threading.Event()
         self._ready_event = threading.Event()
+        self.error = None
         self.observer = threading.Thread(
             target=self._watch_loop,
             name="x-ipe-file-watcher",
@@ -435,6 +1074,9 @@ class FileWatcher:
         self.observer.start()
         self._running = True
         self._ready_event.wait(timeout=max(0.2, self.debounce_seconds * 4))
+        if self.error is not None:
+            self.stop()
+            raise RuntimeError(f"File watcher failed to start: {self.error}")
 
     @x_ipe_tracing(level="INFO")
     def stop(self):
@@ -447,45 +1089,87 @@ class FileWatcher:
 
     @property
     def is_running(self) -> bool:
-        return self._running
+        """True while the watch loop is alive and delivering events."""
+        return self._running and self.observer is not None and self.observer.is_alive()
 
     def _watch_loop(self) -> None:
-        """Run the watchfiles loop and forward changes through the existing handler."""
+        """Run the watch loop; a failure stops the watcher and drops the structure cache."""
+        try:
+            self._watch_directories()
+        except Exception as e:
+            self.error = e
+            print(f"[FileWatcher] Stopped watching {self.project_root}: {e}")
+            if self.structure_cache is not None:
+                # Nothing patches the cache any more; callers fall back to a full scan
+                self.structure_cache.invalidate()
+        finally:
+            self._ready_event.set()
+
+    def _watch_directories(self) -> None:
+        """
+        Watch every non-ignored directory and forward changes through the handler.
+
+        Directories are registered one by one (non-recursively) so gitignored
+        trees such as node_modules never use OS watches. The watch is
+        re-registered when directories are added or a .gitignore changes.
+        """
         handler = FileWatcherHandler(
             self._emit_event,
             self.debounce_seconds,
             ignore_patterns=self.ignore_patterns,
-            project_root=str(self.project_root)
+            project_root=str(self.project_root),
+            batch_callback=self._emit_events
         )
         debounce_ms = max(10, int(self.debounce_seconds * 1000))
         step_ms = max(10, min(debounce_ms, 50))
+        new_dirs: List[Path] = []
 
-        for changes in watch(
-            str(self.project_root),
-            stop_event=self._stop_event,
-            debounce=debounce_ms,
-            step=step_ms,
-            rust_timeout=100,
-            recursive=True,
-            yield_on_timeout=True,
-        ):
-            if not self._ready_event.is_set():
-                if not changes:
-                    self._ready_event.set()
-                    continue
-
-                if all(
-                    change == Change.added and
-                    (Path(path).is_dir() or path in handler._known_files)
-                    for change, path in changes
+        while not self._stop_event.is_set():
+            directories = [str(path) for path in handler._matcher.walk_dirs()]
+            try:
+                for changes in watch(
+                    *directories,
+                    stop_event=self._stop_event,
+                    debounce=debounce_ms,
+                    step=step_ms,
+                    rust_timeout=100,
+                    recursive=False,
+                    yield_on_timeout=True,
                 ):
-                    self._ready_event.set()
-                    continue
+                    if new_dirs:
+                        # Files created before the new directories were registered
+                        for directory in new_dirs:
+                            handler._add_directory_files(directory)
+                        new_dirs = []
+
+                    if not self._ready_event.is_set():
+                        if not changes:
+                            self._ready_event.set()
+                            continue
 
-                self._ready_event.set()
+                        if all(
+                            change == Change.added and
+                            (Path(path).is_dir() or path in handler._known_files)
+                            for change, path in changes
+                        ):
+                            self._ready_event.set()
+                            continue
 
-            if changes:
-                handler.handle_changes(changes)
+                        self._ready_event.set()
+
+                    if changes:
+                        handler.handle_changes(changes)
+                        new_dirs = [
+                            Path(path) for change, path in changes
+                            if change == Change.added and Path(path).is_dir()
+                            and not handler._should_ignore(path)
+                        ]
+                        if new_dirs or any(Path(path).name == GITIGNORE_FILE for _, path in changes):
+                            break
+                else:
+                    return  # stop_event was set
+            except FileNotFoundError:
+                continue  # A directory vanished before it was registered; walk again
 
 
 class ContentService:
@@ -519,6 +1203,15 @@ class ContentService:
         '.txt': 'text',
     }
 
+    # Files larger than this are previewed in pages instead of returned whole
+    LARGE_FILE_THRESHOLD = 2 * 1024 * 1024  # 2MB
+
+    # Lines per page for previews and line-range reads
+    PREVIEW_LINES = 2000
+
+    # Upper bound on bytes per page (guards against huge single-line files)
+    MAX_CHUNK_BYTES = 1024 * 1024  # 1MB
+
     def __init__(self, project_root: str):
         """
         Initialize ContentService.
@@ -542,20 +1235,111 @@ class ContentService:
         return self.FILE_TYPES.get(extension.lower(), 'text')
 
     @x_ipe_tracing(level="INFO")
-    def get_content(self, relative_path: str) -> Dict[str, Any]:
+    def get_content(self, relative_path: str, cursor: Optional[int] = None,
+                    start_line: Optional[int] = None, max_lines: Optional[int] = None,
+                    preview: bool = False) -> Dict[str, Any]:
         """
         Get file content with metadata.
         
+        Files are returned whole unless a range is requested. With preview,
+        files larger than LARGE_FILE_THRESHOLD return their first
+        PREVIEW_LINES lines with 'truncated' and a 'next_cursor' to load more.
+        Only viewers may ask for a preview: a client that saves the content
+        back needs the whole file.
+        
         Args:
             relative_path: Path relative to project root
+            cursor: Byte offset to continue from (a previous 'next_cursor')
+            start_line: Lines to skip after the cursor before reading
+            max_lines: Maximum number of lines to return
+            preview: Page large files instead of returning them whole
             
         Returns:
-            Dict with content, path, type, extension, size
+            Dict with content, path, type, extension, size; paged reads add
+            cursor, next_cursor, line_count and truncated
             
         Raises:
             FileNotFoundError: If file doesn't exist
             PermissionError: If path is outside project root
+            ValueError: If a range parameter is negative
         """
+        full_path = self._resolve_readable(relative_path)
+        
+        # Get file info
+        extension = full_path.suffix
+        file_type = self.detect_file_type(extension)
+        size = full_path.stat().st_size
+        
+        ranged = cursor is not None or start_line is not None or max_lines is not None
+        if not ranged and (not preview or size <= self.LARGE_FILE_THRESHOLD):
+            # Read content
+            with open(full_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            return {
+                'path': relative_path,
+                'content': content,
+                'type': file_type,
+                'extension': extension,
+                'size': size
+            }
+        
+        page = self._read_lines(
+            full_path,
+            size,
+            cursor=cursor or 0,
+            start_line=start_line or 0,
+            max_lines=max_lines or self.PREVIEW_LINES
+        )
+        return {
+            'path': relative_path,
+            'type': file_type,
+            'extension': extension,
+            'size': size,
+            **page
+        }
+
+    @x_ipe_tracing(level="INFO")
+    def read_byte_range(self, relative_path: str, offset: int, length: int) -> Dict[str, Any]:
+        """
+        Read a byte range of a file as text.
+        
+        Args:
+            relative_path: Path relative to project root
+            offset: First byte to read
+            length: Number of bytes (capped at MAX_CHUNK_BYTES)
+            
+        Returns:
+            Dict with path, content, offset, length (bytes actually read),
+            next_offset (None at end of file) and size
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If path is outside project root
+            ValueError: If offset or length is negative
+        """
+        if offset < 0 or length < 0:
+            raise ValueError("Byte range must not be negative")
+        full_path = self._resolve_readable(relative_path)
+        size = full_path.stat().st_size
+        length = min(length, self.MAX_CHUNK_BYTES)
+        
+        with open(full_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+        
+        end = offset + len(data)
+        return {
+            'path': relative_path,
+            'content': data.decode('utf-8', errors='replace'),
+            'offset': offset,
+            'length': len(data),
+            'next_offset': end if end < size else None,
+            'size': size
+        }
+
+    def _resolve_readable(self, relative_path: str) -> Path:
+        """Resolve a path for reading, enforcing the project root boundary."""
         # Construct full path
         full_path = (self.project_root / relative_path).resolve()
         
@@ -567,21 +1351,61 @@ class ContentService:
         if not full_path.exists():
             raise FileNotFoundError(f"File not found: {relative_path}")
         
-        # Read content
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return full_path
+
+    def _read_lines(self, full_path: Path, size: int, cursor: int, start_line: int,
+                    max_lines: int) -> Dict[str, Any]:
+        """
+        Read whole lines starting at a byte cursor via a memory map.
         
-        # Get file info
-        extension = full_path.suffix
-        file_type = self.detect_file_type(extension)
-        size = full_path.stat().st_size
+        Only the returned page is copied out of the map, so memory stays
+        bounded by MAX_CHUNK_BYTES regardless of file size.
+        """
+        if cursor < 0 or start_line < 0 or max_lines < 0:
+            raise ValueError("Range parameters must not be negative")
+        
+        cursor = min(cursor, size)
+        data = b''
+        pos = cursor
+        line_count = 0
+        if size:
+            with open(full_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for _ in range(start_line):
+                    newline = mm.find(b'\n', pos)
+                    if newline == -1:
+                        pos = size
+                        break
+                    pos = newline + 1
+                
+                start = pos
+                limit = min(size, start + self.MAX_CHUNK_BYTES)
+                while line_count < max_lines and pos < limit:
+                    newline = mm.find(b'\n', pos, limit)
+                    if newline == -1:
+                        if limit == size:
+                            line_count += 1  # Last line without a trailing newline
+                        pos = limit
+                        break
+                    pos = newline + 1
+                    line_count += 1
+                data = mm[start:pos]
+                cursor = start
+        
+        # A page cut mid-line must not split a multi-byte character
+        if pos < size:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            content = decoder.decode(data, final=False)
+            pos -= len(decoder.getstate()[0])
+        else:
+            content = data.decode('utf-8', errors='replace')
+        content = content.replace('\r\n', '\n')
         
         return {
-            'path': relative_path,
             'content': content,
-            'type': file_type,
-            'extension': extension,
-            'size': size
+            'cursor': cursor,
+            'next_cursor': pos if pos < size else None,
+            'line_count': line_count,
+            'truncated': pos < size or cursor > 0
         }
 
     @x_ipe_tracing(level="DEBUG")
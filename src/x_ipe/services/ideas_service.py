@@ -5,8 +5,10 @@ IdeasService: CRUD operations for idea files and folders
 """
 import copy
 import json
+import os
 import re
 import shutil
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
@@ -16,6 +18,13 @@ import yaml
 from x_ipe.tracing import x_ipe_tracing
 
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Mode requested for uploaded files; the umask applies as it does for open()
+UPLOAD_FILE_MODE = 0o666
+
+
 class IdeasService:
     """
     Service for managing idea files and folders.
@@ -104,7 +113,8 @@ class IdeasService:
         Upload files to a new or existing idea folder.
         
         Args:
-            files: List of (filename, content_bytes) tuples
+            files: List of (filename, content) tuples; content is bytes, str,
+                   or a readable binary file object (streamed to disk in chunks)
             date: Optional datetime string (MMDDYYYY HHMMSS). Uses now if not provided.
             target_folder: Optional existing folder path to upload into (CR-002)
                           Can be relative to project root (e.g., 'x-ipe-docs/ideas/MyFolder/SubFolder')
@@ -150,7 +160,7 @@ class IdeasService:
         uploaded_files = []
         for filename, content in files:
             file_path = folder_path / filename
-            file_path.write_bytes(content if isinstance(content, bytes) else content.encode('utf-8'))
+            self._write_upload(file_path, content)
             uploaded_files.append(filename)
         
         # CR-004: Write .knowledge-reference.yaml if KB references provided
@@ -164,6 +174,26 @@ class IdeasService:
             'files_uploaded': uploaded_files
         }
     
+    @staticmethod
+    def _write_upload(file_path: Path, content) -> None:
+        """Write an uploaded file atomically (temp file in the target folder → rename)."""
+        tmp_path = file_path.parent / f'.{file_path.name}.{uuid.uuid4().hex[:8]}.tmp'
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, UPLOAD_FILE_MODE)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                if isinstance(content, str):
+                    fh.write(content.encode('utf-8'))
+                elif isinstance(content, (bytes, bytearray)):
+                    fh.write(content)
+                else:
+                    shutil.copyfileobj(content, fh, UPLOAD_CHUNK_BYTES)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
     def _write_kb_references(self, folder_path: Path, kb_references: list):
         """CR-004: Write .knowledge-reference.yaml to idea folder."""
         yaml_path = folder_path / '.knowledge-reference.yaml'
@@ -0,0 +1,216 @@
+"""
+FEATURE-049-A: KB Backend & Storage Foundation — Metadata Store
+
+KBMetadataStore: consolidated SQLite store for the entries of every
+folder's .kb-index.json.
+
+The per-folder JSON files stay the export/import format. Each folder row
+keeps the stamp (size and mtime) of the JSON file it was imported from,
+so a file edited outside the service is re-imported on its next lookup.
+Entries are keyed by (folder, name) and their type, author and tags are
+indexed, so queries over the whole KB do not walk the folder tree.
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TAG_TYPES = ('lifecycle', 'domain')
+
+
+class KBMetadataStore:
+    """
+    Metadata entries of all KB folders in a single SQLite database file.
+
+    Usage:
+        store = KBMetadataStore(kb_root / '.kb-meta.db')
+        store.replace_folder('guides', '1.0', {'api.md': {...}}, stamp)
+        stamp, version, entries = store.lookup('guides')
+        rows = store.query(tag='api', tag_type='domain')
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._ready = False
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self.db_path.exists():
+            self._ready = False  # first use, or the file was deleted
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        # Keep the rollback journal between transactions: creating and deleting
+        # it would change the KB root's mtime and force a full tree rescan
+        conn.execute('PRAGMA journal_mode=PERSIST')
+        if not self._ready:
+            self._ensure_schema(conn)
+            self._ready = True
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS folders (
+                folder TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                stamp TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                folder TEXT NOT NULL,
+                name TEXT NOT NULL,
+                type TEXT,
+                author TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (folder, name)
+            );
+            CREATE INDEX IF NOT EXISTS entries_type ON entries (type);
+            CREATE INDEX IF NOT EXISTS entries_author ON entries (author);
+            CREATE TABLE IF NOT EXISTS entry_tags (
+                folder TEXT NOT NULL,
+                name TEXT NOT NULL,
+                tag_type TEXT NOT NULL,
+                tag TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entry_tags_tag ON entry_tags (tag, tag_type);
+            CREATE INDEX IF NOT EXISTS entry_tags_entry ON entry_tags (folder, name);
+        ''')
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def lookup(self, folder: str, name: Optional[str] = None
+               ) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """Return (stamp, version, entries) for *folder*, or ``None`` if it was never imported.
+
+        With *name*, ``entries`` holds at most that one entry.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT stamp, version FROM folders WHERE folder = ?', (folder,)).fetchone()
+            if row is None:
+                return None
+            if name is None:
+                rows = conn.execute('SELECT name, data FROM entries WHERE folder = ?', (folder,))
+            else:
+                rows = conn.execute('SELECT name, data FROM entries WHERE folder = ? AND name = ?',
+                                    (folder, name))
+            return row[0], row[1], {entry_name: json.loads(data) for entry_name, data in rows}
+        finally:
+            conn.close()
+
+    def query(self, tag: str = '', tag_type: str = '', entry_type: str = '',
+              author: str = '') -> List[Tuple[str, str, Any]]:
+        """Return (folder, name, entry) for entries matching every given filter."""
+        clauses: List[str] = []
+        params: List[str] = []
+        if tag:
+            sub = ('SELECT 1 FROM entry_tags t WHERE t.folder = entries.folder '
+                   'AND t.name = entries.name AND t.tag = ?')
+            params.append(tag)
+            if tag_type:
+                sub += ' AND t.tag_type = ?'
+                params.append(tag_type)
+            clauses.append(f'EXISTS ({sub})')
+        if entry_type:
+            clauses.append('type = ?')
+            params.append(entry_type)
+        if author:
+            clauses.append('author = ?')
+            params.append(author)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        conn = self._connect()
+        try:
+            rows = conn.execute(f'SELECT folder, name, data FROM entries{where} ORDER BY folder, name', params)
+            return [(folder, name, json.loads(data)) for folder, name, data in rows]
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def replace_folder(self, folder: str, version: str, entries: Dict[str, Any], stamp: str) -> None:
+        """Replace every entry of *folder* (an import or export of its JSON file)."""
+        self.replace_folders([(folder, version, entries, stamp)])
+
+    def replace_folders(self, folders: Iterable[Tuple[str, str, Dict[str, Any], str]]) -> None:
+        """Replace the entries of several folders in one transaction."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                for folder, version, entries, stamp in folders:
+                    self._delete_folder(conn, folder)
+                    conn.execute('INSERT INTO folders (folder, version, stamp) VALUES (?, ?, ?)',
+                                 (folder, str(version), stamp))
+                    conn.executemany(
+                        'INSERT INTO entries (folder, name, type, author, data) VALUES (?, ?, ?, ?, ?)',
+                        [(folder, name, *self._entry_columns(entry), json.dumps(entry, ensure_ascii=False))
+                         for name, entry in entries.items()],
+                    )
+                    conn.executemany(
+                        'INSERT INTO entry_tags (folder, name, tag_type, tag) VALUES (?, ?, ?, ?)',
+                        [(folder, name, tag_type, tag)
+                         for name, entry in entries.items()
+                         for tag_type, tag in self._entry_tags(entry)],
+                    )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def remove_prefix(self, folder: str) -> None:
+        """Drop *folder* and every folder below it."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                for table in ('folders', 'entries', 'entry_tags'):
+                    conn.execute(f'DELETE FROM {table} WHERE folder = ? OR substr(folder, 1, ?) = ?',
+                                 (folder, len(folder) + 1, folder + '/'))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def retain(self, folders: Iterable[str]) -> None:
+        """Drop every folder not in *folders* (e.g. deleted outside the service)."""
+        keep = set(folders)
+        with self._lock:
+            conn = self._connect()
+            try:
+                for (folder,) in conn.execute('SELECT folder FROM folders').fetchall():
+                    if folder not in keep:
+                        self._delete_folder(conn, folder)
+                conn.commit()
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _delete_folder(conn: sqlite3.Connection, folder: str) -> None:
+        for table in ('folders', 'entries', 'entry_tags'):
+            conn.execute(f'DELETE FROM {table} WHERE folder = ?', (folder,))
+
+    @staticmethod
+    def _entry_columns(entry: Any) -> Tuple[Optional[str], Optional[str]]:
+        if not isinstance(entry, dict):
+            return None, None
+        entry_type, author = entry.get('type'), entry.get('author')
+        return (entry_type if isinstance(entry_type, str) else None,
+                author if isinstance(author, str) else None)
+
+    @staticmethod
+    def _entry_tags(entry: Any) -> List[Tuple[str, str]]:
+        tags = entry.get('tags') if isinstance(entry, dict) else None
+        if not isinstance(tags, dict):
+            return []
+        pairs = []
+        for tag_type in TAG_TYPES:
+            values = tags.get(tag_type) or []
+            if isinstance(values, str):
+                values = [values]
+            if isinstance(values, list):
+                pairs.extend((tag_type, tag) for tag in dict.fromkeys(values) if isinstance(tag, str))
+        return pairs
@@ -0,0 +1,223 @@
+"""
+FEATURE-049-A: KB Backend & Storage Foundation — Search Index
+
+KBSearchIndex: persistent SQLite FTS5 full-text index over KB documents.
+
+Each document row stores a stamp (size, mtime and metadata fingerprint) so
+the index can be reconciled with files changed outside the service by
+re-reading only the documents whose stamp differs. Ranking is BM25 with
+titles and filenames weighted above body text.
+"""
+import html
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Control characters never appear in indexed text, so they make safe
+# highlight markers that are swapped for <mark> after HTML-escaping.
+_HL_START = '\x02'
+_HL_END = '\x03'
+
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# BM25 column weights: name, title, description, tags, author, body
+_BM25_WEIGHTS = (5.0, 10.0, 3.0, 4.0, 2.0, 1.0)
+
+FIELDS = ('name', 'title', 'description', 'tags', 'author', 'body')
+
+
+def fts5_available() -> bool:
+    """Return True if the sqlite3 build supports FTS5."""
+    try:
+        conn = sqlite3.connect(':memory:')
+        try:
+            conn.execute('CREATE VIRTUAL TABLE t USING fts5(x)')
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 query: every term must match as a prefix."""
+    terms = _TERM_PATTERN.findall(query.lower())
+    if not terms:
+        return None
+    return ' AND '.join(f'"{term}"*' for term in terms)
+
+
+class KBSearchIndex:
+    """
+    Full-text index stored in a single SQLite database file.
+
+    Usage:
+        index = KBSearchIndex(kb_root / '.kb-search.db')
+        index.upsert('guides/api.md', stamp, {'title': 'API Guide', 'body': '...'})
+        paths = index.search('api guide')
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._ready = False
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self.db_path.exists():
+            self._ready = False  # first use, or the file was deleted
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        # Keep the rollback journal between transactions: creating and deleting
+        # it would change the KB root's mtime and force a full tree rescan
+        conn.execute('PRAGMA journal_mode=PERSIST')
+        if not self._ready:
+            self._ensure_schema(conn)
+            self._ready = True
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(f'''
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                stamp TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+                {', '.join(FIELDS)},
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+        ''')
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def stamps(self) -> Dict[str, str]:
+        """Return {path: stamp} for every indexed document."""
+        conn = self._connect()
+        try:
+            return dict(conn.execute('SELECT path, stamp FROM docs'))
+        finally:
+            conn.close()
+
+    def upsert(self, path: str, stamp: str, fields: Dict[str, str]) -> None:
+        """Index (or re-index) a single document."""
+        self.upsert_many([(path, stamp, fields)])
+
+    def upsert_many(self, docs: Iterable[Tuple[str, str, Dict[str, str]]]) -> None:
+        """Index several documents in one transaction."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                for path, stamp, fields in docs:
+                    self._delete(conn, path)
+                    cursor = conn.execute('INSERT INTO docs (path, stamp) VALUES (?, ?)', (path, stamp))
+                    conn.execute(
+                        f'INSERT INTO docs_fts (rowid, {", ".join(FIELDS)}) VALUES (?{", ?" * len(FIELDS)})',
+                        (cursor.lastrowid, *(fields.get(name) or '' for name in FIELDS)),
+                    )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def remove(self, paths: Iterable[str]) -> None:
+        """Drop documents from the index."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                for path in paths:
+                    self._delete(conn, path)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def remove_prefix(self, folder: str) -> None:
+        """Drop every document under *folder*."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                ids = [row[0] for row in conn.execute(
+                    'SELECT id FROM docs WHERE substr(path, 1, ?) = ?', (len(folder) + 1, folder + '/'))]
+                conn.executemany('DELETE FROM docs_fts WHERE rowid = ?', [(i,) for i in ids])
+                conn.executemany('DELETE FROM docs WHERE id = ?', [(i,) for i in ids])
+                conn.commit()
+            finally:
+                conn.close()
+
+    def rename(self, old_path: str, new_path: str) -> None:
+        """Re-key a moved document without re-reading it."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                self._delete(conn, new_path)
+                conn.execute('UPDATE docs SET path = ? WHERE path = ?', (new_path, old_path))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def rename_prefix(self, old_folder: str, new_folder: str) -> None:
+        """Re-key every document under a moved or renamed folder."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    'UPDATE docs SET path = ? || substr(path, ?) WHERE substr(path, 1, ?) = ?',
+                    (new_folder + '/', len(old_folder) + 2, len(old_folder) + 1, old_folder + '/'),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, path: str) -> None:
+        row = conn.execute('SELECT id FROM docs WHERE path = ?', (path,)).fetchone()
+        if row:
+            conn.execute('DELETE FROM docs_fts WHERE rowid = ?', row)
+            conn.execute('DELETE FROM docs WHERE id = ?', row)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, query: str) -> List[str]:
+        """Return paths of documents matching *query*, best match first."""
+        match = build_match_query(query)
+        if match is None:
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f'SELECT docs.path FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid '
+                f'WHERE docs_fts MATCH ? ORDER BY bm25(docs_fts, {", ".join(map(str, _BM25_WEIGHTS))})',
+                (match,),
+            )
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
+
+    def snippets(self, query: str, paths: List[str], tokens: int = 16) -> Dict[str, str]:
+        """Return HTML-safe highlighted snippets for the given result paths."""
+        match = build_match_query(query)
+        if match is None or not paths:
+            return {}
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f'SELECT docs.path, snippet(docs_fts, -1, ?, ?, ?, ?) '
+                f'FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid '
+                f'WHERE docs_fts MATCH ? AND docs.path IN ({", ".join("?" * len(paths))})',
+                (_HL_START, _HL_END, '…', tokens, match, *paths),
+            )
+            return {
+                path: html.escape(text).replace(_HL_START, '<mark>').replace(_HL_END, '</mark>')
+                for path, text in rows
+            }
+        finally:
+            conn.close()
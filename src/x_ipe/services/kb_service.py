@@ -9,15 +9,21 @@ KBConfig: knowledgebase-config.json schema + defaults.
 import json
 import os
 import shutil
+import sqlite3
 import tempfile
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 
+from x_ipe.services.kb_metadata_store import KBMetadataStore
+from x_ipe.services.kb_search_index import KBSearchIndex, fts5_available
 from x_ipe.tracing import x_ipe_tracing
 
 # ---------------------------------------------------------------------------
@@ -29,9 +35,16 @@ KB_CONFIG_FILE = 'knowledgebase-config.json'
 KB_CONFIG_DIR = 'x-ipe-docs/config'
 INTAKE_FOLDER = '.intake'
 KB_INDEX_FILE = '.kb-index.json'
+KB_SEARCH_DB = '.kb-search.db'
+KB_META_DB = '.kb-meta.db'
 
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
 
+TEXT_EXTENSIONS = {'.md', '.txt', '.json', '.yaml', '.yml', '.csv',
+                   '.html', '.htm', '.css', '.js', '.ts', '.xml',
+                   '.toml', '.ini', '.cfg', '.sh', '.bat', '.py',
+                   '.rb', '.java', '.go', '.rs', '.c', '.cpp', '.h'}
+
 EXTENSION_TYPE_MAP = {
     '.md': 'markdown',
     '.png': 'image', '.jpg': 'image', '.jpeg': 'image',
@@ -93,6 +106,7 @@ class KBNode:
     modified_date: Optional[str] = None
     file_type: Optional[str] = None
     frontmatter: Optional[FrontmatterData] = None
+    snippet: Optional[str] = None  # highlighted search excerpt (search results only)
 
     def to_dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {
@@ -110,6 +124,8 @@ class KBNode:
             result['file_type'] = self.file_type
         if self.frontmatter is not None:
             result['frontmatter'] = self.frontmatter.to_dict()
+        if self.snippet is not None:
+            result['snippet'] = self.snippet
         return result
 
 
@@ -164,7 +180,8 @@ class KBConfig:
 class KBService:
     """Service for managing the Knowledge Base file system and metadata."""
 
-    CACHE_TTL = 2.0  # seconds — detect external filesystem changes
+    CACHE_TTL = 2.0  # seconds — check folder mtimes for external changes
+    FULL_RESCAN_INTERVAL = 60.0  # seconds — rescan every file (in-place external edits)
 
     def __init__(self, project_root: str):
         self.project_root = Path(project_root).resolve()
@@ -172,8 +189,17 @@ class KBService:
         self.config_path = self.project_root / KB_CONFIG_DIR / KB_CONFIG_FILE
         self._tree_cache: Optional[List[KBNode]] = None
         self._frontmatter_index: Dict[str, Optional[FrontmatterData]] = {}
+        self._file_stats: Dict[str, os.stat_result] = {}
+        self._folder_nodes: Dict[str, List[KBNode]] = {}  # rel folder -> cached children list
+        self._dir_mtimes: Dict[str, int] = {}
         self._cache_valid = False
-        self._cache_built_at: float = 0.0
+        self._cache_built_at: float = 0.0  # last build or revalidation
+        self._full_scan_at: float = 0.0
+        self._search_index: Optional[KBSearchIndex] = (
+            KBSearchIndex(self.kb_root / KB_SEARCH_DB) if fts5_available() else None
+        )
+        self._search_synced = False
+        self._meta_store = KBMetadataStore(self.kb_root / KB_META_DB)
 
     # ------------------------------------------------------------------
     # Initialization
@@ -260,20 +286,151 @@ class KBService:
         self._cache_valid = False
         self._tree_cache = None
         self._cache_built_at = 0.0
+        self._full_scan_at = 0.0
         self._frontmatter_index.clear()
+        self._file_stats.clear()
+        self._folder_nodes.clear()
+        self._dir_mtimes.clear()
+        self._search_synced = False
         if hasattr(self, '_allowed_ext_cache'):
             del self._allowed_ext_cache
 
     def _ensure_file_index(self) -> None:
-        """Rebuild the in-memory tree cache and metadata index if stale."""
+        """Build the in-memory tree cache and metadata index, or revalidate it.
+
+        Writes through the service patch the cache in place. Changes made
+        outside the service are found every ``CACHE_TTL`` seconds by
+        reloading only folders whose mtime changed, plus a full rescan every
+        ``FULL_RESCAN_INTERVAL`` seconds for files edited in place.
+        """
+        now = time.time()
         if self._cache_valid and self._tree_cache is not None:
-            if time.time() - self._cache_built_at <= self.CACHE_TTL:
+            if now - self._cache_built_at <= self.CACHE_TTL:
+                return
+            if now - self._full_scan_at <= self.FULL_RESCAN_INTERVAL and self._revalidate_folders():
+                self._cache_built_at = now
                 return
             self._invalidate_cache()
         self.ensure_kb_root()
         self._tree_cache = self._build_tree(self.kb_root, '')
         self._cache_valid = True
-        self._cache_built_at = time.time()
+        self._cache_built_at = self._full_scan_at = time.time()
+        self._update_meta_store('retain', list(self._folder_nodes))
+
+    def _revalidate_folders(self) -> bool:
+        """Reload cached subtrees whose folder mtime changed.
+
+        Returns ``False`` if the KB root itself changed and a full rebuild
+        is needed.
+        """
+        stale: List[str] = []
+        for rel_folder in sorted(self._dir_mtimes):
+            if any(rel_folder.startswith(f'{s}/') for s in stale):
+                continue  # inside a subtree that is reloaded anyway
+            try:
+                mtime = (self.kb_root / rel_folder).stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != self._dir_mtimes[rel_folder]:
+                if not rel_folder:
+                    return False
+                stale.append(rel_folder)
+        for rel_folder in stale:
+            self._cache_remove(rel_folder)
+            if (self.kb_root / rel_folder).is_dir():
+                self._cache_load_folder(rel_folder)
+        if stale:
+            self._search_synced = False
+        return True
+
+    def _cache_ready(self) -> bool:
+        return self._cache_valid and self._tree_cache is not None
+
+    @staticmethod
+    def _is_hidden(rel_path: str) -> bool:
+        return any(part.startswith('.') for part in rel_path.split('/'))
+
+    def _refresh_dir_mtime(self, rel_folder: str) -> None:
+        try:
+            self._dir_mtimes[rel_folder] = (self.kb_root / rel_folder).stat().st_mtime_ns
+        except OSError:
+            self._dir_mtimes.pop(rel_folder, None)
+
+    @staticmethod
+    def _cache_insert(siblings: List[KBNode], node: KBNode) -> None:
+        """Insert or replace *node* keeping ``_build_tree`` order (folders first, by name)."""
+        siblings[:] = [n for n in siblings if n.name != node.name]
+        key = (node.type == 'file', node.name.lower())
+        index = 0
+        while index < len(siblings) and (siblings[index].type == 'file', siblings[index].name.lower()) < key:
+            index += 1
+        siblings.insert(index, node)
+
+    def _cache_folder_children(self, rel_folder: str) -> List[KBNode]:
+        """Cached children list of *rel_folder*, adding nodes for new folders."""
+        children = self._folder_nodes.get(rel_folder)
+        if children is not None:
+            return children
+        parent_rel, _, name = rel_folder.rpartition('/')
+        siblings = self._cache_folder_children(parent_rel)
+        children = []
+        self._cache_insert(siblings, KBNode(name=name, path=rel_folder, type='folder', children=children))
+        self._folder_nodes[rel_folder] = children
+        self._refresh_dir_mtime(rel_folder)
+        self._refresh_dir_mtime(parent_rel)
+        return children
+
+    def _cache_put_file(self, rel_path: str, stat: os.stat_result,
+                        fm: Optional[FrontmatterData]) -> None:
+        """Add or refresh one file in the cached tree and metadata index."""
+        if not self._cache_ready() or self._is_hidden(rel_path):
+            return
+        parent_rel, _, name = rel_path.rpartition('/')
+        self._cache_insert(self._cache_folder_children(parent_rel),
+                           self._build_file_node(rel_path, name, stat, fm))
+        self._frontmatter_index[rel_path] = fm
+        self._file_stats[rel_path] = stat
+        self._refresh_dir_mtime(parent_rel)
+
+    def _cache_remove(self, rel_path: str) -> None:
+        """Drop a file, or a folder and its whole subtree, from the cache."""
+        if not self._cache_ready() or self._is_hidden(rel_path):
+            return
+        parent_rel, _, name = rel_path.rpartition('/')
+        siblings = self._folder_nodes.get(parent_rel)
+        if siblings is not None:
+            siblings[:] = [n for n in siblings if n.name != name]
+            self._refresh_dir_mtime(parent_rel)
+        prefix = f'{rel_path}/'
+        for cache in (self._frontmatter_index, self._file_stats, self._folder_nodes, self._dir_mtimes):
+            cache.pop(rel_path, None)
+            for key in [k for k in cache if k.startswith(prefix)]:
+                del cache[key]
+
+    def _cache_load_folder(self, rel_folder: str) -> None:
+        """(Re)load one folder subtree into the cache."""
+        if not self._cache_ready() or self._is_hidden(rel_folder):
+            return
+        parent_rel, _, name = rel_folder.rpartition('/')
+        siblings = self._cache_folder_children(parent_rel)
+        children = self._build_tree(self.kb_root / rel_folder, rel_folder)
+        self._cache_insert(siblings, KBNode(name=name, path=rel_folder, type='folder', children=children))
+        self._refresh_dir_mtime(parent_rel)
+
+    def refresh_file_metadata(self, target: Path) -> None:
+        """Refresh cached metadata of *target* after its index entry changed."""
+        if target.is_file() and target.resolve().is_relative_to(self.kb_root.resolve()):
+            self._file_written(target.resolve())
+
+    def _file_written(self, target: Path, reindex: bool = True) -> None:
+        """Patch the cache (and search index) after writing *target* through the service."""
+        rel_path = self._kb_rel(target)
+        stat = target.stat()
+        fm = self._read_frontmatter(target)
+        if reindex and self._search_index is not None:
+            self._update_search_index('upsert', rel_path, self._search_stamp(stat, fm),
+                                      self._search_fields(target, fm))
+        self._cache_put_file(rel_path, stat, fm)
 
     # ------------------------------------------------------------------
     # Tree building
@@ -282,7 +439,9 @@ class KBService:
     def _build_tree(self, dir_path: Path, rel_base: str) -> List[KBNode]:
         """Recursively build a ``KBNode`` tree for *dir_path*."""
         nodes: List[KBNode] = []
+        self._folder_nodes[rel_base] = nodes
         try:
+            self._dir_mtimes[rel_base] = dir_path.stat().st_mtime_ns
             entries = sorted(dir_path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
         except PermissionError:
             return nodes
@@ -314,6 +473,7 @@ class KBService:
                 else:
                     fm = self._parse_frontmatter_safe(entry)
                 self._frontmatter_index[rel_path] = fm
+                self._file_stats[rel_path] = stat
                 nodes.append(self._build_file_node(rel_path, name, stat, fm))
         return nodes
 
@@ -428,7 +588,33 @@ class KBService:
     KB_INDEX_VERSION = '1.0'
 
     def _read_kb_index(self, folder_path: Path) -> Dict[str, Any]:
-        """Read .kb-index.json from folder. Returns empty entries dict if missing/corrupted.
+        """Read a folder's index from the metadata store (see ``_lookup_kb_index``)."""
+        return self._lookup_kb_index(folder_path)
+
+    def _lookup_kb_index(self, folder_path: Path, name: Optional[str] = None) -> Dict[str, Any]:
+        """Serve a folder's index from the metadata store, importing its .kb-index.json
+        first if the file changed since it was last imported or exported.
+
+        With *name*, only that entry is fetched. Falls back to parsing the
+        JSON file if the store is unavailable.
+        """
+        folder = self._index_folder_key(folder_path)
+        if folder is not None:
+            try:
+                stamp = self._kb_index_stamp(folder_path)
+                stored = self._meta_store.lookup(folder, name)
+                if stored is not None and stored[0] == stamp:
+                    return {'version': stored[1], 'entries': stored[2]}
+                index = self._load_kb_index_file(folder_path)
+                self._meta_store.replace_folder(folder, index['version'], index['entries'], stamp)
+                return index
+            except sqlite3.Error as exc:
+                import logging
+                logging.getLogger(__name__).warning('KB metadata store unavailable: %s', exc)
+        return self._load_kb_index_file(folder_path)
+
+    def _load_kb_index_file(self, folder_path: Path) -> Dict[str, Any]:
+        """Parse .kb-index.json from folder. Returns empty entries dict if missing/corrupted.
         
         Handles both formats:
         - Canonical: {"version": "1.0", "entries": {"file.md": {...}}}
@@ -443,7 +629,8 @@ class KBService:
             if not isinstance(data, dict):
                 return {'version': self.KB_INDEX_VERSION, 'entries': {}}
             if 'entries' in data:
-                return data
+                entries = data['entries'] if isinstance(data['entries'], dict) else {}
+                return {'version': data.get('version', self.KB_INDEX_VERSION), 'entries': entries}
             # Flat format: all top-level keys are entry names
             # (exclude 'version' if present at top level)
             entries = {k: v for k, v in data.items()
@@ -457,13 +644,25 @@ class KBService:
             return {'version': self.KB_INDEX_VERSION, 'entries': {}}
 
     def _write_kb_index(self, folder_path: Path, index_data: Dict[str, Any]) -> None:
-        """Atomic write .kb-index.json to folder."""
-        index_path = folder_path / KB_INDEX_FILE
-        self._write_json(index_path, index_data)
+        """Atomic write .kb-index.json to folder and record it in the metadata store."""
+        self._write_kb_indexes({folder_path: index_data})
+
+    def _write_kb_indexes(self, indexes: Dict[Path, Dict[str, Any]]) -> None:
+        """Export several folders' indexes, updating the metadata store in one transaction."""
+        rows = []
+        for folder_path, index_data in indexes.items():
+            self._write_json(folder_path / KB_INDEX_FILE, index_data)
+            folder = self._index_folder_key(folder_path)
+            if folder is not None:
+                rows.append((folder, index_data.get('version', self.KB_INDEX_VERSION),
+                             index_data.get('entries', {}), self._kb_index_stamp(folder_path)))
+        if rows:
+            # On failure the stored stamps no longer match, so the next read re-imports
+            self._update_meta_store('replace_folders', rows)
 
     def _get_index_entry(self, folder_path: Path, name: str) -> Optional[Dict[str, Any]]:
         """Get a single entry from folder's .kb-index.json."""
-        index = self._read_kb_index(folder_path)
+        index = self._lookup_kb_index(folder_path, name)
         return index['entries'].get(name)
 
     def _set_index_entry(self, folder_path: Path, name: str, entry: Dict[str, Any]) -> None:
@@ -479,6 +678,46 @@ class KBService:
             del index['entries'][name]
             self._write_kb_index(folder_path, index)
 
+    def _index_folder_key(self, folder_path: Path) -> Optional[str]:
+        """Metadata store key of a folder ('' for the KB root), or ``None`` outside the KB."""
+        try:
+            rel = folder_path.relative_to(self.kb_root).as_posix()
+        except ValueError:
+            return None
+        return '' if rel == '.' else rel
+
+    @staticmethod
+    def _kb_index_stamp(folder_path: Path) -> str:
+        try:
+            stat = (folder_path / KB_INDEX_FILE).stat()
+        except OSError:
+            return ''
+        return f'{stat.st_size}:{stat.st_mtime_ns}'
+
+    def _update_meta_store(self, method: str, *args) -> None:
+        """Apply a metadata store update; stale rows are re-imported from JSON on lookup."""
+        try:
+            getattr(self._meta_store, method)(*args)
+        except (sqlite3.Error, OSError) as exc:
+            import logging
+            logging.getLogger(__name__).warning('KB metadata store update failed: %s', exc)
+
+    @x_ipe_tracing()
+    def query_index(self, tag: str = '', tag_type: str = '', entry_type: str = '',
+                    author: str = '') -> List[Dict[str, Any]]:
+        """Find index entries across the whole KB by tag, type and/or author.
+
+        Answered by the metadata store, so no folders are walked beyond
+        the regular cache revalidation.
+        """
+        self._ensure_file_index()
+        rows = self._meta_store.query(tag=tag, tag_type=tag_type, entry_type=entry_type, author=author)
+        return [
+            {'path': f'{folder}/{name}' if folder else name, 'folder': folder, 'name': name, 'entry': entry}
+            for folder, name, entry in rows
+            if not self._is_hidden(folder)
+        ]
+
     @staticmethod
     def _detect_kb_file_type(filename: str) -> str:
         """Map file extension to knowledge base type category."""
@@ -600,8 +839,41 @@ class KBService:
         if not target.is_dir():
             raise FileNotFoundError(f"Folder not found: {folder}")
 
+        rel_folder = self._index_folder_key(target) or ''
+        if self._is_hidden(rel_folder):
+            # Hidden folders (e.g. .intake) are not cached; read them from disk
+            return self._sort_files(self._list_files_on_disk(target, recursive), sort)
+
+        # Served from the cached stats and metadata; no directory walk
+        prefix = f'{rel_folder}/' if rel_folder else ''
         files: List[KBNode] = []
-        entries = target.rglob('*') if recursive else target.iterdir()
+        for rel, stat in list(self._file_stats.items()):
+            if not rel.startswith(prefix):
+                continue
+            if not recursive and '/' in rel[len(prefix):]:
+                continue
+            files.append(self._build_file_node(rel, rel.rpartition('/')[2], stat,
+                                               self._frontmatter_index.get(rel)))
+        if recursive:
+            # Hidden subfolders are not cached either
+            for folder in list(self._folder_nodes):
+                if folder == rel_folder or folder.startswith(prefix):
+                    for hidden in self._hidden_subfolders(self.kb_root / folder):
+                        files.extend(self._list_files_on_disk(hidden, recursive=True))
+        return self._sort_files(files, sort)
+
+    @staticmethod
+    def _hidden_subfolders(folder: Path) -> List[Path]:
+        try:
+            with os.scandir(folder) as entries:
+                return [Path(e.path) for e in entries if e.name.startswith('.') and e.is_dir()]
+        except OSError:
+            return []
+
+    def _list_files_on_disk(self, folder: Path, recursive: bool) -> List[KBNode]:
+        """List the (non-dot) files of *folder* by walking the directory."""
+        files: List[KBNode] = []
+        entries = folder.rglob('*') if recursive else folder.iterdir()
         # Cache indexes per folder for efficiency
         _index_cache: Dict[Path, Dict[str, Any]] = {}
         for entry in entries:
@@ -622,7 +894,7 @@ class KBService:
             else:
                 fm = self._frontmatter_index.get(rel) or self._parse_frontmatter_safe(entry)
             files.append(self._build_file_node(rel, entry.name, stat, fm))
-        return self._sort_files(files, sort)
+        return files
 
     # ------------------------------------------------------------------
     # File CRUD
@@ -637,22 +909,11 @@ class KBService:
         stat = target.stat()
         file_type = self._determine_file_type(target.name)
 
-        # Read metadata from folder's index
-        folder_path = target.parent
-        idx_entry = self._get_index_entry(folder_path, target.name)
-        if idx_entry:
-            fm = self._index_entry_to_frontmatter(idx_entry)
-        else:
-            # Fallback: parse frontmatter from file (backwards compat)
-            fm = self._parse_frontmatter_safe(target)
+        fm = self._read_frontmatter(target)
 
         # Binary files: return metadata only (no content)
-        TEXT_EXTS = {'.md', '.txt', '.json', '.yaml', '.yml', '.csv',
-                     '.html', '.htm', '.css', '.js', '.ts', '.xml',
-                     '.toml', '.ini', '.cfg', '.sh', '.bat', '.py',
-                     '.rb', '.java', '.go', '.rs', '.c', '.cpp', '.h'}
         ext = target.suffix.lower()
-        if ext not in TEXT_EXTS:
+        if ext not in TEXT_EXTENSIONS:
             return {
                 'name': target.name,
                 'path': rel_path,
@@ -675,6 +936,14 @@ class KBService:
             'file_type': file_type,
         }
 
+    def _read_frontmatter(self, target: Path) -> Optional[FrontmatterData]:
+        """Metadata for *target* from its folder's index, else from its frontmatter."""
+        idx_entry = self._get_index_entry(target.parent, target.name)
+        if idx_entry:
+            return self._index_entry_to_frontmatter(idx_entry)
+        # Fallback: parse frontmatter from file (backwards compat)
+        return self._parse_frontmatter_safe(target)
+
     @x_ipe_tracing()
     def create_file(self, rel_path: str, content: str,
                     frontmatter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -684,10 +953,7 @@ class KBService:
         if target.exists():
             raise FileExistsError(f"File already exists: {rel_path}")
 
-        # URL bookmark validation
-        if target.name.endswith('.url.md'):
-            if not frontmatter or not frontmatter.get('url'):
-                raise ValueError("URL bookmark files require a 'url' field in frontmatter")
+        self._validate_url_bookmark(target.name, frontmatter)
 
         # Write file content (no frontmatter injection)
         self._check_size(content)
@@ -697,26 +963,30 @@ class KBService:
         entry = self._auto_populate_index_entry(target.name, frontmatter)
         self._set_index_entry(target.parent, target.name, entry)
 
-        self._invalidate_cache()
+        self._file_written(target)
         return self.get_file(rel_path)
 
     @x_ipe_tracing()
-    def create_binary_file(self, rel_path: str, data: bytes,
+    def create_binary_file(self, rel_path: str, data,
                            metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Create a new binary KB file (images, PDFs, etc.) with index entry."""
+        """Create a new binary KB file (images, PDFs, etc.) with index entry.
+        *data* is bytes or a readable binary file object, streamed to disk."""
         target = self._resolve_safe_path(rel_path)
         self._validate_file_type(target.name)
         if target.exists():
             raise FileExistsError(f"File already exists: {rel_path}")
-        if len(data) > MAX_FILE_SIZE_BYTES:
-            raise ValueError("File exceeds maximum size of 10MB")
-        self._write_binary_atomic(target, data)
+        if isinstance(data, (bytes, bytearray)):
+            if len(data) > MAX_FILE_SIZE_BYTES:
+                raise ValueError("File exceeds maximum size of 10MB")
+            self._write_binary_atomic(target, data)
+        else:
+            self._write_stream_atomic(target, data)
 
         # Write metadata to folder's .kb-index.json
         entry = self._auto_populate_index_entry(target.name, metadata)
         self._set_index_entry(target.parent, target.name, entry)
 
-        self._invalidate_cache()
+        self._file_written(target)
         stat = target.stat()
         fm = self._index_entry_to_frontmatter(entry)
         return {
@@ -746,7 +1016,7 @@ class KBService:
             new_entry = self._auto_populate_index_entry(target.name, {**existing_entry, **frontmatter})
             self._set_index_entry(target.parent, target.name, new_entry)
 
-        self._invalidate_cache()
+        self._file_written(target)
         return self.get_file(rel_path)
 
     @x_ipe_tracing()
@@ -758,7 +1028,8 @@ class KBService:
         # Remove index entry
         self._remove_index_entry(target.parent, target.name)
         target.unlink()
-        self._invalidate_cache()
+        self._update_search_index('remove', [self._kb_rel(target)])
+        self._cache_remove(self._kb_rel(target))
 
     @x_ipe_tracing()
     def move_file(self, source: str, destination: str) -> Dict[str, Any]:
@@ -779,7 +1050,9 @@ class KBService:
             self._remove_index_entry(src.parent, src.name)
             self._set_index_entry(dst.parent, dst.name, old_entry)
 
-        self._invalidate_cache()
+        self._update_search_index('rename', self._kb_rel(src), self._kb_rel(dst))
+        self._cache_remove(self._kb_rel(src))
+        self._file_written(dst, reindex=False)
         return {'old_path': source, 'new_path': destination}
 
     # ------------------------------------------------------------------
@@ -793,7 +1066,8 @@ class KBService:
         if target.exists():
             raise FileExistsError(f"Folder already exists: {rel_path}")
         target.mkdir(parents=True)
-        self._invalidate_cache()
+        if self._cache_ready() and not self._is_hidden(self._kb_rel(target)):
+            self._cache_folder_children(self._kb_rel(target))
         return {'name': target.name, 'path': rel_path, 'type': 'folder'}
 
     @x_ipe_tracing()
@@ -807,7 +1081,10 @@ class KBService:
             raise FileExistsError(f"A folder named '{new_name}' already exists")
         target.rename(new_target)
         new_rel = str(new_target.relative_to(self.kb_root)).replace('\\', '/')
-        self._invalidate_cache()
+        self._update_search_index('rename_prefix', self._kb_rel(target), new_rel)
+        self._update_meta_store('remove_prefix', self._kb_rel(target))
+        self._cache_remove(self._kb_rel(target))
+        self._cache_load_folder(new_rel)
         return {'name': new_name, 'path': new_rel, 'type': 'folder'}
 
     @x_ipe_tracing()
@@ -827,7 +1104,10 @@ class KBService:
             raise FileExistsError(f"Destination already exists: {dst.name}")
         shutil.move(str(src), str(dst))
         new_rel = str(dst.relative_to(self.kb_root)).replace('\\', '/')
-        self._invalidate_cache()
+        self._update_search_index('rename_prefix', self._kb_rel(src), new_rel)
+        self._update_meta_store('remove_prefix', self._kb_rel(src))
+        self._cache_remove(self._kb_rel(src))
+        self._cache_load_folder(new_rel)
         return {'old_path': source, 'new_path': new_rel}
 
     @x_ipe_tracing()
@@ -842,7 +1122,9 @@ class KBService:
             raise FileNotFoundError(f"Folder not found: {rel_path}")
         count = sum(1 for _ in target.rglob('*') if _.is_file())
         shutil.rmtree(target)
-        self._invalidate_cache()
+        self._update_search_index('remove_prefix', self._kb_rel(target))
+        self._update_meta_store('remove_prefix', self._kb_rel(target))
+        self._cache_remove(self._kb_rel(target))
         return {'deleted': rel_path, 'deleted_count': count}
 
     # ------------------------------------------------------------------
@@ -864,22 +1146,126 @@ class KBService:
     # ------------------------------------------------------------------
 
     @x_ipe_tracing()
-    def search(self, query: str = '', tag: str = '',
-               tag_type: str = '') -> List[KBNode]:
-        """Search KB files by filename + frontmatter fields and/or tag."""
+    def search(self, query: str = '', tag: str = '', tag_type: str = '',
+               limit: Optional[int] = None, offset: int = 0) -> List[KBNode]:
+        """Search KB files by full text and/or tag.
+
+        Queries match filenames, titles, descriptions, tags, authors and
+        text bodies through the on-disk FTS index (every word as a prefix),
+        ranked by BM25 with a highlighted ``snippet`` per result. Without
+        FTS5 support, falls back to substring matching on filename and
+        metadata. *limit* / *offset* page the ranked results.
+        """
         self._ensure_file_index()
-        results: List[KBNode] = []
-        q = query.lower()
+        ranked = self._ranked_search(query) if query.strip() else None
 
-        for rel_path, fm in self._frontmatter_index.items():
-            if self._matches(rel_path, fm, q, tag, tag_type):
-                target = self.kb_root / rel_path
-                if not target.is_file():
-                    continue
-                stat = target.stat()
-                results.append(self._build_file_node(rel_path, target.name, stat, fm))
+        if ranked is None:
+            q = query.lower()
+            paths = [rel_path for rel_path, fm in list(self._frontmatter_index.items())
+                     if self._matches(rel_path, fm, q, tag, tag_type)]
+        else:
+            paths = [rel_path for rel_path in ranked
+                     if rel_path in self._frontmatter_index
+                     and self._matches(rel_path, self._frontmatter_index[rel_path], '', tag, tag_type)]
+
+        page = paths[offset:offset + limit] if limit is not None else paths[offset:]
+        snippets: Dict[str, str] = {}
+        if ranked is not None and page:
+            try:
+                snippets = self._search_index.snippets(query, page)
+            except sqlite3.Error:
+                pass
+
+        results: List[KBNode] = []
+        for rel_path in page:
+            stat = self._file_stats.get(rel_path)
+            if stat is None:
+                continue
+            node = self._build_file_node(rel_path, Path(rel_path).name, stat,
+                                         self._frontmatter_index[rel_path])
+            node.snippet = snippets.get(rel_path)
+            results.append(node)
         return results
 
+    # ------------------------------------------------------------------
+    # Search index (.kb-search.db)
+    # ------------------------------------------------------------------
+
+    def _ranked_search(self, query: str) -> Optional[List[str]]:
+        """Ranked paths from the FTS index, or ``None`` if it is unavailable."""
+        if self._search_index is None:
+            return None
+        try:
+            self._sync_search_index()
+            return self._search_index.search(query)
+        except sqlite3.Error as exc:
+            import logging
+            logging.getLogger(__name__).warning('KB search index unavailable: %s', exc)
+            return None
+
+    def _sync_search_index(self) -> None:
+        """Reconcile the FTS index with the current tree.
+
+        Only files whose stamp (size, mtime, metadata) changed since they
+        were indexed are re-read, so files edited outside the service are
+        picked up without rebuilding the index.
+        """
+        if self._search_synced:
+            return
+        indexed = self._search_index.stamps()
+        changed = []
+        for rel_path, stat in self._file_stats.items():
+            fm = self._frontmatter_index.get(rel_path)
+            stamp = self._search_stamp(stat, fm)
+            if indexed.pop(rel_path, None) != stamp:
+                changed.append((rel_path, stamp, fm))
+        if changed:
+            self._search_index.upsert_many(
+                (rel_path, stamp, self._search_fields(self.kb_root / rel_path, fm))
+                for rel_path, stamp, fm in changed
+            )
+        if indexed:
+            self._search_index.remove(indexed)
+        self._search_synced = True
+
+    def _update_search_index(self, method: str, *args) -> None:
+        """Apply an incremental index update; a failed update is repaired by the next sync."""
+        if self._search_index is None:
+            return
+        try:
+            getattr(self._search_index, method)(*args)
+        except (sqlite3.Error, OSError):
+            self._search_synced = False
+
+    @staticmethod
+    def _search_stamp(stat: os.stat_result, fm: Optional[FrontmatterData]) -> str:
+        meta = json.dumps(fm.to_dict() if fm else None, sort_keys=True, default=str)
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{zlib.crc32(meta.encode('utf-8')):08x}"
+
+    def _search_fields(self, target: Path, fm: Optional[FrontmatterData]) -> Dict[str, str]:
+        """Text columns indexed for one file."""
+        body = ''
+        ext = target.suffix.lower()
+        if ext in TEXT_EXTENSIONS:
+            try:
+                body = target.read_text(encoding='utf-8', errors='replace')
+            except OSError:
+                body = ''
+            if ext == '.md':
+                body = self._extract_body(body)
+        tags = (fm.tags.lifecycle + fm.tags.domain) if fm and fm.tags else []
+        return {
+            'name': target.name,
+            'title': str(fm.title or '') if fm else '',
+            'description': str(fm.description or '') if fm else '',
+            'tags': ' '.join(str(t) for t in tags),
+            'author': str(fm.author or '') if fm else '',
+            'body': body,
+        }
+
+    def _kb_rel(self, path: Path) -> str:
+        return str(path.relative_to(self.kb_root)).replace('\\', '/')
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -981,85 +1367,212 @@ class KBService:
                 self._allowed_ext_cache = None
         return self._allowed_ext_cache or {e for e in KBConfig().allowed_extensions}
 
+    @staticmethod
+    def _validate_url_bookmark(name: str, frontmatter: Optional[Dict[str, Any]]) -> None:
+        """URL bookmark files need a 'url' in their metadata."""
+        if name.endswith('.url.md'):
+            if not frontmatter or not frontmatter.get('url'):
+                raise ValueError("URL bookmark files require a 'url' field in frontmatter")
+
     @staticmethod
     def _check_size(content: str) -> None:
         if len(content.encode('utf-8')) > MAX_FILE_SIZE_BYTES:
             raise ValueError("File exceeds maximum size of 10MB")
 
-    def _extract_archive_entries(self, entries, dest_folder, get_name, get_data, is_dir=None):
-        """Shared loop for archive extraction (zip/7z).
+    # ------------------------------------------------------------------
+    # Archive ingestion (FEATURE-049-E)
+    # ------------------------------------------------------------------
+
+    ARCHIVE_EXTENSIONS = {'.zip', '.7z'}
+    INGEST_WORKERS = 4
+    COPY_CHUNK_BYTES = 1024 * 1024
+
+    def _ingest_archive(self, members, dest_folder: str, open_member,
+                        progress: Optional[Callable[[int, int], None]] = None) -> list:
+        """Bulk-ingest archive files into the KB.
+
+        Entries are validated up front, streamed to disk by a bounded worker
+        pool, then each touched folder's .kb-index.json is written once and
+        the cache and search index are refreshed once. Nested archives,
+        unsupported types, oversized files and existing paths are skipped.
 
         Args:
-            entries: iterable of archive entries
+            members: iterable of (name, uncompressed size, member) per file
             dest_folder: KB-relative destination folder
-            get_name: callable(entry) -> str filename within archive
-            get_data: callable(entry) -> bytes raw file content
-            is_dir: callable(entry) -> bool (optional, skips dirs if provided)
+            open_member: callable(member) -> readable binary file object
+            progress: optional callable(done, total) called as files land
         """
-        results = []
-        skip_exts = {'.zip', '.7z'}
-        TEXT_EXTS = {'.md', '.txt', '.json', '.yaml', '.yml', '.csv',
-                     '.html', '.htm', '.css', '.js', '.ts', '.xml',
-                     '.toml', '.ini', '.cfg', '.sh', '.bat', '.py',
-                     '.rb', '.java', '.go', '.rs', '.c', '.cpp', '.h'}
-        for entry in entries:
-            if is_dir and is_dir(entry):
-                continue
-            name = get_name(entry)
+        planned = []
+        seen = set()
+        for name, size, member in members:
             ext = os.path.splitext(name)[1].lower()
-            if ext in skip_exts:
+            if ext in self.ARCHIVE_EXTENSIONS or size > MAX_FILE_SIZE_BYTES:
                 continue
+            rel_path = f'{dest_folder}/{name}' if dest_folder else name
             try:
-                raw_data = get_data(entry)
-                rel_path = f'{dest_folder}/{name}' if dest_folder else name
-                parent = os.path.dirname(rel_path)
-                if parent:
-                    try:
-                        self.create_folder(parent)
-                    except FileExistsError:
-                        pass
-                if ext in TEXT_EXTS:
-                    result = self.create_file(rel_path, raw_data.decode('utf-8', errors='replace'))
-                else:
-                    result = self.create_binary_file(rel_path, raw_data)
-                results.append(result)
-            except (FileExistsError, ValueError):
-                pass
+                target = self._resolve_safe_path(rel_path)
+                self._validate_file_type(target.name)
+                # Archive members carry no metadata, so bookmarks are skipped
+                self._validate_url_bookmark(target.name, None)
+            except ValueError:
+                continue
+            if target in seen or target.exists():
+                continue
+            seen.add(target)
+            planned.append((rel_path, target, member))
+
+        for parent in {target.parent for _, target, _ in planned}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Archive readers share one file handle; open/close members one at a time
+        member_lock = threading.Lock()
+
+        def write_member(target: Path, member) -> os.stat_result:
+            with member_lock:
+                source = open_member(member)
+            try:
+                return self._write_stream_atomic(
+                    target, source, normalize_text=target.suffix.lower() in TEXT_EXTENSIONS)
+            finally:
+                with member_lock:
+                    source.close()
+
+        total = len(planned)
+        stats: List[Optional[os.stat_result]] = [None] * total
+        with ThreadPoolExecutor(max_workers=self.INGEST_WORKERS) as pool:
+            futures = {pool.submit(write_member, target, member): i
+                       for i, (_, target, member) in enumerate(planned)}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    stats[futures[future]] = future.result()
+                except (OSError, ValueError, EOFError):
+                    pass
+                if progress:
+                    progress(done, total)
+
+        results = []
+        written = []
+        folder_entries: Dict[Path, Dict[str, Any]] = {}
+        for (rel_path, target, _), stat in zip(planned, stats):
+            if stat is None:
+                continue
+            entry = self._auto_populate_index_entry(target.name)
+            folder_entries.setdefault(target.parent, {})[target.name] = entry
+            fm = self._index_entry_to_frontmatter(entry)
+            written.append((target, stat, fm))
+            results.append({
+                'name': target.name,
+                'path': rel_path,
+                'size_bytes': stat.st_size,
+                'modified_date': self._iso_mtime(stat),
+                'file_type': self._determine_file_type(target.name),
+                'frontmatter': fm.to_dict(),
+            })
+        if not written:
+            return results
+
+        indexes = {}
+        for folder_path, entries in folder_entries.items():
+            index = self._read_kb_index(folder_path)
+            index['entries'].update(entries)
+            indexes[folder_path] = index
+        self._write_kb_indexes(indexes)
+
+        if self._search_index is not None:
+            self._update_search_index('upsert_many', (
+                (self._kb_rel(target), self._search_stamp(stat, fm), self._search_fields(target, fm))
+                for target, stat, fm in written
+            ))
+        dest_rel = dest_folder.replace('\\', '/').strip('/')
+        if dest_rel:
+            self._cache_remove(dest_rel)
+            self._cache_load_folder(dest_rel)
+        else:
+            self._invalidate_cache()
         return results
 
+    def _write_stream_atomic(self, target: Path, source, normalize_text: bool = False) -> os.stat_result:
+        """Stream *source* into *target* in chunks (temp → rename), enforcing the size limit.
+
+        With *normalize_text*, content is re-encoded as valid UTF-8 like
+        create_file does (text is capped at 10MB, so it is read at once).
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                if normalize_text:
+                    data = source.read(MAX_FILE_SIZE_BYTES + 1)
+                    data = data.decode('utf-8', errors='replace').encode('utf-8')
+                    if len(data) > MAX_FILE_SIZE_BYTES:
+                        raise ValueError("File exceeds maximum size of 10MB")
+                    out.write(data)
+                else:
+                    copied = 0
+                    while chunk := source.read(self.COPY_CHUNK_BYTES):
+                        copied += len(chunk)
+                        if copied > MAX_FILE_SIZE_BYTES:
+                            raise ValueError("File exceeds maximum size of 10MB")
+                        out.write(chunk)
+            os.replace(tmp_path, str(target))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return target.stat()
+
     @x_ipe_tracing()
-    def extract_zip(self, zip_bytes: bytes, dest_folder: str = '') -> list:
+    def extract_zip(self, source, dest_folder: str = '',
+                    progress: Optional[Callable[[int, int], None]] = None) -> list:
         """Extract a .zip archive into the KB, preserving folder structure.
+        *source* is the archive bytes or a seekable binary file object.
         Skips nested .zip/.7z archives within the ZIP."""
         import zipfile
         import io
 
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-            return self._extract_archive_entries(
-                entries=zf.infolist(),
-                dest_folder=dest_folder,
-                get_name=lambda info: info.filename,
-                get_data=lambda info: zf.read(info.filename),
-                is_dir=lambda info: info.is_dir(),
-            )
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        with zipfile.ZipFile(source) as zf:
+            members = [(info.filename, info.file_size, info)
+                       for info in zf.infolist() if not info.is_dir()]
+            return self._ingest_archive(members, dest_folder, zf.open, progress)
 
     @x_ipe_tracing()
-    def extract_7z(self, sevenz_bytes: bytes, dest_folder: str = '') -> list:
+    def extract_7z(self, source, dest_folder: str = '',
+                   progress: Optional[Callable[[int, int], None]] = None) -> list:
         """Extract a .7z archive into the KB, preserving folder structure.
-        Skips nested .zip/.7z archives. Requires py7zr."""
+        *source* is the archive bytes or a seekable binary file object.
+        Skips nested .zip/.7z archives. Requires py7zr.
+
+        Solid 7z archives decompress sequentially, so files are first
+        extracted to a staging folder in the system temp directory (never
+        into memory, and outside the KB so its folders are not touched)
+        and then ingested like zip members."""
         try:
             import py7zr
-            import io
-            with py7zr.SevenZipFile(io.BytesIO(sevenz_bytes), mode='r') as z:
-                items = z.readall().items()
-                return self._extract_archive_entries(
-                    entries=items,
-                    dest_folder=dest_folder,
-                    get_name=lambda item: item[0],
-                    get_data=lambda item: item[1].read(),
-                )
         except ImportError:
             raise ValueError(".7z extraction requires py7zr library")
+        import io
+
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        staging = Path(tempfile.mkdtemp(prefix='x-ipe-ingest-'))
+        try:
+            with py7zr.SevenZipFile(source, mode='r') as z:
+                names = [
+                    info.filename for info in z.list()
+                    if not info.is_directory
+                    and os.path.splitext(info.filename)[1].lower() not in self.ARCHIVE_EXTENSIONS
+                    and not Path(info.filename).is_absolute()
+                    and '..' not in Path(info.filename).parts
+                ]
+                if names:
+                    z.extract(path=staging, targets=names)
+            members = [(name, (staging / name).stat().st_size, staging / name)
+                       for name in names if (staging / name).is_file()]
+            return self._ingest_archive(members, dest_folder, lambda path: open(path, 'rb'), progress)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
 
     # ------------------------------------------------------------------
     # Intake status management (FEATURE-049-F)
@@ -1235,5 +1748,4 @@ class KBService:
             }
 
         self._write_intake_status(data)
-        self._invalidate_cache()
         return {'ok': True, 'filename': filename, 'status': status, 'destination': destination}
@@ -4,11 +4,19 @@ FEATURE-058-E/F: Ontology Graph Viewer — Service Layer
 Reads ontology graph data from knowledge-base/.ontology/ directory,
 transforms JSONL event-sourced records to Cytoscape.js-compatible JSON,
 provides text search and BFS graph traversal across entities.
+
+Parsed graph files and cross-graph relation chunks are cached per process
+and validated against each file's mtime, size and inode, so requests for
+unchanged graphs are served from memory. The merged /graphs/all payload
+is additionally kept serialized and gzip-compressed with a content ETag.
 """
+import gzip
+import hashlib
 import importlib.util
 import json
 import math
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -25,15 +33,16 @@ def _import_ontology_search():
     project_root = os.path.dirname(
         os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     )
-    # ontology.py must be importable first (search.py depends on it)
-    ontology_path = os.path.join(
-        project_root, '.github', 'skills', 'x-ipe-tool-ontology', 'scripts', 'ontology.py'
-    )
-    ont_spec = importlib.util.spec_from_file_location('ontology', ontology_path)
-    ont_mod = importlib.util.module_from_spec(ont_spec)
+    # ontology.py and text_index.py must be importable first (search.py depends on them)
     import sys
-    sys.modules['ontology'] = ont_mod
-    ont_spec.loader.exec_module(ont_mod)
+    for dep in ('ontology', 'text_index'):
+        dep_path = os.path.join(
+            project_root, '.github', 'skills', 'x-ipe-tool-ontology', 'scripts', f'{dep}.py'
+        )
+        dep_spec = importlib.util.spec_from_file_location(dep, dep_path)
+        dep_mod = importlib.util.module_from_spec(dep_spec)
+        sys.modules[dep] = dep_mod
+        dep_spec.loader.exec_module(dep_mod)
 
     search_path = os.path.join(
         project_root, '.github', 'skills', 'x-ipe-tool-ontology', 'scripts', 'search.py'
@@ -55,6 +64,103 @@ def _get_search_module():
     return _search_module
 
 
+def _file_stamp(path) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _ParsedGraph:
+    """A graph file parsed once, with its Cytoscape elements precomputed.
+
+    Shared between requests: callers must not modify anything reachable
+    from it.
+    """
+
+    def __init__(self, path: Path, entities: list[dict], relations: list[dict],
+                 needs_replay: bool, nodes: list[dict], edges: list[dict]):
+        self.path = path
+        self.entities = entities
+        self.relations = relations
+        self.nodes = nodes
+        self.edges = edges
+        self.entity_ids = frozenset(e.get('id', '') for e in entities)
+        # update/delete/unrelate records need the ontology tool's full replay
+        self._needs_replay = needs_replay
+        self._tagged: tuple[list[dict], list[dict]] | None = None
+        self._search_view: tuple[dict, list, dict, Any] | None = None
+        self._lock = threading.Lock()
+
+    def tagged_elements(self, name: str) -> tuple[list[dict], list[dict]]:
+        """Nodes and edges carrying the '_graph' attribute used by get_all_graphs."""
+        with self._lock:
+            if self._tagged is None:
+                self._tagged = (
+                    [{**n, 'data': {**n['data'], '_graph': name}} for n in self.nodes],
+                    [{**e, 'data': {**e['data'], '_graph': name}} for e in self.edges],
+                )
+            return self._tagged
+
+    def search_view(self) -> tuple[dict, list, dict, Any]:
+        """(entities by id, relations, undirected adjacency, text index) as search.py loads them."""
+        with self._lock:
+            if self._search_view is None:
+                search_mod = _get_search_module()
+                if self._needs_replay:
+                    entities, relations = search_mod.load_graph(str(self.path))
+                else:
+                    entities = {e.get('id', ''): e for e in self.entities}
+                    relations = self.relations
+                self._search_view = (
+                    entities,
+                    relations,
+                    search_mod.build_adjacency(relations),
+                    search_mod.TextIndex.from_entities(entities),
+                )
+            return self._search_view
+
+
+class _CrossRelations:
+    """Cross-graph relation edges with an entity id -> edge positions index."""
+
+    def __init__(self, edges: list[dict]):
+        self.edges = edges
+        self.by_entity: dict[str, list[int]] = {}
+        for i, edge in enumerate(edges):
+            self.by_entity.setdefault(edge['data']['source'], []).append(i)
+            if edge['data']['target'] != edge['data']['source']:
+                self.by_entity.setdefault(edge['data']['target'], []).append(i)
+
+    def touching(self, entity_ids) -> list[dict]:
+        """Edges with an endpoint in entity_ids, in chunk order."""
+        positions = {i for eid in entity_ids for i in self.by_entity.get(eid, ())}
+        return [self.edges[i] for i in sorted(positions)]
+
+
+class GraphsPayload:
+    """A serialized get_all_graphs()/get_cluster_summary() response.
+
+    body is compact JSON, gzip_body the same bytes gzip-compressed, and
+    etag a strong validator (unquoted) derived from the body.
+    """
+
+    def __init__(self, data: dict):
+        self.body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+
+
+# Process-wide caches: graph file path -> (stamp, _ParsedGraph),
+# relations dir -> (chunk stamps, _CrossRelations) and
+# (ontology dir, mode) -> (directory stamps, GraphsPayload)
+_graph_cache: dict[str, tuple] = {}
+_relations_cache: dict[str, tuple] = {}
+_payload_cache: dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+
+
 class OntologyGraphService:
     """Service for reading and transforming ontology graph data."""
 
@@ -106,27 +212,17 @@ class OntologyGraphService:
         .ontology/relations/_relations.NNN.jsonl that touch entities in this graph.
         """
         graph_path = self._ontology_dir / f'{name}.jsonl'
-        if not graph_path.is_file():
+        parsed = self._get_parsed_graph(graph_path)
+        if parsed is None:
             return None
 
-        entities, relations = self._parse_graph_jsonl(graph_path)
-
-        nodes = [self._entity_to_cytoscape_node(e) for e in entities]
-        edges = [self._relation_to_cytoscape_edge(r) for r in relations]
-
         # Include cross-graph relations that touch entities in this graph
-        entity_ids = {e.get('id', '') for e in entities}
-        cross_edges = self._load_cross_graph_relations()
-        for edge in cross_edges:
-            src = edge['data']['source']
-            tgt = edge['data']['target']
-            if src in entity_ids or tgt in entity_ids:
-                edges.append(edge)
+        edges = parsed.edges + self._get_cross_relations().touching(parsed.entity_ids)
 
         return {
             'name': name,
             'elements': {
-                'nodes': nodes,
+                'nodes': list(parsed.nodes),
                 'edges': edges,
             },
         }
@@ -152,21 +248,15 @@ class OntologyGraphService:
             if not name:
                 continue
             graph_names.append(name)
-            graph_path = self._ontology_dir / f'{name}.jsonl'
-            if not graph_path.is_file():
+            parsed = self._get_parsed_graph(self._ontology_dir / f'{name}.jsonl')
+            if parsed is None:
                 continue
-            entities, relations = self._parse_graph_jsonl(graph_path)
-            for e in entities:
-                node = self._entity_to_cytoscape_node(e)
-                node['data']['_graph'] = name
-                all_nodes.append(node)
-            for r in relations:
-                edge = self._relation_to_cytoscape_edge(r)
-                edge['data']['_graph'] = name
-                all_edges.append(edge)
+            nodes, edges = parsed.tagged_elements(name)
+            all_nodes.extend(nodes)
+            all_edges.extend(edges)
 
         # Append cross-graph relations from _relations.NNN.jsonl chunks
-        all_edges.extend(self._load_cross_graph_relations())
+        all_edges.extend(self._get_cross_relations().edges)
 
         return {
             'elements': {
@@ -176,19 +266,131 @@ class OntologyGraphService:
             'graph_names': graph_names,
         }
 
+    @x_ipe_tracing()
+    def get_cluster_summary(self) -> dict:
+        """Level-of-detail view of get_all_graphs: one summary node per graph.
+
+        Each graph (a cluster produced by graph_ops build) becomes a node
+        with id 'cluster:<name>'; cross-graph relations are aggregated into
+        one weighted edge per ordered pair of graphs. Clients expand a
+        cluster by fetching /api/kb/ontology/graph/<name>.
+        """
+        if not self.has_ontology:
+            return {'mode': 'clusters', 'elements': {'nodes': [], 'edges': []}, 'graph_names': []}
+
+        index = self._read_graph_index() or {}
+        nodes: list[dict] = []
+        graph_names: list[str] = []
+        graph_of: dict[str, str] = {}
+
+        for g in index.get('graphs', []):
+            name = g.get('name', '')
+            if not name:
+                continue
+            graph_names.append(name)
+            parsed = self._get_parsed_graph(self._ontology_dir / f'{name}.jsonl')
+            if parsed is None:
+                continue
+            for eid in parsed.entity_ids:
+                graph_of.setdefault(eid, name)
+            nodes.append({
+                'data': {
+                    'id': f'cluster:{name}',
+                    'label': g.get('root_label') or name,
+                    'node_type': 'cluster',
+                    'entity_count': len(parsed.entities),
+                    'relation_count': len(parsed.relations),
+                    '_graph': name,
+                }
+            })
+
+        weights: dict[tuple[str, str], int] = {}
+        for edge in self._get_cross_relations().edges:
+            src = graph_of.get(edge['data']['source'])
+            tgt = graph_of.get(edge['data']['target'])
+            if src and tgt and src != tgt:
+                weights[(src, tgt)] = weights.get((src, tgt), 0) + 1
+
+        edges = [
+            {
+                'data': {
+                    'id': f'cx_{src}_{tgt}',
+                    'source': f'cluster:{src}',
+                    'target': f'cluster:{tgt}',
+                    'label': str(count),
+                    'weight': count,
+                    'cross_graph': True,
+                }
+            }
+            for (src, tgt), count in weights.items()
+        ]
+
+        return {
+            'mode': 'clusters',
+            'elements': {
+                'nodes': nodes,
+                'edges': edges,
+            },
+            'graph_names': graph_names,
+        }
+
+    def get_all_graphs_payload(self, mode: str = 'full') -> GraphsPayload:
+        """Serialized get_all_graphs() ('full') or get_cluster_summary() ('clusters').
+
+        Rebuilt only when a graph file, the graph index or a relation chunk
+        changed since the payload was last materialized.
+        """
+        key = (str(self._ontology_dir), mode)
+        stamps = self._ontology_stamps()
+        with _cache_lock:
+            cached = _payload_cache.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        data = self.get_cluster_summary() if mode == 'clusters' else self.get_all_graphs()
+        payload = GraphsPayload(data)
+        with _cache_lock:
+            _payload_cache[key] = (stamps, payload)
+        return payload
+
+    def _ontology_stamps(self) -> tuple:
+        """Stamps of every file the merged graph payload is built from."""
+        files = [self._ontology_dir / GRAPH_INDEX_FILE]
+        files.extend(sorted(self._ontology_dir.glob('*.jsonl')))
+        files.extend(sorted((self._ontology_dir / 'relations').glob('_relations.*.jsonl')))
+        return tuple((str(f), _file_stamp(f)) for f in files)
+
     def _load_cross_graph_relations(self) -> list[dict]:
         """Read all _relations.NNN.jsonl chunks from .ontology/relations/.
 
         FEATURE-059-F: Returns list of Cytoscape edge dicts representing
         cross-graph relations created by the ontology-synthesizer (059-D).
         """
+        return list(self._get_cross_relations().edges)
+
+    def _get_cross_relations(self) -> _CrossRelations:
+        """Cross-graph relations from the cache, re-read when any chunk changed."""
         relations_dir = self._ontology_dir / 'relations'
         if not relations_dir.is_dir():
-            return []
+            return _CrossRelations([])
 
-        edges: list[dict] = []
         # Sort by chunk number to maintain append order
         chunks = sorted(relations_dir.glob('_relations.*.jsonl'))
+        stamps = tuple((chunk.name, _file_stamp(chunk)) for chunk in chunks)
+        key = str(relations_dir)
+        with _cache_lock:
+            cached = _relations_cache.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        cross = _CrossRelations(self._read_relation_chunks(chunks))
+        with _cache_lock:
+            _relations_cache[key] = (stamps, cross)
+        return cross
+
+    @staticmethod
+    def _read_relation_chunks(chunks: list[Path]) -> list[dict]:
+        edges: list[dict] = []
         for chunk_path in chunks:
             try:
                 with open(chunk_path) as f:
@@ -226,32 +428,41 @@ class OntologyGraphService:
 
     @x_ipe_tracing()
     def search(self, query: str, graph_names: list[str] | None = None) -> list[dict]:
-        """Search nodes across graphs with case-insensitive text matching.
+        """Search nodes across graphs using each graph's token index.
 
-        Matches against entity label and description fields.
-        If graph_names is provided, only searches those graphs.
+        Matches query tokens against entity label, description and dimension
+        values as prefixes (fuzzily when nothing matches). Graphs are scored
+        by BM25 against the combined statistics of the searched graphs, and
+        relevance is the score relative to the best match (0..1]. If
+        graph_names is provided, only searches those graphs.
         """
         if not self.has_ontology or not query:
             return []
 
-        q = query.lower()
         targets = self._resolve_target_graphs(graph_names)
 
-        results = []
+        views = []
         for graph_name, graph_path in targets:
-            entities, _ = self._parse_graph_jsonl(graph_path)
-            for entity in entities:
-                props = entity.get('properties', {})
-                relevance = self._compute_relevance(props, q)
-                if relevance > 0:
-                    results.append({
-                        'node_id': entity.get('id', ''),
-                        'label': props.get('label', ''),
-                        'graph': graph_name,
-                        'relevance': relevance,
-                    })
+            parsed = self._get_parsed_graph(graph_path)
+            if parsed is not None:
+                views.append((graph_name, parsed.search_view()))
+        corpus = [text_index for _, (_, _, _, text_index) in views]
+
+        results = []
+        for graph_name, (entities, _, _, text_index) in views:
+            for eid, score, _ in text_index.search(query, corpus):
+                props = entities[eid].get('properties', {})
+                results.append({
+                    'node_id': eid,
+                    'label': props.get('label', ''),
+                    'graph': graph_name,
+                    'relevance': score,
+                })
 
         results.sort(key=lambda r: r['relevance'], reverse=True)
+        top_score = results[0]['relevance'] if results else 0
+        for r in results:
+            r['relevance'] = round(r['relevance'] / top_score, 4) if top_score else 0.0
         return results
 
     @x_ipe_tracing()
@@ -294,6 +505,7 @@ class OntologyGraphService:
             depth=depth,
             page_size=page_size,
             page=page,
+            graph_loader=self._search_graph_loader,
         )
 
         # Transform matches to API format
@@ -339,6 +551,35 @@ class OntologyGraphService:
         except (json.JSONDecodeError, OSError):
             return None
 
+    def _get_parsed_graph(self, path: Path) -> _ParsedGraph | None:
+        """Return the cached parse of a graph file, re-parsing it if it changed."""
+        stamp = _file_stamp(path)
+        key = str(path)
+        with _cache_lock:
+            cached = _graph_cache.get(key)
+            if stamp is None or not path.is_file():
+                _graph_cache.pop(key, None)
+                return None
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        entities, relations, needs_replay = self._parse_graph_file(path)
+        parsed = _ParsedGraph(
+            path, entities, relations, needs_replay,
+            nodes=[self._entity_to_cytoscape_node(e) for e in entities],
+            edges=[self._relation_to_cytoscape_edge(r) for r in relations],
+        )
+        with _cache_lock:
+            _graph_cache[key] = (stamp, parsed)
+        return parsed
+
+    def _search_graph_loader(self, path: Path) -> tuple[dict, list, dict, Any]:
+        """search.py graph loader serving cached graphs, adjacency and text indexes."""
+        parsed = self._get_parsed_graph(Path(path))
+        if parsed is None:
+            return {}, [], {}, _get_search_module().TextIndex()
+        return parsed.search_view()
+
     def _parse_graph_jsonl(self, path: Path) -> tuple[list[dict], list[dict]]:
         """Parse a graph JSONL file into entities and relations.
 
@@ -347,8 +588,15 @@ class OntologyGraphService:
         - 'relate': relation record with 'from', 'rel', 'to' fields
         Malformed lines are skipped.
         """
+        entities, relations, _ = self._parse_graph_file(path)
+        return entities, relations
+
+    @staticmethod
+    def _parse_graph_file(path: Path) -> tuple[list[dict], list[dict], bool]:
+        """_parse_graph_jsonl, also reporting whether other ops (update, delete, ...) occur."""
         entities: list[dict] = []
         relations: list[dict] = []
+        needs_replay = False
 
         try:
             with open(path) as f:
@@ -371,10 +619,12 @@ class OntologyGraphService:
                             'to': record.get('to', ''),
                             'properties': record.get('properties', {}),
                         })
+                    elif op in ('update', 'delete', 'unrelate'):
+                        needs_replay = True
         except OSError:
             pass
 
-        return entities, relations
+        return entities, relations, needs_replay
 
     def _entity_to_cytoscape_node(self, entity: dict) -> dict:
         """Transform an ontology entity to Cytoscape.js node format."""
@@ -437,33 +687,6 @@ class OntologyGraphService:
                 targets.append((p.stem, p))
         return targets
 
-    @staticmethod
-    def _compute_relevance(props: dict, query_lower: str) -> float:
-        """Compute relevance score for an entity against a search query."""
-        score = 0.0
-        label = props.get('label', '')
-        if isinstance(label, str) and query_lower in label.lower():
-            score += 1.0
-            if label.lower() == query_lower:
-                score += 0.5  # Exact match bonus
-
-        desc = props.get('description', '')
-        if isinstance(desc, str) and query_lower in desc.lower():
-            score += 0.5
-
-        dims = props.get('dimensions', {})
-        if isinstance(dims, dict):
-            for dim_vals in dims.values():
-                if isinstance(dim_vals, list):
-                    for v in dim_vals:
-                        if isinstance(v, str) and query_lower in v.lower():
-                            score += 0.25
-                            break
-                elif isinstance(dim_vals, str) and query_lower in dim_vals.lower():
-                    score += 0.25
-
-        return score
-
     @staticmethod
     def _compute_dominant_type_from_index(graph_info: dict) -> str:
         """Determine dominant node type. Falls back to 'concept'."""
@@ -11,9 +11,10 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from x_ipe.services.tools_config_service import ToolsConfigService
-from x_ipe.tracing.writer import TraceLogWriter
+from x_ipe.tracing.writer import TraceLogWriter, SEGMENT_SUFFIX
+from x_ipe.tracing.index import TraceIndex, get_trace_index
 from x_ipe.tracing.parser import TraceLogParser
-from x_ipe.tracing import x_ipe_tracing
+from x_ipe.tracing import x_ipe_tracing, invalidate_tracing_config
 
 
 class TracingService:
@@ -68,7 +69,9 @@ class TracingService:
             "stop_at": config.get("tracing_stop_at"),
             "log_path": config.get("tracing_log_path", "instance/traces/"),
             "retention_hours": config.get("tracing_retention_hours", 24),
-            "ignored_apis": config.get("tracing_ignored_apis", [])
+            "ignored_apis": config.get("tracing_ignored_apis", []),
+            "segment_files": config.get("tracing_segment_files", False),
+            "format": config.get("tracing_format", "text")
         }
     
     @x_ipe_tracing()
@@ -125,6 +128,7 @@ class TracingService:
         config = self.tools_config.load()
         config["tracing_stop_at"] = stop_at_str
         self.tools_config.save(config)
+        invalidate_tracing_config(str(self.project_root))
         
         return {"success": True, "stop_at": stop_at_str}
     
@@ -142,6 +146,7 @@ class TracingService:
         config["tracing_stop_at"] = None
         config["tracing_enabled"] = False
         self.tools_config.save(config)
+        invalidate_tracing_config(str(self.project_root))
         
         return {"success": True}
     
@@ -156,19 +161,31 @@ class TracingService:
         config = self.tools_config.load()
         config["tracing_ignored_apis"] = patterns
         self.tools_config.save(config)
+        invalidate_tracing_config(str(self.project_root))
     
     @x_ipe_tracing()
-    def list_logs(self) -> List[Dict[str, Any]]:
+    def list_logs(self, api: Optional[str] = None, status: Optional[str] = None,
+                  limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        List all trace log files.
+        List trace logs, newest first.
+        
+        Served from the trace index (index.jsonl), so the cost does not
+        grow with the number of log files.
+        
+        Args:
+            api: Only traces whose API contains this text
+            status: Only traces with this status (SUCCESS, ERROR)
+            limit: Maximum number of traces to return
         
         Returns:
-            List of log file metadata dictionaries:
+            List of log metadata dictionaries:
             - trace_id: str
             - api: str (e.g., "GET /api/project/structure")
             - filename: str
             - size: int (bytes)
             - timestamp: str (ISO format)
+            - status: str or None
+            - duration_ms: int or None
         """
         config = self.get_config()
         log_path = self.project_root / config["log_path"]
@@ -177,66 +194,42 @@ class TracingService:
             return []
         
         logs = []
-        for filepath in sorted(log_path.glob("*.log"), reverse=True):
-            try:
-                # Parse filename: {timestamp}-{api}-{trace_id}.log
-                # Example: 20260202-072505-get-api-project-structure-a649c048-3d73.log
-                stem = filepath.stem
-                
-                # Extract trace_id (last 2 UUID segments: xxxxxxxx-xxxx)
-                # Split and find the UUID pattern at the end
-                parts = stem.split("-")
-                if len(parts) >= 4:
-                    # Last 2 parts form the trace_id (e.g., "a649c048-3d73")
-                    trace_id = f"{parts[-2]}-{parts[-1]}"
-                    # First 2 parts are timestamp (YYYYMMDD-HHMMSS)
-                    # Middle parts are the API name
-                    api_parts = parts[2:-2]  # Skip timestamp and trace_id
-                    api_name = "-".join(api_parts) if api_parts else "unknown"
-                    # Convert api_name back to path format (e.g., "get-api-project-structure" -> "GET /api/project/structure")
-                    api = self._filename_to_api(api_name)
-                else:
-                    trace_id = stem
-                    api = "/unknown"
-                
-                stat = filepath.stat()
-                logs.append({
-                    "trace_id": trace_id,
-                    "api": api,
-                    "filename": filepath.name,
-                    "size": stat.st_size,
-                    "timestamp": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-            except OSError:
+        for record in self._get_index(log_path).records():
+            if api and api.lower() not in record.get("api", "").lower():
+                continue
+            if status and (record.get("status") or "").upper() != status.upper():
                 continue
+            logs.append({
+                "trace_id": record["trace_id"],
+                "api": record.get("api") or "/unknown",
+                "filename": record.get("file", ""),
+                "size": record.get("length", 0),
+                "timestamp": self._local_timestamp(record.get("timestamp", "")),
+                "status": record.get("status"),
+                "duration_ms": record.get("total_ms")
+            })
+            if limit is not None and len(logs) >= limit:
+                break
         
         return logs
     
-    def _filename_to_api(self, api_name: str) -> str:
-        """
-        Convert sanitized API filename component back to API format.
-        
-        Args:
-            api_name: Sanitized name (e.g., "get-api-project-structure")
-            
-        Returns:
-            API string (e.g., "GET /api/project/structure")
-        """
-        if not api_name or api_name == "unknown":
-            return "/unknown"
-        
-        # Split by first hyphen to get method
-        parts = api_name.split("-", 1)
-        if len(parts) < 2:
-            return f"/{api_name}"
-        
-        method = parts[0].upper()
-        path_part = parts[1]
-        
-        # Convert hyphens back to slashes for path
-        path = "/" + path_part.replace("-", "/")
-        
-        return f"{method} {path}"
+    def _get_index(self, log_path: Path) -> TraceIndex:
+        """Return the trace index, building it from the log files if it is missing."""
+        index = get_trace_index(log_path)
+        index.ensure(TraceLogWriter(str(log_path)).scan_index_records)
+        return index
+    
+    @staticmethod
+    def _local_timestamp(trace_timestamp: str) -> str:
+        """Convert a stored UTC timestamp to the local ISO format list_logs returns."""
+        try:
+            value = trace_timestamp[:-1] if trace_timestamp.endswith("Z") else trace_timestamp
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone().replace(tzinfo=None).isoformat()
+        except ValueError:
+            return trace_timestamp
     
     @x_ipe_tracing()
     def cleanup_on_startup(self) -> int:
@@ -275,13 +268,15 @@ class TracingService:
             return 0
         
         deleted = 0
-        for filepath in log_path.glob("*.log"):
+        for filepath in TraceLogWriter(str(log_path)).iter_log_files():
             try:
                 filepath.unlink()
                 deleted += 1
             except OSError:
                 continue
         
+        get_trace_index(log_path).clear()
+        
         return deleted
     
     @x_ipe_tracing()
@@ -289,8 +284,8 @@ class TracingService:
         """
         Get parsed trace data for visualization.
         
-        Searches for a log file matching the trace_id (exact or partial)
-        and parses it into visualization-ready structure.
+        Looks up the trace_id (exact or partial) in the trace index and
+        parses that trace into visualization-ready structure.
         
         Args:
             trace_id: Full or partial trace ID to search for
@@ -313,21 +308,61 @@ class TracingService:
         if not log_path.exists():
             return None
         
-        # Search for matching file
-        matching_file = None
-        for filepath in log_path.glob("*.log"):
-            if trace_id in filepath.stem:
-                matching_file = filepath
-                break
-        
-        if not matching_file:
+        filepath, record = self._locate_trace(trace_id)
+        if filepath is None:
             return None
         
-        # Parse the file
+        # Parse the trace (text or JSONL)
         parser = TraceLogParser()
-        result = parser.parse(matching_file)
+        if filepath.name.endswith(SEGMENT_SUFFIX):
+            content = TraceLogWriter.read_segment_trace(filepath, record["offset"], record["length"])
+            result = parser.parse_text(content)
+        else:
+            result = parser.parse(filepath)
         
         # Add filename for reference
-        result["filename"] = matching_file.name
+        result["filename"] = filepath.name
         
         return result
+    
+    @x_ipe_tracing()
+    def get_trace_text(self, trace_id: str) -> Optional[str]:
+        """
+        Get a trace in the human-readable text log format.
+        
+        JSONL traces are rendered on demand; text traces are returned as stored.
+        
+        Args:
+            trace_id: Full or partial trace ID to search for
+            
+        Returns:
+            Text log or None if not found
+        """
+        filepath, record = self._locate_trace(trace_id)
+        if filepath is None:
+            return None
+        
+        parser = TraceLogParser()
+        if filepath.name.endswith(SEGMENT_SUFFIX):
+            content = TraceLogWriter.read_segment_trace(filepath, record["offset"], record["length"])
+            return parser.render_text(content.split("\n"))
+        with open(filepath, encoding='utf-8', errors='replace', newline='') as f:
+            return parser.render_text(f)
+    
+    def _locate_trace(self, trace_id: str):
+        """Find a trace's file and index record, or (None, None)."""
+        config = self.get_config()
+        log_path = self.project_root / config["log_path"]
+        
+        if not log_path.exists():
+            return None, None
+        
+        # Look up the trace's file and byte range in the index
+        record = self._get_index(log_path).find(trace_id)
+        if record is None:
+            return None, None
+        
+        filepath = log_path / record["file"]
+        if not filepath.is_file():
+            return None, None
+        return filepath, record
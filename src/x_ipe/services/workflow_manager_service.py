@@ -9,16 +9,28 @@ Manages the full lifecycle of engineering workflows:
 - Atomic writes for data integrity
 - Deliverables resolution (FEATURE-036-E)
 - Auto-archive of stale workflows (FEATURE-036-E)
+- Process-wide caching of parsed states and the template, with
+  write-behind for action status updates
+- Optimistic concurrency: action updates are applied to a private copy
+  and committed with a compare-and-swap on the state's revision, checked
+  under the workflow file lock shared with the app-interactor scripts
+- Batched deliverable existence checks over cached directory listings
 """
 
+import atexit
 import fcntl
 import json
 import logging
 import os
+import pickle
 import re
 import shutil
 import tempfile
+import threading
+import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -37,8 +49,14 @@ INTERACTION_MODES = (
 )
 
 
-def _load_workflow_template(project_root: str = None) -> dict:
-    """Load workflow template from x-ipe-docs/config/workflow-template.json."""
+# Parsed templates and their compiled configs, keyed by template path and
+# validated against the file's mtime and size: {path: {"stamp", "template", "config"}}
+_template_cache = {}
+_template_lock = threading.Lock()
+
+
+def _template_entry(project_root: str = None):
+    """Return the cache entry of the first workflow template found, or None."""
     search_paths = []
     if project_root:
         search_paths.append(Path(project_root) / "x-ipe-docs" / "config" / "workflow-template.json")
@@ -49,16 +67,46 @@ def _load_workflow_template(project_root: str = None) -> dict:
     search_paths.append(service_dir.parent / "resources" / "config" / "workflow-template.json")
 
     for config_path in search_paths:
-        if config_path.exists():
-            try:
-                return json.loads(config_path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                break
-    return {}
+        try:
+            stat = config_path.stat()
+        except OSError:
+            continue
+        key = str(config_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _template_lock:
+            entry = _template_cache.get(key)
+            if entry is None or entry["stamp"] != stamp:
+                try:
+                    template = json.loads(config_path.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    return None
+                entry = _template_cache[key] = {"stamp": stamp, "template": template, "config": None}
+            return entry
+    return None
+
+
+def _load_workflow_template(project_root: str = None) -> dict:
+    """Load workflow template from x-ipe-docs/config/workflow-template.json.
+
+    The parsed template is cached and shared; callers must not modify it.
+    """
+    entry = _template_entry(project_root)
+    return entry["template"] if entry else {}
 
 
 def _init_config(project_root: str = None):
-    """Initialise config from template file, deriving internal structures.
+    """Return the config compiled from the template file (cached with the template)."""
+    entry = _template_entry(project_root)
+    if entry is None:
+        return _compile_config({})
+    with _template_lock:
+        if entry["config"] is None:
+            entry["config"] = _compile_config(entry["template"])
+        return entry["config"]
+
+
+def _compile_config(tpl: dict):
+    """Derive internal structures from a template.
 
     The template uses a condensed per-action format::
 
@@ -72,7 +120,6 @@ def _init_config(project_root: str = None):
       deliverable_categories – action → category
       next_actions_map       – action → [suggested next actions]
     """
-    tpl = _load_workflow_template(project_root)
     tpl_stages = tpl.get("stages", {})
 
     if tpl_stages and all("actions" in s for s in tpl_stages.values()):
@@ -200,10 +247,486 @@ NAME_PATTERN = re.compile(r"^[\w-]+$")
 MAX_NAME_LENGTH = 100
 
 
+# Coalescing window for deferred (write-behind) state writes
+WRITE_BEHIND_DELAY = 0.25  # seconds
+
+# Attempts of an optimistic action update before giving up with CONFLICT
+MAX_UPDATE_ATTEMPTS = 100
+
+
 def _now_iso():
     return datetime.now(timezone.utc).isoformat()
 
 
+def _copy_state(state: dict) -> dict:
+    """Deep-copy a JSON-shaped state (a pickle round trip is ~3x faster than deepcopy)."""
+    return pickle.loads(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
+
+def _file_stamp(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _write_state_file(path: str, state: dict):
+    """Atomically write a workflow state file; returns its new stamp."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return _file_stamp(path)
+
+
+WORKFLOW_INDEX_FILE = ".workflow-index.json"
+
+
+def _summarize_state(state: dict, fallback_name: str) -> dict:
+    """The list_workflows record for one workflow state."""
+    feature_count = len(state.get("features", []))
+    if not feature_count and "stages" in state:
+        for sn in ("implement", "validation", "feedback"):
+            feats = state.get("stages", {}).get(sn, {}).get("features", {})
+            if feats:
+                feature_count = len(feats)
+                break
+    interaction_mode = (state.get("global", {})
+                        .get("process_preference", {})
+                        .get("interaction_mode", "interact-with-human"))
+    return {
+        "name": state.get("name", fallback_name),
+        "created": state.get("created"),
+        "last_activity": state.get("last_activity"),
+        "current_stage": state.get("current_stage"),
+        "feature_count": feature_count,
+        "interaction_mode": interaction_mode,
+    }
+
+
+class _SummaryIndex:
+    """Per-directory summaries of workflow files, persisted in .workflow-index.json.
+
+    Records are updated whenever a state is written through the service and
+    carry the stamp of the file they describe. Listing stats each
+    workflow file and re-parses only those whose stamp differs (edited
+    outside the process, or new), so it never loads full states otherwise.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._dirs = {}  # directory -> {"records": {filename: {"stamp", "summary"}}, "dirty": bool}
+
+    def record(self, path: str, state: dict, stamp) -> None:
+        """Record the summary of *state*, the content of *path* as of *stamp*."""
+        directory, filename = os.path.split(path)
+        with self._lock:
+            entry = self._load(directory)
+            entry["records"][filename] = {
+                "stamp": list(stamp) if stamp else None,
+                "summary": _summarize_state(state, filename[:-len(".json")]),
+            }
+            entry["dirty"] = True
+
+    def summaries(self, directory: str) -> list:
+        """Return summaries of all workflow-*.json files in *directory*, sorted by file name."""
+        return [summary for _, summary in self.records(directory)]
+
+    def records(self, directory: str) -> list:
+        """Return (file name, summary) of all readable workflow files in *directory*."""
+        with self._lock:
+            entry = self._load(directory)
+            records = entry["records"]
+            seen = set()
+            with os.scandir(directory) as it:
+                for dirent in it:
+                    name = dirent.name
+                    if not (name.startswith("workflow-") and name.endswith(".json")) or not dirent.is_file():
+                        continue
+                    seen.add(name)
+                    stat = dirent.stat()
+                    stamp = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+                    record = records.get(name)
+                    if record is None or record["stamp"] != stamp:
+                        records[name] = {"stamp": stamp, "summary": self._parse(dirent.path, name)}
+                        entry["dirty"] = True
+            for name in set(records) - seen:
+                del records[name]
+                entry["dirty"] = True
+            if entry["dirty"]:
+                self._save(directory, records)
+                entry["dirty"] = False
+            return [(name, records[name]["summary"]) for name in sorted(records)
+                    if records[name]["summary"] is not None]
+
+    def _load(self, directory: str) -> dict:
+        entry = self._dirs.get(directory)
+        if entry is None:
+            records = {}
+            try:
+                with open(os.path.join(directory, WORKFLOW_INDEX_FILE), encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and isinstance(data.get("workflows"), dict):
+                    records = data["workflows"]
+            except (OSError, ValueError):
+                pass
+            entry = self._dirs[directory] = {"records": records, "dirty": False}
+        return entry
+
+    @staticmethod
+    def _parse(path: str, filename: str):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return _summarize_state(json.load(f), filename[:-len(".json")])
+        except (OSError, ValueError, AttributeError):
+            return None  # unreadable or corrupted; re-parsed when the file changes
+
+    @staticmethod
+    def _save(directory: str, records: dict) -> None:
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "workflows": records}, f, ensure_ascii=False)
+            os.replace(tmp_path, os.path.join(directory, WORKFLOW_INDEX_FILE))
+        except OSError as exc:
+            logger.warning("Failed to save workflow index in %s: %s", directory, exc)
+
+
+_summary_index = _SummaryIndex()
+
+
+class _StateCache:
+    """Process-wide cache of parsed workflow states, shared by all service instances.
+
+    Entries are keyed by file path and validated against the file's
+    (inode, size, mtime) stamp, so files changed outside the process are
+    re-read. Cached states are never modified in place: readers get copies
+    and writers install new objects. Deferred writes are flushed once per
+    WRITE_BEHIND_DELAY, so a burst of action updates serializes the file
+    once.
+
+    Every installed state gets a "revision" one above the cached one, so
+    swap() can commit an update only if nothing was installed since the
+    updater read its copy.
+
+    Files are written under the workflow's flock (workflow-<name>.lock),
+    which the app-interactor scripts also hold while they update a state.
+    The flock and file I/O of each workflow run under a lock of its own,
+    so a workflow held by another process does not stall the others.
+    A deferred update keeps a function that re-applies it: if the file was
+    changed by another process before the flush, the pending updates are
+    re-applied to the newer file instead of being dropped. The flush also
+    runs at exit; updates of a workflow whose file is gone are dropped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # guards the dicts and the timer, never held for I/O
+        self._entries = {}  # path -> {"state", "stamp", "config", "dirty", "pending"}
+        self._timer = None
+        self._path_locks = {}  # path -> RLock serializing the flock and file I/O of one workflow
+        self._locked = set()  # paths whose workflow flock this process holds (under their path lock)
+
+    def _path_lock(self, path: str):
+        with self._lock:
+            lock = self._path_locks.get(path)
+            if lock is None:
+                lock = self._path_locks[path] = threading.RLock()
+            return lock
+
+    def _entry(self, path: str):
+        with self._lock:
+            return self._entries.get(path)
+
+    def _drop(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def get(self, path: str, config):
+        """Cached state for *path*, or None if missing, stale or parsed under another template.
+
+        Pending updates are flushed first if the file changed on disk.
+        """
+        with self._path_lock(path):
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if entry["dirty"] and (entry["config"] is not config or _file_stamp(path) != entry["stamp"]):
+                self._flush_entry(path, entry)
+                entry = self._entry(path)
+            if entry is not None and entry["config"] is config and _file_stamp(path) == entry["stamp"]:
+                return entry["state"]
+            self._drop(path)
+            return None
+
+    def put(self, path: str, state: dict, stamp, config) -> None:
+        with self._path_lock(path), self._lock:
+            self._entries[path] = {"state": state, "stamp": stamp, "config": config,
+                                   "dirty": False, "pending": []}
+
+    def write(self, path: str, state: dict, config) -> None:
+        """Install *state* for *path* and write it now."""
+        with self._path_lock(path):
+            self._install(path, state, config)
+
+    def swap(self, path: str, state: dict, base_revision: int, config,
+             defer: bool = False, reapply=None) -> bool:
+        """Install *state* only if *path* is still at *base_revision* (compare-and-swap).
+
+        Returns False, installing nothing, if another update won the race
+        or the file changed on disk since it was read. The check runs under
+        the workflow flock, so it also sees writes by other processes. With
+        *defer*, the write happens within WRITE_BEHIND_DELAY; *reapply(state)*
+        must then apply the same update to a state read from disk (see class
+        docs). Only updates of the same workflow wait for each other.
+        """
+        with self._path_lock(path), self._file_lock(path):
+            current = self.get(path, config)
+            if current is None or current.get("revision", 0) != base_revision:
+                return False
+            entry = self._entry(path)
+            if defer and reapply is not None:
+                state["revision"] = base_revision + 1
+                entry.update(state=state, dirty=True)
+                entry["pending"].append(reapply)
+                _summary_index.record(path, state, entry["stamp"])
+                with self._lock:
+                    if self._timer is None:
+                        self._timer = threading.Timer(WRITE_BEHIND_DELAY, self.flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+                return True
+            self._install(path, state, config)
+            return True
+
+    def _install(self, path: str, state: dict, config) -> None:
+        """Write *state* to *path* under the workflow lock and cache it (call under the path lock)."""
+        entry = self._entry(path)
+        current = entry["state"].get("revision", 0) if entry is not None else 0
+        state["revision"] = max(current, state.get("revision", 0)) + 1
+        self._drop(path)
+        with self._file_lock(path):
+            stamp = _write_state_file(path, state)
+        self.put(path, state, stamp, config)
+        _summary_index.record(path, state, stamp)
+
+    def discard(self, path: str) -> None:
+        """Forget *path* and any unflushed update (the file is being removed or moved)."""
+        with self._path_lock(path):
+            self._drop(path)
+
+    def flush(self) -> None:
+        """Write every deferred state now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty = [path for path, entry in self._entries.items() if entry["dirty"]]
+        for path in dirty:
+            with self._path_lock(path):
+                entry = self._entry(path)
+                if entry is not None and entry["dirty"]:
+                    self._flush_entry(path, entry)
+
+    def _flush_entry(self, path: str, entry: dict) -> None:
+        """Write a deferred state, re-applying its updates if the file changed on disk (call under the path lock)."""
+        pending = entry["pending"]
+        entry.update(dirty=False, pending=[])
+        if not os.path.exists(path):
+            # Deleted or moved along with its folder: writing it back would resurrect it
+            logger.debug("Dropping %d unflushed update(s) of removed workflow %s", len(pending), path)
+            self._drop(path)
+            return
+        try:
+            with self._file_lock(path):
+                if _file_stamp(path) != entry["stamp"]:
+                    state = self._reapply(path, entry["state"], pending)
+                    if state is None:
+                        self._drop(path)
+                        return
+                    entry["state"] = state
+                entry["stamp"] = _write_state_file(path, entry["state"])
+        except OSError as exc:
+            logger.warning("Failed to flush workflow state %s: %s", path, exc)
+            self._drop(path)
+            return
+        _summary_index.record(path, entry["state"], entry["stamp"])
+
+    @contextmanager
+    def _file_lock(self, path: str):
+        """Hold the workflow flock of *path*; re-entrant within this process (call under the path lock)."""
+        if path in self._locked:
+            yield
+            return
+        with _workflow_file_lock(path):
+            self._locked.add(path)
+            try:
+                yield
+            finally:
+                self._locked.discard(path)
+
+    @staticmethod
+    def _reapply(path: str, cached: dict, pending: list):
+        """Apply *pending* updates to the state on disk; None if the file is gone or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Workflow file %s changed on disk and cannot be read (%s); "
+                           "dropping %d unflushed update(s)", path, exc, len(pending))
+            return None
+        for apply in pending:
+            err = apply(state)
+            if err:
+                logger.warning("Could not re-apply update to %s changed on disk: %s",
+                               path, err.get("message", err))
+        state["revision"] = max(cached.get("revision", 0), state.get("revision", 0)) + 1
+        return state
+
+
+def _workflow_file_lock(path: str):
+    """Exclusive flock on the workflow's lock file (workflow-<name>.lock)."""
+    return _FileLock(os.path.splitext(path)[0] + ".lock")
+
+
+class _FileLock:
+    """Context manager holding an flock on *lock_path*.
+
+    The app-interactor scripts unlink the lock file when they release it,
+    so the lock is re-taken if the path no longer names the locked inode.
+    """
+
+    def __init__(self, lock_path: str):
+        self._lock_path = lock_path
+        self._fd = None
+
+    def __enter__(self):
+        while True:
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_RDWR)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.stat(self._lock_path).st_ino == os.fstat(fd).st_ino:
+                    self._fd = fd
+                    return self
+            except FileNotFoundError:
+                pass
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+_state_cache = _StateCache()
+atexit.register(_state_cache.flush)
+
+
+# Directories listed in parallel once a deliverable check spans this many
+DIR_SCAN_PARALLEL_MIN = 8
+DIR_SCAN_WORKERS = 8
+# A listing is only cached once its directory's mtime is this much older than
+# the scan, so a change within the same mtime tick cannot hide behind it
+DIR_SCAN_RACY_NS = 2_000_000_000
+
+
+class _DirListingCache:
+    """Process-wide cache of directory listings for deliverable existence checks.
+
+    Each directory is listed with one scandir and its entry names cached
+    with the directory's mtime, so checking many deliverables costs one
+    stat per distinct directory instead of one lookup per path. The file
+    watcher evicts listings as changes arrive; entries are still validated
+    against the mtime because the watcher skips gitignored paths and
+    directory-only changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # dir path -> (mtime_ns, frozenset of existing names)
+
+    def exists_many(self, paths) -> list:
+        """Return os.path.exists() for each of *paths*, one listing per directory."""
+        results = [False] * len(paths)
+        by_dir = {}
+        for i, path in enumerate(paths):
+            path = os.fspath(path)
+            parent, name = os.path.split(os.path.normpath(path))
+            if not name or name in (os.curdir, os.pardir) or os.pardir in Path(path).parts:
+                results[i] = os.path.exists(path)  # ".." must resolve symlinks first
+                continue
+            by_dir.setdefault(parent, []).append((i, name))
+
+        dirs = list(by_dir)
+        if len(dirs) >= DIR_SCAN_PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=min(DIR_SCAN_WORKERS, len(dirs))) as pool:
+                listings = list(pool.map(self._listing, dirs))
+        else:
+            listings = [self._listing(d) for d in dirs]
+
+        for directory, names in zip(dirs, listings):
+            for i, name in by_dir[directory]:
+                results[i] = name in names
+        return results
+
+    def invalidate(self, paths) -> None:
+        """Drop listings affected by changes to *paths* (watcher callback)."""
+        with self._lock:
+            for path in paths:
+                path = os.path.normpath(os.fspath(path))
+                self._entries.pop(os.path.dirname(path), None)
+                prefix = path + os.sep
+                for directory in [d for d in self._entries if d == path or d.startswith(prefix)]:
+                    del self._entries[directory]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _listing(self, directory: str) -> frozenset:
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._entries.pop(directory, None)
+            return frozenset()
+        with self._lock:
+            entry = self._entries.get(directory)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        names = set()
+        try:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    # Path.exists() follows symlinks, so dangling ones do not count
+                    if not dir_entry.is_symlink() or os.path.exists(dir_entry.path):
+                        names.add(dir_entry.name)
+        except OSError:
+            return frozenset()
+        names = frozenset(names)
+        with self._lock:
+            if time.time_ns() - mtime > DIR_SCAN_RACY_NS:
+                self._entries[directory] = (mtime, names)
+            else:
+                self._entries.pop(directory, None)
+        return names
+
+
+_dir_listings = _DirListingCache()
+
+
+def invalidate_dir_listings(paths) -> None:
+    """Evict cached deliverable directory listings for changed paths."""
+    _dir_listings.invalidate(paths)
+
+
 class WorkflowManagerService:
     """Backend service for engineering workflow management."""
 
@@ -246,35 +769,10 @@ class WorkflowManagerService:
 
     @x_ipe_tracing()
     def list_workflows(self) -> list:
-        """Return metadata for all active workflows."""
+        """Return metadata for all active workflows (from the summary index)."""
         if not self._workflow_dir.exists():
             return []
-
-        results = []
-        for f in sorted(self._workflow_dir.glob("workflow-*.json")):
-            try:
-                state = json.loads(f.read_text(encoding="utf-8"))
-                feature_count = len(state.get("features", []))
-                if not feature_count and "stages" in state:
-                    for sn in ("implement", "validation", "feedback"):
-                        feats = state.get("stages", {}).get(sn, {}).get("features", {})
-                        if feats:
-                            feature_count = len(feats)
-                            break
-                interaction_mode = (state.get("global", {})
-                                    .get("process_preference", {})
-                                    .get("interaction_mode", "interact-with-human"))
-                results.append({
-                    "name": state.get("name", f.stem),
-                    "created": state.get("created"),
-                    "last_activity": state.get("last_activity"),
-                    "current_stage": state.get("current_stage"),
-                    "feature_count": feature_count,
-                    "interaction_mode": interaction_mode,
-                })
-            except (json.JSONDecodeError, KeyError):
-                continue
-        return results
+        return [dict(summary) for summary in _summary_index.summaries(str(self._workflow_dir))]
 
     @x_ipe_tracing()
     def delete_workflow(self, name: str) -> dict:
@@ -283,6 +781,7 @@ class WorkflowManagerService:
         if not path.exists():
             return {"success": False, "error": "NOT_FOUND",
                     "message": f"Workflow '{name}' not found"}
+        _state_cache.discard(str(path))
         path.unlink()
         lock_path = path.with_suffix(".lock")
         lock_path.unlink(missing_ok=True)
@@ -330,27 +829,26 @@ class WorkflowManagerService:
         if deliverables is not None and isinstance(deliverables, list):
             deliverables = self._convert_list_to_keyed(action, deliverables)
 
-        # File-level lock to prevent lost-update race condition.
-        # Concurrent read-modify-write cycles on the same JSON file would
-        # silently discard all but the last writer's changes without this.
-        lock_path = self._get_workflow_path(workflow_name).with_suffix(".lock")
-        lock_path.parent.mkdir(parents=True, exist_ok=True)
-        lock_fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
-        try:
-            fcntl.flock(lock_fd, fcntl.LOCK_EX)
-            return self._do_update_action(
+        # Optimistic concurrency: each attempt updates a private copy and
+        # commits it only if no other update was installed meanwhile, in
+        # this process or (checked under the workflow flock) by another one,
+        # so the updates are built without holding the lock and none is lost.
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            result = self._do_update_action(
                 workflow_name, action, status, feature_id,
                 deliverables, context, features)
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
+            if result is not None:
+                return result
+        return {"success": False, "error": "CONFLICT",
+                "message": f"Workflow '{workflow_name}' is being updated concurrently — retry later"}
 
     def _do_update_action(self, workflow_name, action, status, feature_id,
                           deliverables, context, features):
-        """Inner update logic, called under file lock."""
+        """One optimistic update attempt; returns None if another update won the race."""
         state = self._read_state(workflow_name)
         if "error" in state and state.get("success") is False:
             return state
+        base_revision = state.get("revision", 0)
 
         if deliverables is not None and not self.validate_action_deliverables(action, deliverables):
             return {
@@ -359,6 +857,25 @@ class WorkflowManagerService:
                 "message": f"Deliverables for action '{action}' do not match the current workflow template",
             }
 
+        def apply(target):
+            return self._apply_action_update(target, action, status, feature_id,
+                                             deliverables, context, features)
+
+        err = apply(state)
+        if err:
+            return err
+        if not self._swap_state(workflow_name, state, base_revision, defer=True, reapply=apply):
+            return None
+
+        next_action = self._compute_next_action(state)
+        return {"success": True, "data": {
+            "action_updated": action, "new_status": status,
+            "current_stage": state["current_stage"],
+            "next_action": next_action}}
+
+    def _apply_action_update(self, state, action, status, feature_id,
+                             deliverables, context, features):
+        """Apply an action update to *state* in place; returns an error dict or None."""
         # Find the action in the state
         if feature_id:
             updated, err = self._update_feature_action(state, action, status, feature_id, deliverables, context)
@@ -382,18 +899,12 @@ class WorkflowManagerService:
         # Re-evaluate stage gating
         self._evaluate_stage_gating(state)
         state["last_activity"] = _now_iso()
-        self._write_state(workflow_name, state)
-
-        next_action = self._compute_next_action(state)
-        return {"success": True, "data": {
-            "action_updated": action, "new_status": status,
-            "current_stage": state["current_stage"],
-            "next_action": next_action}}
+        return None
 
     @x_ipe_tracing()
     def check_dependencies(self, workflow_name: str, feature_id: str) -> dict:
         """Check if a feature's dependencies are satisfied."""
-        state = self._read_state(workflow_name)
+        state = self._read_state(workflow_name, readonly=True)
         if "error" in state and state.get("success") is False:
             return state
 
@@ -419,15 +930,19 @@ class WorkflowManagerService:
     @x_ipe_tracing()
     def get_next_action(self, workflow_name: str) -> dict:
         """Return the recommended next action."""
-        state = self._read_state(workflow_name)
+        state = self._read_state(workflow_name, readonly=True)
         if "error" in state and state.get("success") is False:
             return state
         return self._compute_next_action(state)
 
     @x_ipe_tracing()
     def resolve_deliverables(self, workflow_name: str) -> dict:
-        """Collect all deliverables from all actions, check file existence."""
-        state = self._read_state(workflow_name)
+        """Collect all deliverables from all actions, check file existence.
+
+        Existence is checked once all entries are collected, in one batch
+        over cached per-directory listings.
+        """
+        state = self._read_state(workflow_name, readonly=True)
         if "error" in state and state.get("success") is False:
             return state
 
@@ -444,26 +959,24 @@ class WorkflowManagerService:
                         if isinstance(value, list):
                             # CR-003: Expand array into individual entries
                             for path_str in value:
-                                full_path = self._project_root / path_str
                                 deliverables.append({
                                     "name": tag_name,
                                     "path": path_str,
                                     "category": category,
                                     "stage": stage_name,
-                                    "exists": full_path.exists(),
+                                    "exists": None,
                                 })
                         else:
                             expanded = self._maybe_expand_kb_reference(tag_name, value, category, stage_name)
                             deliverables.extend(expanded)
                 elif isinstance(raw_deliverables, list):
                     for path_str in raw_deliverables:
-                        full_path = self._project_root / path_str
                         deliverables.append({
                             "name": os.path.basename(path_str),
                             "path": path_str,
                             "category": category,
                             "stage": stage_name,
-                            "exists": full_path.exists(),
+                            "exists": None,
                         })
 
         # Per-feature stages
@@ -480,7 +993,6 @@ class WorkflowManagerService:
                             if isinstance(value, list):
                                 # CR-003: Expand array into individual entries
                                 for path_str in value:
-                                    full_path = self._project_root / path_str
                                     deliverables.append({
                                         "name": tag_name,
                                         "path": path_str,
@@ -488,7 +1000,7 @@ class WorkflowManagerService:
                                         "stage": stage_name,
                                         "feature_id": feat_id,
                                         "feature_name": feat_name,
-                                        "exists": full_path.exists(),
+                                        "exists": None,
                                     })
                             else:
                                 expanded = self._maybe_expand_kb_reference(
@@ -498,7 +1010,6 @@ class WorkflowManagerService:
                                 deliverables.extend(expanded)
                     elif isinstance(raw_deliverables, list):
                         for path_str in raw_deliverables:
-                            full_path = self._project_root / path_str
                             deliverables.append({
                                 "name": os.path.basename(path_str),
                                 "path": path_str,
@@ -506,14 +1017,20 @@ class WorkflowManagerService:
                                 "stage": stage_name,
                                 "feature_id": feat_id,
                                 "feature_name": feat_name,
-                                "exists": full_path.exists(),
+                                "exists": None,
                             })
 
+        found = _dir_listings.exists_many([self._project_root / d["path"] for d in deliverables])
+        for entry, exists in zip(deliverables, found):
+            entry["exists"] = exists
         return {"deliverables": deliverables, "count": len(deliverables)}
 
     @x_ipe_tracing()
     def _maybe_expand_kb_reference(self, tag_name, value, category, stage_name, **extra):
-        """Expand .knowledge-reference.yaml into individual referenced files."""
+        """Expand .knowledge-reference.yaml into individual referenced files.
+
+        Entries are returned with "exists" unset; resolve_deliverables fills it.
+        """
         if os.path.basename(value) == ".knowledge-reference.yaml":
             full_path = self._project_root / value
             if full_path.exists():
@@ -523,16 +1040,17 @@ class WorkflowManagerService:
                     refs = parsed.get("knowledge-reference", []) if isinstance(parsed, dict) else []
                     if not isinstance(refs, list):
                         refs = []
+                    if not all(isinstance(ref_path, str) for ref_path in refs):
+                        raise TypeError("knowledge-reference entries must be paths")
                     if refs:
                         items = []
                         for ref_path in refs:
-                            ref_full = self._project_root / ref_path
                             entry = {
                                 "name": tag_name,
                                 "path": ref_path,
                                 "category": category,
                                 "stage": stage_name,
-                                "exists": ref_full.exists(),
+                                "exists": None,
                             }
                             entry.update(extra)
                             items.append(entry)
@@ -540,13 +1058,12 @@ class WorkflowManagerService:
                 except Exception:
                     pass  # Fall through to default
         # Default: return as-is
-        full_path = self._project_root / value
         entry = {
             "name": tag_name,
             "path": value,
             "category": category,
             "stage": stage_name,
-            "exists": full_path.exists(),
+            "exists": None,
         }
         entry.update(extra)
         return [entry]
@@ -636,7 +1153,7 @@ class WorkflowManagerService:
     def resolve_candidates(self, workflow_name: str, action: str,
                            candidates_name: str, feature_id: str = None) -> list:
         """Resolve candidates to list of file paths for dropdown population."""
-        state = self._read_state(workflow_name)
+        state = self._read_state(workflow_name, readonly=True)
         if "error" in state and state.get("success") is False:
             return []
         template = _load_workflow_template(str(self._project_root))
@@ -827,17 +1344,19 @@ class WorkflowManagerService:
         if not self._workflow_dir.exists():
             return {"archived_count": 0}
 
+        _state_cache.flush()
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        for f in list(self._workflow_dir.glob("workflow-*.json")):
+        for filename, summary in _summary_index.records(str(self._workflow_dir)):
+            f = self._workflow_dir / filename
             try:
-                state = json.loads(f.read_text(encoding="utf-8"))
-                last_activity = state.get("last_activity", "")
-                if last_activity:
+                last_activity = summary.get("last_activity") or ""
+                if last_activity and f.exists():
                     la_dt = datetime.fromisoformat(last_activity)
                     if la_dt < cutoff:
+                        _state_cache.discard(str(f))
                         shutil.move(str(f), str(archive_dir / f.name))
                         archived += 1
-            except (json.JSONDecodeError, ValueError, KeyError):
+            except (ValueError, TypeError):
                 continue
 
         return {"archived_count": archived}
@@ -942,35 +1461,52 @@ class WorkflowManagerService:
             "features": [],
         }
 
-    def _read_state(self, name: str) -> dict:
+    def _read_state(self, name: str, readonly: bool = False) -> dict:
+        """Return the workflow state, from the process-wide cache when current.
+
+        The result is a private copy unless *readonly*, in which case it is
+        the cached object itself and must not be modified.
+        """
         path = self._get_workflow_path(name)
+        cached = _state_cache.get(str(path), self._stage_config)
+        if cached is not None:
+            return cached if readonly else _copy_state(cached)
         if not path.exists():
             return {"success": False, "error": "NOT_FOUND",
                     "message": f"Workflow '{name}' not found"}
+        stamp = _file_stamp(str(path))
         try:
             state = json.loads(path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             return {"success": False, "error": "CORRUPTED_STATE",
                     "message": f"Workflow '{name}' has corrupted state — manual repair required"}
+        migrated = False
         if state.get("schema_version") != "2.0" and "stages" in state:
             state = self._migrate_v1_to_v2(state)
-            self._write_state(name, state)
+            migrated = True
         if self._migrate_sync_feature_actions(state):
+            migrated = True
+        if migrated:
             self._write_state(name, state)
-        return state
+        else:
+            _state_cache.put(str(path), state, stamp, self._stage_config)
+        return state if readonly else _copy_state(state)
 
     def _write_state(self, name: str, state: dict):
+        """Persist *state*, which must not be modified afterwards (it becomes the cached copy)."""
         self._workflow_dir.mkdir(parents=True, exist_ok=True)
-        target = self._get_workflow_path(name)
-        fd, tmp_path = tempfile.mkstemp(dir=str(self._workflow_dir), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
-            os.replace(tmp_path, str(target))
-        except Exception:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-            raise
+        _state_cache.write(str(self._get_workflow_path(name)), state, self._stage_config)
+
+    def _swap_state(self, name: str, state: dict, base_revision: int,
+                    defer: bool = False, reapply=None) -> bool:
+        """Persist *state* like _write_state, but only if the workflow is still at *base_revision*.
+
+        With *defer*, the write is coalesced with others in the next
+        WRITE_BEHIND_DELAY (readers in this process see the new state at
+        once); *reapply* redoes the update if the file changes meanwhile.
+        """
+        return _state_cache.swap(str(self._get_workflow_path(name)), state, base_revision,
+                                 self._stage_config, defer=defer, reapply=reapply)
 
     def _update_shared_action(self, state, action, status, deliverables, context=None):
         """Update action in a shared stage (ideation/requirement)."""
@@ -110,7 +110,7 @@ class ContentRenderer {
         this.showLoading();
         
         try {
-            const response = await fetch(`/api/file/content?path=${encodeURIComponent(path)}`);
+            const response = await fetch(`/api/file/content?path=${encodeURIComponent(path)}&preview=true`);
             
             if (!response.ok) {
                 const error = await response.json();
@@ -131,7 +131,10 @@ class ContentRenderer {
     render(data) {
         const { content, type, path, extension } = data;
         
-        if (type === 'markdown') {
+        if (data.truncated) {
+            // Large file: show a plain-text page and fetch more on demand
+            this.renderPaged(data);
+        } else if (type === 'markdown') {
             this.renderMarkdown(content);
         } else if (type === 'html') {
             this.renderHtml(content);
@@ -384,6 +387,48 @@ class ContentRenderer {
         `;
     }
     
+    /**
+     * Render one page of a large file as plain text with a "Load more" button.
+     * Highlighting is skipped: it is the slow part for multi-megabyte files.
+     */
+    renderPaged(data) {
+        this.container.innerHTML = `
+            <div class="code-viewer code-viewer-paged">
+                <div class="alert alert-info py-1 px-2 small">
+                    Large file (${(data.size / (1024 * 1024)).toFixed(1)} MB) — showing a partial view
+                </div>
+                <pre><code class="language-text"></code></pre>
+                <button type="button" class="btn btn-sm btn-outline-secondary load-more-btn">Load more</button>
+            </div>
+        `;
+        const code = this.container.querySelector('code');
+        const button = this.container.querySelector('.load-more-btn');
+        const path = this.currentPath;
+        let nextCursor = data.next_cursor;
+        
+        const append = (page) => {
+            code.appendChild(document.createTextNode(page.content));
+            nextCursor = page.next_cursor;
+            button.hidden = nextCursor === null || nextCursor === undefined;
+        };
+        append(data);
+        
+        button.addEventListener('click', async () => {
+            button.disabled = true;
+            try {
+                const response = await fetch(
+                    `/api/file/content?path=${encodeURIComponent(path)}&cursor=${nextCursor}`
+                );
+                if (!response.ok) throw new Error(`HTTP error ${response.status}`);
+                if (this.currentPath === path) append(await response.json());
+            } catch (error) {
+                console.error('Failed to load more content:', error);
+            } finally {
+                button.disabled = false;
+            }
+        });
+    }
+    
     /**
      * Show loading state
      */
@@ -137,6 +137,11 @@ class ContentEditor {
                 throw new Error('Failed to load file content');
             }
             const data = await response.json();
+            if (data.truncated) {
+                // Saving a partial view would drop the rest of the file
+                this._showToast('File is too large to edit in the browser', 'error');
+                return;
+            }
             this.originalContent = data.content;
             
             // Switch to edit mode
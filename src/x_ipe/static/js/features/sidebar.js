@@ -3,6 +3,12 @@
  * FEATURE-001: Project Navigation (Polling Implementation)
  * 
  * Uses HTTP polling every 5 seconds to detect structure changes.
+ * When the server pushes 'structure_delta' messages over Socket.IO the tree
+ * is patched in place and polling pauses; a sequence gap triggers a resync.
+ *
+ * The tree is loaded lazily: sections arrive with their first level, and a
+ * folder is listed from /api/project/directory when it is first expanded.
+ * Folders not listed yet carry child_count instead of children.
  */
 class ProjectSidebar {
     constructor(containerId) {
@@ -11,6 +17,10 @@ class ProjectSidebar {
         this.sections = [];
         this.lastStructureHash = null;
         this.pollInterval = 5000; // 5 seconds
+        this.structureSeq = null;  // Sequence of the last applied structure delta
+        this._structureSocket = null;
+        this.loadedFolders = new Set();   // Folder paths listed since the last load
+        this._loadingFolders = new Set(); // Folder paths with a listing request in flight
         
         // FEATURE-009: Track changed paths for visual indicator
         this.changedPaths = new Set();
@@ -22,6 +32,9 @@ class ProjectSidebar {
         this.expandedSections = new Set(); // Set of section IDs
         this.expandedFolders = new Set();  // Set of folder paths
         
+        this._onStructureDelta = this._onStructureDelta.bind(this);
+        this._onStructureSocketConnect = this._onStructureSocketConnect.bind(this);
+        
         this._startPolling();
         
         // FEATURE-049-B: Listen for KB changes to auto-refresh sidebar tree
@@ -43,11 +56,14 @@ class ProjectSidebar {
      * Check for structure changes via HTTP polling
      */
     async _checkForChanges() {
+        this._subscribeStructureDeltas();
+        // Deltas keep the tree current while the socket is up
+        if (this.structureSeq !== null && this._structureSocket && this._structureSocket.connected) {
+            return;
+        }
         try {
-            const response = await fetch('/api/project/structure');
-            if (!response.ok) return;
-            
-            const data = await response.json();
+            const data = await this._fetchStructure();
+            if (!data) return;
             const newHash = this._hashStructure(data.sections);
             
             // First load - initialize paths
@@ -74,6 +90,278 @@ class ProjectSidebar {
         }
     }
     
+    /**
+     * Fetch the lazy structure and list again the folders opened so far
+     * Returns null if the server answered with an error
+     */
+    async _fetchStructure() {
+        const response = await fetch('/api/project/structure?mode=lazy');
+        if (!response.ok) return null;
+        const data = await response.json();
+        this._setStructureSeq(response);
+        
+        // Parents first, so nested folders are found once their parent is listed
+        const opened = [...this.loadedFolders].sort((a, b) => a.split('/').length - b.split('/').length);
+        this.loadedFolders = new Set();
+        for (const path of opened) {
+            const node = this._findStructureNode(data.sections, path);
+            if (!node || node.type !== 'folder') continue;
+            const page = await this._fetchDirectory(path);
+            if (page) this._setFolderPage(node, page);
+        }
+        return data;
+    }
+    
+    /**
+     * Fetch one page of a directory listing, or null if it failed
+     */
+    async _fetchDirectory(path, cursor = null) {
+        let url = `/api/project/directory?path=${encodeURIComponent(path)}`;
+        if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
+        const response = await fetch(url);
+        if (!response.ok) return null;
+        return response.json();
+    }
+    
+    /**
+     * Install the first listing page of a folder node
+     */
+    _setFolderPage(node, page) {
+        node.children = page.children;
+        node.child_count = page.child_count;
+        node.next_cursor = page.next_cursor;
+        this.loadedFolders.add(node.path);
+    }
+    
+    /**
+     * List a folder that was expanded before its children were loaded
+     */
+    async _loadFolder(path) {
+        if (this._loadingFolders.has(path)) return;
+        this._loadingFolders.add(path);
+        try {
+            const page = await this._fetchDirectory(path);
+            // The tree may have been replaced while the request was in flight
+            const node = page && this._findStructureNode(this.sections, path);
+            if (!node || node.children) return;
+            this._setFolderPage(node, page);
+            this.expandedFolders.add(path);
+            this._renderLoaded();
+        } catch (error) {
+            console.error('[ProjectSidebar] Folder load error:', error);
+        } finally {
+            this._loadingFolders.delete(path);
+        }
+    }
+    
+    /**
+     * Append the next listing page of a section or folder
+     */
+    async _loadMore(path) {
+        if (this._loadingFolders.has(path)) return;
+        const start = this._findStructureNode(this.sections, path);
+        if (!start || !start.next_cursor) return;
+        this._loadingFolders.add(path);
+        try {
+            const page = await this._fetchDirectory(path, start.next_cursor);
+            const node = page && this._findStructureNode(this.sections, path);
+            if (!node || !node.children) return;
+            // Entries added by deltas meanwhile may already be listed
+            const listed = new Set(node.children.map(c => c.path));
+            node.children.push(...page.children.filter(c => !listed.has(c.path)));
+            node.child_count = page.child_count;
+            node.next_cursor = page.next_cursor;
+            this._renderLoaded();
+        } catch (error) {
+            console.error('[ProjectSidebar] Load more error:', error);
+        } finally {
+            this._loadingFolders.delete(path);
+        }
+    }
+    
+    /**
+     * Re-render after listing more entries, without flagging them as changed
+     */
+    _renderLoaded() {
+        this.previousPathMtimes = this._extractAllPathMtimes(this.sections);
+        this.lastStructureHash = this._hashStructure(this.sections);
+        this.render();
+    }
+    
+    /**
+     * Remember the structure sequence reported by the server (if cached)
+     */
+    _setStructureSeq(response) {
+        const seq = response.headers.get('X-Structure-Seq');
+        this.structureSeq = seq !== null ? parseInt(seq, 10) : null;
+    }
+    
+    /**
+     * Listen for server-pushed structure deltas on the app's socket
+     * Shares the terminal manager's connection (as voice input does) instead
+     * of opening another one; checked on every poll since terminal sessions,
+     * and their sockets, come and go
+     */
+    _subscribeStructureDeltas() {
+        const socket = (window.terminalManager && window.terminalManager.socket) || null;
+        if (socket === this._structureSocket) return;
+        if (this._structureSocket) {
+            this._structureSocket.off('structure_delta', this._onStructureDelta);
+            this._structureSocket.off('connect', this._onStructureSocketConnect);
+        }
+        this._structureSocket = socket;
+        if (!socket) return;
+        socket.on('structure_delta', this._onStructureDelta);
+        socket.on('connect', this._onStructureSocketConnect);
+        if (socket.connected) this._onStructureSocketConnect();
+    }
+    
+    /**
+     * Deltas may have been missed while disconnected (or on another socket)
+     */
+    _onStructureSocketConnect() {
+        if (this.structureSeq !== null) this._resyncStructure();
+    }
+    
+    /**
+     * Apply a pushed delta message, resyncing when a sequence was missed
+     */
+    _onStructureDelta(message) {
+        if (this.structureSeq === null || message.seq <= this.structureSeq) return;
+        if (message.base_seq !== this.structureSeq) {
+            this._resyncStructure();
+            return;
+        }
+        this._applyStructureMessages([message]);
+    }
+    
+    /**
+     * Fetch missed delta messages (or the full tree) since our sequence
+     */
+    async _resyncStructure() {
+        try {
+            const response = await fetch(`/api/project/structure/deltas?since=${this.structureSeq}`);
+            if (!response.ok) return;
+            const data = await response.json();
+            if (data.messages) {
+                this._applyStructureMessages(data.messages);
+            } else if (data.structure) {
+                this.structureSeq = data.seq;
+                this._updateSections(data.structure.sections);
+            }
+        } catch (error) {
+            console.error('[ProjectSidebar] Resync error:', error);
+        }
+    }
+    
+    /**
+     * Patch this.sections with delta messages and re-render once
+     */
+    _applyStructureMessages(messages) {
+        if (!messages.length) return;
+        const sections = JSON.parse(JSON.stringify(this.sections));
+        for (const message of messages) {
+            for (const delta of message.deltas) {
+                this._applyStructureDelta(sections, delta);
+            }
+            this.structureSeq = message.seq;
+        }
+        this._updateSections(sections);
+    }
+    
+    /**
+     * Apply a single add/remove/rename/mtime/section delta
+     */
+    _applyStructureDelta(sections, delta) {
+        if (delta.op === 'section') {
+            const index = sections.findIndex(s => s.id === delta.section.id);
+            if (index >= 0) sections[index] = delta.section;
+        } else if (delta.op === 'remove') {
+            this._removeStructureNode(sections, delta.path);
+        } else if (delta.op === 'add') {
+            this._insertStructureNode(sections, delta.path, delta.node);
+        } else if (delta.op === 'rename') {
+            this._removeStructureNode(sections, delta.from);
+            this._insertStructureNode(sections, delta.to, delta.node);
+        } else if (delta.op === 'mtime') {
+            const node = this._findStructureNode(sections, delta.path);
+            if (node) node.mtime = delta.mtime;
+        }
+    }
+    
+    /**
+     * Locate the section or folder that holds `path` (creating nothing)
+     * `children` is undefined when that folder has not been listed yet
+     */
+    _findStructureParent(sections, path) {
+        const section = sections.find(s => path.startsWith(s.path + '/'));
+        if (!section) return null;
+        let parent = section;
+        const parts = path.slice(section.path.length + 1).split('/');
+        let current = section.path;
+        for (const part of parts.slice(0, -1)) {
+            current = `${current}/${part}`;
+            const folder = parent.children && parent.children.find(c => c.path === current && c.type === 'folder');
+            if (!folder) return null;
+            parent = folder;
+        }
+        return { section, parent, children: parent.children };
+    }
+    
+    /**
+     * Locate the section or node at `path`
+     */
+    _findStructureNode(sections, path) {
+        const section = sections.find(s => s.path === path);
+        if (section) return section;
+        const found = this._findStructureParent(sections, path);
+        return (found && found.children && found.children.find(c => c.path === path)) || null;
+    }
+    
+    _removeStructureNode(sections, path) {
+        const found = this._findStructureParent(sections, path);
+        if (!found) return;
+        if (!found.children) {
+            // Not listed yet: only the count shown before expanding changes
+            if (found.parent.child_count > 0) found.parent.child_count--;
+            return;
+        }
+        const index = found.children.findIndex(c => c.path === path);
+        if (index < 0) return;
+        found.children.splice(index, 1);
+        if (found.parent.child_count > 0) found.parent.child_count--;
+    }
+    
+    _insertStructureNode(sections, path, node) {
+        const found = this._findStructureParent(sections, path);
+        if (!found) return;
+        found.section.exists = true;
+        if (!found.children) {
+            found.parent.child_count = (found.parent.child_count || 0) + 1;
+            return;
+        }
+        this._removeStructureNode(sections, path);
+        if (found.parent.child_count !== undefined) found.parent.child_count++;
+        // Same ordering as the server: folders first, then case-insensitive name
+        const key = n => `${n.type === 'file' ? 1 : 0}${n.name.toLowerCase()}`;
+        const index = found.children.findIndex(c => key(c) > key(node));
+        // Past the last listed page: "Show more" will list it
+        if (index < 0 && found.parent.next_cursor) return;
+        found.children.splice(index < 0 ? found.children.length : index, 0, node);
+    }
+    
+    /**
+     * Swap in new sections, tracking changed paths like the poll does
+     */
+    _updateSections(sections) {
+        const currentPathMtimes = this._extractAllPathMtimes(sections);
+        this._detectChangedPaths(this.previousPathMtimes, currentPathMtimes);
+        this.previousPathMtimes = currentPathMtimes;
+        this.lastStructureHash = this._hashStructure(sections);
+        this.sections = sections;
+        this.render();
+    }
+    
     /**
      * Create a simple hash of the structure for comparison
      */
@@ -207,12 +495,11 @@ class ProjectSidebar {
      */
     async load() {
         try {
-            const response = await fetch('/api/project/structure');
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
+            const data = await this._fetchStructure();
+            if (!data) {
+                throw new Error('HTTP error loading project structure');
             }
             
-            const data = await response.json();
             this.sections = data.sections;
             this.lastStructureHash = this._hashStructure(data.sections);
             this.previousPathMtimes = this._extractAllPathMtimes(data.sections);
@@ -320,6 +607,7 @@ class ProjectSidebar {
                 const content = document.querySelector(targetSelector);
                 if (content) {
                     content.classList.add('show');
+                    if (folder.dataset.lazy) this._loadFolder(folderPath);
                 }
             }
         });
@@ -333,6 +621,7 @@ class ProjectSidebar {
                 const content = document.querySelector(targetSelector);
                 if (content) {
                     content.classList.add('show');
+                    if (folder.dataset.lazy) this._loadFolder(folderPath);
                 }
             }
         });
@@ -425,7 +714,7 @@ class ProjectSidebar {
         } else if (!hasChildren) {
             html += '<div class="nav-empty">No files</div>';
         } else {
-            html += this.renderChildren(section.children);
+            html += this.renderChildren(section.children, 0, section);
         }
         
         html += '</div></div>';
@@ -434,9 +723,10 @@ class ProjectSidebar {
     
     /**
      * Render children (files and folders)
-     * Files are rendered above folders
+     * Files are rendered above folders; `parent` adds a "Show more" item
+     * while it has unlisted pages
      */
-    renderChildren(children, depth = 0) {
+    renderChildren(children, depth = 0, parent = null) {
         if (!children || children.length === 0) {
             return '';
         }
@@ -458,7 +748,39 @@ class ProjectSidebar {
             html += this.renderFolder(item, depth);
         }
         
-        return html;
+        return html + this._renderLoadMore(parent, depth);
+    }
+    
+    /**
+     * Render the "Show more" item of a partially listed section or folder
+     */
+    _renderLoadMore(parent, depth) {
+        if (!parent || !parent.next_cursor) return '';
+        const paddingLeft = 2 + (depth * 0.75);
+        const remaining = parent.child_count - parent.children.length;
+        return `
+            <div class="nav-item nav-load-more" style="padding-left: ${paddingLeft}rem" data-path="${parent.path}">
+                <i class="bi bi-three-dots"></i>
+                <span>Show ${remaining > 0 ? remaining : ''} more</span>
+            </div>
+        `;
+    }
+    
+    /**
+     * Whether a folder has been listed, and whether it has anything to expand
+     */
+    _folderState(folder) {
+        const isLoaded = Array.isArray(folder.children);
+        const hasChildren = isLoaded ? folder.children.length > 0 : folder.child_count > 0;
+        return { isLoaded, hasChildren };
+    }
+    
+    /**
+     * Folder content before the first listing: a placeholder while it loads
+     */
+    _renderFolderLoading(depth) {
+        const paddingLeft = 2 + (depth * 0.75);
+        return `<div class="nav-empty" style="padding-left: ${paddingLeft}rem">Loading…</div>`;
     }
     
     /**
@@ -466,7 +788,7 @@ class ProjectSidebar {
      */
     renderFolder(folder, depth) {
         const folderId = folder.path.replace(/[\/\.]/g, '-');
-        const hasChildren = folder.children && folder.children.length > 0;
+        const { isLoaded, hasChildren } = this._folderState(folder);
         const paddingLeft = 2 + (depth * 0.75);
         const isChanged = this.changedPaths.has(folder.path);
         
@@ -474,7 +796,7 @@ class ProjectSidebar {
             <div class="nav-item nav-folder${isChanged ? ' has-changes' : ''}" 
                  style="padding-left: ${paddingLeft}rem"
                  data-bs-target="#folder-${folderId}"
-                 data-path="${folder.path}">
+                 data-path="${folder.path}"${isLoaded ? '' : ' data-lazy="true"'}>
                 ${isChanged ? '<span class="change-indicator"></span>' : ''}
                 <i class="bi bi-folder"></i>
                 <span>${folder.name}</span>
@@ -485,7 +807,7 @@ class ProjectSidebar {
         if (hasChildren) {
             html += `
                 <div class="collapse nav-folder-content" id="folder-${folderId}">
-                    ${this.renderChildren(folder.children, depth + 1)}
+                    ${isLoaded ? this.renderChildren(folder.children, depth + 1, folder) : this._renderFolderLoading(depth + 1)}
                 </div>
             `;
         }
@@ -556,7 +878,7 @@ class ProjectSidebar {
         if (!section.exists || !hasChildren) {
             html += '<div class="nav-empty kb-empty-state">📖 No articles yet</div>';
         } else {
-            html += this._renderKBChildren(section.children);
+            html += this._renderKBChildren(section.children, 0, section);
         }
         
         // Intake placeholder (FEATURE-049-F future)
@@ -572,7 +894,7 @@ class ProjectSidebar {
     }
     
     // FEATURE-049-B: Render KB children with drag-drop attributes on folders
-    _renderKBChildren(children, depth = 0) {
+    _renderKBChildren(children, depth = 0, parent = null) {
         if (!children || children.length === 0) return '';
         
         let html = '';
@@ -585,13 +907,13 @@ class ProjectSidebar {
         for (const item of folders) {
             html += this._renderKBFolder(item, depth);
         }
-        return html;
+        return html + this._renderLoadMore(parent, depth);
     }
     
     // FEATURE-049-B: Render KB folder with drag-drop support
     _renderKBFolder(folder, depth) {
         const folderId = folder.path.replace(/[\/\.]/g, '-');
-        const hasChildren = folder.children && folder.children.length > 0;
+        const { isLoaded, hasChildren } = this._folderState(folder);
         const paddingLeft = 2 + (depth * 0.75);
         const isChanged = this.changedPaths.has(folder.path);
         
@@ -600,7 +922,7 @@ class ProjectSidebar {
                  style="padding-left: ${paddingLeft}rem"
                  data-bs-target="#folder-${folderId}"
                  data-path="${folder.path}"
-                 data-kb-folder="true"
+                 data-kb-folder="true"${isLoaded ? '' : ' data-lazy="true"'}
                  draggable="true">
                 ${isChanged ? '<span class="change-indicator"></span>' : ''}
                 <i class="bi bi-folder"></i>
@@ -612,7 +934,7 @@ class ProjectSidebar {
         if (hasChildren) {
             html += `
                 <div class="collapse nav-folder-content" id="folder-${folderId}">
-                    ${this._renderKBChildren(folder.children, depth + 1)}
+                    ${isLoaded ? this._renderKBChildren(folder.children, depth + 1, folder) : this._renderFolderLoading(depth + 1)}
                 </div>
             `;
         }
@@ -1050,6 +1372,15 @@ class ProjectSidebar {
             }
         });
         
+        // Lazy listing: fetch the next page of a large section or folder
+        this.container.querySelectorAll('.nav-load-more').forEach(item => {
+            item.addEventListener('click', (e) => {
+                e.preventDefault();
+                e.stopPropagation();
+                this._loadMore(item.dataset.path);
+            });
+        });
+        
         // Hover expand/collapse for sections and folders
         this._bindHoverExpand();
         
@@ -1168,6 +1499,11 @@ class ProjectSidebar {
             const folderPath = folder.dataset.path;
             let isPinned = this.pinnedFolders.has(folderPath);
             
+            // Unlisted folders fetch their children when first opened
+            if (folder.dataset.lazy) {
+                target.addEventListener('show.bs.collapse', () => this._loadFolder(folderPath), { once: true });
+            }
+            
             // Click to pin/unpin
             folder.addEventListener('click', (e) => {
                 e.preventDefault();
@@ -1036,6 +1036,10 @@ class WorkplaceManager {
             } else {
                 const response = await fetch(`/api/file/content?path=${encodeURIComponent(path)}`);
                 const data = await response.json();
+                if (data.truncated) {
+                    // Saving a partial view would drop the rest of the file
+                    throw new Error('File content is incomplete');
+                }
                 
                 this.originalContent = data.content || '';
                 this.renderContent(contentArea, data.content || '');
@@ -22,9 +22,10 @@ Usage:
 from .decorator import x_ipe_tracing
 from .context import TraceContext
 from .buffer import TraceBuffer, TraceEntry
-from .writer import TraceLogWriter
+from .writer import TraceLogWriter, AsyncTraceLogWriter
+from .index import TraceIndex, get_trace_index
 from .redactor import Redactor
-from .middleware import init_tracing_middleware
+from .middleware import init_tracing_middleware, get_tracing_config, invalidate_tracing_config, get_trace_writer
 
 __all__ = [
     'x_ipe_tracing',
@@ -32,6 +33,12 @@ __all__ = [
     'TraceBuffer',
     'TraceEntry',
     'TraceLogWriter',
+    'AsyncTraceLogWriter',
+    'TraceIndex',
+    'get_trace_index',
     'Redactor',
     'init_tracing_middleware',
+    'get_tracing_config',
+    'invalidate_tracing_config',
+    'get_trace_writer',
 ]
@@ -27,6 +27,8 @@ class TraceEntry:
         data: Parameters, return value, or error details
         duration_ms: Execution time in milliseconds (only for exit events)
         depth: Nesting level (0 = root)
+        encoded: JSON encoding of data, computed once and reused for
+            size accounting and log output
     """
     timestamp: datetime
     trace_id: str
@@ -37,6 +39,23 @@ class TraceEntry:
     data: dict
     duration_ms: Optional[float] = None
     depth: int = 0
+    encoded: Optional[str] = field(default=None, repr=False, compare=False)
+
+
+def encode_data(data: Any) -> str:
+    """
+    Encode trace data as JSON for log output.
+    
+    Args:
+        data: Parameters, return value, or error details
+        
+    Returns:
+        JSON string; data that cannot be encoded is encoded as str(data)
+    """
+    try:
+        return json.dumps(data, default=str, ensure_ascii=False)
+    except (TypeError, ValueError, RecursionError):
+        return json.dumps(str(data), ensure_ascii=False)
 
 
 class TraceBuffer:
@@ -77,10 +96,9 @@ class TraceBuffer:
         Args:
             entry: TraceEntry to add
         """
-        try:
-            entry_size = len(json.dumps(entry.data, default=str))
-        except (TypeError, ValueError):
-            entry_size = 100  # Fallback size estimate
+        if entry.encoded is None:
+            entry.encoded = encode_data(entry.data)
+        entry_size = len(entry.encoded)
         
         if self._size + entry_size > self.MAX_SIZE:
             return  # Silently drop if buffer full
@@ -106,10 +124,7 @@ class TraceBuffer:
         for entry in self.entries:
             indent = "  " * (entry.depth + 1)
             
-            try:
-                data_str = json.dumps(entry.data, default=str, ensure_ascii=False)
-            except (TypeError, ValueError):
-                data_str = str(entry.data)
+            data_str = entry.encoded if entry.encoded is not None else encode_data(entry.data)
             
             # Truncate very long data
             if len(data_str) > 1000:
@@ -133,3 +148,45 @@ class TraceBuffer:
         )
         
         return "\n".join(lines)
+    
+    def to_jsonl(self, status: str, total_ms: float) -> str:
+        """
+        Format the buffer as JSON Lines (one object per event).
+        
+        Each entry line ends with its already-encoded "data" field, so
+        payloads are not serialized again and readers can take the raw
+        JSON text without decoding it.
+        
+        Args:
+            status: Final status (SUCCESS, ERROR)
+            total_ms: Total execution time in milliseconds
+            
+        Returns:
+            JSONL string ready for file output
+        """
+        lines = [json.dumps({
+            "t": "start",
+            "trace_id": self.trace_id,
+            "api": self.root_api,
+            "timestamp": f"{self.started_at.isoformat()}Z"
+        }, ensure_ascii=False)]
+        
+        for entry in self.entries:
+            meta = json.dumps({
+                "t": entry.event_type,
+                "level": entry.level,
+                "fn": entry.function_name,
+                "depth": entry.depth,
+                "ms": round(entry.duration_ms, 3) if entry.duration_ms is not None else None
+            }, ensure_ascii=False)
+            encoded = entry.encoded if entry.encoded is not None else encode_data(entry.data)
+            lines.append(f'{meta[:-1]}, "data": {encoded}}}')
+        
+        lines.append(json.dumps({
+            "t": "end",
+            "trace_id": self.trace_id,
+            "total_ms": round(total_ms),
+            "status": status
+        }, ensure_ascii=False))
+        
+        return "\n".join(lines)
@@ -5,13 +5,18 @@ FEATURE-023: Application Action Tracing - Core
 
 Provides a decorator that automatically logs function entry, exit,
 return values, and exceptions with execution timing.
+
+Per-call overhead is kept low: parameter names are bound once at
+decoration time, and each payload is JSON-encoded exactly once (the
+encoding is stored on the TraceEntry and reused by TraceBuffer).
 """
 import functools
+import json
 import time
 import asyncio
 import inspect
 from datetime import datetime, timezone
-from typing import Callable, List, Optional, Any, Dict
+from typing import Callable, List, Optional, Any, Dict, Tuple
 
 from .context import TraceContext
 from .buffer import TraceEntry
@@ -44,23 +49,26 @@ def x_ipe_tracing(
         return lambda fn: fn  # No-op decorator
     
     redactor = Redactor(custom_fields=redact)
+    get_current = TraceContext.get_current
     
     def decorator(func: Callable) -> Callable:
+        param_names = _get_param_names(func)
+        
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            ctx = TraceContext.get_current()
+            ctx = get_current()
             if not ctx:
                 return func(*args, **kwargs)  # No active trace
             
-            return _trace_call(ctx, func, args, kwargs, level, redactor)
+            return _trace_call(ctx, func, args, kwargs, level, redactor, param_names)
         
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            ctx = TraceContext.get_current()
+            ctx = get_current()
             if not ctx:
                 return await func(*args, **kwargs)  # No active trace
             
-            return await _trace_call_async(ctx, func, args, kwargs, level, redactor)
+            return await _trace_call_async(ctx, func, args, kwargs, level, redactor, param_names)
         
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -69,7 +77,21 @@ def x_ipe_tracing(
     return decorator
 
 
-def _extract_params(func: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
+def _get_param_names(func: Callable) -> Tuple[str, ...]:
+    """
+    Read a function's parameter names once, at decoration time.
+    
+    Returns:
+        Tuple of parameter names, empty if the signature is unavailable
+    """
+    try:
+        return tuple(inspect.signature(func).parameters)
+    except (ValueError, TypeError):
+        return ()
+
+
+def _extract_params(func: Callable, args: tuple, kwargs: dict,
+                    param_names: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
     """
     Extract function parameters as a dictionary.
     
@@ -79,57 +101,92 @@ def _extract_params(func: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]
         func: The function being called
         args: Positional arguments
         kwargs: Keyword arguments
+        param_names: Parameter names bound at decoration time; looked up
+            from the signature when not given
         
     Returns:
         Dictionary of parameter names to values
     """
+    if param_names is None:
+        param_names = _get_param_names(func)
+    
     params = {}
     
-    try:
-        sig = inspect.signature(func)
-        param_names = list(sig.parameters.keys())
-        
-        # Map positional args
-        for i, arg in enumerate(args):
-            if i < len(param_names):
-                # Skip 'self' and 'cls' parameters
-                param_name = param_names[i]
-                if param_name not in ('self', 'cls'):
-                    params[param_name] = arg
-            else:
-                params[f"arg_{i}"] = arg
-        
-        # Add keyword args
-        params.update(kwargs)
-    except (ValueError, TypeError):
-        # Fallback if signature introspection fails
-        for i, arg in enumerate(args):
+    # Map positional args (unnamed ones fall back to arg_<i>)
+    for i, arg in enumerate(args):
+        if i < len(param_names):
+            # Skip 'self' and 'cls' parameters
+            param_name = param_names[i]
+            if param_name not in ('self', 'cls'):
+                params[param_name] = arg
+        else:
             params[f"arg_{i}"] = arg
-        params.update(kwargs)
+    
+    # Add keyword args
+    params.update(kwargs)
     
     return params
 
 
-def _safe_serialize(value: Any) -> Any:
+def _serialize(value: Any) -> Tuple[Any, str]:
     """
-    Safely serialize a value for logging.
-    
-    Handles circular references and non-serializable objects.
+    Serialize a value once, returning both the loggable value and its JSON.
     
     Args:
         value: Value to serialize
         
     Returns:
-        Serializable representation of the value
+        Tuple of (serializable value, JSON encoding of that value)
     """
     try:
-        # Try direct serialization
-        import json
-        json.dumps(value, default=str)
-        return value
+        return value, json.dumps(value, default=str, ensure_ascii=False)
     except (TypeError, ValueError, RecursionError):
         # Fallback for complex objects
-        return str(value)[:500]
+        fallback = str(value)[:500]
+        return fallback, json.dumps(fallback, ensure_ascii=False)
+
+
+def _serialize_payload(payload: Dict[str, Any]) -> Tuple[Any, str]:
+    """
+    Serialize a dict payload, stringifying only the values that fail.
+    
+    Args:
+        payload: Parameters or {"return": value}
+        
+    Returns:
+        Tuple of (serializable payload, JSON encoding)
+    """
+    try:
+        return payload, json.dumps(payload, default=str, ensure_ascii=False)
+    except (TypeError, ValueError, RecursionError):
+        return _serialize({k: _serialize(v)[0] for k, v in payload.items()})
+
+
+def _redact_return(redactor: Redactor, result: Any) -> Dict[str, Any]:
+    """Redact a return value; circular structures are stringified first."""
+    try:
+        return redactor.redact({"return": result})
+    except RecursionError:
+        return redactor.redact({"return": str(result)[:500]})
+
+
+def _make_entry(ctx: TraceContext, level: str, direction: str, event_type: str,
+                func_name: str, payload: Dict[str, Any], depth: int,
+                duration_ms: Optional[float] = None) -> TraceEntry:
+    """Build a TraceEntry with its data serialized once."""
+    data, encoded = _serialize_payload(payload)
+    return TraceEntry(
+        timestamp=datetime.now(timezone.utc),
+        trace_id=ctx.trace_id,
+        level=level,
+        direction=direction,
+        event_type=event_type,
+        function_name=func_name,
+        data=data,
+        duration_ms=duration_ms,
+        depth=depth,
+        encoded=encoded
+    )
 
 
 def _trace_call(
@@ -138,7 +195,8 @@ def _trace_call(
     args: tuple,
     kwargs: dict,
     level: str,
-    redactor: Redactor
+    redactor: Redactor,
+    param_names: Optional[Tuple[str, ...]] = None
 ) -> Any:
     """
     Trace a synchronous function call.
@@ -149,19 +207,11 @@ def _trace_call(
     depth = ctx.push_call(func_name)
     
     # Extract and redact parameters
-    params = _extract_params(func, args, kwargs)
-    redacted_params = redactor.redact(params)
+    params = _extract_params(func, args, kwargs, param_names)
     
     # Log entry
-    ctx.buffer.add(TraceEntry(
-        timestamp=datetime.now(timezone.utc),
-        trace_id=ctx.trace_id,
-        level=level,
-        direction="→",
-        event_type="start_function",
-        function_name=func_name,
-        data=_safe_serialize(redacted_params),
-        depth=depth
+    ctx.buffer.add(_make_entry(
+        ctx, level, "→", "start_function", func_name, redactor.redact(params), depth
     ))
     
     start = time.perf_counter()
@@ -169,20 +219,10 @@ def _trace_call(
         result = func(*args, **kwargs)
         duration = (time.perf_counter() - start) * 1000
         
-        # Redact and serialize return value
-        redacted_result = redactor.redact({"return": _safe_serialize(result)})
-        
-        # Log success
-        ctx.buffer.add(TraceEntry(
-            timestamp=datetime.now(timezone.utc),
-            trace_id=ctx.trace_id,
-            level=level,
-            direction="←",
-            event_type="return_function",
-            function_name=func_name,
-            data=redacted_result,
-            duration_ms=duration,
-            depth=depth
+        # Log success with the redacted return value
+        ctx.buffer.add(_make_entry(
+            ctx, level, "←", "return_function", func_name,
+            _redact_return(redactor, result), depth, duration
         ))
         return result
         
@@ -190,19 +230,9 @@ def _trace_call(
         duration = (time.perf_counter() - start) * 1000
         
         # Log error
-        ctx.buffer.add(TraceEntry(
-            timestamp=datetime.now(timezone.utc),
-            trace_id=ctx.trace_id,
-            level="ERROR",
-            direction="←",
-            event_type="exception",
-            function_name=func_name,
-            data={
-                "error": type(e).__name__,
-                "message": str(e)
-            },
-            duration_ms=duration,
-            depth=depth
+        ctx.buffer.add(_make_entry(
+            ctx, "ERROR", "←", "exception", func_name,
+            {"error": type(e).__name__, "message": str(e)}, depth, duration
         ))
         raise
         
@@ -216,7 +246,8 @@ async def _trace_call_async(
     args: tuple,
     kwargs: dict,
     level: str,
-    redactor: Redactor
+    redactor: Redactor,
+    param_names: Optional[Tuple[str, ...]] = None
 ) -> Any:
     """
     Trace an asynchronous function call.
@@ -227,19 +258,11 @@ async def _trace_call_async(
     depth = ctx.push_call(func_name)
     
     # Extract and redact parameters
-    params = _extract_params(func, args, kwargs)
-    redacted_params = redactor.redact(params)
+    params = _extract_params(func, args, kwargs, param_names)
     
     # Log entry
-    ctx.buffer.add(TraceEntry(
-        timestamp=datetime.now(timezone.utc),
-        trace_id=ctx.trace_id,
-        level=level,
-        direction="→",
-        event_type="start_function",
-        function_name=func_name,
-        data=_safe_serialize(redacted_params),
-        depth=depth
+    ctx.buffer.add(_make_entry(
+        ctx, level, "→", "start_function", func_name, redactor.redact(params), depth
     ))
     
     start = time.perf_counter()
@@ -247,20 +270,10 @@ async def _trace_call_async(
         result = await func(*args, **kwargs)
         duration = (time.perf_counter() - start) * 1000
         
-        # Redact and serialize return value
-        redacted_result = redactor.redact({"return": _safe_serialize(result)})
-        
-        # Log success
-        ctx.buffer.add(TraceEntry(
-            timestamp=datetime.now(timezone.utc),
-            trace_id=ctx.trace_id,
-            level=level,
-            direction="←",
-            event_type="return_function",
-            function_name=func_name,
-            data=redacted_result,
-            duration_ms=duration,
-            depth=depth
+        # Log success with the redacted return value
+        ctx.buffer.add(_make_entry(
+            ctx, level, "←", "return_function", func_name,
+            _redact_return(redactor, result), depth, duration
         ))
         return result
         
@@ -268,19 +281,9 @@ async def _trace_call_async(
         duration = (time.perf_counter() - start) * 1000
         
         # Log error
-        ctx.buffer.add(TraceEntry(
-            timestamp=datetime.now(timezone.utc),
-            trace_id=ctx.trace_id,
-            level="ERROR",
-            direction="←",
-            event_type="exception",
-            function_name=func_name,
-            data={
-                "error": type(e).__name__,
-                "message": str(e)
-            },
-            duration_ms=duration,
-            depth=depth
+        ctx.buffer.add(_make_entry(
+            ctx, "ERROR", "←", "exception", func_name,
+            {"error": type(e).__name__, "message": str(e)}, depth, duration
         ))
         raise
         
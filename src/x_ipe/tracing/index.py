@@ -0,0 +1,215 @@
+"""
+FEATURE-023: Application Action Tracing - Core
+
+TraceIndex: append-only manifest of the traces in a log directory.
+
+Every written trace appends one JSON line to index.jsonl with its id,
+API, status, duration, start timestamp and location (file, offset,
+length). Readers keep the parsed manifest in memory and only read lines
+appended since their last look, so listing and lookups by trace id do
+not touch the log files themselves.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+INDEX_FILE = "index.jsonl"
+
+
+class TraceIndex:
+    """
+    In-memory view of a trace directory's index.jsonl.
+
+    Usage:
+        index = get_trace_index("instance/traces/")
+        index.append([{"trace_id": "abc-123", "api": "GET /api/x", ...}])
+        record = index.get("abc-123")
+        records = index.records()
+    """
+
+    def __init__(self, log_path: str):
+        """
+        Initialize TraceIndex.
+
+        Args:
+            log_path: Trace log directory holding index.jsonl
+        """
+        self.log_path = Path(log_path)
+        self.path = self.log_path / INDEX_FILE
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._pending: Optional[List[Dict[str, Any]]] = None
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._inode: Optional[int] = None
+        self._offset = 0
+
+    def exists(self) -> bool:
+        """Check whether the manifest file exists."""
+        return self.path.exists()
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append trace records with a single write.
+
+        While ensure() is rebuilding the manifest the records are held
+        back and written with the rebuilt manifest instead.
+
+        Args:
+            records: Dicts with trace_id, api, status, total_ms,
+                timestamp, file, offset and length
+        """
+        records = list(records)
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        if not lines:
+            return
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(records)
+                return
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            with open(fd, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+    def ensure(self, scan: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        """
+        Build the manifest from the log files if it does not exist yet.
+
+        The scan runs without blocking append(); records appended while it
+        runs are written after the scanned ones, in the same rewrite, so
+        none are lost. Concurrent callers wait for the rebuild to finish.
+
+        Args:
+            scan: Returns index records for every log file in the directory
+        """
+        if self.exists():
+            return
+        with self._build_lock:
+            if self.exists():
+                return
+            with self._lock:
+                self._pending = []
+            try:
+                records = list(scan())
+                with self._lock:
+                    self.rewrite(records + self._pending)
+            finally:
+                with self._lock:
+                    self._pending = None
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return all indexed traces, newest first."""
+        with self._lock:
+            self._refresh()
+            return sorted(self._records.values(), key=lambda r: r.get("timestamp", ""), reverse=True)
+
+    def get(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a trace by exact id."""
+        with self._lock:
+            self._refresh()
+            return self._records.get(trace_id)
+
+    def find(self, partial_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a trace by exact id, falling back to a substring of the id or file name."""
+        with self._lock:
+            self._refresh()
+            record = self._records.get(partial_id)
+            if record is not None:
+                return record
+            for trace_id, record in self._records.items():
+                if partial_id in trace_id or partial_id in record.get("file", ""):
+                    return record
+            return None
+
+    def rewrite(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Atomically replace the manifest (used for rebuilds and compaction)."""
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            self.log_path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(lines)
+            os.replace(tmp_path, self.path)
+            self._reset()
+
+    def compact(self) -> int:
+        """
+        Drop records whose log file no longer exists.
+
+        Returns:
+            Number of records dropped
+        """
+        with self._lock:
+            if not self.exists():
+                return 0
+            records = list(reversed(self.records()))
+            kept = [r for r in records if (self.log_path / r.get("file", "")).is_file()]
+            if len(kept) != len(records):
+                self.rewrite(kept)
+            return len(records) - len(kept)
+
+    def clear(self) -> None:
+        """Delete the manifest."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            self._reset()
+
+    def _reset(self) -> None:
+        self._records = {}
+        self._inode = None
+        self._offset = 0
+
+    def _refresh(self) -> None:
+        """Read lines appended since the last refresh; reload if the file was replaced."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self._reset()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+
+        # A concurrent append may have left a partial last line; leave it for next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("trace_id"):
+                self._records.pop(record["trace_id"], None)
+                self._records[record["trace_id"]] = record
+        self._offset += end
+
+
+_indexes: Dict[str, TraceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trace_index(log_path) -> TraceIndex:
+    """
+    Return the shared TraceIndex for a log directory.
+
+    Args:
+        log_path: Trace log directory
+    """
+    key = os.path.abspath(str(log_path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = TraceIndex(key)
+        return index
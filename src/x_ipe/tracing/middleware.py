@@ -4,16 +4,20 @@ FEATURE-023: Application Action Tracing - Middleware
 Flask middleware for automatic request tracing.
 
 Creates TraceContext for each request when tracing is active,
-then writes the trace log file after the request completes.
+then hands the finished trace to a background writer after the
+request completes.
 """
+import json
+import os
+import threading
 import time
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 from flask import Flask, request, g
-from typing import List
+from typing import Dict, Iterable, Optional, Tuple
 
 from .context import TraceContext
-from .writer import TraceLogWriter
+from .writer import AsyncTraceLogWriter
 
 
 # APIs to ignore (to avoid infinite loops and noise)
@@ -23,6 +27,9 @@ IGNORED_API_PREFIXES = (
     '/socket.io/',        # WebSocket
 )
 
+TOOLS_CONFIG_PATH = Path("x-ipe-docs") / "config" / "tools.json"
+DEFAULT_LOG_PATH = "instance/traces/"
+
 
 def init_tracing_middleware(app: Flask) -> None:
     """
@@ -44,15 +51,15 @@ def init_tracing_middleware(app: Flask) -> None:
         if request.path.startswith(IGNORED_API_PREFIXES):
             return
         
-        # Check if tracing is active and get config
+        # Check if tracing is active (cached; re-read only when tools.json changes)
         project_root = app.config.get('PROJECT_ROOT', '.')
-        active, ignored_apis = _get_tracing_config(project_root)
+        config = get_tracing_config(project_root)
         
-        if not active:
+        if not config.is_active():
             return
         
         # Skip user-configured ignored APIs
-        if _is_path_ignored(request.path, ignored_apis):
+        if config.is_ignored(request.path):
             return
         
         # Start trace context
@@ -75,13 +82,8 @@ def init_tracing_middleware(app: Flask) -> None:
         # Determine status from response
         status = "SUCCESS" if response.status_code < 400 else "ERROR"
         
-        # Get log path from config
-        project_root = app.config.get('PROJECT_ROOT', '.')
-        log_path = _get_trace_log_path(project_root)
-        
         # Write trace to file
-        writer = TraceLogWriter(log_path)
-        writer.write(buffer, status)
+        _write_trace(app, buffer, status)
         
         return response
     
@@ -91,107 +93,200 @@ def init_tracing_middleware(app: Flask) -> None:
         if exception is not None:
             buffer = TraceContext.end_trace()
             if buffer is not None:
-                project_root = app.config.get('PROJECT_ROOT', '.')
-                log_path = _get_trace_log_path(project_root)
-                writer = TraceLogWriter(log_path)
-                writer.write(buffer, "ERROR")
+                _write_trace(app, buffer, "ERROR")
 
 
-def _get_tracing_config(project_root: str) -> tuple:
+def _write_trace(app: Flask, buffer, status: str) -> None:
     """
-    Get tracing configuration including active status and ignored APIs.
+    Hand a finished trace to the background writer.
     
-    Reads from tools.json to check tracing_enabled, tracing_stop_at,
-    and tracing_ignored_apis.
+    Writes synchronously when testing or when TRACING_ASYNC_WRITES is
+    False, so the log file exists as soon as the response is returned.
+    """
+    project_root = app.config.get('PROJECT_ROOT', '.')
+    config = get_tracing_config(project_root)
+    log_path = config.log_dir(project_root)
     
-    Args:
-        project_root: Path to project root
-        
-    Returns:
-        Tuple of (is_active: bool, ignored_apis: List[str])
+    if app.config.get('TESTING') or not app.config.get('TRACING_ASYNC_WRITES', True):
+        _trace_writer.write_now(log_path, buffer, status, segmented=config.segmented,
+                                log_format=config.log_format)
+    else:
+        _trace_writer.submit(log_path, buffer, status, segmented=config.segmented,
+                             log_format=config.log_format)
+
+
+_trace_writer = AsyncTraceLogWriter()
+
+
+def get_trace_writer() -> AsyncTraceLogWriter:
+    """Return the process-wide background trace writer."""
+    return _trace_writer
+
+
+class TracingConfig:
     """
-    import json
+    Tracing settings parsed from tools.json.
     
-    tools_path = Path(project_root) / "x-ipe-docs" / "config" / "tools.json"
-    if not tools_path.exists():
-        return False, []
+    The ignored API patterns are compiled into an exact-match set and a
+    prefix tuple (patterns ending with *), so matching a request path is
+    one set lookup and one str.startswith call.
+    """
     
-    try:
-        with open(tools_path) as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return False, []
+    def __init__(self, enabled: bool = False, stop_at: Optional[str] = None,
+                 ignored_apis: Iterable[str] = (), log_path: str = DEFAULT_LOG_PATH,
+                 segmented: bool = False, log_format: str = "text"):
+        """
+        Initialize TracingConfig.
+        
+        Args:
+            enabled: tracing_enabled flag
+            stop_at: tracing_stop_at ISO timestamp, if any
+            ignored_apis: tracing_ignored_apis patterns
+            log_path: tracing_log_path, relative to the project root
+            segmented: tracing_segment_files flag (append to rolling segments)
+            log_format: tracing_format, "text" or "jsonl"
+        """
+        self.enabled = bool(enabled)
+        self.stop_at = stop_at
+        self.ignored_apis = list(ignored_apis or [])
+        self.log_path = log_path or DEFAULT_LOG_PATH
+        self.segmented = bool(segmented)
+        self.log_format = log_format or "text"
+        self._stop_timestamp = _parse_stop_at(stop_at)
+        self._ignored_exact = frozenset(p for p in self.ignored_apis if not p.endswith('*'))
+        self._ignored_prefixes = tuple(p[:-1] for p in self.ignored_apis if p.endswith('*'))
     
-    ignored_apis = config.get("tracing_ignored_apis", [])
+    @classmethod
+    def from_dict(cls, config: dict) -> 'TracingConfig':
+        """Build from a parsed tools.json dict."""
+        return cls(
+            enabled=config.get("tracing_enabled", False),
+            stop_at=config.get("tracing_stop_at"),
+            ignored_apis=config.get("tracing_ignored_apis", []),
+            log_path=config.get("tracing_log_path", DEFAULT_LOG_PATH),
+            segmented=config.get("tracing_segment_files", False),
+            log_format=config.get("tracing_format", "text")
+        )
     
-    # Check if explicitly enabled
-    if config.get("tracing_enabled", False):
-        return True, ignored_apis
+    def is_active(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether tracing is on: explicitly enabled, or stop_at is in the future.
+        
+        Args:
+            now: Current UNIX time (defaults to time.time())
+        """
+        if self.enabled:
+            return True
+        if self._stop_timestamp is None:
+            return False
+        return (time.time() if now is None else now) < self._stop_timestamp
     
-    # Check if stop_at is in the future
-    stop_at = config.get("tracing_stop_at")
-    if stop_at:
-        try:
-            # Keep timezone-aware for proper comparison
-            stop_time = datetime.fromisoformat(
-                stop_at.replace("Z", "+00:00")
-            )
-            if datetime.now(timezone.utc) < stop_time:
-                return True, ignored_apis
-        except (ValueError, AttributeError):
-            pass
+    def is_ignored(self, path: str) -> bool:
+        """
+        Check if a request path matches a user-configured ignored API pattern.
+        
+        Supports exact matches and prefix matches (patterns ending with *).
+        """
+        return path in self._ignored_exact or (
+            bool(self._ignored_prefixes) and path.startswith(self._ignored_prefixes)
+        )
     
-    return False, ignored_apis
+    def log_dir(self, project_root: str) -> str:
+        """Absolute path to the trace log directory."""
+        return str(Path(project_root) / self.log_path)
+
+
+def _parse_stop_at(stop_at: Optional[str]) -> Optional[float]:
+    """Parse a tracing_stop_at timestamp into UNIX time, or None if unset/invalid."""
+    if not stop_at:
+        return None
+    try:
+        # Keep timezone-aware for proper comparison
+        return datetime.fromisoformat(stop_at.replace("Z", "+00:00")).timestamp()
+    except (ValueError, AttributeError):
+        return None
 
 
-def _is_path_ignored(path: str, ignored_apis: List[str]) -> bool:
+class TracingConfigCache:
     """
-    Check if a request path matches any user-configured ignored API patterns.
+    Process-wide cache of TracingConfig per project root.
     
-    Supports exact matches and prefix matches (patterns ending with *).
+    A cached entry is reused while tools.json keeps the same mtime and
+    size, so a request costs one stat() instead of an open and a JSON
+    parse. TracingService invalidates entries when it writes the file.
+    """
     
-    Args:
-        path: Request path (e.g., "/api/project/structure")
-        ignored_apis: List of API patterns to ignore
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Optional[Tuple[int, int]], TracingConfig]] = {}
+    
+    def get(self, project_root: str) -> TracingConfig:
+        """Return the tracing config for a project root, re-reading tools.json if it changed."""
+        tools_path = _tools_path(project_root)
+        signature = _file_signature(tools_path)
         
-    Returns:
-        True if path should be ignored
-    """
-    for pattern in ignored_apis:
-        if pattern.endswith('*'):
-            # Prefix match
-            if path.startswith(pattern[:-1]):
-                return True
-        else:
-            # Exact match
-            if path == pattern:
-                return True
-    return False
-
-
-def _get_trace_log_path(project_root: str) -> str:
-    """
-    Get the trace log directory path.
+        entry = self._entries.get(tools_path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        
+        config = _load_tracing_config(tools_path) if signature is not None else TracingConfig()
+        with self._lock:
+            self._entries[tools_path] = (signature, config)
+        return config
     
-    Reads from tools.json or uses default.
+    def invalidate(self, project_root: Optional[str] = None) -> None:
+        """Drop the cached config for one project root, or all of them."""
+        with self._lock:
+            if project_root is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(_tools_path(project_root), None)
+
+
+def _tools_path(project_root: str) -> str:
+    return os.path.abspath(os.path.join(project_root, TOOLS_CONFIG_PATH))
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_tracing_config(tools_path: str) -> TracingConfig:
+    try:
+        with open(tools_path) as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return TracingConfig()
+    if not isinstance(config, dict):
+        return TracingConfig()
+    return TracingConfig.from_dict(config)
+
+
+_config_cache = TracingConfigCache()
+
+
+def get_tracing_config(project_root: str) -> TracingConfig:
+    """
+    Get the (cached) tracing configuration for a project.
     
     Args:
         project_root: Path to project root
         
     Returns:
-        Absolute path to trace log directory
+        TracingConfig read from x-ipe-docs/config/tools.json
     """
-    import json
-    
-    tools_path = Path(project_root) / "x-ipe-docs" / "config" / "tools.json"
-    log_path = "instance/traces/"
-    
-    if tools_path.exists():
-        try:
-            with open(tools_path) as f:
-                config = json.load(f)
-                log_path = config.get("tracing_log_path", log_path)
-        except (json.JSONDecodeError, IOError):
-            pass
+    return _config_cache.get(str(project_root))
+
+
+def invalidate_tracing_config(project_root: Optional[str] = None) -> None:
+    """
+    Drop cached tracing configuration after tools.json is written.
     
-    return str(Path(project_root) / log_path)
+    Args:
+        project_root: Project whose config changed, or None for all projects
+    """
+    _config_cache.invalidate(None if project_root is None else str(project_root))
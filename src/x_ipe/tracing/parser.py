@@ -3,28 +3,163 @@ FEATURE-023-C: Trace Viewer & DAG Visualization
 
 TraceLogParser for parsing trace log files into visualization-ready graph structures.
 
-Handles the log format:
+Handles the text log format:
     [TRACE-START] trace_id | API | timestamp
     [INFO] → start_function: name | input_json
     [INFO] ← return_function: name | output_json | duration
     [ERROR] ← exception: name | error | duration
     [TRACE-END] trace_id | total_duration | status
+
+and the JSONL format written by TraceBuffer.to_jsonl:
+    {"t": "start", "trace_id": ..., "api": ..., "timestamp": ...}
+    {"t": "start_function", "level": ..., "fn": ..., "depth": ..., "ms": ..., "data": {...}}
+    {"t": "end", "trace_id": ..., "total_ms": ..., "status": ...}
+
+Files are parsed line by line, so the call graph of a very large trace
+is built without holding the file contents in memory.
 """
+import json
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
+
+
+# Node input/output text is capped like the text log format caps data
+MAX_DATA_CHARS = 1000
+
+_JSONL_DATA_MARKER = ', "data": '
+
+
+def _truncate(data_str: str) -> str:
+    if len(data_str) > MAX_DATA_CHARS:
+        return data_str[:MAX_DATA_CHARS - 3] + "..."
+    return data_str
+
+
+def _split_jsonl_line(line: str):
+    """Split a JSONL entry line into (metadata dict, raw data JSON text)."""
+    marker = line.find(_JSONL_DATA_MARKER)
+    if marker == -1:
+        return json.loads(line), None
+    return json.loads(line[:marker] + "}"), line[marker + len(_JSONL_DATA_MARKER):-1]
+
+
+class _GraphBuilder:
+    """Accumulates nodes and edges as trace events arrive."""
+
+    def __init__(self):
+        self.result = {
+            "trace_id": "",
+            "api": "",
+            "timestamp": "",
+            "total_time_ms": 0,
+            "status": "success",
+            "nodes": [],
+            "edges": []
+        }
+        self.nodes: List[Dict[str, Any]] = []
+        self.edges: List[Dict[str, str]] = []
+        self.call_stack: List[int] = []  # Stack of node indices for tracking parent-child
+        self.current_error_node: Optional[int] = None
+        self.stack_lines: List[Dict[str, Any]] = []
+
+    def start_trace(self, trace_id: str, api: str, timestamp: str) -> None:
+        self.result["trace_id"] = trace_id
+        self.result["api"] = api
+        self.result["timestamp"] = timestamp
+
+        # Create root API node
+        self.call_stack.append(self._add_node(api, "API", "{}"))
+
+    def end_trace(self, total_ms: int, status: str) -> None:
+        self.result["total_time_ms"] = total_ms
+        self.result["status"] = status.lower()
+
+        # Update root node timing
+        if self.nodes:
+            self.nodes[0]["timing"] = f"{total_ms}ms"
+            if status.upper() == "ERROR":
+                self.nodes[0]["status"] = "error"
+
+    def start_function(self, level: str, func_name: str, input_json: str) -> None:
+        parent = self.call_stack[-1] if self.call_stack else None
+        node_index = self._add_node(func_name, level, input_json)
+
+        # Create edge from parent
+        if parent is not None:
+            self.edges.append({
+                "source": f"node-{parent}",
+                "target": f"node-{node_index}"
+            })
+        self.call_stack.append(node_index)
+
+    def return_function(self, output_json: str, duration: str) -> None:
+        # Pop from stack and update node
+        if self.call_stack:
+            current_id = self.call_stack.pop()
+            if current_id < len(self.nodes):
+                self.nodes[current_id]["output"] = output_json
+                self.nodes[current_id]["timing"] = f"{duration}ms"
+
+    def exception(self, error_type: str, error_msg: str, duration: str) -> None:
+        # Pop from stack and update node with error
+        if self.call_stack:
+            current_id = self.call_stack.pop()
+            if current_id < len(self.nodes):
+                self.nodes[current_id]["status"] = "error"
+                self.nodes[current_id]["timing"] = f"{duration}ms"
+                self.nodes[current_id]["error"] = {
+                    "type": error_type,
+                    "message": error_msg,
+                    "stack": []
+                }
+                self.current_error_node = current_id
+
+    def stack_line(self, func: str, file_path: str, line_num: Optional[str]) -> None:
+        self.stack_lines.append({
+            "func": func,
+            "file": file_path,
+            "line": int(line_num) if line_num else None
+        })
+
+    def finish_stack(self) -> None:
+        if self.stack_lines and self.current_error_node is not None:
+            self.nodes[self.current_error_node]["error"]["stack"] = self.stack_lines
+        self.stack_lines = []
+        self.current_error_node = None
+
+    def build(self) -> Dict[str, Any]:
+        # Finalize any remaining stack lines
+        self.finish_stack()
+        self.result["nodes"] = self.nodes
+        self.result["edges"] = self.edges
+        return self.result
+
+    def _add_node(self, label: str, level: str, input_json: str) -> int:
+        node_index = len(self.nodes)
+        self.nodes.append({
+            "id": f"node-{node_index}",
+            "label": label,
+            "timing": "",
+            "status": "success",
+            "level": level,
+            "input": input_json,
+            "output": "{}",
+            "error": None
+        })
+        return node_index
 
 
 class TraceLogParser:
     """
     Parse trace log files into graph structure for visualization.
-    
+
     Usage:
         parser = TraceLogParser()
         result = parser.parse(Path("trace.log"))
         # result = {"trace_id": "...", "nodes": [...], "edges": [...]}
     """
-    
+
     # Regex patterns for parsing log lines
     TRACE_START_PATTERN = re.compile(
         r'\[TRACE-START\]\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*(.+)'
@@ -44,14 +179,16 @@ class TraceLogParser:
     STACK_LINE_PATTERN = re.compile(
         r'\s+at\s+(\w+)\s+\(([^:]+):?(\d+)?\)'
     )
-    
+
     def parse(self, filepath: Path) -> Dict[str, Any]:
         """
         Parse trace log file into visualization-ready structure.
-        
+
+        The file is streamed line by line (text or JSONL, detected per line).
+
         Args:
             filepath: Path to the trace log file
-            
+
         Returns:
             Dictionary with trace data:
             {
@@ -77,159 +214,154 @@ class TraceLogParser:
                 ]
             }
         """
-        result = {
-            "trace_id": "",
-            "api": "",
-            "timestamp": "",
-            "total_time_ms": 0,
-            "status": "success",
-            "nodes": [],
-            "edges": []
-        }
-        
         if not filepath.exists():
-            return result
-        
-        content = filepath.read_text()
-        if not content.strip():
-            return result
-        
-        lines = content.splitlines()
-        nodes = []
-        edges = []
-        call_stack = []  # Stack of node indices for tracking parent-child
-        node_counter = 0
-        current_error_node = None
-        stack_lines = []
-        
+            return self.parse_lines([])
+
+        with open(filepath, encoding='utf-8', errors='replace', newline='') as f:
+            return self.parse_lines(f)
+
+    def parse_text(self, content: str) -> Dict[str, Any]:
+        """
+        Parse the text of a single trace (a log file or a segment block).
+
+        Args:
+            content: Trace log text (text or JSONL format)
+
+        Returns:
+            Same structure as parse()
+        """
+        return self.parse_lines(content.split("\n"))
+
+    def parse_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Parse trace log lines one at a time.
+
+        Args:
+            lines: Iterable of lines (text or JSONL format)
+
+        Returns:
+            Same structure as parse()
+        """
+        builder = _GraphBuilder()
         for raw_line in lines:
-            # Keep original line for stack trace matching
-            line = raw_line.strip()
-            
-            # Check for stack trace lines (indented with 'at')
-            stack_match = self.STACK_LINE_PATTERN.match(raw_line)
-            if stack_match and current_error_node is not None:
-                func, file_path, line_num = stack_match.groups()
-                stack_lines.append({
-                    "func": func,
-                    "file": file_path,
-                    "line": int(line_num) if line_num else None
-                })
-                continue
-            
-            # If we were collecting stack and hit non-stack line, finalize
-            if stack_lines and current_error_node is not None:
-                nodes[current_error_node]["error"]["stack"] = stack_lines
-                stack_lines = []
-                current_error_node = None
-            
-            # TRACE-START
-            start_match = self.TRACE_START_PATTERN.match(line)
-            if start_match:
-                trace_id, api, timestamp = start_match.groups()
-                result["trace_id"] = trace_id.strip()
-                result["api"] = api.strip()
-                result["timestamp"] = timestamp.strip()
-                
-                # Create root API node
-                nodes.append({
-                    "id": f"node-{node_counter}",
-                    "label": api.strip(),
-                    "timing": "",
-                    "status": "success",
-                    "level": "API",
-                    "input": "{}",
-                    "output": "{}",
-                    "error": None
-                })
-                call_stack.append(node_counter)
-                node_counter += 1
-                continue
-            
-            # TRACE-END
-            end_match = self.TRACE_END_PATTERN.match(line)
-            if end_match:
-                _, total_ms, status = end_match.groups()
-                result["total_time_ms"] = int(total_ms)
-                result["status"] = status.lower()
-                
-                # Update root node timing
-                if nodes:
-                    nodes[0]["timing"] = f"{total_ms}ms"
-                    if status.upper() == "ERROR":
-                        nodes[0]["status"] = "error"
-                continue
-            
-            # Function start
-            func_start_match = self.FUNCTION_START_PATTERN.match(line)
-            if func_start_match:
-                level, func_name, input_json = func_start_match.groups()
-                func_name = func_name.strip()
-                
-                # Create function node
-                new_node = {
-                    "id": f"node-{node_counter}",
-                    "label": func_name,
-                    "timing": "",
-                    "status": "success",
-                    "level": level,
-                    "input": input_json.strip(),
-                    "output": "{}",
-                    "error": None
-                }
-                nodes.append(new_node)
-                
-                # Create edge from parent
-                if call_stack:
-                    parent_id = call_stack[-1]
-                    edges.append({
-                        "source": f"node-{parent_id}",
-                        "target": f"node-{node_counter}"
-                    })
-                
-                call_stack.append(node_counter)
-                node_counter += 1
-                continue
-            
-            # Function return
-            func_return_match = self.FUNCTION_RETURN_PATTERN.match(line)
-            if func_return_match:
-                level, func_name, output_json, duration = func_return_match.groups()
-                func_name = func_name.strip()
-                
-                # Pop from stack and update node
-                if call_stack:
-                    current_id = call_stack.pop()
-                    if current_id < len(nodes):
-                        nodes[current_id]["output"] = output_json.strip()
-                        nodes[current_id]["timing"] = f"{duration}ms"
+            raw_line = raw_line.rstrip("\r\n")
+            if raw_line.startswith("{"):
+                self._parse_jsonl_line(builder, raw_line)
+            else:
+                self._parse_text_line(builder, raw_line)
+        return builder.build()
+
+    def render_text(self, lines: Iterable[str]) -> str:
+        """
+        Render a JSONL trace in the human-readable text log format.
+
+        Text-format lines are passed through unchanged.
+
+        Args:
+            lines: Iterable of trace lines
+
+        Returns:
+            Text log, as TraceBuffer.to_log_string would have written it
+        """
+        output = []
+        for raw_line in lines:
+            line = raw_line.rstrip("\r\n")
+            if not line.startswith("{"):
+                if line:
+                    output.append(line)
                 continue
-            
-            # Exception
-            exception_match = self.EXCEPTION_PATTERN.match(line)
-            if exception_match:
-                level, func_name, error_type, error_msg, duration = exception_match.groups()
-                func_name = func_name.strip()
-                
-                # Pop from stack and update node with error
-                if call_stack:
-                    current_id = call_stack.pop()
-                    if current_id < len(nodes):
-                        nodes[current_id]["status"] = "error"
-                        nodes[current_id]["timing"] = f"{duration}ms"
-                        nodes[current_id]["error"] = {
-                            "type": error_type.strip(),
-                            "message": error_msg.strip(),
-                            "stack": []
-                        }
-                        current_error_node = current_id
+            try:
+                meta, data = _split_jsonl_line(line)
+            except ValueError:
                 continue
-        
-        # Finalize any remaining stack lines
-        if stack_lines and current_error_node is not None:
-            nodes[current_error_node]["error"]["stack"] = stack_lines
-        
-        result["nodes"] = nodes
-        result["edges"] = edges
-        
-        return result
+            kind = meta.get("t")
+            if kind == "start":
+                output.append(f"[TRACE-START] {meta.get('trace_id', '')} | {meta.get('api', '')} | {meta.get('timestamp', '')}")
+            elif kind == "end":
+                output.append(f"[TRACE-END] {meta.get('trace_id', '')} | {meta.get('total_ms', 0)}ms | {meta.get('status', '')}")
+            else:
+                indent = "  " * (meta.get("depth", 0) + 1)
+                direction = "→" if kind == "start_function" else "←"
+                line_text = (
+                    f"{indent}[{meta.get('level', 'INFO')}] {direction} {kind}: "
+                    f"{meta.get('fn', '')} | {_truncate(data or '{}')}"
+                )
+                if meta.get("ms") is not None:
+                    line_text += f" | {meta['ms']:.0f}ms"
+                output.append(line_text)
+        return "\n".join(output)
+
+    def _parse_jsonl_line(self, builder: _GraphBuilder, line: str) -> None:
+        try:
+            meta, data = _split_jsonl_line(line)
+        except ValueError:
+            return
+        builder.finish_stack()
+
+        kind = meta.get("t")
+        if kind == "start_function":
+            builder.start_function(meta.get("level", "INFO"), meta.get("fn", ""), _truncate(data or "{}"))
+        elif kind == "return_function":
+            builder.return_function(_truncate(data or "{}"), f"{meta.get('ms') or 0:.0f}")
+        elif kind == "exception":
+            try:
+                error = json.loads(data) if data else {}
+            except ValueError:
+                error = {}
+            if not isinstance(error, dict):
+                error = {"message": str(error)}
+            builder.exception(
+                str(error.get("error", "")), str(error.get("message", "")), f"{meta.get('ms') or 0:.0f}"
+            )
+        elif kind == "start":
+            builder.start_trace(meta.get("trace_id", ""), meta.get("api", ""), meta.get("timestamp", ""))
+        elif kind == "end":
+            builder.end_trace(int(meta.get("total_ms") or 0), str(meta.get("status", "")))
+
+    def _parse_text_line(self, builder: _GraphBuilder, raw_line: str) -> None:
+        # Keep original line for stack trace matching
+        line = raw_line.strip()
+
+        # Check for stack trace lines (indented with 'at')
+        stack_match = self.STACK_LINE_PATTERN.match(raw_line)
+        if stack_match and builder.current_error_node is not None:
+            builder.stack_line(*stack_match.groups())
+            return
+
+        # If we were collecting stack and hit non-stack line, finalize
+        if builder.stack_lines and builder.current_error_node is not None:
+            builder.finish_stack()
+
+        # TRACE-START
+        start_match = self.TRACE_START_PATTERN.match(line)
+        if start_match:
+            trace_id, api, timestamp = start_match.groups()
+            builder.start_trace(trace_id.strip(), api.strip(), timestamp.strip())
+            return
+
+        # TRACE-END
+        end_match = self.TRACE_END_PATTERN.match(line)
+        if end_match:
+            _, total_ms, status = end_match.groups()
+            builder.end_trace(int(total_ms), status)
+            return
+
+        # Function start
+        func_start_match = self.FUNCTION_START_PATTERN.match(line)
+        if func_start_match:
+            level, func_name, input_json = func_start_match.groups()
+            builder.start_function(level, func_name.strip(), input_json.strip())
+            return
+
+        # Function return
+        func_return_match = self.FUNCTION_RETURN_PATTERN.match(line)
+        if func_return_match:
+            level, func_name, output_json, duration = func_return_match.groups()
+            builder.return_function(output_json.strip(), duration)
+            return
+
+        # Exception
+        exception_match = self.EXCEPTION_PATTERN.match(line)
+        if exception_match:
+            level, func_name, error_type, error_msg, duration = exception_match.groups()
+            builder.exception(error_type.strip(), error_msg.strip(), duration)
@@ -6,6 +6,7 @@ Redactor module for sensitive data redaction in trace logs.
 This module provides automatic redaction of sensitive data before logging,
 including passwords, tokens, API keys, and credit card numbers.
 """
+import functools
 import re
 from typing import Any, Dict, List, Set, Optional
 
@@ -25,6 +26,9 @@ SENSITIVE_KEY_PATTERNS = {
     "privatekey",
 }
 
+# Distinct key names whose sensitivity is remembered per Redactor
+SENSITIVE_KEY_CACHE_SIZE = 1024
+
 # Value patterns
 CREDIT_CARD_PATTERN = re.compile(r"^\d{16}$")
 JWT_PREFIX = "eyJ"
@@ -56,6 +60,10 @@ class Redactor:
         self.custom_fields: Set[str] = set(
             f.lower() for f in (custom_fields or [])
         )
+        # Parameter names repeat on every call; payload keys are unbounded
+        self._is_sensitive = functools.lru_cache(maxsize=SENSITIVE_KEY_CACHE_SIZE)(
+            self._is_sensitive_key
+        )
     
     def redact(self, data: Any) -> Any:
         """
@@ -86,15 +94,7 @@ class Redactor:
         Returns:
             Redacted value or original value if not sensitive
         """
-        key_lower = key.lower()
-        
-        # Check field name against sensitive patterns
-        for pattern in SENSITIVE_KEY_PATTERNS:
-            if pattern in key_lower:
-                return REDACTED
-        
-        # Check custom fields
-        if key_lower in self.custom_fields:
+        if self._is_sensitive(key):
             return REDACTED
         
         # Check value patterns for strings
@@ -109,3 +109,15 @@ class Redactor:
         
         # Recurse for nested structures
         return self.redact(value)
+    
+    def _is_sensitive_key(self, key: str) -> bool:
+        """Check a field name against sensitive patterns and custom fields."""
+        key_lower = str(key).lower()
+        
+        # Check field name against sensitive patterns
+        for pattern in SENSITIVE_KEY_PATTERNS:
+            if pattern in key_lower:
+                return True
+        
+        # Check custom fields
+        return key_lower in self.custom_fields
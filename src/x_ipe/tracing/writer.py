@@ -5,14 +5,37 @@ TraceLogWriter for writing trace buffers to log files.
 
 Handles file naming, directory creation, permission setting,
 and cleanup of old log files.
+
+Traces are either written one file per trace ({timestamp}-{api}-{id}.log)
+or appended to rolling segment files (segment-*.trace). AsyncTraceLogWriter
+moves the writing off the request thread.
 """
+import atexit
+import json
 import os
+import queue
 import re
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .buffer import TraceBuffer
+from .index import INDEX_FILE, get_trace_index
+
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".trace"
+SEGMENT_GLOB = f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"
+
+# Per-trace file suffix for each log format
+LOG_FORMATS = {"text": ".log", "jsonl": ".jsonl"}
+
+_TRACE_START = b"[TRACE-START]"
+_TRACE_END = b"[TRACE-END]"
+_JSONL_START = b'{"t": "start"'
+_JSONL_END = b'{"t": "end"'
 
 
 class TraceLogWriter:
@@ -28,16 +51,29 @@ class TraceLogWriter:
         deleted = writer.cleanup(retention_hours=24)
     """
     
-    def __init__(self, log_path: str = "instance/traces/"):
+    # Segment files roll over once they reach this size
+    SEGMENT_MAX_BYTES = 8 * 1024 * 1024  # 8MB
+    
+    def __init__(self, log_path: str = "instance/traces/", segmented: bool = False,
+                 log_format: str = "text"):
         """
         Initialize TraceLogWriter.
         
         Args:
             log_path: Directory path for log files
+            segmented: Append traces to rolling segment files instead of
+                writing one file per trace
+            log_format: "text" (human-readable) or "jsonl" (one JSON object per event)
         """
         self.log_path = Path(log_path)
+        self.segmented = segmented
+        self.log_format = log_format if log_format in LOG_FORMATS else "text"
+        self._segment: Optional[Path] = None
+        self._segment_size = 0
+        self._segment_seq = 0
     
-    def write(self, buffer: TraceBuffer, status: str = "SUCCESS") -> Optional[str]:
+    def write(self, buffer: TraceBuffer, status: str = "SUCCESS",
+              total_ms: Optional[float] = None) -> Optional[str]:
         """
         Write trace buffer to log file.
         
@@ -47,37 +83,148 @@ class TraceLogWriter:
         Args:
             buffer: TraceBuffer to write
             status: Final status (SUCCESS, ERROR)
+            total_ms: Total duration; measured from buffer.started_at if None
             
         Returns:
             Path to created log file, or None if write failed
         """
+        paths = self.write_batch([(buffer, status, total_ms)])
+        return paths[0] if paths else None
+    
+    def write_batch(self, items: List[Tuple[TraceBuffer, str, Optional[float]]]) -> List[Optional[str]]:
+        """
+        Write several trace buffers with one directory check.
+        
+        In segmented mode the whole batch is appended with a single open.
+        
+        Args:
+            items: (buffer, status, total_ms) tuples
+            
+        Returns:
+            Path written for each item (None where the write failed)
+        """
+        # Calculate total durations not measured by the caller
+        now = datetime.now(timezone.utc)
+        items = [
+            (buffer, status, total_ms if total_ms is not None
+             else (now - buffer.started_at).total_seconds() * 1000)
+            for buffer, status, total_ms in items
+        ]
+        
         try:
             # Ensure directory exists
             self.log_path.mkdir(parents=True, exist_ok=True)
-            
-            # Calculate total duration
-            total_ms = (datetime.now(timezone.utc) - buffer.started_at).total_seconds() * 1000
-            content = buffer.to_log_string(status, total_ms)
+        except OSError as e:
+            print(f"[TRACING] Failed to write log: {e}")
+            return [None] * len(items)
+        
+        if self.segmented:
+            locations = self._append_to_segment(items)
+        else:
+            locations = [self._write_file(buffer, status, total_ms) for buffer, status, total_ms in items]
+        
+        records = [
+            self._index_record(buffer, status, total_ms, location)
+            for (buffer, status, total_ms), location in zip(items, locations)
+            if location is not None
+        ]
+        try:
+            index = get_trace_index(self.log_path)
+            # Index older logs first so the manifest never hides them
+            index.ensure(self.scan_index_records)
+            index.append(records)
+        except OSError as e:
+            print(f"[TRACING] Failed to update trace index: {e}")
+        
+        return [str(location[0]) if location is not None else None for location in locations]
+    
+    @staticmethod
+    def _index_record(buffer: TraceBuffer, status: str, total_ms: Optional[float],
+                      location: Tuple[Path, int, int]) -> Dict[str, Any]:
+        path, offset, length = location
+        return {
+            "trace_id": buffer.trace_id,
+            "api": buffer.root_api,
+            "status": status,
+            "total_ms": round(total_ms) if total_ms is not None else None,
+            "timestamp": buffer.started_at.isoformat(),
+            "file": path.name,
+            "offset": offset,
+            "length": length,
+        }
+    
+    def _render(self, buffer: TraceBuffer, status: str, total_ms: float) -> str:
+        if self.log_format == "jsonl":
+            return buffer.to_jsonl(status, total_ms)
+        return buffer.to_log_string(status, total_ms)
+    
+    def _write_file(self, buffer: TraceBuffer, status: str,
+                    total_ms: float) -> Optional[Tuple[Path, int, int]]:
+        try:
+            content = self._render(buffer, status, total_ms).encode('utf-8')
             
             # Generate filename
             timestamp = buffer.started_at.strftime("%Y%m%d-%H%M%S")
             api_name = self._sanitize_api_name(buffer.root_api)
-            filename = f"{timestamp}-{api_name}-{buffer.trace_id}.log"
+            filename = f"{timestamp}-{api_name}-{buffer.trace_id}{LOG_FORMATS[self.log_format]}"
             filepath = self.log_path / filename
             
-            # Write file
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write file (owner read/write only)
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'wb') as f:
                 f.write(content)
             
-            # Set permissions (owner read/write only)
-            os.chmod(filepath, 0o600)
-            
-            return str(filepath)
+            return filepath, 0, len(content)
             
         except Exception as e:
             print(f"[TRACING] Failed to write log: {e}")
             return None
     
+    def _append_to_segment(self, items: List[Tuple[TraceBuffer, str, float]]) -> List[Optional[Tuple[Path, int, int]]]:
+        blocks = []
+        for buffer, status, total_ms in items:
+            try:
+                blocks.append((self._render(buffer, status, total_ms) + "\n").encode('utf-8'))
+            except Exception as e:
+                print(f"[TRACING] Failed to render log: {e}")
+                blocks.append(None)
+        
+        paths: List[Optional[Tuple[Path, int, int]]] = []
+        f = None
+        try:
+            for block in blocks:
+                if block is None:
+                    paths.append(None)
+                    continue
+                if f is None or self._segment_size >= self.SEGMENT_MAX_BYTES:
+                    if f is not None:
+                        f.close()
+                    f = self._open_segment()
+                f.write(block)
+                paths.append((self._segment, self._segment_size, len(block)))
+                self._segment_size += len(block)
+        except OSError as e:
+            print(f"[TRACING] Failed to write log: {e}")
+            paths.extend([None] * (len(blocks) - len(paths)))
+        finally:
+            if f is not None:
+                f.close()
+        return paths
+    
+    def _open_segment(self):
+        """Open the current segment for appending, rolling to a new one when full."""
+        if self._segment is None or self._segment_size >= self.SEGMENT_MAX_BYTES:
+            self._segment_seq += 1
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+            self._segment = self.log_path / (
+                f"{SEGMENT_PREFIX}{stamp}-{os.getpid()}-{self._segment_seq}{SEGMENT_SUFFIX}"
+            )
+            self._segment_size = 0
+        fd = os.open(self._segment, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        f = open(fd, 'ab')
+        self._segment_size = f.seek(0, os.SEEK_END)
+        return f
+    
     def cleanup(self, retention_hours: int = 24) -> int:
         """
         Delete log files older than retention period.
@@ -94,16 +241,185 @@ class TraceLogWriter:
         deleted = 0
         cutoff = datetime.now(timezone.utc).timestamp() - (retention_hours * 3600)
         
-        for filepath in self.log_path.glob("*.log"):
+        for filepath in self.iter_log_files():
             try:
+                if filepath == self._segment:
+                    continue  # Still being appended to
                 if filepath.stat().st_mtime < cutoff:
                     filepath.unlink()
                     deleted += 1
             except OSError:
                 continue
         
+        if deleted:
+            get_trace_index(self.log_path).compact()
+        
         return deleted
     
+    def iter_log_files(self) -> Iterator[Path]:
+        """Yield every per-trace log file and segment file in the log directory."""
+        if not self.log_path.exists():
+            return
+        for suffix in LOG_FORMATS.values():
+            for filepath in self.log_path.glob(f"*{suffix}"):
+                if filepath.name != INDEX_FILE:
+                    yield filepath
+        yield from self.log_path.glob(SEGMENT_GLOB)
+    
+    @staticmethod
+    def iter_segment_traces(segment: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Scan a segment file for the traces it contains.
+        
+        Only the start/end lines of each trace are decoded (text or JSONL).
+        
+        Args:
+            segment: Path to a segment file
+            
+        Yields:
+            Dict with trace_id, api, timestamp, total_ms, status,
+            offset and length (byte range of the trace block)
+        """
+        current = None
+        offset = 0
+        with open(segment, 'rb') as f:
+            for line in f:
+                if line.startswith(_TRACE_START):
+                    parts = line[len(_TRACE_START):].decode('utf-8', 'replace').split("|")
+                    current = {
+                        "trace_id": parts[0].strip(),
+                        "api": parts[1].strip() if len(parts) > 1 else "",
+                        "timestamp": parts[2].strip() if len(parts) > 2 else "",
+                        "offset": offset,
+                    }
+                elif line.startswith(_JSONL_START):
+                    header = _load_json_line(line)
+                    current = {
+                        "trace_id": str(header.get("trace_id", "")),
+                        "api": str(header.get("api", "")),
+                        "timestamp": str(header.get("timestamp", "")),
+                        "offset": offset,
+                    }
+                elif line.startswith(_TRACE_END) and current is not None:
+                    parts = line[len(_TRACE_END):].decode('utf-8', 'replace').split("|")
+                    try:
+                        current["total_ms"] = int(parts[1].strip().rstrip("ms"))
+                    except (IndexError, ValueError):
+                        current["total_ms"] = 0
+                    current["status"] = parts[2].strip() if len(parts) > 2 else ""
+                    current["length"] = offset + len(line) - current["offset"]
+                    yield current
+                    current = None
+                elif line.startswith(_JSONL_END) and current is not None:
+                    footer = _load_json_line(line)
+                    current["total_ms"] = footer.get("total_ms") or 0
+                    current["status"] = str(footer.get("status", ""))
+                    current["length"] = offset + len(line) - current["offset"]
+                    yield current
+                    current = None
+                offset += len(line)
+    
+    def scan_index_records(self) -> List[Dict[str, Any]]:
+        """Build index records from the log files (used when the manifest is missing)."""
+        records = []
+        for filepath in sorted(self.iter_log_files()):
+            try:
+                traces = list(self.iter_segment_traces(filepath))
+                if traces:
+                    # Complete traces: exact id, API, status and duration from their start/end lines
+                    for trace in traces:
+                        records.append({
+                            "trace_id": trace["trace_id"],
+                            "api": trace["api"],
+                            "status": trace["status"],
+                            "total_ms": trace["total_ms"],
+                            "timestamp": trace["timestamp"],
+                            "file": filepath.name,
+                            "offset": trace["offset"],
+                            "length": trace["length"]
+                        })
+                elif not filepath.name.endswith(SEGMENT_SUFFIX):
+                    records.append(self._scan_partial_log(filepath))
+            except OSError:
+                continue
+        return records
+    
+    def _scan_partial_log(self, filepath: Path) -> Dict[str, Any]:
+        """Index a log file without a complete trace, relying on its filename."""
+        # Parse filename: {timestamp}-{api}-{trace_id}.log
+        # Example: 20260202-072505-get-api-project-structure-a649c048-3d73.log
+        stem = filepath.stem
+        
+        # Extract trace_id (last 2 UUID segments: xxxxxxxx-xxxx)
+        # Split and find the UUID pattern at the end
+        parts = stem.split("-")
+        if len(parts) >= 4:
+            # Last 2 parts form the trace_id (e.g., "a649c048-3d73")
+            trace_id = f"{parts[-2]}-{parts[-1]}"
+            # First 2 parts are timestamp (YYYYMMDD-HHMMSS)
+            # Middle parts are the API name
+            api_parts = parts[2:-2]  # Skip timestamp and trace_id
+            api_name = "-".join(api_parts) if api_parts else "unknown"
+            # Convert api_name back to path format (e.g., "get-api-project-structure" -> "GET /api/project/structure")
+            api = self._filename_to_api(api_name)
+        else:
+            trace_id = stem
+            api = "/unknown"
+        
+        # Prefer the exact id and API from the TRACE-START header when present
+        with open(filepath, 'rb') as f:
+            header = f.readline(4096).decode('utf-8', 'replace')
+        header_parts = header[len("[TRACE-START]"):].split("|")
+        if header.startswith("[TRACE-START]") and len(header_parts) >= 2:
+            trace_id = header_parts[0].strip() or trace_id
+            api = header_parts[1].strip() or api
+        
+        stat = filepath.stat()
+        return {
+            "trace_id": trace_id,
+            "api": api,
+            "status": None,
+            "total_ms": None,
+            "timestamp": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+            "file": filepath.name,
+            "offset": 0,
+            "length": stat.st_size
+        }
+    
+    @staticmethod
+    def _filename_to_api(api_name: str) -> str:
+        """
+        Convert sanitized API filename component back to API format.
+        
+        Args:
+            api_name: Sanitized name (e.g., "get-api-project-structure")
+            
+        Returns:
+            API string (e.g., "GET /api/project/structure")
+        """
+        if not api_name or api_name == "unknown":
+            return "/unknown"
+        
+        # Split by first hyphen to get method
+        parts = api_name.split("-", 1)
+        if len(parts) < 2:
+            return f"/{api_name}"
+        
+        method = parts[0].upper()
+        path_part = parts[1]
+        
+        # Convert hyphens back to slashes for path
+        path = "/" + path_part.replace("-", "/")
+        
+        return f"{method} {path}"
+    
+    @staticmethod
+    def read_segment_trace(segment: Path, offset: int, length: int) -> str:
+        """Read one trace block from a segment file."""
+        with open(segment, 'rb') as f:
+            f.seek(offset)
+            return f.read(length).decode('utf-8', 'replace')
+    
     def _sanitize_api_name(self, api: str) -> str:
         """
         Convert API string to safe filename component.
@@ -120,3 +436,156 @@ class TraceLogWriter:
         sanitized = re.sub(r'-+', '-', sanitized)
         # Strip leading/trailing hyphens
         return sanitized.strip("-")
+
+
+def _load_json_line(line: bytes) -> Dict[str, Any]:
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+class AsyncTraceLogWriter:
+    """
+    Background writer that takes trace log I/O off the request thread.
+    
+    Requests hand finished buffers to submit(), which only enqueues. A
+    daemon thread drains the bounded queue in batches and writes them with
+    TraceLogWriter. When the queue is full the trace is dropped and
+    counted rather than blocking the request.
+    
+    Usage:
+        async_writer = AsyncTraceLogWriter()
+        async_writer.submit("instance/traces/", buffer, "SUCCESS")
+        async_writer.flush()
+    """
+    
+    DEFAULT_QUEUE_SIZE = 1000
+    BATCH_SIZE = 64
+    
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE, batch_size: int = BATCH_SIZE):
+        """
+        Initialize AsyncTraceLogWriter.
+        
+        Args:
+            queue_size: Maximum traces waiting to be written
+            batch_size: Maximum traces written per batch
+        """
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.written = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._writers: Dict[Tuple[str, bool, str], TraceLogWriter] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(self, log_path: str, buffer: TraceBuffer, status: str,
+               segmented: bool = False, log_format: str = "text") -> bool:
+        """
+        Queue a finished trace for writing.
+        
+        The total duration is measured now, not when the write happens.
+        
+        Args:
+            log_path: Trace log directory
+            buffer: Finished TraceBuffer
+            status: Final status (SUCCESS, ERROR)
+            segmented: Append to rolling segment files
+            log_format: "text" or "jsonl"
+            
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        total_ms = (datetime.now(timezone.utc) - buffer.started_at).total_seconds() * 1000
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(((str(log_path), segmented, log_format), buffer, status, total_ms))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+    
+    def write_now(self, log_path: str, buffer: TraceBuffer, status: str,
+                  segmented: bool = False, log_format: str = "text") -> Optional[str]:
+        """
+        Write a trace synchronously, sharing segment state with queued writes.
+        
+        Returns:
+            Path written, or None if the write failed
+        """
+        paths = self._write([((str(log_path), segmented, log_format), buffer, status, None)])
+        return paths[0] if paths else None
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued trace has been written.
+        
+        Args:
+            timeout: Seconds to wait; None waits indefinitely
+            
+        Returns:
+            True if the queue drained in time
+        """
+        if self._thread is None:
+            return True
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def stats(self) -> Dict[str, int]:
+        """Return queued, written and dropped trace counts."""
+        return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="trace-log-writer", daemon=True)
+                thread.start()
+                atexit.register(self.flush, 5.0)
+                self._thread = thread
+    
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                print(f"[TRACING] Failed to write log batch: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write(self, batch: list) -> List[Optional[str]]:
+        groups: Dict[Tuple[str, bool, str], list] = {}
+        for index, (key, buffer, status, total_ms) in enumerate(batch):
+            groups.setdefault(key, []).append((index, (buffer, status, total_ms)))
+        
+        results: List[Optional[str]] = [None] * len(batch)
+        with self._write_lock:
+            for key, entries in groups.items():
+                writer = self._writers.get(key)
+                if writer is None:
+                    writer = self._writers[key] = TraceLogWriter(key[0], segmented=key[1], log_format=key[2])
+                paths = writer.write_batch([item for _, item in entries])
+                for (index, _), path in zip(entries, paths):
+                    results[index] = path
+            self.written += sum(1 for path in results if path is not None)
+        return results
@@ -0,0 +1,87 @@
+"""
+Benchmark: rebuilding named ontology graphs after a small change
+
+Creates a master entity log with many small clusters, builds the named
+graphs once, appends one entity related to an existing cluster, then
+times the rebuild as a full build and as an incremental build. Not
+collected by pytest; run directly:
+
+    python -m tests.bench_graph_build [clusters] [cluster_size]
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_SCRIPTS_DIR = os.path.join(
+    os.path.dirname(__file__), "..", ".github", "skills", "x-ipe-tool-ontology", "scripts"
+)
+sys.path.insert(0, _SCRIPTS_DIR)
+
+import graph_ops  # noqa: E402
+import ontology  # noqa: E402
+
+
+def _write_log(entities_path: Path, source: Path, clusters: int, cluster_size: int) -> None:
+    with open(entities_path, "w") as f:
+        for c in range(clusters):
+            ids = [f"know_{c:05d}{m:03d}" for m in range(cluster_size)]
+            for m, eid in enumerate(ids):
+                entity = {
+                    "id": eid, "type": "KnowledgeNode", "created": f"2026-01-01T00:{m:02d}",
+                    "properties": {"label": f"Topic {c} item {m}", "node_type": "concept",
+                                   "source_files": [str(source)], "weight": 5},
+                }
+                f.write(json.dumps({"op": "create", "entity": entity}) + "\n")
+            for a, b in zip(ids, ids[1:]):
+                f.write(json.dumps({"op": "relate", "from": a, "rel": "related_to", "to": b}) + "\n")
+
+
+def _timed_rebuild(base: Path, full: bool) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp) / "ont"
+        shutil.copytree(base, work)
+        entities_path = str(work / "_entities.jsonl")
+        # Rewrite the state's paths for the copy
+        state_path = work / graph_ops.BUILD_STATE_FILE
+        state = json.loads(state_path.read_text())
+        state["entities_path"] = str(Path(entities_path).resolve())
+        state["log"]["inode"] = os.stat(entities_path).st_ino
+        state_path.write_text(json.dumps(state))
+
+        new = ontology.create_entity(
+            "KnowledgeNode",
+            {"label": "New item", "node_type": "concept", "source_files": [str(base.parent / "src.md")]},
+            entities_path,
+        )
+        ontology.create_relation(new["id"], "related_to", "know_00000000", None, entities_path)
+        start = time.perf_counter()
+        result = graph_ops.build(str(base.parent), str(work), entities_path, full=full)
+        elapsed = time.perf_counter() - start
+        assert result["incremental"] is not full
+        return elapsed
+
+
+def run(clusters: int = 2000, cluster_size: int = 10) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = root / "src.md"
+        source.write_text("source")
+        base = root / "ont"
+        base.mkdir()
+        _write_log(base / "_entities.jsonl", source, clusters, cluster_size)
+        graph_ops.build(str(root), str(base), str(base / "_entities.jsonl"))
+        return {
+            "full build": _timed_rebuild(base, full=True),
+            "incremental build": _timed_rebuild(base, full=False),
+        }
+
+
+if __name__ == '__main__':
+    clusters = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cluster_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for name, seconds in run(clusters, cluster_size).items():
+        print(f"{name:>18}: {seconds:6.2f} s")
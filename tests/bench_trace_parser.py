@@ -0,0 +1,80 @@
+"""
+Benchmark: parsing a very large trace log
+
+Writes one trace with many nested calls in both the text and JSONL
+formats, then compares wall time and peak Python memory (tracemalloc)
+for reading the whole file before parsing against streaming it line by
+line. Not collected by pytest; run directly:
+
+    python -m tests.bench_trace_parser [calls]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from x_ipe.tracing import TraceBuffer, TraceEntry
+from x_ipe.tracing.buffer import encode_data
+from x_ipe.tracing.parser import TraceLogParser
+
+
+def _build_buffer(calls: int) -> TraceBuffer:
+    """Build a trace of `calls` calls nested up to 8 deep (2 entries per call)."""
+    buffer = TraceBuffer("bench-0001", "GET /api/bench")
+    now = datetime.now(timezone.utc)
+    for i in range(calls):
+        depth = i % 8
+        for event, direction, data, duration in (
+            ("start_function", "→", {"item_id": i, "name": f"item-{i}", "tags": ["a", "b"]}, None),
+            ("return_function", "←", {"ok": True, "size": i * 3}, 0.4),
+        ):
+            entry = TraceEntry(
+                timestamp=now, trace_id=buffer.trace_id, level="INFO", direction=direction,
+                event_type=event, function_name=f"service.step_{depth}", data=data,
+                duration_ms=duration, depth=depth,
+            )
+            entry.encoded = encode_data(data)
+            # Bypass the buffer size cap so the file is genuinely large
+            buffer.entries.append(entry)
+    return buffer
+
+
+def _measure(func) -> tuple:
+    # Time without tracemalloc (it slows allocation-heavy code), then measure memory
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    nodes = len(result["nodes"])
+    del result
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, nodes
+
+
+def run(calls: int = 100000) -> dict:
+    """Return (seconds, peak bytes, nodes) for each parsing mode."""
+    buffer = _build_buffer(calls)
+    parser = TraceLogParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = Path(tmp) / "trace.log"
+        jsonl_path = Path(tmp) / "trace.jsonl"
+        text_path.write_text(buffer.to_log_string("SUCCESS", 1000.0), encoding="utf-8")
+        jsonl_path.write_text(buffer.to_jsonl("SUCCESS", 1000.0), encoding="utf-8")
+        del buffer
+
+        return {
+            f"text, whole file ({text_path.stat().st_size >> 20} MB)":
+                _measure(lambda: parser.parse_text(text_path.read_text(encoding="utf-8"))),
+            "text, streamed": _measure(lambda: parser.parse(text_path)),
+            f"jsonl, streamed ({jsonl_path.stat().st_size >> 20} MB)": _measure(lambda: parser.parse(jsonl_path)),
+        }
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, (seconds, peak, nodes) in run(calls).items():
+        print(f"{name:>28}: {seconds:6.2f} s  peak {peak / 2**20:7.1f} MB  ({nodes} nodes)")
@@ -0,0 +1,58 @@
+"""
+Benchmark: per-call overhead of @x_ipe_tracing
+
+Measures a trivial function undecorated, decorated without an active
+trace, and decorated inside an active trace. Not collected by pytest;
+run directly:
+
+    python -m tests.bench_tracing [iterations]
+"""
+import sys
+import time
+
+from x_ipe.tracing import x_ipe_tracing, TraceContext
+
+
+def _plain(order_id, items, note=None):
+    return {"order_id": order_id, "count": len(items)}
+
+
+_traced = x_ipe_tracing(level="INFO")(_plain)
+
+
+def _per_call_us(func, iterations: int) -> float:
+    items = ["a", "b", "c"]
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i, items, note="x")
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int = 20000) -> dict:
+    """Return per-call microseconds for each mode."""
+    TraceContext.end_trace()
+    plain = _per_call_us(_plain, iterations)
+    untraced = _per_call_us(_traced, iterations)
+    
+    TraceContext.start_trace("BENCH")
+    try:
+        traced = _per_call_us(_traced, iterations)
+        buffer = TraceContext.get_current().buffer
+        start = time.perf_counter()
+        buffer.to_log_string("SUCCESS", 0.0)
+        format_us = (time.perf_counter() - start) / max(len(buffer.entries), 1) * 1e6
+    finally:
+        TraceContext.end_trace()
+    
+    return {
+        "plain": plain,
+        "decorated, no trace": untraced,
+        "decorated, tracing": traced,
+        "log format per entry": format_us,
+    }
+
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, micros in run(iterations).items():
+        print(f"{name:>22}: {micros:8.2f} us/call")
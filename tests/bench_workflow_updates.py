@@ -0,0 +1,84 @@
+"""
+Benchmark: concurrent action updates on one workflow
+
+Starts N updaters, each driving the feature_refinement action of its
+own feature through M status changes, and reports throughput and lost
+updates for the compare-and-swap commit against the previous approach
+of holding an exclusive lock around every read-modify-write (emulated
+with a threading.Lock: the service itself now takes the workflow file
+lock when it commits, and a second flock in the same process would
+block on it). An update is lost if a feature does not end in its last status or the
+workflow revision did not advance once per update. Not collected by
+pytest; run directly:
+
+    python -m tests.bench_workflow_updates [updaters] [updates]
+"""
+import contextlib
+import sys
+import tempfile
+import threading
+import time
+
+import x_ipe.services.workflow_manager_service as wms
+from x_ipe.services.workflow_manager_service import WorkflowManagerService
+
+STATUSES = ("in_progress", "failed", "in_progress", "done")
+
+
+def _setup(project_root: str, updaters: int):
+    service = WorkflowManagerService(project_root)
+    service.create_workflow("bench")
+    for action in ("compose_idea", "refine_idea", "requirement_gathering", "feature_breakdown"):
+        service.update_action_status("bench", action, "done")
+    feature_ids = [f"FEATURE-{i:03d}-A" for i in range(updaters)]
+    service.add_features("bench", [{"id": fid, "name": fid, "depends_on": []} for fid in feature_ids])
+    return service, feature_ids
+
+
+def _run(locked: bool, updaters: int, updates: int) -> tuple:
+    """Return (updates per second, lost updates)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        service, feature_ids = _setup(tmp, updaters)
+        exclusive = threading.Lock()
+        start_revision = service.get_workflow("bench")["revision"]
+        barrier = threading.Barrier(updaters + 1)
+
+        def update(fid):
+            barrier.wait()
+            for i in range(updates):
+                status = STATUSES[i % len(STATUSES)] if i < updates - 1 else "done"
+                with exclusive if locked else contextlib.nullcontext():
+                    service.update_action_status("bench", "feature_refinement", status, feature_id=fid)
+
+        threads = [threading.Thread(target=update, args=(fid,)) for fid in feature_ids]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        wms._state_cache.flush()
+
+        state = WorkflowManagerService(tmp).get_workflow("bench")
+        features = {feat["feature_id"]: feat for feat in state["features"]}
+        lost = sum(
+            features[fid]["implement"]["actions"]["feature_refinement"]["status"] != "done"
+            for fid in feature_ids
+        )
+        lost += updaters * updates - (state["revision"] - start_revision)
+        return updaters * updates / elapsed, lost
+
+
+def run(updaters: int = 16, updates: int = 50) -> dict:
+    return {
+        "exclusive lock": _run(True, updaters, updates),
+        "compare-and-swap": _run(False, updaters, updates),
+    }
+
+
+if __name__ == '__main__':
+    updaters = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    updates = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    for name, (rate, lost) in run(updaters, updates).items():
+        print(f"{name:>16}: {rate:8.0f} updates/s  lost updates: {lost}")
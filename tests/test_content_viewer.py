@@ -314,3 +314,89 @@ class TestContentServiceTracing:
             assert 'detect_file_type' in func_names
         finally:
             TraceContext.end_trace()
+
+
+class TestPagedContent:
+    """Tests for previews and ranged reads of large files"""
+
+    @pytest.fixture
+    def big_file(self, temp_project):
+        lines = [f'line {i} ✓' for i in range(50)]
+        path = temp_project / 'big.log'
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return path, lines
+
+    @pytest.fixture
+    def small_threshold(self, monkeypatch):
+        from x_ipe.services import ContentService
+        monkeypatch.setattr(ContentService, 'LARGE_FILE_THRESHOLD', 100)
+        monkeypatch.setattr(ContentService, 'PREVIEW_LINES', 10)
+
+    def test_small_file_response_is_unchanged(self, client, temp_project):
+        (temp_project / 'a.txt').write_text('hello')
+        data = client.get('/api/file/content?path=a.txt').get_json()
+        assert set(data) == {'path', 'content', 'type', 'extension', 'size'}
+
+    def test_large_file_preview_returns_first_page(self, client, big_file, small_threshold):
+        _, lines = big_file
+        data = client.get('/api/file/content?path=big.log&preview=true').get_json()
+        assert data['truncated'] is True
+        assert data['line_count'] == 10
+        assert data['content'] == '\n'.join(lines[:10]) + '\n'
+        assert data['next_cursor'] is not None
+
+    def test_large_file_is_whole_without_preview(self, client, big_file, small_threshold):
+        # Editors save what they load, so they must never get a partial file
+        path, _ = big_file
+        data = client.get('/api/file/content?path=big.log').get_json()
+        assert data['content'] == path.read_text(encoding='utf-8')
+        assert 'truncated' not in data
+
+    def test_cursor_pages_through_whole_file(self, client, big_file, small_threshold):
+        path, _ = big_file
+        content, cursor = '', 0
+        while cursor is not None:
+            data = client.get(f'/api/file/content?path=big.log&cursor={cursor}').get_json()
+            content += data['content']
+            cursor = data['next_cursor']
+        assert content == path.read_text(encoding='utf-8')
+
+    def test_start_line_and_lines(self, client, big_file):
+        _, lines = big_file
+        data = client.get('/api/file/content?path=big.log&start_line=45&lines=3').get_json()
+        assert data['content'] == '\n'.join(lines[45:48]) + '\n'
+        assert data['truncated'] is True
+
+    def test_last_line_without_newline(self, client, temp_project):
+        (temp_project / 'c.txt').write_text('a\nb')
+        data = client.get('/api/file/content?path=c.txt&start_line=1').get_json()
+        assert data['content'] == 'b'
+        assert data['line_count'] == 1
+        assert data['next_cursor'] is None
+
+    def test_chunk_cap_does_not_split_characters(self, temp_project, monkeypatch):
+        from x_ipe.services import ContentService
+        monkeypatch.setattr(ContentService, 'MAX_CHUNK_BYTES', 4)
+        (temp_project / 'u.txt').write_text('ab✓✓', encoding='utf-8')
+        service = ContentService(str(temp_project))
+        first = service.get_content('u.txt', max_lines=1)
+        assert first['content'] == 'ab'
+        second = service.get_content('u.txt', cursor=first['next_cursor'], max_lines=1)
+        assert second['content'] == '✓'
+
+    def test_byte_range(self, client, temp_project):
+        (temp_project / 'r.txt').write_text('0123456789')
+        data = client.get('/api/file/content?path=r.txt&offset=2&length=3').get_json()
+        assert data['content'] == '234'
+        assert data['next_offset'] == 5
+
+    def test_invalid_range_returns_400(self, client, temp_project):
+        (temp_project / 'r.txt').write_text('x')
+        assert client.get('/api/file/content?path=r.txt&cursor=abc').status_code == 400
+        assert client.get('/api/file/content?path=r.txt&lines=-1').status_code == 400
+
+    def test_raw_supports_http_range(self, client, temp_project):
+        (temp_project / 'r.txt').write_text('0123456789')
+        response = client.get('/api/file/content?path=r.txt&raw=true', headers={'Range': 'bytes=2-4'})
+        assert response.status_code == 206
+        assert response.data == b'234'
@@ -0,0 +1,184 @@
+"""
+Tests for the compiled gitignore matcher (x_ipe.core.gitignore)
+
+Tests cover:
+- Pattern semantics: globs, **, negation, anchoring, directory-only
+- Nested .gitignore files and reloading
+- Pruned directory walks and FileWatcherHandler snapshots
+"""
+import pytest
+from pathlib import Path
+
+from x_ipe.core.gitignore import GitignoreMatcher, compile_pattern
+
+
+def _matcher(root, patterns):
+    return GitignoreMatcher(str(root), root_patterns=patterns)
+
+
+class TestCompilePattern:
+    """Tests for single-line compilation"""
+
+    def test_blank_and_comment_lines_are_skipped(self):
+        assert compile_pattern('') is None
+        assert compile_pattern('   ') is None
+        assert compile_pattern('# comment') is None
+
+    def test_escaped_hash_is_a_pattern(self):
+        assert compile_pattern('\\#file') is not None
+
+    def test_flags(self):
+        _, negated, directory_only = compile_pattern('!build/')
+        assert negated is True
+        assert directory_only is True
+
+
+class TestGitignoreMatcher:
+    """Tests for path matching semantics"""
+
+    def test_unanchored_name_matches_at_any_depth(self, tmp_path):
+        matcher = _matcher(tmp_path, ['__pycache__/'])
+        assert matcher.is_ignored('__pycache__/x.pyc', is_dir=False)
+        assert matcher.is_ignored('src/pkg/__pycache__/x.pyc', is_dir=False)
+
+    def test_directory_only_pattern_does_not_match_files(self, tmp_path):
+        matcher = _matcher(tmp_path, ['build/'])
+        assert matcher.is_ignored('build', is_dir=True)
+        assert not matcher.is_ignored('build', is_dir=False)
+
+    def test_anchored_pattern_only_matches_from_root(self, tmp_path):
+        matcher = _matcher(tmp_path, ['/dist'])
+        assert matcher.is_ignored('dist/app.js', is_dir=False)
+        assert not matcher.is_ignored('src/dist/app.js', is_dir=False)
+
+    def test_middle_slash_anchors_pattern(self, tmp_path):
+        matcher = _matcher(tmp_path, ['docs/generated'])
+        assert matcher.is_ignored('docs/generated/a.md', is_dir=False)
+        assert not matcher.is_ignored('src/docs/generated/a.md', is_dir=False)
+
+    def test_glob_wildcards(self, tmp_path):
+        matcher = _matcher(tmp_path, ['*.log', 'tmp?.txt', 'data[0-9].csv'])
+        assert matcher.is_ignored('logs/server.log', is_dir=False)
+        assert matcher.is_ignored('tmp1.txt', is_dir=False)
+        assert not matcher.is_ignored('tmp10.txt', is_dir=False)
+        assert matcher.is_ignored('data7.csv', is_dir=False)
+        assert not matcher.is_ignored('datax.csv', is_dir=False)
+
+    def test_star_does_not_cross_directories(self, tmp_path):
+        matcher = _matcher(tmp_path, ['src/*.py'])
+        assert matcher.is_ignored('src/a.py', is_dir=False)
+        assert not matcher.is_ignored('src/pkg/a.py', is_dir=False)
+
+    def test_double_star_patterns(self, tmp_path):
+        matcher = _matcher(tmp_path, ['**/cache', 'out/**', 'a/**/z.txt'])
+        assert matcher.is_ignored('x/y/cache', is_dir=True)
+        assert matcher.is_ignored('out/deep/file.bin', is_dir=False)
+        assert matcher.is_ignored('a/z.txt', is_dir=False)
+        assert matcher.is_ignored('a/b/c/z.txt', is_dir=False)
+
+    def test_negation_reincludes_file(self, tmp_path):
+        matcher = _matcher(tmp_path, ['*.log', '!keep.log'])
+        assert matcher.is_ignored('debug.log', is_dir=False)
+        assert not matcher.is_ignored('keep.log', is_dir=False)
+
+    def test_last_matching_pattern_wins(self, tmp_path):
+        matcher = _matcher(tmp_path, ['!keep.log', '*.log'])
+        assert matcher.is_ignored('keep.log', is_dir=False)
+
+    def test_negation_cannot_reinclude_inside_ignored_directory(self, tmp_path):
+        matcher = _matcher(tmp_path, ['vendor/', '!vendor/keep.txt'])
+        assert matcher.is_ignored('vendor/keep.txt', is_dir=False)
+
+    def test_git_directory_is_always_ignored(self, tmp_path):
+        matcher = _matcher(tmp_path, [])
+        assert matcher.is_ignored('.git/HEAD', is_dir=False)
+
+    def test_absolute_paths_outside_root_are_not_ignored(self, tmp_path):
+        matcher = _matcher(tmp_path / 'project', ['*'])
+        assert not matcher.is_ignored(str(tmp_path / 'other' / 'a.txt'), is_dir=False)
+
+    def test_root_gitignore_read_from_disk(self, tmp_path):
+        (tmp_path / '.gitignore').write_text('*.tmp\n')
+        matcher = GitignoreMatcher(str(tmp_path))
+        assert matcher.is_ignored(str(tmp_path / 'a.tmp'), is_dir=False)
+
+
+class TestNestedGitignore:
+    """Tests for nested .gitignore files"""
+
+    def test_nested_file_applies_relative_to_its_directory(self, tmp_path):
+        (tmp_path / 'pkg').mkdir()
+        (tmp_path / 'pkg' / '.gitignore').write_text('/local.txt\n')
+        matcher = _matcher(tmp_path, [])
+        assert matcher.is_ignored(str(tmp_path / 'pkg' / 'local.txt'), is_dir=False)
+        assert not matcher.is_ignored(str(tmp_path / 'local.txt'), is_dir=False)
+
+    def test_nested_negation_overrides_parent(self, tmp_path):
+        (tmp_path / 'pkg').mkdir()
+        (tmp_path / 'pkg' / '.gitignore').write_text('!important.log\n')
+        matcher = _matcher(tmp_path, ['*.log'])
+        assert not matcher.is_ignored(str(tmp_path / 'pkg' / 'important.log'), is_dir=False)
+        assert matcher.is_ignored(str(tmp_path / 'pkg' / 'other.log'), is_dir=False)
+
+    def test_reload_picks_up_changes(self, tmp_path):
+        gitignore = tmp_path / '.gitignore'
+        gitignore.write_text('*.a\n')
+        matcher = GitignoreMatcher(str(tmp_path))
+        assert matcher.is_ignored('x.a', is_dir=False)
+
+        gitignore.write_text('*.b\n')
+        matcher.reload(str(gitignore))
+        assert not matcher.is_ignored('x.a', is_dir=False)
+        assert matcher.is_ignored('x.b', is_dir=False)
+
+
+class TestPrunedWalk:
+    """Tests for walking without descending into ignored directories"""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for rel in ('src/app.py', 'node_modules/lib/index.js', '.venv/bin/python', 'build.log'):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('x')
+        return tmp_path
+
+    def test_walk_files_skips_ignored(self, tree):
+        matcher = _matcher(tree, ['node_modules/', '.venv/', '*.log'])
+        files = {p.relative_to(tree).as_posix() for p in matcher.walk_files()}
+        assert files == {'src/app.py'}
+
+    def test_walk_never_lists_ignored_directories(self, tree, monkeypatch):
+        import os
+        listed = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path='.'):
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', tracking_scandir)
+        matcher = _matcher(tree, ['node_modules/', '.venv/'])
+        list(matcher.walk_files())
+        assert 'src' in listed
+        assert 'node_modules' not in listed
+        assert '.venv' not in listed
+
+    def test_watcher_snapshot_excludes_ignored_trees(self, tree):
+        from x_ipe.services.file_service import FileWatcherHandler
+        handler = FileWatcherHandler(
+            lambda event: None,
+            ignore_patterns=['node_modules/', '.venv/'],
+            project_root=str(tree),
+        )
+        known = {Path(p).relative_to(tree).as_posix() for p in handler._known_files}
+        assert known == {'src/app.py', 'build.log'}
+
+    def test_watcher_without_patterns_reads_root_gitignore(self, tree):
+        from x_ipe.services.file_service import FileWatcherHandler
+        (tree / '.gitignore').write_text('*.log\n')
+        for patterns in (None, []):
+            handler = FileWatcherHandler(lambda event: None, ignore_patterns=patterns,
+                                         project_root=str(tree))
+            assert handler._should_ignore(str(tree / 'build.log'))
+            assert not handler._should_ignore(str(tree / 'src' / 'app.py'))
@@ -253,6 +253,26 @@ class TestIdeasServiceUpload:
         file_path = temp_ideas_dir / result['folder_name'] / 'image.png'
         assert file_path.read_bytes() == binary_content
 
+    def test_upload_streams_file_objects(self, ideas_service, temp_ideas_dir):
+        """upload() copies file-like content to disk without leaving temp files"""
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        files = [('large.bin', BytesIO(content))]
+
+        result = ideas_service.upload(files)
+
+        folder = temp_ideas_dir / result['folder_name']
+        assert (folder / 'large.bin').read_bytes() == content
+        assert not list(folder.glob('*.tmp'))
+
+    def test_uploaded_files_respect_umask(self, ideas_service, temp_ideas_dir):
+        """Uploaded files get the umask-derived mode, not mkstemp's 0600"""
+        result = ideas_service.upload([('notes.md', b'# notes')])
+
+        mode = (temp_ideas_dir / result['folder_name'] / 'notes.md').stat().st_mode & 0o777
+        reference = temp_ideas_dir / 'reference.txt'
+        reference.write_bytes(b'x')
+        assert mode == reference.stat().st_mode & 0o777
+
 
 # ============================================================================
 # IdeasService Unit Tests - upload() with target_folder (CR-002)
@@ -262,6 +262,86 @@ class TestTreeCacheTTL:
         assert 'intake-result.md' in names
 
 
+class TestIncrementalCache:
+    """Writes patch the cached tree in place instead of rebuilding it."""
+
+    @staticmethod
+    def _fresh_tree(kb_service):
+        from x_ipe.services.kb_service import KBService
+        return [n.to_dict() for n in KBService(str(kb_service.project_root)).get_tree()]
+
+    @staticmethod
+    def _track_builds(kb_service, monkeypatch):
+        calls = []
+        original = kb_service._build_tree
+
+        def tracking(dir_path, rel_base):
+            calls.append(rel_base)
+            return original(dir_path, rel_base)
+
+        monkeypatch.setattr(kb_service, '_build_tree', tracking)
+        return calls
+
+    def test_file_crud_patches_tree(self, kb_service, monkeypatch):
+        kb_service.create_folder('docs')
+        kb_service.get_tree()
+        calls = self._track_builds(kb_service, monkeypatch)
+
+        kb_service.create_file('docs/b.md', 'B', {'title': 'B'})
+        kb_service.create_file('docs/A.md', 'A', {'title': 'A'})
+        kb_service.create_file('new/deep/c.md', 'C')
+        kb_service.update_file('docs/b.md', frontmatter={'title': 'B2'})
+        kb_service.move_file('docs/A.md', 'new/A.md')
+        kb_service.delete_file('new/deep/c.md')
+
+        tree = [n.to_dict() for n in kb_service.get_tree()]
+        assert calls == []
+        assert tree == self._fresh_tree(kb_service)
+        assert kb_service.search(query='B2')[0].path == 'docs/b.md'
+
+    def test_folder_rename_reloads_only_subtree(self, kb_service, monkeypatch):
+        kb_service.create_file('one/x.md', 'X')
+        kb_service.create_file('two/y.md', 'Y')
+        kb_service.get_tree()
+        calls = self._track_builds(kb_service, monkeypatch)
+
+        kb_service.rename_folder('one', 'uno')
+        kb_service.move_folder('two', 'uno')
+
+        assert calls == ['uno', 'uno/two']
+        assert [n.to_dict() for n in kb_service.get_tree()] == self._fresh_tree(kb_service)
+        assert 'one/x.md' not in kb_service._frontmatter_index
+        assert 'uno/two/y.md' in kb_service._frontmatter_index
+
+    def test_folder_delete_drops_subtree(self, kb_service):
+        kb_service.create_file('gone/sub/z.md', 'Z')
+        kb_service.get_tree()
+        kb_service.delete_folder('gone')
+        assert kb_service.get_tree() == []
+        assert kb_service._frontmatter_index == {}
+
+    def test_revalidation_reloads_changed_folder_only(self, kb_service, monkeypatch):
+        kb_service.create_file('a/one.md', '1')
+        kb_service.create_file('b/two.md', '2')
+        kb_service.get_tree()
+        calls = self._track_builds(kb_service, monkeypatch)
+
+        _create_md_file(kb_service.kb_root, 'b/three.md', body='3')
+        kb_service._cache_built_at = 0
+        tree = kb_service.get_tree()
+
+        assert calls == ['b']
+        assert [n.name for n in tree[1].children] == ['three.md', 'two.md']
+
+    def test_full_rescan_after_interval(self, kb_service, monkeypatch):
+        kb_service.get_tree()
+        calls = self._track_builds(kb_service, monkeypatch)
+        kb_service._cache_built_at = 0
+        kb_service._full_scan_at = 0
+        kb_service.get_tree()
+        assert calls == ['']
+
+
 # ===========================================================================
 # AC-049-A-03: Folder CRUD Operations
 # ===========================================================================
@@ -641,6 +721,86 @@ class TestSearchAPI:
         assert len(data['results']) == 1
 
 
+class TestFullTextSearch:
+    """Full-text search through the on-disk FTS index."""
+
+    def test_search_matches_body_with_snippet(self, kb_service):
+        kb_service.create_file('notes.md', 'Deploy with the blue-green strategy.',
+                               {'title': 'Release Notes'})
+        results = kb_service.search(query='strategy')
+        assert [r.name for r in results] == ['notes.md']
+        assert '<mark>strategy</mark>' in results[0].snippet
+
+    def test_title_match_ranks_above_body_match(self, kb_service):
+        kb_service.create_file('body.md', 'Mentions caching once.', {'title': 'Other'})
+        kb_service.create_file('title.md', 'Nothing here.', {'title': 'Caching Guide'})
+        results = kb_service.search(query='caching')
+        assert [r.name for r in results] == ['title.md', 'body.md']
+
+    def test_snippet_is_html_escaped(self, kb_service):
+        kb_service.create_file('x.md', '<script>alert(1)</script> needle', {'title': 'X'})
+        snippet = kb_service.search(query='needle')[0].snippet
+        assert '<script>' not in snippet
+        assert '&lt;script&gt;' in snippet
+
+    def test_pagination(self, kb_service):
+        for i in range(5):
+            kb_service.create_file(f'doc{i}.md', 'shared term', {'title': f'Doc {i}'})
+        first = kb_service.search(query='shared', limit=2)
+        rest = kb_service.search(query='shared', limit=10, offset=2)
+        assert len(first) == 2
+        assert len(rest) == 3
+        assert not {r.path for r in first} & {r.path for r in rest}
+
+    def test_crud_updates_index_incrementally(self, kb_service):
+        kb_service.create_file('a.md', 'alpha content', {'title': 'A'})
+        kb_service.create_folder('sub')
+        kb_service.search(query='alpha')
+
+        kb_service.update_file('a.md', content='bravo content')
+        kb_service.move_file('a.md', 'sub/a.md')
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(type(kb_service), '_search_fields',
+                       lambda *a: pytest.fail('unchanged file re-read'))
+            assert kb_service.search(query='alpha') == []
+            assert [r.path for r in kb_service.search(query='bravo')] == ['sub/a.md']
+
+        kb_service.rename_folder('sub', 'moved')
+        assert [r.path for r in kb_service.search(query='bravo')] == ['moved/a.md']
+        kb_service.delete_file('moved/a.md')
+        assert kb_service.search(query='bravo') == []
+
+    def test_external_edits_are_picked_up(self, kb_service):
+        target = _create_md_file(kb_service.kb_root, 'ext.md', body='original words')
+        kb_service._invalidate_cache()
+        assert len(kb_service.search(query='original')) == 1
+
+        target.write_text('replacement words longer text', encoding='utf-8')
+        kb_service._invalidate_cache()
+        assert kb_service.search(query='original') == []
+        assert len(kb_service.search(query='replacement')) == 1
+
+    def test_fallback_without_fts(self, kb_service):
+        kb_service._search_index = None
+        _create_md_file(kb_service.kb_root, 'plain.md', frontmatter={'title': 'Fallback Title'})
+        kb_service._invalidate_cache()
+        assert len(kb_service.search(query='back tit')) == 1  # substring match
+        assert kb_service.search(query='missing') == []
+
+    def test_search_route_paging(self, client, app):
+        svc = app.config['KB_SERVICE']
+        svc.ensure_kb_root()
+        for i in range(3):
+            svc.create_file(f'p{i}.md', 'paged body', {'title': f'P{i}'})
+        data = client.get('/api/kb/search?q=paged&limit=2').get_json()
+        assert len(data['results']) == 2
+        assert data['has_more'] is True
+        data = client.get('/api/kb/search?q=paged&limit=2&offset=2').get_json()
+        assert len(data['results']) == 1
+        assert data['has_more'] is False
+        assert client.get('/api/kb/search?q=paged&limit=0').status_code == 400
+
+
 # ===========================================================================
 # AC-049-A-10: URL Bookmark Format
 # ===========================================================================
@@ -818,6 +978,91 @@ class TestZipExtraction:
         assert (kb_service.kb_root / 'a' / 'b' / 'c' / 'deep.md').is_file()
 
 
+class TestBulkArchiveIngest:
+    """Archive uploads are ingested in bulk: one index write per folder."""
+
+    @staticmethod
+    def _zip(files):
+        import zipfile
+        import io
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            for name, data in files.items():
+                zf.writestr(name, data)
+        buf.seek(0)
+        return buf
+
+    def test_one_index_write_per_folder(self, kb_service, monkeypatch):
+        files = {f'{folder}/doc{i}.md': f'body {i}' for folder in ('a', 'b') for i in range(10)}
+        writes = []
+        original = kb_service._write_json
+        monkeypatch.setattr(kb_service, '_write_json',
+                            lambda target, data: (writes.append(target.parent.name), original(target, data)))
+
+        results = kb_service.extract_zip(self._zip(files))
+
+        assert len(results) == 20
+        assert sorted(writes) == ['a', 'b']
+        assert len(kb_service._read_kb_index(kb_service.kb_root / 'a')['entries']) == 10
+
+    def test_progress_and_visibility(self, kb_service):
+        kb_service.get_tree()
+        calls = []
+        kb_service.extract_zip(self._zip({'x/one.md': 'alpha', 'x/two.md': 'beta'}), 'dest',
+                               progress=lambda done, total: calls.append((done, total)))
+
+        assert calls[-1] == (2, 2)
+        tree = kb_service.get_tree()
+        assert tree[0].path == 'dest'
+        assert [r.path for r in kb_service.search(query='beta')] == ['dest/x/two.md']
+
+    def test_skips_existing_oversized_and_unsafe_entries(self, kb_service, monkeypatch):
+        import x_ipe.services.kb_service as kb_module
+        kb_service.create_file('exists.md', 'original')
+        monkeypatch.setattr(kb_module, 'MAX_FILE_SIZE_BYTES', 20)
+
+        results = kb_service.extract_zip(self._zip({
+            'exists.md': 'replaced',
+            'big.md': 'x' * 50,
+            '../escape.md': 'nope',
+            'ok.md': 'fine',
+        }))
+
+        assert [r['path'] for r in results] == ['ok.md']
+        assert (kb_service.kb_root / 'exists.md').read_text() == 'original'
+        assert not (kb_service.kb_root / 'big.md').exists()
+
+    def test_url_bookmarks_without_metadata_are_skipped(self, kb_service):
+        results = kb_service.extract_zip(self._zip({
+            'links/site.url.md': '# Site',
+            'links/notes.md': 'notes',
+        }))
+
+        assert [r['path'] for r in results] == ['links/notes.md']
+        assert not (kb_service.kb_root / 'links' / 'site.url.md').exists()
+
+    def test_upload_route_emits_progress(self, client, app, monkeypatch):
+        import x_ipe.routes.kb_routes as kb_routes
+        events = []
+
+        class FakeSocketIO:
+            def emit(self, event, data, **kwargs):
+                events.append((event, data))
+
+        monkeypatch.setattr(kb_routes, 'UPLOAD_PROGRESS_MIN_FILES', 1)
+        monkeypatch.setitem(app.extensions, 'socketio', FakeSocketIO())
+        app.config['KB_SERVICE'].ensure_kb_root()
+        resp = client.post('/api/kb/upload', data={
+            'files': (self._zip({'a.md': 'A', 'b.md': 'B'}), 'bundle.zip'),
+            'upload_id': 'u-1',
+        }, content_type='multipart/form-data')
+
+        assert resp.status_code == 201
+        assert resp.get_json()['total'] == 2
+        assert events[-1] == ('kb_upload_progress',
+                              {'upload_id': 'u-1', 'file': 'bundle.zip', 'done': 2, 'total': 2})
+
+
 class TestSevenZipExtraction:
     """AC-049-E-08: .7z archive auto-extraction into KB."""
 
@@ -831,6 +1076,19 @@ class TestSevenZipExtraction:
         assert len(results) >= 1
         assert (kb_service.kb_root / 'readme.md').is_file()
 
+    def test_extract_7z_stages_outside_kb(self, kb_service):
+        py7zr = pytest.importorskip('py7zr')
+        import io
+        import os
+        kb_service.create_folder('dest')
+        root_mtime = os.stat(kb_service.kb_root).st_mtime_ns
+        buf = io.BytesIO()
+        with py7zr.SevenZipFile(buf, 'w') as z:
+            z.writestr(b'# Doc', 'doc.md')
+        kb_service.extract_7z(buf.getvalue(), dest_folder='dest')
+        assert (kb_service.kb_root / 'dest' / 'doc.md').is_file()
+        assert os.stat(kb_service.kb_root).st_mtime_ns == root_mtime
+
     def test_extract_7z_missing_library_raises(self, kb_service, monkeypatch):
         import builtins
         real_import = builtins.__import__
@@ -1504,6 +1762,18 @@ class TestKBIndexRoutes:
         entry = svc._get_index_entry(svc.kb_root, 'guides/')
         assert entry['title'] == 'Guides'
 
+    def test_query_index(self, client, app):
+        svc = app.config['KB_SERVICE']
+        svc.ensure_kb_root()
+        svc.create_file('guides/setup.md', 'Setup', {'author': 'ann', 'tags': {'domain': ['ops']}})
+        svc.create_file('notes.md', 'Notes', {'author': 'bob'})
+        resp = client.get('/api/kb/index/query?tag=ops&tag_type=domain')
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data['total'] == 1
+        assert data['entries'][0]['path'] == 'guides/setup.md'
+        assert data['entries'][0]['entry']['author'] == 'ann'
+
 class TestKBIndex:
     """CR-002: .kb-index.json per-folder metadata registry."""
 
@@ -1610,6 +1880,21 @@ class TestKBIndex:
         assert entry['type'] == 'image'
         assert result['frontmatter']['title'] == 'Photo'
 
+    def test_create_binary_file_streams_file_object(self, kb_service):
+        from io import BytesIO
+        data = os.urandom(2 * 1024 * 1024 + 5)
+        kb_service.create_binary_file('big.pdf', BytesIO(data))
+        assert (kb_service.kb_root / 'big.pdf').read_bytes() == data
+        assert not list(kb_service.kb_root.glob('*.tmp'))
+
+    def test_create_binary_file_stream_rejects_oversize(self, kb_service):
+        from io import BytesIO
+        from x_ipe.services.kb_service import MAX_FILE_SIZE_BYTES
+        with pytest.raises(ValueError):
+            kb_service.create_binary_file('huge.pdf', BytesIO(b'\0' * (MAX_FILE_SIZE_BYTES + 1)))
+        assert not (kb_service.kb_root / 'huge.pdf').exists()
+        assert not list(kb_service.kb_root.glob('*.tmp'))
+
     def test_delete_file_removes_index_entry(self, kb_service):
         kb_service.create_file('doomed.md', 'Gone')
         assert kb_service._get_index_entry(kb_service.kb_root, 'doomed.md') is not None
@@ -1673,6 +1958,76 @@ class TestKBIndex:
         assert sub_entry is not None
 
 
+class TestKBMetadataStore:
+    """Consolidated metadata store backing the per-folder .kb-index.json files."""
+
+    def test_lookups_do_not_parse_json(self, kb_service, monkeypatch):
+        kb_service.create_file('docs/a.md', 'A', {'title': 'Alpha'})
+        monkeypatch.setattr(kb_service, '_load_kb_index_file',
+                            lambda folder: pytest.fail('index JSON parsed'))
+        assert kb_service._get_index_entry(kb_service.kb_root / 'docs', 'a.md')['title'] == 'Alpha'
+        assert kb_service.get_file('docs/a.md')['frontmatter']['title'] == 'Alpha'
+
+    def test_json_stays_export_format(self, kb_service):
+        kb_service.create_file('docs/a.md', 'A', {'title': 'Alpha'})
+        data = json.loads((kb_service.kb_root / 'docs' / '.kb-index.json').read_text(encoding='utf-8'))
+        assert data['entries']['a.md']['title'] == 'Alpha'
+
+    def test_external_json_edit_is_imported(self, kb_service):
+        kb_service.create_file('a.md', 'A', {'title': 'Alpha'})
+        index_path = kb_service.kb_root / '.kb-index.json'
+        data = json.loads(index_path.read_text(encoding='utf-8'))
+        data['entries']['a.md']['title'] = 'Edited outside'
+        index_path.write_text(json.dumps(data), encoding='utf-8')
+        os.utime(index_path, ns=(1, 1))
+        assert kb_service._get_index_entry(kb_service.kb_root, 'a.md')['title'] == 'Edited outside'
+
+    def test_survives_deleted_database(self, kb_service):
+        kb_service.create_file('a.md', 'A', {'title': 'Alpha'})
+        (kb_service.kb_root / '.kb-meta.db').unlink()
+        assert kb_service._get_index_entry(kb_service.kb_root, 'a.md')['title'] == 'Alpha'
+
+    def test_query_by_tag_type_and_author(self, kb_service):
+        kb_service.create_file('a.md', 'A', {'tags': {'domain': ['api']}, 'author': 'ann'})
+        kb_service.create_file('sub/b.md', 'B', {'tags': {'lifecycle': ['api']}, 'author': 'bob'})
+        kb_service.create_binary_file('sub/c.png', b'\x89PNG', {'author': 'ann'})
+
+        assert [e['path'] for e in kb_service.query_index(tag='api')] == ['a.md', 'sub/b.md']
+        assert [e['path'] for e in kb_service.query_index(tag='api', tag_type='lifecycle')] == ['sub/b.md']
+        assert [e['path'] for e in kb_service.query_index(author='ann')] == ['a.md', 'sub/c.png']
+        assert [e['path'] for e in kb_service.query_index(entry_type='image')] == ['sub/c.png']
+
+    def test_query_forgets_deleted_folders(self, kb_service):
+        kb_service.create_file('old/a.md', 'A', {'author': 'ann'})
+        kb_service.rename_folder('old', 'new')
+        assert [e['path'] for e in kb_service.query_index(author='ann')] == ['new/a.md']
+        kb_service.delete_folder('new')
+        assert kb_service.query_index(author='ann') == []
+
+    def test_list_files_recursive_uses_cache(self, kb_service, monkeypatch):
+        kb_service.create_file('a.md', 'A')
+        kb_service.create_file('sub/deep/b.md', 'B', {'title': 'Bee'})
+        kb_service.get_tree()
+        monkeypatch.setattr(Path, 'rglob', lambda *a: pytest.fail('directory walked'))
+        files = {f.path: f for f in kb_service.list_files(recursive=True)}
+        assert set(files) == {'a.md', 'sub/deep/b.md'}
+        assert files['sub/deep/b.md'].frontmatter.title == 'Bee'
+        assert [f.path for f in kb_service.list_files(folder='sub')] == []
+
+    def test_list_files_includes_hidden_folders(self, kb_service):
+        kb_service.create_file('a.md', 'A')
+        intake = kb_service.kb_root / '.intake' / 'batch'
+        intake.mkdir(parents=True)
+        (intake / 'raw.md').write_text('raw')
+        kb_service.get_tree()
+
+        assert [f.path for f in kb_service.list_files(folder='.intake', recursive=True)] == [
+            '.intake/batch/raw.md']
+        assert [f.path for f in kb_service.list_files(folder='.intake/batch')] == ['.intake/batch/raw.md']
+        assert {f.path for f in kb_service.list_files(recursive=True)} == {'a.md', '.intake/batch/raw.md'}
+        assert [f.path for f in kb_service.list_files()] == ['a.md']
+
+
 class TestKBIndexMigration:
     """CR-002: Migration from frontmatter to .kb-index.json."""
 
@@ -0,0 +1,185 @@
+"""
+Tests for ID allocation and chunk rollover in the knowledge stores.
+
+Instance and relation IDs come from the chunk index (_index.json) and memory
+entry sequences from .sequences.json, instead of scanning the whole store.
+"""
+import json
+import os
+import sys
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+_SKILLS_DIR = Path(__file__).resolve().parent.parent / ".github" / "skills"
+for _skill in ("x-ipe-knowledge-ontology-builder", "x-ipe-knowledge-ontology-synthesizer",
+               "x-ipe-knowledge-keeper-memory"):
+    sys.path.insert(0, str(_SKILLS_DIR / _skill / "scripts"))
+
+import memory_ops  # noqa: E402
+import ontology_ops  # noqa: E402
+import synthesis_ops  # noqa: E402
+
+
+def _create_instance(ontology_dir: Path, label: str) -> str:
+    ontology_ops.cmd_create_instance(Namespace(
+        ontology_dir=str(ontology_dir), label=label, class_id="concept",
+        source_files=None, properties=None,
+    ))
+    index = json.loads((ontology_dir / "instances" / "_index.json").read_text())
+    return index["latest_instance_id"]
+
+
+class TestInstanceIds:
+    @pytest.fixture
+    def ontology_dir(self, tmp_path):
+        return tmp_path / "ontology"
+
+    def test_sequential_ids(self, ontology_dir, capsys):
+        ids = [_create_instance(ontology_dir, f"Item {i}") for i in range(3)]
+        assert ids == ["inst-001", "inst-002", "inst-003"]
+        index = json.loads((ontology_dir / "instances" / "_index.json").read_text())
+        chunk = ontology_dir / "instances" / "instance.001.jsonl"
+        assert index["chunks"]["instance.001.jsonl"] == {
+            "instance_count": 3, "lines": 3, "bytes": chunk.stat().st_size,
+        }
+        assert index["next_instance_seq"] == 4
+
+    def test_allocation_does_not_rescan_chunks(self, ontology_dir, capsys, monkeypatch):
+        _create_instance(ontology_dir, "First")
+        scanned = []
+        original = ontology_ops._scan_chunk
+        monkeypatch.setattr(ontology_ops, "_scan_chunk",
+                            lambda path, offset=0: scanned.append(offset) or original(path, offset))
+        assert _create_instance(ontology_dir, "Second") == "inst-002"
+        assert scanned == []
+
+    def test_records_appended_by_other_writers_are_folded_in(self, ontology_dir, capsys):
+        _create_instance(ontology_dir, "First")
+        chunk = ontology_dir / "instances" / "instance.001.jsonl"
+        with open(chunk, "a") as f:
+            f.write(json.dumps({"op": "update", "id": "inst-001", "props": {}}) + "\n")
+            f.write(json.dumps({"op": "create", "id": "inst-007", "props": {}}) + "\n")
+        assert _create_instance(ontology_dir, "Second") == "inst-008"
+        index = json.loads((ontology_dir / "instances" / "_index.json").read_text())
+        assert index["chunks"]["instance.001.jsonl"]["lines"] == 4
+
+    def test_missing_or_legacy_index_falls_back_to_scan(self, ontology_dir, capsys):
+        _create_instance(ontology_dir, "First")
+        _create_instance(ontology_dir, "Second")
+        index_path = ontology_dir / "instances" / "_index.json"
+        index_path.write_text(json.dumps({"latest_instance_id": "inst-002"}))
+        assert _create_instance(ontology_dir, "Third") == "inst-003"
+        index_path.unlink()
+        assert _create_instance(ontology_dir, "Fourth") == "inst-004"
+
+    def test_chunk_rollover(self, ontology_dir, capsys, monkeypatch):
+        monkeypatch.setattr(ontology_ops, "CHUNK_LINE_LIMIT", 2)
+        for i in range(5):
+            _create_instance(ontology_dir, f"Item {i}")
+        instances_dir = ontology_dir / "instances"
+        assert sorted(p.name for p in instances_dir.glob("instance.*.jsonl")) == [
+            "instance.001.jsonl", "instance.002.jsonl", "instance.003.jsonl",
+        ]
+        index = json.loads((instances_dir / "_index.json").read_text())
+        assert index["current_chunk"] == 3
+        assert index["chunks"]["instance.003.jsonl"]["lines"] == 1
+
+    def test_unknown_newer_chunk_triggers_rescan(self, ontology_dir, capsys):
+        _create_instance(ontology_dir, "First")
+        newer = ontology_dir / "instances" / "instance.002.jsonl"
+        newer.write_text(json.dumps({"op": "create", "id": "inst-020", "props": {}}) + "\n")
+        assert _create_instance(ontology_dir, "Second") == "inst-021"
+        assert len(newer.read_text().splitlines()) == 2
+
+
+class TestRelationIds:
+    @pytest.fixture
+    def relations_dir(self, tmp_path):
+        path = tmp_path / "relations"
+        path.mkdir()
+        return path
+
+    def _append(self, relations_dir, count):
+        index = synthesis_ops._load_relation_index(relations_dir)
+        ids = []
+        for _ in range(count):
+            chunk_num = synthesis_ops._resolve_relation_chunk(index)
+            rel_id = synthesis_ops._next_relation_id(index)
+            synthesis_ops._append_jsonl(
+                relations_dir / synthesis_ops._relation_chunk_name(chunk_num),
+                {"op": "create", "type": "Relation", "id": rel_id, "props": {}},
+            )
+            synthesis_ops._record_relation(relations_dir, index, rel_id, chunk_num)
+            ids.append(rel_id)
+        synthesis_ops._save_relation_index(relations_dir, index)
+        return ids
+
+    def test_ids_continue_across_batches(self, relations_dir):
+        assert self._append(relations_dir, 2) == ["rel-001", "rel-002"]
+        assert self._append(relations_dir, 1) == ["rel-003"]
+
+    def test_allocation_does_not_rescan_chunks(self, relations_dir, monkeypatch):
+        self._append(relations_dir, 1)
+        monkeypatch.setattr(synthesis_ops, "_scan_relation_chunk",
+                            lambda path, offset=0: pytest.fail("relation chunk was scanned"))
+        assert self._append(relations_dir, 1) == ["rel-002"]
+
+    def test_rollover_and_rescan(self, relations_dir, monkeypatch):
+        monkeypatch.setattr(synthesis_ops, "CHUNK_LINE_LIMIT", 2)
+        self._append(relations_dir, 3)
+        assert sorted(p.name for p in relations_dir.glob("_relations.*.jsonl")) == [
+            "_relations.001.jsonl", "_relations.002.jsonl",
+        ]
+        (relations_dir / "_index.json").unlink()
+        assert self._append(relations_dir, 2) == ["rel-004", "rel-005"]
+        assert (relations_dir / "_relations.003.jsonl").exists()
+
+    def test_existing_store_without_index(self, relations_dir):
+        chunk = relations_dir / "_relations.001.jsonl"
+        chunk.write_text("".join(
+            json.dumps({"op": "create", "id": f"rel-{n:03d}", "props": {}}) + "\n" for n in (1, 9)
+        ))
+        assert self._append(relations_dir, 1) == ["rel-010"]
+
+
+class TestMemorySequence:
+    @pytest.fixture
+    def memory_dir(self, tmp_path):
+        path = tmp_path / "memory"
+        memory_ops._ensure_dirs(path)
+        return path
+
+    def _create(self, memory_dir, memory_type, title, capsys):
+        memory_ops.cmd_create(Namespace(
+            memory_dir=str(memory_dir), type=memory_type, title=title, content="body",
+            content_file=None, tags=None, metadata=None,
+        ))
+        return json.loads(capsys.readouterr().out)["memory_entry_id"]
+
+    def test_sequence_per_tier(self, memory_dir, capsys):
+        today = memory_ops._today()
+        assert self._create(memory_dir, "episodic", "One", capsys) == f"epi-{today}-001"
+        assert self._create(memory_dir, "episodic", "Two", capsys) == f"epi-{today}-002"
+        assert self._create(memory_dir, "semantic", "One", capsys) == f"sem-{today}-001"
+
+    def test_counter_avoids_frontmatter_scan(self, memory_dir, capsys, monkeypatch):
+        self._create(memory_dir, "episodic", "One", capsys)
+        monkeypatch.setattr(memory_ops, "_read_frontmatter",
+                            lambda path: pytest.fail("entry frontmatter was scanned"))
+        assert self._create(memory_dir, "episodic", "Two", capsys).endswith("-002")
+
+    def test_new_date_restarts_sequence(self, memory_dir, capsys):
+        (memory_dir / memory_ops.SEQUENCE_FILE).write_text(
+            json.dumps({"episodic": {"date": "20000101", "last": 41}}))
+        assert self._create(memory_dir, "episodic", "One", capsys).endswith("-001")
+
+    def test_tier_without_counter_is_scanned(self, memory_dir, capsys):
+        self._create(memory_dir, "semantic", "One", capsys)
+        self._create(memory_dir, "semantic", "Two", capsys)
+        (memory_dir / memory_ops.SEQUENCE_FILE).write_text(
+            json.dumps({"episodic": {"date": memory_ops._today(), "last": 5}}))
+        assert self._create(memory_dir, "semantic", "Three", capsys).endswith("-003")
+        assert not list(memory_dir.glob("*.tmp"))
+        assert os.path.exists(memory_dir / memory_ops.SEQUENCE_LOCK_FILE)
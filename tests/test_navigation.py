@@ -427,3 +427,425 @@ class TestProjectServiceTracing:
             assert '_scan_directory' in func_names
         finally:
             TraceContext.end_trace()
+
+
+class TestProjectStructureCache:
+    """Tests for the watcher-fed ProjectStructureCache (FEATURE-001)"""
+
+    @pytest.fixture
+    def cache(self, temp_project):
+        from x_ipe.services import ProjectStructureCache
+        src_dir = temp_project / 'src'
+        (src_dir / 'pkg').mkdir(parents=True)
+        (src_dir / 'main.py').write_text('# Main')
+        (src_dir / 'pkg' / 'util.py').write_text('# Util')
+        return ProjectStructureCache(str(temp_project))
+
+    def _code_section(self, structure):
+        return next(s for s in structure['sections'] if s['id'] == 'code')
+
+    def test_initial_structure_matches_full_scan(self, cache, temp_project):
+        from x_ipe.services import ProjectService
+        assert cache.get_structure() == ProjectService(str(temp_project)).get_structure()
+
+    def test_structure_is_served_from_memory(self, cache):
+        first = cache.get_structure()
+        assert cache.get_structure() is first
+
+    def test_created_event_inserts_sorted_node(self, cache, temp_project):
+        cache.get_structure()
+        generation = cache.generation
+        new_file = temp_project / 'src' / 'app.py'
+        new_file.write_text('# App')
+
+        assert cache.apply_event('created', str(new_file)) is True
+        assert cache.generation == generation + 1
+
+        from x_ipe.services import ProjectService
+        assert cache.get_structure() == ProjectService(str(temp_project)).get_structure()
+
+    def test_created_event_in_new_folder_adds_folders(self, cache, temp_project):
+        cache.get_structure()
+        nested = temp_project / 'src' / 'new' / 'deep'
+        nested.mkdir(parents=True)
+        (nested / 'mod.py').write_text('# Mod')
+
+        cache.apply_event('created', str(nested / 'mod.py'))
+
+        from x_ipe.services import ProjectService
+        assert cache.get_structure() == ProjectService(str(temp_project)).get_structure()
+
+    def test_modified_event_updates_mtime(self, cache, temp_project):
+        cache.get_structure()
+        target = temp_project / 'src' / 'main.py'
+        os.utime(target, (1_000_000, 1_000_000))
+
+        assert cache.apply_event('modified', str(target)) is True
+        code = self._code_section(cache.get_structure())
+        main = next(c for c in code['children'] if c['name'] == 'main.py')
+        assert main['mtime'] == 1_000_000
+
+    def test_unchanged_mtime_keeps_generation(self, cache, temp_project):
+        cache.get_structure()
+        etag = cache.etag
+        assert cache.apply_event('modified', str(temp_project / 'src' / 'main.py')) is False
+        assert cache.etag == etag
+
+    def test_deleted_event_prunes_vanished_folder(self, cache, temp_project):
+        cache.get_structure()
+        shutil.rmtree(temp_project / 'src' / 'pkg')
+
+        assert cache.apply_event('deleted', str(temp_project / 'src' / 'pkg' / 'util.py')) is True
+        code = self._code_section(cache.get_structure())
+        assert [c['name'] for c in code['children']] == ['main.py']
+
+    def test_hidden_and_outside_paths_are_ignored(self, cache, temp_project):
+        cache.get_structure()
+        hidden = temp_project / 'src' / '.env.json'
+        hidden.write_text('{}')
+        assert cache.apply_event('created', str(hidden)) is False
+        assert cache.apply_event('created', str(temp_project / 'README.md')) is False
+
+    def test_section_created_after_build_is_scanned(self, cache, temp_project):
+        cache.get_structure()
+        planning = temp_project / 'x-ipe-docs' / 'planning'
+        planning.mkdir(parents=True)
+        (planning / 'task-board.md').write_text('# Tasks')
+
+        cache.apply_event('created', str(planning / 'task-board.md'))
+        section = next(s for s in cache.get_structure()['sections'] if s['id'] == 'planning')
+        assert section['exists'] is True
+        assert section['children'][0]['name'] == 'task-board.md'
+
+    def test_api_returns_etag_and_304(self, app, client, temp_project):
+        from x_ipe.services import ProjectStructureCache
+        from unittest.mock import MagicMock
+        app.config['PROJECT_STRUCTURE_CACHE'] = ProjectStructureCache(str(temp_project))
+        app.config['FILE_WATCHER'] = MagicMock(is_running=True)
+
+        response = client.get('/api/project/structure')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert etag
+
+        cached = client.get('/api/project/structure', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+
+        src_dir = temp_project / 'src'
+        src_dir.mkdir()
+        (src_dir / 'main.py').write_text('# Main')
+        app.config['PROJECT_STRUCTURE_CACHE'].apply_event('created', str(src_dir / 'main.py'))
+
+        changed = client.get('/api/project/structure', headers={'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
+
+    def test_api_scans_when_watcher_stopped(self, app, client, cache, temp_project):
+        from unittest.mock import MagicMock
+        app.config['PROJECT_STRUCTURE_CACHE'] = cache
+        app.config['FILE_WATCHER'] = MagicMock(is_running=False)
+        cache.get_structure()
+        (temp_project / 'src' / 'late.py').write_text('x')
+
+        response = client.get('/api/project/structure')
+        assert 'ETag' not in response.headers
+        src = next(s for s in response.get_json()['sections'] if s['id'] == 'code')
+        assert 'late.py' in [c['name'] for c in src['children']]
+
+    def test_watcher_failure_stops_watcher_and_drops_cache(self, cache, temp_project, monkeypatch):
+        import x_ipe.services.file_service as file_service
+
+        def failing_watch(*paths, **kwargs):
+            raise OSError('OS file watch limit reached')
+
+        monkeypatch.setattr(file_service, 'watch', failing_watch)
+        cache.get_structure()
+        generation = cache.generation
+        watcher = file_service.FileWatcher(str(temp_project), structure_cache=cache)
+
+        with pytest.raises(RuntimeError, match='watch limit'):
+            watcher.start()
+        assert not watcher.is_running
+        assert cache.generation > generation
+
+    def test_watcher_does_not_register_ignored_directories(self, temp_project, monkeypatch):
+        import x_ipe.services.file_service as file_service
+        registered = []
+
+        def recording_watch(*paths, **kwargs):
+            registered.extend(paths)
+            return iter([])
+
+        (temp_project / '.gitignore').write_text('node_modules/\n')
+        (temp_project / 'node_modules' / 'lib').mkdir(parents=True)
+        (temp_project / 'src' / 'pkg').mkdir(parents=True, exist_ok=True)
+        monkeypatch.setattr(file_service, 'watch', recording_watch)
+        file_service.FileWatcher(str(temp_project))._watch_loop()
+
+        names = {Path(p).relative_to(temp_project.resolve()).as_posix() for p in registered}
+        assert {'.', 'src', 'src/pkg'} <= names
+        assert not any(name.startswith('node_modules') for name in names)
+
+    def test_watcher_handler_reports_removed_directory(self, temp_project):
+        from x_ipe.services.file_service import FileWatcherHandler
+        from watchfiles import Change
+
+        pkg = temp_project / 'pkg'
+        pkg.mkdir()
+        (pkg / 'a.py').write_text('a')
+        events = []
+        handler = FileWatcherHandler(events.append, debounce_seconds=0.01, project_root=str(temp_project))
+
+        shutil.rmtree(pkg)
+        handler.handle_changes({(Change.deleted, str(pkg))})
+        import time
+        time.sleep(0.05)
+
+        assert [(e['action'], e['path']) for e in events] == [('deleted', str(pkg))]
+
+
+class TestProjectStructureDeltas:
+    """Tests for sequenced structure deltas and resync (FEATURE-001)"""
+
+    @pytest.fixture
+    def cache(self, temp_project):
+        from x_ipe.services import ProjectStructureCache
+        (temp_project / 'src' / 'pkg').mkdir(parents=True)
+        (temp_project / 'src' / 'main.py').write_text('# Main')
+        (temp_project / 'src' / 'pkg' / 'util.py').write_text('# Util')
+        cache = ProjectStructureCache(str(temp_project))
+        cache.get_structure()
+        return cache
+
+    def test_batch_produces_single_sequenced_message(self, cache, temp_project):
+        seq = cache.generation
+        for name in ('a.py', 'b.py'):
+            (temp_project / 'src' / name).write_text(name)
+
+        message = cache.apply_events([
+            ('created', str(temp_project / 'src' / 'a.py')),
+            ('created', str(temp_project / 'src' / 'b.py')),
+        ])
+
+        assert message['base_seq'] == seq
+        assert message['seq'] == seq + 1
+        assert [(d['op'], d['path']) for d in message['deltas']] == [
+            ('add', 'src/a.py'), ('add', 'src/b.py')
+        ]
+        assert message['deltas'][0]['node']['type'] == 'file'
+
+    def test_no_change_produces_no_message(self, cache, temp_project):
+        assert cache.apply_events([('modified', str(temp_project / 'src' / 'main.py'))]) is None
+
+    def test_file_move_is_reported_as_rename(self, cache, temp_project):
+        old = temp_project / 'src' / 'main.py'
+        new = temp_project / 'src' / 'pkg' / 'main.py'
+        old.rename(new)
+
+        message = cache.apply_events([('deleted', str(old)), ('created', str(new))])
+
+        assert message['deltas'] == [{
+            'op': 'rename', 'from': 'src/main.py', 'to': 'src/pkg/main.py',
+            'node': {'name': 'main.py', 'type': 'file', 'path': 'src/pkg/main.py',
+                     'mtime': new.stat().st_mtime},
+        }]
+
+    def test_folder_rename_is_reported_as_rename(self, cache, temp_project):
+        old = temp_project / 'src' / 'pkg'
+        new = temp_project / 'src' / 'lib'
+        old.rename(new)
+
+        message = cache.apply_events([('deleted', str(old)), ('created', str(new / 'util.py'))])
+
+        assert [(d['op'], d.get('from'), d.get('to')) for d in message['deltas']] == [
+            ('rename', 'src/pkg', 'src/lib')
+        ]
+        assert message['deltas'][0]['node']['children'][0]['path'] == 'src/lib/util.py'
+
+    def test_mtime_delta(self, cache, temp_project):
+        target = temp_project / 'src' / 'main.py'
+        os.utime(target, (2_000_000, 2_000_000))
+
+        message = cache.apply_events([('modified', str(target))])
+        assert message['deltas'] == [{'op': 'mtime', 'path': 'src/main.py', 'mtime': 2_000_000}]
+
+    def test_deltas_since_returns_missed_messages(self, cache, temp_project):
+        seq = cache.generation
+        (temp_project / 'src' / 'a.py').write_text('a')
+        first = cache.apply_events([('created', str(temp_project / 'src' / 'a.py'))])
+        (temp_project / 'src' / 'b.py').write_text('b')
+        second = cache.apply_events([('created', str(temp_project / 'src' / 'b.py'))])
+
+        assert cache.deltas_since(seq) == [first, second]
+        assert cache.deltas_since(second['seq']) == []
+
+    def test_deltas_since_requires_resync_after_invalidate(self, cache):
+        seq = cache.generation
+        cache.invalidate()
+        cache.get_structure()
+        assert cache.deltas_since(seq) is None
+
+    def test_watcher_emits_structure_delta_per_batch(self, cache, temp_project):
+        from x_ipe.services import FileWatcher
+        from unittest.mock import MagicMock
+
+        socketio = MagicMock()
+        watcher = FileWatcher(str(temp_project), socketio=socketio, structure_cache=cache)
+        (temp_project / 'src' / 'a.py').write_text('a')
+        watcher._emit_events([
+            {'type': 'structure_changed', 'action': 'created', 'path': str(temp_project / 'src' / 'a.py')}
+        ])
+
+        emitted = [c[0][0] for c in socketio.emit.call_args_list]
+        assert emitted == ['structure_delta']
+        assert socketio.emit.call_args_list[0][0][1]['deltas'][0]['path'] == 'src/a.py'
+
+    def test_watcher_emits_per_file_events_without_delta(self, cache, temp_project):
+        from x_ipe.services import FileWatcher
+        from unittest.mock import MagicMock
+
+        socketio = MagicMock()
+        watcher = FileWatcher(str(temp_project), socketio=socketio, structure_cache=cache)
+        (temp_project / 'outside.txt').write_text('a')
+        watcher._emit_events([
+            {'type': 'structure_changed', 'action': 'created', 'path': str(temp_project / 'outside.txt')}
+        ])
+
+        emitted = [c[0][0] for c in socketio.emit.call_args_list]
+        assert emitted == ['structure_changed', 'content_changed']
+
+    def test_watcher_passes_absolute_paths_to_change_listeners(self, temp_project):
+        from x_ipe.services import FileWatcher
+        from unittest.mock import MagicMock
+
+        received = []
+        watcher = FileWatcher(str(temp_project), socketio=MagicMock(), change_listeners=[received.append])
+        path = str(temp_project / 'src' / 'a.py')
+        watcher._emit_events([{'type': 'structure_changed', 'action': 'created', 'path': path}])
+
+        assert received == [[path]]
+
+    def test_deltas_endpoint(self, app, client, cache, temp_project):
+        from unittest.mock import MagicMock
+        app.config['PROJECT_STRUCTURE_CACHE'] = cache
+        app.config['FILE_WATCHER'] = MagicMock(is_running=True)
+        response = client.get('/api/project/structure')
+        seq = int(response.headers['X-Structure-Seq'])
+
+        (temp_project / 'src' / 'a.py').write_text('a')
+        message = cache.apply_events([('created', str(temp_project / 'src' / 'a.py'))])
+
+        data = client.get(f'/api/project/structure/deltas?since={seq}').get_json()
+        assert data == {'seq': message['seq'], 'messages': [message]}
+
+        resync = client.get('/api/project/structure/deltas?since=-5').get_json()
+        assert resync['seq'] == cache.generation
+        assert 'structure' in resync
+
+    def test_lazy_structure_reports_sequence(self, app, client, cache):
+        from unittest.mock import MagicMock
+        app.config['PROJECT_STRUCTURE_CACHE'] = cache
+        app.config['FILE_WATCHER'] = MagicMock(is_running=True)
+        response = client.get('/api/project/structure?mode=lazy')
+        assert response.get_json()['mode'] == 'lazy'
+        assert int(response.headers['X-Structure-Seq']) == cache.generation
+
+    def test_deltas_endpoint_without_cache(self, client):
+        assert client.get('/api/project/structure/deltas?since=1').status_code == 404
+
+
+class TestLazyDirectoryListing:
+    """Tests for lazy, paginated directory listings (FEATURE-001)"""
+
+    @pytest.fixture
+    def big_project(self, temp_project):
+        src_dir = temp_project / 'src'
+        (src_dir / 'pkg' / 'sub').mkdir(parents=True)
+        (src_dir / 'pkg' / 'a.py').write_text('a')
+        (src_dir / 'pkg' / 'image.png').write_bytes(b'png')
+        (src_dir / '.hidden').mkdir()
+        for i in range(5):
+            (src_dir / f'file{i}.py').write_text(str(i))
+        return temp_project
+
+    @pytest.fixture(params=['service', 'cache'])
+    def source(self, request, big_project):
+        from x_ipe.services import ProjectService, ProjectStructureCache
+        if request.param == 'service':
+            return ProjectService(str(big_project))
+        return ProjectStructureCache(str(big_project))
+
+    def test_lists_one_level_with_child_counts(self, source):
+        listing = source.list_directory('src')
+
+        assert listing['path'] == 'src'
+        assert listing['child_count'] == 6
+        assert listing['next_cursor'] is None
+        pkg = listing['children'][0]
+        assert pkg['name'] == 'pkg'
+        assert pkg['child_count'] == 2  # sub/ and a.py; image.png is unsupported
+        assert 'children' not in pkg
+
+    def test_cursor_pagination_covers_every_entry_once(self, source):
+        names = []
+        cursor = None
+        while True:
+            page = source.list_directory('src', cursor=cursor, limit=2)
+            names.extend(c['name'] for c in page['children'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        assert names == ['pkg', 'file0.py', 'file1.py', 'file2.py', 'file3.py', 'file4.py']
+
+    def test_cursor_survives_inserted_entries(self, big_project):
+        from x_ipe.services import ProjectService
+        service = ProjectService(str(big_project))
+        first = service.list_directory('src', limit=3)
+        (big_project / 'src' / 'file00.py').write_text('new')
+        second = service.list_directory('src', cursor=first['next_cursor'], limit=10)
+        assert [c['name'] for c in second['children']] == ['file2.py', 'file3.py', 'file4.py']
+
+    def test_paths_outside_sections_are_rejected(self, source):
+        for path in ('../etc', 'src/../..', 'src/.hidden', 'x-ipe-docs'):
+            with pytest.raises(PermissionError):
+                source.list_directory(path)
+
+    def test_missing_directory_raises(self, source):
+        with pytest.raises(FileNotFoundError):
+            source.list_directory('src/nope')
+
+    def test_bad_cursor_raises_value_error(self, source):
+        with pytest.raises(ValueError):
+            source.list_directory('src', cursor='not-a-cursor')
+
+    def test_lazy_structure_returns_first_level_only(self, source):
+        structure = source.get_lazy_structure(limit=2)
+        assert structure['mode'] == 'lazy'
+        code = next(s for s in structure['sections'] if s['id'] == 'code')
+        assert code['child_count'] == 6
+        assert len(code['children']) == 2
+        assert code['next_cursor']
+        planning = next(s for s in structure['sections'] if s['id'] == 'planning')
+        assert planning['exists'] is False
+
+    def test_directory_api(self, client, big_project):
+        response = client.get('/api/project/directory?path=src/pkg')
+        assert response.status_code == 200
+        assert [c['name'] for c in response.get_json()['children']] == ['sub', 'a.py']
+
+        assert client.get('/api/project/directory').status_code == 400
+        assert client.get('/api/project/directory?path=src/missing').status_code == 404
+        assert client.get('/api/project/directory?path=../').status_code == 403
+        assert client.get('/api/project/directory?path=src&cursor=%%%').status_code == 400
+
+    def test_structure_api_lazy_mode(self, client, big_project):
+        data = client.get('/api/project/structure?mode=lazy&limit=1').get_json()
+        code = next(s for s in data['sections'] if s['id'] == 'code')
+        assert len(code['children']) == 1
+        assert code['children'][0]['child_count'] == 2
+
+    def test_structure_api_full_mode_is_default(self, client, big_project):
+        data = client.get('/api/project/structure').get_json()
+        assert 'mode' not in data
+        code = next(s for s in data['sections'] if s['id'] == 'code')
+        assert code['children'][0]['children'][0]['name'] == 'sub'
@@ -248,6 +248,11 @@ class TestOntologyGraphServiceSearch:
             relevances = [r['relevance'] for r in results]
             assert relevances == sorted(relevances, reverse=True)
 
+    def test_search_relevance_relative_to_best_match(self, graph_service):
+        results = graph_service.search('auth', None)
+        assert results[0]['relevance'] == 1.0
+        assert all(0 < r['relevance'] <= 1 for r in results)
+
     def test_search_empty_query(self, graph_service):
         results = graph_service.search('', None)
         assert results == []
@@ -368,6 +373,71 @@ class TestBlueprintRegistration:
         assert isinstance(svc, OntologyGraphService)
 
 
+# ============================================================================
+# RESIDENT GRAPH CACHE TESTS
+# ============================================================================
+
+class TestGraphCache:
+    """Parsed graphs are kept in memory until their file changes."""
+
+    def test_unchanged_graph_is_not_reparsed(self, graph_service):
+        from x_ipe.services.ontology_graph_service import OntologyGraphService
+        graph_service.get_all_graphs()
+        with patch.object(OntologyGraphService, '_parse_graph_file',
+                          side_effect=AssertionError('re-parsed')):
+            result = graph_service.get_graph('jwt-authentication')
+            graph_service.get_all_graphs()
+            graph_service.search('token')
+        assert len(result['elements']['nodes']) == 2
+
+    def test_cache_shared_across_service_instances(self, kb_root_with_ontology):
+        from x_ipe.services.ontology_graph_service import OntologyGraphService
+        OntologyGraphService(str(kb_root_with_ontology)).get_graph('api-design')
+        with patch.object(OntologyGraphService, '_parse_graph_file',
+                          side_effect=AssertionError('re-parsed')):
+            result = OntologyGraphService(str(kb_root_with_ontology)).get_graph('api-design')
+        assert result['elements']['nodes'][0]['data']['id'] == 'know_ccc'
+
+    def test_changed_file_is_reparsed(self, graph_service, kb_root_with_ontology):
+        graph_service.get_graph('api-design')
+        graph_file = kb_root_with_ontology / '.ontology' / 'api-design.jsonl'
+        with open(graph_file, 'a') as f:
+            f.write('\n' + json.dumps({"op": "create", "entity": {"id": "know_ddd", "properties": {
+                "label": "GraphQL", "node_type": "concept"}}}))
+        ids = {n['data']['id'] for n in graph_service.get_graph('api-design')['elements']['nodes']}
+        assert ids == {'know_ccc', 'know_ddd'}
+
+    def test_deleted_file_is_dropped(self, graph_service, kb_root_with_ontology):
+        graph_service.get_graph('api-design')
+        (kb_root_with_ontology / '.ontology' / 'api-design.jsonl').unlink()
+        assert graph_service.get_graph('api-design') is None
+
+    def test_callers_do_not_share_result_lists(self, graph_service):
+        first = graph_service.get_graph('jwt-authentication')
+        first['elements']['nodes'].clear()
+        first['elements']['edges'].append({'data': {}})
+        second = graph_service.get_graph('jwt-authentication')
+        assert len(second['elements']['nodes']) == 2
+        assert len(second['elements']['edges']) == 1
+
+    def test_search_bfs_replays_deletes(self, graph_service, kb_root_with_ontology):
+        graph_file = kb_root_with_ontology / '.ontology' / 'jwt-authentication.jsonl'
+        with open(graph_file, 'a') as f:
+            f.write('\n' + json.dumps({"op": "delete", "id": "know_bbb"}))
+        result = graph_service.search_bfs('Token Refresh')
+        assert result['results'] == []
+
+    def test_search_bfs_uses_cached_graphs(self, graph_service):
+        from x_ipe.services.ontology_graph_service import OntologyGraphService
+        graph_service.get_graph('jwt-authentication')
+        graph_service.get_graph('api-design')
+        with patch.object(OntologyGraphService, '_parse_graph_file',
+                          side_effect=AssertionError('re-parsed')):
+            result = graph_service.search_bfs('Authentication')
+        assert [r['node_id'] for r in result['results']] == ['know_aaa']
+        assert set(result['subgraph']['nodes']) == {'know_aaa', 'know_bbb'}
+
+
 # ============================================================================
 # EDGE CASE TESTS
 # ============================================================================
@@ -846,3 +916,62 @@ class TestGetAllGraphsAPI:
         # 'all' must hit /graphs/all, not /graph/<name='all'>
         resp = client_relations.get('/api/kb/ontology/graphs/all')
         assert resp.status_code == 200  # not 404
+
+
+class TestGetAllGraphsPayload:
+    """Precomputed /graphs/all payload: gzip, strong ETags and cluster LOD."""
+
+    def test_gzip_when_accepted(self, client_relations):
+        import gzip
+        plain = client_relations.get('/api/kb/ontology/graphs/all')
+        resp = client_relations.get('/api/kb/ontology/graphs/all',
+                                    headers={'Accept-Encoding': 'gzip, deflate'})
+        assert resp.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in resp.headers['Vary']
+        assert json.loads(gzip.decompress(resp.data)) == plain.get_json()
+
+    def test_identity_without_accept_encoding(self, client_relations):
+        resp = client_relations.get('/api/kb/ontology/graphs/all')
+        assert 'Content-Encoding' not in resp.headers
+        assert resp.headers['ETag'].startswith('"')
+
+    def test_matching_etag_returns_304(self, client_relations):
+        first = client_relations.get('/api/kb/ontology/graphs/all')
+        resp = client_relations.get('/api/kb/ontology/graphs/all',
+                                    headers={'If-None-Match': first.headers['ETag']})
+        assert resp.status_code == 304
+        assert resp.data == b''
+        assert resp.headers['ETag'] == first.headers['ETag']
+
+    def test_etag_changes_when_graph_changes(self, client_relations, kb_root_with_relations):
+        first = client_relations.get('/api/kb/ontology/graphs/all')
+        with open(kb_root_with_relations / '.ontology' / 'graph-b.jsonl', 'a') as f:
+            f.write('\n' + json.dumps({"op": "create", "entity": {"id": "ent_c", "properties": {
+                "label": "Gamma"}}}))
+        resp = client_relations.get('/api/kb/ontology/graphs/all',
+                                    headers={'If-None-Match': first.headers['ETag']})
+        assert resp.status_code == 200
+        assert resp.headers['ETag'] != first.headers['ETag']
+        assert len(resp.get_json()['elements']['nodes']) == 3
+
+    def test_payload_reused_while_unchanged(self, graph_service_relations):
+        assert graph_service_relations.get_all_graphs_payload() is \
+            graph_service_relations.get_all_graphs_payload()
+
+    def test_cluster_summary(self, graph_service_relations):
+        result = graph_service_relations.get_cluster_summary()
+        assert result['mode'] == 'clusters'
+        ids = {n['data']['id']: n['data'] for n in result['elements']['nodes']}
+        assert set(ids) == {'cluster:graph-a', 'cluster:graph-b'}
+        assert ids['cluster:graph-a']['entity_count'] == 1
+        weights = {(e['data']['source'], e['data']['target']): e['data']['weight']
+                   for e in result['elements']['edges']}
+        assert weights == {('cluster:graph-a', 'cluster:graph-b'): 2,
+                           ('cluster:graph-b', 'cluster:graph-a'): 1}
+
+    def test_api_lod_clusters(self, client_relations):
+        full = client_relations.get('/api/kb/ontology/graphs/all')
+        resp = client_relations.get('/api/kb/ontology/graphs/all?lod=clusters')
+        assert resp.status_code == 200
+        assert resp.get_json()['mode'] == 'clusters'
+        assert resp.headers['ETag'] != full.headers['ETag']
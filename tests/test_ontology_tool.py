@@ -27,6 +27,7 @@ import ontology  # noqa: E402
 import dimension_registry  # noqa: E402
 import graph_ops  # noqa: E402
 import search  # noqa: E402
+import text_index  # noqa: E402
 
 
 # ──────────────────── Fixtures ────────────────────
@@ -368,6 +369,122 @@ class TestCorruptedLineRecovery:
         assert len(entities) == 1  # valid entity still loaded
 
 
+class TestUnrelate:
+    def test_unrelate_removes_all_matching_and_keeps_order(self, tmp_graph, two_entities):
+        id1, id2 = two_entities
+        ontology.create_relation(id1, "related_to", id2, None, tmp_graph)
+        ontology.create_relation(id2, "part_of", id1, None, tmp_graph)
+        ontology.create_relation(id1, "related_to", id2, None, tmp_graph)
+        ontology.create_relation(id1, "depends_on", id2, None, tmp_graph)
+        ontology.append_op(tmp_graph, {"op": "unrelate", "from": id1, "rel": "related_to", "to": id2})
+        _, relations = ontology.load_graph(tmp_graph)
+        assert [r["rel"] for r in relations] == ["part_of", "depends_on"]
+
+
+class TestSnapshots:
+    @pytest.fixture(autouse=True)
+    def _small_interval(self, monkeypatch):
+        monkeypatch.setattr(ontology, "SNAPSHOT_INTERVAL", 3)
+
+    @staticmethod
+    def _full_replay(graph_path):
+        snapshot = ontology._snapshot_path(Path(graph_path))
+        snapshot.unlink(missing_ok=True)
+        return ontology.load_graph(graph_path)
+
+    def test_no_snapshot_below_interval(self, tmp_graph, two_entities):
+        ontology.load_graph(tmp_graph)
+        assert not ontology._snapshot_path(Path(tmp_graph)).exists()
+
+    def test_snapshot_written_and_tail_replayed(self, tmp_graph, two_entities):
+        id1, id2 = two_entities
+        ontology.create_relation(id1, "related_to", id2, None, tmp_graph)
+        ontology.load_graph(tmp_graph)
+        snapshot = json.loads(ontology._snapshot_path(Path(tmp_graph)).read_text())
+        assert snapshot["offset"] == os.path.getsize(tmp_graph)
+
+        ontology.update_entity(id1, {"weight": 9}, tmp_graph)
+        ontology.append_op(tmp_graph, {"op": "unrelate", "from": id1, "rel": "related_to", "to": id2})
+        entities, relations = ontology.load_graph(tmp_graph)
+        assert entities[id1]["properties"]["weight"] == 9
+        assert relations == []
+        assert (entities, relations) == self._full_replay(tmp_graph)
+
+    def test_stale_snapshot_ignored_after_rewrite(self, tmp_graph, two_entities, sample_props):
+        id1, _ = two_entities
+        ontology.update_entity(id1, {"weight": 2}, tmp_graph)
+        ontology.load_graph(tmp_graph)
+        assert ontology._snapshot_path(Path(tmp_graph)).exists()
+
+        with open(tmp_graph) as f:
+            first = f.readline()
+        with open(tmp_graph, "w") as f:
+            f.write(first)
+        entities, _ = ontology.load_graph(tmp_graph)
+        assert list(entities) == [id1]
+        assert entities[id1]["properties"]["weight"] == ontology.WEIGHT_DEFAULT
+
+    def test_unterminated_tail_not_snapshotted(self, tmp_graph, two_entities):
+        id1, _ = two_entities
+        with open(tmp_graph, "a") as f:
+            f.write(json.dumps({"op": "delete", "id": id1}))
+        entities, _ = ontology.load_graph(tmp_graph)
+        assert id1 not in entities
+        assert not ontology._snapshot_path(Path(tmp_graph)).exists()
+
+
+class TestCompaction:
+    def test_compact_preserves_state(self, tmp_graph, two_entities, sample_props):
+        id1, id2 = two_entities
+        ontology.create_relation(id1, "related_to", id2, {"w": 1}, tmp_graph)
+        ontology.create_relation(id2, "part_of", id1, None, tmp_graph)
+        ontology.append_op(tmp_graph, {"op": "unrelate", "from": id2, "rel": "part_of", "to": id1})
+        for weight in range(1, 9):
+            ontology.update_entity(id1, {"weight": weight}, tmp_graph)
+        doomed = ontology.create_entity("KnowledgeNode", dict(sample_props), tmp_graph)
+        ontology.delete_entity(doomed["id"], tmp_graph)
+        before = ontology.load_graph(tmp_graph)
+        size_before = os.path.getsize(tmp_graph)
+
+        result = ontology.compact_graph(tmp_graph)
+
+        assert result == {"entities": 2, "relations": 1,
+                          "bytes_before": size_before, "bytes_after": os.path.getsize(tmp_graph)}
+        assert result["bytes_after"] < size_before
+        with open(tmp_graph) as f:
+            assert len(f.readlines()) == 3
+        assert ontology.load_graph(tmp_graph) == before
+        ontology._snapshot_path(Path(tmp_graph)).unlink()
+        assert ontology.load_graph(tmp_graph) == before
+
+    def test_append_after_compaction(self, tmp_graph, two_entities, sample_props):
+        ontology.compact_graph(tmp_graph)
+        created = ontology.create_entity("KnowledgeNode", dict(sample_props), tmp_graph)
+        entities, _ = ontology.load_graph(tmp_graph)
+        assert set(entities) == set(two_entities) | {created["id"]}
+
+    def test_append_right_after_rename_is_not_lost(self, tmp_graph, two_entities, sample_props, monkeypatch):
+        # An appender may lock the new log as soon as it is renamed into place
+        real_replace = os.replace
+        appended = {"op": "create", "entity": {"id": "late", "type": "KnowledgeNode", "properties": {}}}
+
+        def replace_then_append(src, dst):
+            real_replace(src, dst)
+            if str(dst) == tmp_graph:
+                with open(tmp_graph, "a") as f:
+                    f.write(json.dumps(appended) + "\n")
+
+        monkeypatch.setattr(ontology.os, "replace", replace_then_append)
+        ontology.compact_graph(tmp_graph)
+        monkeypatch.undo()
+        entities, _ = ontology.load_graph(tmp_graph)
+        assert set(entities) == set(two_entities) | {"late"}
+
+    def test_compact_missing_graph(self, tmp_graph):
+        with pytest.raises(ValueError):
+            ontology.compact_graph(tmp_graph)
+
+
 # ══════════════════════════════════════════════════
 #  dimension_registry.py
 # ══════════════════════════════════════════════════
@@ -639,6 +756,132 @@ class TestSearch:
         result = search.search("JWT", "auth.jsonl", ont_dir)
         assert result["total_count"] >= 1
 
+    def test_scores_relative_to_best_match(self, search_setup):
+        ont_dir, _, _ = search_setup
+        scores = [m["score"] for m in search.search("auth", "all", ont_dir)["matches"]]
+        assert scores[0] == 1.0
+        assert all(0 < score <= 1 for score in scores)
+
+
+def _node(eid, label, description="", **dimensions):
+    return {"id": eid, "properties": {"label": label, "description": description,
+                                      "dimensions": dimensions}}
+
+
+class TestTextIndex:
+    def test_prefix_match(self):
+        index = text_index.TextIndex.from_entities({"a": _node("a", "Authentication")})
+        assert [r[0] for r in index.search("auth")] == ["a"]
+
+    def test_all_tokens_must_match(self):
+        index = text_index.TextIndex.from_entities({
+            "a": _node("a", "JWT Auth"),
+            "b": _node("b", "JWT Refresh"),
+        })
+        assert [r[0] for r in index.search("jwt auth")] == ["a"]
+
+    def test_fuzzy_match(self):
+        index = text_index.TextIndex.from_entities({"a": _node("a", "Authentication")})
+        assert [r[0] for r in index.search("authentcation")] == ["a"]
+        assert index.search("xyz") == []
+
+    def test_label_ranked_above_description(self):
+        index = text_index.TextIndex.from_entities({
+            "desc": _node("desc", "Sessions", "Handles token expiry"),
+            "label": _node("label", "Token Store", "Persistence layer"),
+            "other": _node("other", "Unrelated"),
+        })
+        results = index.search("token")
+        assert [r[0] for r in results] == ["label", "desc"]
+        assert results[0][2] == ["label"]
+        assert results[1][2] == ["description"]
+
+    def test_dimension_fields(self):
+        index = text_index.TextIndex.from_entities({"a": _node("a", "X", tech=["Python", "Flask"])})
+        assert index.search("flask")[0][2] == ["dimensions.tech"]
+
+    def test_shared_corpus_makes_scores_comparable(self):
+        small = text_index.TextIndex.from_entities({"a": _node("a", "Token")})
+        large = text_index.TextIndex.from_entities({
+            "b": _node("b", "Token"), "c": _node("c", "Cache"), "d": _node("d", "Queue"),
+        })
+        assert small.search("token")[0][1] != large.search("token")[0][1]
+        corpus = [small, large]
+        assert small.search("token", corpus)[0][1] == large.search("token", corpus)[0][1]
+
+    def test_remove(self):
+        index = text_index.TextIndex.from_entities({"a": _node("a", "Token"), "b": _node("b", "Token")})
+        index.remove("a")
+        assert [r[0] for r in index.search("token")] == ["b"]
+        assert "a" not in index.docs
+
+
+class TestPersistedTextIndex:
+    def test_build_writes_index(self, tmp_path):
+        entities_path = str(tmp_path / "_entities.jsonl")
+        output_path = tmp_path / "output"
+        src_file = tmp_path / "src" / "auth.py"
+        src_file.parent.mkdir(parents=True)
+        src_file.write_text("# auth module")
+        ontology.create_entity("KnowledgeNode", {"label": "Auth Module", "node_type": "concept",
+                                                 "source_files": [str(src_file)]}, entities_path)
+
+        graph_ops.build(str(tmp_path), str(output_path), entities_path)
+        graph_file = output_path / "auth-module.jsonl"
+        saved = json.loads(text_index.index_path(graph_file).read_bytes())
+        assert saved["files"]["auth-module.jsonl"]["offset"] == graph_file.stat().st_size
+        assert len(saved["docs"]) == 1
+
+    def test_appended_records_are_folded_in(self, search_setup):
+        ont_dir, id1, _ = search_setup
+        graph_file = Path(ont_dir) / "auth.jsonl"
+        path = text_index.index_path(graph_file)
+        entities, _ = ontology.load_graph(str(graph_file))
+        text_index.write_index(path, [graph_file], entities)
+        saved = path.read_bytes()
+
+        created = ontology.create_entity("KnowledgeNode", {"label": "Kerberos", "node_type": "concept",
+                                                           "source_files": []}, str(graph_file))
+        ontology.delete_entity(id1, str(graph_file))
+        entities, _ = ontology.load_graph(str(graph_file))
+        index = text_index.load_index(path, [graph_file], entities)
+        assert [r[0] for r in index.search("kerberos")] == [created["id"]]
+        assert id1 not in index.docs
+        assert path.read_bytes() == saved  # Below INDEX_FLUSH_RECORDS: not rewritten
+
+    def test_flush_after_many_records(self, search_setup, monkeypatch):
+        ont_dir, _, _ = search_setup
+        graph_file = Path(ont_dir) / "auth.jsonl"
+        path = text_index.index_path(graph_file)
+        entities, _ = ontology.load_graph(str(graph_file))
+        text_index.write_index(path, [graph_file], entities)
+        monkeypatch.setattr(text_index, "INDEX_FLUSH_RECORDS", 1)
+        created = ontology.create_entity("KnowledgeNode", {"label": "Kerberos", "node_type": "concept",
+                                                           "source_files": []}, str(graph_file))
+        entities, _ = ontology.load_graph(str(graph_file))
+        text_index.load_index(path, [graph_file], entities)
+        saved = json.loads(path.read_bytes())
+        assert created["id"] in saved["docs"]
+        assert saved["files"]["auth.jsonl"]["offset"] == graph_file.stat().st_size
+
+    def test_rewritten_log_rebuilds(self, search_setup):
+        ont_dir, id1, id2 = search_setup
+        graph_file = Path(ont_dir) / "auth.jsonl"
+        path = text_index.index_path(graph_file)
+        entities, _ = ontology.load_graph(str(graph_file))
+        text_index.write_index(path, [graph_file], entities)
+
+        ontology.delete_entity(id1, str(graph_file))
+        ontology.compact_graph(str(graph_file))
+        entities, _ = ontology.load_graph(str(graph_file))
+        index = text_index.load_index(path, [graph_file], entities)
+        assert set(index.docs) == {id2}
+
+    def test_search_uses_persisted_index(self, search_setup):
+        ont_dir, _, _ = search_setup
+        search.search("JWT", "all", ont_dir)
+        assert text_index.index_path(Path(ont_dir) / "auth.jsonl").exists()
+
 
 class TestBFSSubgraph:
     def test_bfs_reaches_neighbors(self, search_setup):
@@ -659,6 +902,29 @@ class TestBFSSubgraph:
         nodes, edges = search._bfs_subgraph({id1}, entities, relations, depth=0)
         assert nodes == {id1}
 
+    def test_bfs_with_prebuilt_adjacency(self, search_setup):
+        ont_dir, id1, id2 = search_setup
+        graph_file = str(Path(ont_dir) / "auth.jsonl")
+        entities, relations = ontology.load_graph(graph_file)
+        adjacency = search.build_adjacency(relations)
+
+        assert search._bfs_subgraph({id1}, entities, [], depth=1, adjacencies=[adjacency]) == \
+            search._bfs_subgraph({id1}, entities, relations, depth=1)
+
+    def test_search_with_graph_loader(self, search_setup):
+        ont_dir, id1, id2 = search_setup
+        loaded = []
+
+        def loader(path):
+            loaded.append(Path(path).name)
+            entities, relations = ontology.load_graph(str(path))
+            return (entities, relations, search.build_adjacency(relations),
+                    text_index.TextIndex.from_entities(entities))
+
+        result = search.search("JWT", "auth.jsonl", ont_dir, depth=1, graph_loader=loader)
+        assert loaded == ["auth.jsonl"]
+        assert set(result["subgraph"]["nodes"]) >= {id1, id2}
+
 
 # ══════════════════════════════════════════════════
 #  CLI smoke tests
@@ -769,6 +1035,13 @@ class TestOntologyCLI:
         assert rc == 0
         assert json.loads(out)["entity_count"] == 1
 
+    def test_compact_cli(self, tmp_graph, sample_props, capsys):
+        entity = ontology.create_entity("KnowledgeNode", sample_props, tmp_graph)
+        ontology.update_entity(entity["id"], {"weight": 7}, tmp_graph)
+        rc, out = self._run_main(ontology, ["compact", "--graph", tmp_graph], capsys)
+        assert rc == 0
+        assert json.loads(out)["entities"] == 1
+
     def test_create_validation_error_cli(self, tmp_graph, capsys):
         rc, out = self._run_main(ontology, ["create", "--type", "KnowledgeNode", "--props", '{"label":"X"}', "--graph", tmp_graph], capsys)
         assert rc == 1
@@ -997,6 +1270,131 @@ class TestGraphIndex:
         assert len(json.loads(new_content)["graphs"]) == 2
 
 
+class TestIncrementalBuild:
+    """graph_ops.build() only rewrites clusters affected since the last build."""
+
+    @pytest.fixture()
+    def kb(self, tmp_path):
+        scope = tmp_path / "kb"
+        scope.mkdir()
+        ont_dir = tmp_path / ".ontology"
+        ont_dir.mkdir()
+        return scope, ont_dir, str(ont_dir / "_entities.jsonl")
+
+    @staticmethod
+    def _create(kb, label):
+        scope, _, ents = kb
+        src = scope / f"{label}.md"
+        src.write_text(label)
+        return ontology.create_entity(
+            "KnowledgeNode", {"label": label, "node_type": "concept", "source_files": [str(src)]}, ents
+        )["id"]
+
+    @staticmethod
+    def _build(kb, **kwargs):
+        scope, ont_dir, ents = kb
+        return graph_ops.build(str(scope), str(ont_dir), ents, **kwargs)
+
+    @staticmethod
+    def _graphs(kb):
+        manifest = json.loads((kb[1] / ".graph-index.json").read_text())
+        return {g["file"]: g["entity_count"] for g in manifest["graphs"]}
+
+    def test_unrelated_change_keeps_other_clusters(self, kb):
+        self._create(kb, "Alpha")
+        self._create(kb, "Beta")
+        assert self._build(kb)["incremental"] is False
+        beta = kb[1] / "beta.jsonl"
+        beta_stat = beta.stat()
+
+        self._create(kb, "Gamma")
+        result = self._build(kb)
+        assert result["incremental"] is True
+        assert [f["file"] for f in result["files"]] == ["gamma.jsonl"]
+        assert beta.stat().st_mtime_ns == beta_stat.st_mtime_ns
+        assert self._graphs(kb) == {"alpha.jsonl": 1, "beta.jsonl": 1, "gamma.jsonl": 1}
+        assert result["clusters"] == 3
+        assert result["entities_in_scope"] == 3
+
+    def test_new_relation_merges_clusters(self, kb):
+        a = self._create(kb, "Alpha")
+        b = self._create(kb, "Beta")
+        self._create(kb, "Gamma")
+        self._build(kb)
+
+        ontology.create_relation(a, "related_to", b, None, kb[2])
+        ontology.create_relation(a, "depends_on", b, None, kb[2])
+        result = self._build(kb)
+        assert result["incremental"] is True
+        assert [f["file"] for f in result["files"]] == ["alpha.jsonl"]
+        assert result["removed_files"] == ["beta.jsonl"]
+        assert not (kb[1] / "beta.jsonl").exists()
+        assert self._graphs(kb) == {"gamma.jsonl": 1, "alpha.jsonl": 2}
+
+    def test_deleted_entity_removes_cluster(self, kb):
+        self._create(kb, "Alpha")
+        b = self._create(kb, "Beta")
+        self._build(kb)
+
+        ontology.delete_entity(b, kb[2])
+        result = self._build(kb)
+        assert result["incremental"] is True
+        assert result["removed_files"] == ["beta.jsonl"]
+        assert not (kb[1] / ".beta.jsonl.index").exists()
+        assert self._graphs(kb) == {"alpha.jsonl": 1}
+
+    def test_deleted_source_file_is_pruned(self, kb):
+        self._create(kb, "Alpha")
+        self._create(kb, "Beta")
+        self._build(kb)
+
+        (kb[0] / "Beta.md").unlink()
+        result = self._build(kb)
+        assert result["incremental"] is True
+        assert len(result["pruned"]) == 1
+        assert self._graphs(kb) == {"alpha.jsonl": 1}
+
+    def test_no_changes_rewrites_nothing(self, kb):
+        self._create(kb, "Alpha")
+        self._build(kb)
+        manifest = (kb[1] / ".graph-index.json").read_text()
+
+        result = self._build(kb)
+        assert result["files"] == [] and result["removed_files"] == []
+        assert (kb[1] / ".graph-index.json").read_text() == manifest
+
+    def test_matches_full_build(self, kb):
+        a = self._create(kb, "Alpha")
+        b = self._create(kb, "Beta")
+        self._build(kb)
+        c = self._create(kb, "Gamma")
+        ontology.create_relation(b, "related_to", c, None, kb[2])
+        ontology.update_entity(a, {"label": "Alpha Prime"}, kb[2])
+        self._build(kb)
+        incremental = self._graphs(kb)
+
+        result = self._build(kb, full=True)
+        assert result["incremental"] is False
+        assert self._graphs(kb) == incremental == {"alpha-prime.jsonl": 1, "beta.jsonl": 2}
+
+    def test_rewritten_log_falls_back_to_full_build(self, kb):
+        self._create(kb, "Alpha")
+        b = self._create(kb, "Beta")
+        self._build(kb)
+
+        ontology.delete_entity(b, kb[2])
+        ontology.compact_graph(kb[2])
+        result = self._build(kb)
+        assert result["incremental"] is False
+        assert self._graphs(kb) == {"alpha.jsonl": 1}
+
+    def test_scope_change_falls_back_to_full_build(self, kb, tmp_path):
+        self._create(kb, "Alpha")
+        self._build(kb)
+        result = graph_ops.build(str(tmp_path), str(kb[1]), kb[2])
+        assert result["incremental"] is False
+
+
 class TestRetag:
     """Tests for ontology.py retag_files() function."""
 
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
+import threading
 import os
 
 
@@ -162,6 +163,16 @@ class TestRedactor:
         result = redactor.redact(data)
         
         assert result == data
+    
+    def test_key_cache_is_bounded(self):
+        """Arbitrary payload keys must not grow the key cache without limit."""
+        from x_ipe.tracing.redactor import Redactor, SENSITIVE_KEY_CACHE_SIZE
+        
+        redactor = Redactor()
+        redactor.redact({f"key{i}": i for i in range(SENSITIVE_KEY_CACHE_SIZE * 2)})
+        
+        assert redactor._is_sensitive.cache_info().currsize == SENSITIVE_KEY_CACHE_SIZE
+        assert redactor.redact({"user_token": "abc"}) == {"user_token": "[REDACTED]"}
 
 
 # =============================================================================
@@ -567,6 +578,65 @@ class TestTracingDecorator:
         assert len(buffer.entries) >= 2  # Entry and exit
 
 
+class TestTracingFastPath:
+    """Tests for signature binding and serialize-once behavior."""
+    
+    def test_signature_is_read_once_at_decoration(self):
+        """inspect.signature should not run on each traced call."""
+        from x_ipe.tracing.decorator import x_ipe_tracing
+        from x_ipe.tracing.context import TraceContext
+        
+        @x_ipe_tracing(level="INFO")
+        def add(a, b):
+            return a + b
+        
+        TraceContext.start_trace("TEST")
+        with patch('x_ipe.tracing.decorator.inspect.signature') as signature:
+            add(1, b=2)
+        buffer = TraceContext.end_trace()
+        
+        signature.assert_not_called()
+        assert buffer.entries[0].data == {"a": 1, "b": 2}
+    
+    def test_entries_are_encoded_once(self):
+        """Buffer and log output should reuse the decorator's encoding."""
+        from x_ipe.tracing.decorator import x_ipe_tracing
+        from x_ipe.tracing.context import TraceContext
+        
+        @x_ipe_tracing(level="INFO")
+        def greet(name):
+            return f"Hello, {name}"
+        
+        TraceContext.start_trace("TEST")
+        greet("Zoë")
+        buffer = TraceContext.end_trace()
+        
+        with patch('x_ipe.tracing.buffer.json.dumps') as dumps:
+            log = buffer.to_log_string("SUCCESS", 1.0)
+        dumps.assert_not_called()
+        assert buffer.entries[0].encoded == '{"name": "Zoë"}'
+        assert '{"return": "Hello, Zoë"}' in log
+    
+    def test_unserializable_return_value_is_stringified(self):
+        """Circular values fall back to a truncated string per key."""
+        from x_ipe.tracing.decorator import x_ipe_tracing
+        from x_ipe.tracing.context import TraceContext
+        
+        circular = []
+        circular.append(circular)
+        
+        @x_ipe_tracing(level="INFO")
+        def make():
+            return circular
+        
+        TraceContext.start_trace("TEST")
+        make()
+        buffer = TraceContext.end_trace()
+        
+        assert buffer.entries[1].data == {"return": "[[...]]"}
+        assert buffer.entries[1].encoded == '{"return": "[[...]]"}'
+
+
 # =============================================================================
 # UNIT TESTS: TraceLogWriter
 # =============================================================================
@@ -677,6 +747,300 @@ class TestTraceLogWriter:
         assert result is None
 
 
+class TestAsyncTraceLogWriter:
+    """Unit tests for background, batched trace writing."""
+    
+    def _buffer(self, trace_id, api="GET /api/test"):
+        from x_ipe.tracing.buffer import TraceBuffer, TraceEntry
+        
+        buffer = TraceBuffer(trace_id, api)
+        buffer.add(TraceEntry(
+            timestamp=datetime.now(timezone.utc),
+            trace_id=trace_id,
+            level="INFO",
+            direction="→",
+            event_type="start_function",
+            function_name="handler",
+            data={"x": 1},
+            depth=0
+        ))
+        return buffer
+    
+    def test_submit_writes_in_background(self, tmp_path):
+        from x_ipe.tracing.writer import AsyncTraceLogWriter
+        
+        writer = AsyncTraceLogWriter()
+        for i in range(5):
+            assert writer.submit(str(tmp_path), self._buffer(f"aaaaaaaa-000{i}"), "SUCCESS")
+        assert writer.flush(timeout=5)
+        
+        assert len(list(tmp_path.glob("*.log"))) == 5
+        assert writer.stats() == {"queued": 0, "written": 5, "dropped": 0}
+    
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        from x_ipe.tracing.writer import AsyncTraceLogWriter
+        
+        writer = AsyncTraceLogWriter(queue_size=2)
+        release = threading.Event()
+        original = writer._write
+        writer._write = lambda batch: (release.wait(5), original(batch))[1]
+        
+        results = [writer.submit(str(tmp_path), self._buffer(f"bbbbbbbb-000{i}"), "SUCCESS")
+                   for i in range(10)]
+        release.set()
+        writer.flush(timeout=5)
+        
+        assert results.count(False) == writer.dropped
+        assert writer.dropped >= 7
+        assert writer.written == 10 - writer.dropped
+    
+    def test_segment_mode_appends_to_one_file(self, tmp_path):
+        from x_ipe.tracing.writer import TraceLogWriter
+        
+        writer = TraceLogWriter(str(tmp_path), segmented=True)
+        writer.write_batch([
+            (self._buffer("cccccccc-0001", "GET /api/a"), "SUCCESS", 5.0),
+            (self._buffer("cccccccc-0002", "POST /api/b"), "ERROR", 7.0),
+        ])
+        
+        segments = list(tmp_path.glob("segment-*.trace"))
+        assert len(segments) == 1
+        traces = list(TraceLogWriter.iter_segment_traces(segments[0]))
+        assert [(t["trace_id"], t["api"], t["status"], t["total_ms"]) for t in traces] == [
+            ("cccccccc-0001", "GET /api/a", "SUCCESS", 5),
+            ("cccccccc-0002", "POST /api/b", "ERROR", 7),
+        ]
+        block = TraceLogWriter.read_segment_trace(segments[0], traces[1]["offset"], traces[1]["length"])
+        assert block.startswith("[TRACE-START] cccccccc-0002")
+        assert block.rstrip().endswith("ERROR")
+    
+    def test_segment_rolls_over_when_full(self, tmp_path):
+        from x_ipe.tracing.writer import TraceLogWriter
+        
+        writer = TraceLogWriter(str(tmp_path), segmented=True)
+        writer.SEGMENT_MAX_BYTES = 1
+        writer.write_batch([(self._buffer(f"dddddddd-000{i}"), "SUCCESS", 1.0) for i in range(3)])
+        
+        assert len(list(tmp_path.glob("segment-*.trace"))) == 3
+    
+    def test_service_reads_segment_traces(self, tmp_path):
+        from x_ipe.tracing.writer import TraceLogWriter
+        from x_ipe.services.tracing_service import TracingService
+        
+        TraceLogWriter(str(tmp_path / "instance" / "traces"), segmented=True).write_batch([
+            (self._buffer("eeeeeeee-0001", "GET /api/seg"), "SUCCESS", 3.0),
+        ])
+        service = TracingService(str(tmp_path))
+        
+        logs = service.list_logs()
+        assert [(log["trace_id"], log["api"]) for log in logs] == [("eeeeeeee-0001", "GET /api/seg")]
+        
+        trace = service.get_trace("eeeeeeee-0001")
+        assert trace["api"] == "GET /api/seg"
+        assert trace["nodes"][1]["label"] == "handler"
+        
+        assert service.delete_all_logs() == 1
+        assert service.list_logs() == []
+
+
+class TestTraceIndex:
+    """Unit tests for the trace index manifest."""
+    
+    def _write(self, log_path, trace_id, api="GET /api/test", status="SUCCESS", segmented=False):
+        from x_ipe.tracing.writer import TraceLogWriter
+        from x_ipe.tracing.buffer import TraceBuffer
+        
+        writer = TraceLogWriter(str(log_path), segmented=segmented)
+        return writer.write(TraceBuffer(trace_id, api), status, total_ms=12.0)
+    
+    def test_writer_appends_index_records(self, tmp_path):
+        from x_ipe.tracing.index import get_trace_index
+        
+        self._write(tmp_path, "aaaa1111-0001", "POST /api/orders", "ERROR")
+        record = get_trace_index(tmp_path).get("aaaa1111-0001")
+        
+        assert record["api"] == "POST /api/orders"
+        assert record["status"] == "ERROR"
+        assert record["total_ms"] == 12
+        assert (tmp_path / record["file"]).is_file()
+    
+    def test_index_reads_only_new_lines(self, tmp_path):
+        from x_ipe.tracing.index import get_trace_index
+        
+        self._write(tmp_path, "bbbb2222-0001")
+        index = get_trace_index(tmp_path)
+        assert len(index.records()) == 1
+        
+        self._write(tmp_path, "bbbb2222-0002")
+        with patch('x_ipe.tracing.index.json.loads', wraps=json.loads) as loads:
+            assert len(index.records()) == 2
+        assert loads.call_count == 1
+    
+    def test_list_logs_filters_from_index(self, tmp_path):
+        from x_ipe.services.tracing_service import TracingService
+        
+        log_path = tmp_path / "instance" / "traces"
+        self._write(log_path, "cccc3333-0001", "GET /api/a")
+        self._write(log_path, "cccc3333-0002", "GET /api/b", "ERROR")
+        service = TracingService(str(tmp_path))
+        
+        assert [log["trace_id"] for log in service.list_logs(status="ERROR")] == ["cccc3333-0002"]
+        assert [log["trace_id"] for log in service.list_logs(api="/api/a")] == ["cccc3333-0001"]
+        assert len(service.list_logs(limit=1)) == 1
+    
+    def test_get_trace_does_not_scan_directory(self, tmp_path):
+        from x_ipe.services.tracing_service import TracingService
+        
+        log_path = tmp_path / "instance" / "traces"
+        self._write(log_path, "dddd4444-0001", "GET /api/x")
+        service = TracingService(str(tmp_path))
+        
+        with patch.object(Path, 'glob', side_effect=AssertionError("directory scanned")):
+            trace = service.get_trace("dddd4444-0001")
+        assert trace["api"] == "GET /api/x"
+    
+    def test_missing_index_is_rebuilt_from_logs(self, tmp_path):
+        from x_ipe.services.tracing_service import TracingService
+        from x_ipe.tracing.index import get_trace_index
+        
+        log_path = tmp_path / "instance" / "traces"
+        self._write(log_path, "eeee5555-0001", "GET /api/one")
+        self._write(log_path, "eeee5555-0002", "GET /api/two", segmented=True)
+        get_trace_index(log_path).clear()
+        
+        logs = TracingService(str(tmp_path)).list_logs()
+        assert {(log["trace_id"], log["api"]) for log in logs} == {
+            ("eeee5555-0001", "GET /api/one"),
+            ("eeee5555-0002", "GET /api/two"),
+        }
+    
+    def test_writer_indexes_older_logs_once(self, tmp_path):
+        from x_ipe.tracing.index import get_trace_index
+        
+        self._write(tmp_path, "abab7777-0001", "GET /api/old")
+        get_trace_index(tmp_path).clear()
+        
+        self._write(tmp_path, "abab7777-0002", "GET /api/new")
+        index = get_trace_index(tmp_path)
+        assert {r["trace_id"] for r in index.records()} == {"abab7777-0001", "abab7777-0002"}
+        
+        with patch.object(Path, 'glob', side_effect=AssertionError("directory scanned")):
+            self._write(tmp_path, "abab7777-0003")
+        assert index.get("abab7777-0003") is not None
+    
+    def test_append_during_rebuild_is_kept(self, tmp_path):
+        from x_ipe.tracing.writer import TraceLogWriter
+        from x_ipe.tracing.index import get_trace_index
+        
+        self._write(tmp_path, "cdcd8888-0001", "GET /api/old")
+        index = get_trace_index(tmp_path)
+        index.clear()
+        
+        def scan():
+            records = TraceLogWriter(str(tmp_path)).scan_index_records()
+            # A trace finishes while the directory is being scanned
+            index.append([dict(records[0], trace_id="cdcd8888-0002")])
+            return records
+        
+        index.ensure(scan)
+        assert {r["trace_id"] for r in index.records()} == {"cdcd8888-0001", "cdcd8888-0002"}
+    
+    def test_cleanup_compacts_index(self, tmp_path):
+        from x_ipe.tracing.writer import TraceLogWriter
+        from x_ipe.tracing.index import get_trace_index
+        
+        path = self._write(tmp_path, "ffff6666-0001")
+        old = datetime.now().timestamp() - 48 * 3600
+        os.utime(path, (old, old))
+        
+        assert TraceLogWriter(str(tmp_path)).cleanup(retention_hours=24) == 1
+        assert get_trace_index(tmp_path).records() == []
+
+
+class TestJsonlTraceFormat:
+    """Unit tests for the JSONL trace format and streaming parser."""
+    
+    def _buffer(self, trace_id="abcd1234-0001"):
+        from x_ipe.tracing.buffer import TraceBuffer, TraceEntry
+        
+        buffer = TraceBuffer(trace_id, "POST /api/orders")
+        now = datetime.now(timezone.utc)
+        for event, direction, data, duration, depth in (
+            ("start_function", "→", {"order_id": 7, "note": "a | b"}, None, 0),
+            ("start_function", "→", {"sku": "x"}, None, 1),
+            ("return_function", "←", {"ok": True}, 3.0, 1),
+            ("exception", "←", {"error": "ValueError", "message": "bad"}, 9.0, 0),
+        ):
+            buffer.add(TraceEntry(
+                timestamp=now, trace_id=trace_id, level="INFO", direction=direction,
+                event_type=event, function_name=f"fn_{depth}", data=data,
+                duration_ms=duration, depth=depth,
+            ))
+        return buffer
+    
+    def test_every_line_is_json(self):
+        lines = self._buffer().to_jsonl("ERROR", 15.0).splitlines()
+        
+        records = [json.loads(line) for line in lines]
+        assert records[0]["t"] == "start"
+        assert records[1]["data"] == {"order_id": 7, "note": "a | b"}
+        assert records[-1] == {"t": "end", "trace_id": "abcd1234-0001", "total_ms": 15, "status": "ERROR"}
+    
+    def test_jsonl_and_text_parse_to_same_graph(self):
+        from x_ipe.tracing.parser import TraceLogParser
+        
+        buffer = self._buffer()
+        parser = TraceLogParser()
+        from_text = parser.parse_text(buffer.to_log_string("ERROR", 15.0))
+        from_jsonl = parser.parse_text(buffer.to_jsonl("ERROR", 15.0))
+        
+        assert from_jsonl["edges"] == from_text["edges"]
+        assert [n["label"] for n in from_jsonl["nodes"]] == [n["label"] for n in from_text["nodes"]]
+        assert from_jsonl["nodes"][2]["output"] == '{"ok": true}'
+        assert from_jsonl["nodes"][1]["error"]["type"] == "ValueError"
+        assert from_jsonl["status"] == "error"
+    
+    def test_render_text_matches_text_format(self):
+        from x_ipe.tracing.parser import TraceLogParser
+        
+        buffer = self._buffer()
+        rendered = TraceLogParser().render_text(buffer.to_jsonl("SUCCESS", 15.0).splitlines())
+        
+        assert rendered == buffer.to_log_string("SUCCESS", 15.0).rstrip("\n")
+    
+    def test_parse_streams_file(self, tmp_path):
+        from x_ipe.tracing.parser import TraceLogParser
+        
+        path = tmp_path / "trace.jsonl"
+        path.write_text(self._buffer().to_jsonl("SUCCESS", 15.0), encoding="utf-8")
+        
+        with patch.object(Path, 'read_text', side_effect=AssertionError("file read whole")):
+            result = TraceLogParser().parse(path)
+        assert result["trace_id"] == "abcd1234-0001"
+        assert len(result["nodes"]) == 3
+    
+    @pytest.mark.parametrize("segmented", [False, True])
+    def test_service_reads_jsonl_traces(self, tmp_path, segmented):
+        from x_ipe.tracing.writer import TraceLogWriter
+        from x_ipe.tracing.index import get_trace_index
+        from x_ipe.services.tracing_service import TracingService
+        
+        log_path = tmp_path / "instance" / "traces"
+        writer = TraceLogWriter(str(log_path), segmented=segmented, log_format="jsonl")
+        path = writer.write(self._buffer(), "ERROR", total_ms=15.0)
+        if not segmented:
+            assert path.endswith(".jsonl")
+        service = TracingService(str(tmp_path))
+        
+        assert service.get_trace("abcd1234-0001")["api"] == "POST /api/orders"
+        assert service.get_trace_text("abcd1234-0001").startswith("[TRACE-START] abcd1234-0001 |")
+        
+        # Rebuilding the index picks up JSONL files too
+        get_trace_index(log_path).clear()
+        logs = service.list_logs()
+        assert [(log["trace_id"], log["status"]) for log in logs] == [("abcd1234-0001", "ERROR")]
+
+
 # =============================================================================
 # UNIT TESTS: TracingService
 # =============================================================================
@@ -1178,6 +1542,72 @@ class TestTracingMiddleware:
                 f"No trace files should be created when tracing is inactive. Found: {len(logs)}"
 
 
+class TestTracingConfigCache:
+    """Tests for the in-memory tracing config used by the middleware."""
+    
+    def _write_tools(self, root, config):
+        config_dir = root / "x-ipe-docs" / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        (config_dir / "tools.json").write_text(json.dumps(config))
+    
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        from x_ipe.tracing.middleware import get_tracing_config
+        
+        self._write_tools(tmp_path, {"tracing_enabled": True})
+        first = get_tracing_config(str(tmp_path))
+        with patch('x_ipe.tracing.middleware.json.load') as load:
+            second = get_tracing_config(str(tmp_path))
+        
+        load.assert_not_called()
+        assert second is first
+        assert second.is_active()
+    
+    def test_file_change_is_picked_up(self, tmp_path):
+        from x_ipe.tracing.middleware import get_tracing_config
+        
+        self._write_tools(tmp_path, {"tracing_enabled": True})
+        assert get_tracing_config(str(tmp_path)).is_active()
+        
+        self._write_tools(tmp_path, {"tracing_enabled": False, "tracing_log_path": "logs/"})
+        config = get_tracing_config(str(tmp_path))
+        assert not config.is_active()
+        assert config.log_dir(str(tmp_path)) == str(tmp_path / "logs/")
+    
+    def test_service_stop_invalidates_cache(self, tmp_path):
+        from x_ipe.tracing.middleware import get_tracing_config
+        from x_ipe.services.tracing_service import TracingService
+        
+        self._write_tools(tmp_path, {})
+        service = TracingService(str(tmp_path))
+        service.start(duration_minutes=3)
+        assert get_tracing_config(str(tmp_path)).is_active()
+        
+        service.stop()
+        assert not get_tracing_config(str(tmp_path)).is_active()
+    
+    def test_missing_file_is_inactive(self, tmp_path):
+        from x_ipe.tracing.middleware import get_tracing_config
+        
+        config = get_tracing_config(str(tmp_path))
+        assert not config.is_active()
+        assert config.log_dir(str(tmp_path)) == str(tmp_path / "instance/traces/")
+    
+    def test_ignored_api_patterns(self):
+        from x_ipe.tracing.middleware import TracingConfig
+        
+        config = TracingConfig(ignored_apis=["/api/exact", "/api/prefix/*"])
+        assert config.is_ignored("/api/exact")
+        assert not config.is_ignored("/api/exact/child")
+        assert config.is_ignored("/api/prefix/anything")
+        assert not config.is_ignored("/api/other")
+    
+    def test_expired_stop_at_is_inactive(self):
+        from x_ipe.tracing.middleware import TracingConfig
+        
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat().replace("+00:00", "Z")
+        assert not TracingConfig(stop_at=past).is_active()
+        assert not TracingConfig(stop_at="not-a-date").is_active()
+
 # =============================================================================
 # TEST SUMMARY
 # =============================================================================
@@ -19,6 +19,7 @@ import json
 import os
 import shutil
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import patch
@@ -292,6 +293,114 @@ class TestKbReferenceExpansion:
         assert kb_items[0]["exists"] is False
 
 
+class TestBatchedExistenceChecks:
+    """Deliverable existence is checked over cached per-directory listings."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_listings(self):
+        from x_ipe.services import workflow_manager_service as wms
+        wms._dir_listings.clear()
+        yield
+        wms._dir_listings.clear()
+
+    @staticmethod
+    def _age(path):
+        """Backdate a directory's mtime so its listing is cacheable."""
+        old = datetime.now().timestamp() - 60
+        os.utime(path, (old, old))
+
+    @staticmethod
+    @contextmanager
+    def _count_scandirs(project_root):
+        """Record directories under *project_root* listed with os.scandir.
+
+        os.scandir is patched module-wide, so calls from other threads
+        (e.g. trace writers left by earlier tests) are filtered out.
+        """
+        from x_ipe.services import workflow_manager_service as wms
+        real_scandir = os.scandir
+        root = os.fspath(project_root)
+        scanned = []
+
+        def scandir(path="."):
+            if os.fspath(path).startswith(root):
+                scanned.append(os.fspath(path))
+            return real_scandir(path)
+
+        with patch.object(wms.os, "scandir", scandir):
+            yield scanned
+
+    def test_one_scandir_per_directory(self, service, project_root):
+        docs = project_root / "docs"
+        docs.mkdir()
+        paths = [f"docs/f{i}.md" for i in range(20)]
+        for p in paths[:10]:
+            (project_root / p).write_text("x")
+        service.create_workflow("wf")
+        service.update_action_status("wf", "compose_idea", "done",
+                                     deliverables={"raw-ideas": paths, "ideas-folder": "docs"})
+
+        with self._count_scandirs(project_root) as scanned:
+            result = service.resolve_deliverables("wf")
+
+        assert len(scanned) == 2  # docs/ and the project root
+        raw = [d["exists"] for d in result["deliverables"] if d["name"] == "raw-ideas"]
+        assert raw == [True] * 10 + [False] * 10
+
+    def test_unchanged_directory_is_not_rescanned(self, service, project_root):
+        _create_workflow_with_deliverables(service, project_root)
+        self._age(project_root / "x-ipe-docs" / "ideas" / "test")
+        service.resolve_deliverables("test-wf")
+
+        with self._count_scandirs(project_root) as scanned:
+            result = service.resolve_deliverables("test-wf")
+
+        assert scanned == []
+        assert result["deliverables"][0]["exists"] is True
+
+    def test_removed_file_detected_after_directory_changes(self, service, project_root):
+        _create_workflow_with_deliverables(service, project_root)
+        idea_dir = project_root / "x-ipe-docs" / "ideas" / "test"
+        self._age(idea_dir)
+        assert service.resolve_deliverables("test-wf")["deliverables"][0]["exists"] is True
+
+        (idea_dir / "idea-summary-v1.md").unlink()
+
+        assert service.resolve_deliverables("test-wf")["deliverables"][0]["exists"] is False
+
+    def test_invalidate_forces_rescan(self, service, project_root):
+        from x_ipe.services.workflow_manager_service import invalidate_dir_listings
+        _create_workflow_with_deliverables(service, project_root)
+        idea_file = project_root / "x-ipe-docs" / "ideas" / "test" / "idea-summary-v1.md"
+        self._age(idea_file.parent)
+        service.resolve_deliverables("test-wf")
+
+        invalidate_dir_listings([str(idea_file)])
+        with self._count_scandirs(project_root) as scanned:
+            service.resolve_deliverables("test-wf")
+
+        assert scanned == [str(idea_file.parent)]
+
+    def test_many_directories_match_path_exists(self, service, project_root):
+        paths = []
+        for i in range(12):
+            folder = project_root / "features" / f"F{i}"
+            folder.mkdir(parents=True)
+            (folder / "spec.md").write_text("x")
+            paths += [f"features/F{i}/spec.md", f"features/F{i}/missing.md", f"features/F{i}"]
+        paths += ["features/../features/F0/spec.md", "nowhere/spec.md", "features/F1/"]
+        (project_root / "features" / "dangling.md").symlink_to(project_root / "gone.md")
+        paths.append("features/dangling.md")
+        service.create_workflow("wf")
+        service.update_action_status("wf", "compose_idea", "done",
+                                     deliverables={"raw-ideas": paths, "ideas-folder": "features"})
+
+        result = service.resolve_deliverables("wf")
+
+        raw = [d["exists"] for d in result["deliverables"] if d["name"] == "raw-ideas"]
+        assert raw == [(project_root / p).exists() for p in paths]
+
+
 # ─────────────────────────────────────────────
 # Backend: archive_stale_workflows()
 # ─────────────────────────────────────────────
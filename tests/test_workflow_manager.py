@@ -10,6 +10,7 @@ TDD: All tests written before implementation — all should FAIL initially.
 """
 
 import json
+import logging
 import os
 import tempfile
 import shutil
@@ -166,11 +167,9 @@ class TestWorkflowCRUD:
         assert not os.path.exists(filepath)
 
     def test_delete_workflow_removes_lock_file(self, workflow_service, sample_workflow, workflow_dir):
-        """AC: delete_workflow also removes the associated .lock file."""
+        """AC: delete_workflow also removes a .lock file left by older versions."""
         lock_path = os.path.join(workflow_dir, f"workflow-{sample_workflow}.lock")
-        # Trigger lock file creation via an update
-        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
-        assert os.path.exists(lock_path), ".lock file should exist after update"
+        open(lock_path, "w").close()
         workflow_service.delete_workflow(sample_workflow)
         assert not os.path.exists(lock_path), ".lock file should be cleaned up on delete"
 
@@ -555,6 +554,353 @@ class TestStatePersistence:
         assert result.get("success") is False or "error" in str(result).lower()
 
 
+class TestStateCache:
+    """Process-wide state cache and write-behind for action updates."""
+
+    @staticmethod
+    def _read_file(workflow_dir, name):
+        with open(os.path.join(workflow_dir, f"workflow-{name}.json")) as f:
+            return json.load(f)
+
+    def test_reads_are_served_from_cache(self, workflow_service, sample_workflow, monkeypatch):
+        workflow_service.get_workflow(sample_workflow)
+        monkeypatch.setattr(Path, "read_text", lambda *a, **k: pytest.fail("state file re-read"))
+        assert workflow_service.get_workflow(sample_workflow)["name"] == sample_workflow
+
+    def test_get_workflow_returns_private_copy(self, workflow_service, sample_workflow):
+        state = workflow_service.get_workflow(sample_workflow)
+        state["current_stage"] = "mutated"
+        assert workflow_service.get_workflow(sample_workflow)["current_stage"] == "ideation"
+
+    def test_update_burst_is_written_once(self, workflow_service, sample_workflow, workflow_dir, monkeypatch):
+        import x_ipe.services.workflow_manager_service as wms
+        wms._state_cache.flush()  # settle writes deferred by earlier tests
+        writes = []
+        original = wms._write_state_file
+        monkeypatch.setattr(wms, "_write_state_file", lambda path, state: (writes.append(path), original(path, state))[1])
+
+        for status in ("in_progress", "failed", "in_progress", "done"):
+            workflow_service.update_action_status(sample_workflow, "compose_idea", status)
+        assert writes == []
+        assert workflow_service.get_workflow(sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+        wms._state_cache.flush()
+        assert len(writes) == 1
+        assert self._read_file(workflow_dir, sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_deferred_write_is_flushed_automatically(self, workflow_service, sample_workflow, workflow_dir):
+        import time
+        from x_ipe.services.workflow_manager_service import WRITE_BEHIND_DELAY
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        time.sleep(WRITE_BEHIND_DELAY + 0.5)
+        assert self._read_file(workflow_dir, sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_shared_across_service_instances(self, temp_project_dir, workflow_service, sample_workflow):
+        from x_ipe.services.workflow_manager_service import WorkflowManagerService
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        other = WorkflowManagerService(temp_project_dir)
+        assert other.get_workflow(sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_external_edit_is_picked_up(self, workflow_service, sample_workflow, workflow_dir):
+        workflow_service.get_workflow(sample_workflow)
+        state = self._read_file(workflow_dir, sample_workflow)
+        state["idea_folder"] = "edited/outside"
+        with open(os.path.join(workflow_dir, f"workflow-{sample_workflow}.json"), "w") as f:
+            json.dump(state, f)
+        assert workflow_service.get_workflow(sample_workflow)["idea_folder"] == "edited/outside"
+
+    def test_delete_drops_pending_write(self, workflow_service, sample_workflow, workflow_dir):
+        import x_ipe.services.workflow_manager_service as wms
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        workflow_service.delete_workflow(sample_workflow)
+        wms._state_cache.flush()
+        assert not os.path.exists(os.path.join(workflow_dir, f"workflow-{sample_workflow}.json"))
+
+    def _edit_file(self, workflow_dir, name, **changes):
+        state = self._read_file(workflow_dir, name)
+        state.update(changes)
+        with open(os.path.join(workflow_dir, f"workflow-{name}.json"), "w") as f:
+            json.dump(state, f)
+
+    def test_pending_update_is_reapplied_over_external_edit(self, workflow_service, sample_workflow, workflow_dir):
+        import x_ipe.services.workflow_manager_service as wms
+        wms._state_cache.flush()
+        assert workflow_service.update_action_status(sample_workflow, "compose_idea", "done")["success"]
+        self._edit_file(workflow_dir, sample_workflow, idea_folder="edited/outside")
+        wms._state_cache.flush()
+
+        state = self._read_file(workflow_dir, sample_workflow)
+        assert state["idea_folder"] == "edited/outside"
+        assert state["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_read_after_external_edit_keeps_pending_update(self, workflow_service, sample_workflow, workflow_dir):
+        import x_ipe.services.workflow_manager_service as wms
+        wms._state_cache.flush()
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        self._edit_file(workflow_dir, sample_workflow, idea_folder="edited/outside")
+
+        state = workflow_service.get_workflow(sample_workflow)
+        assert state["idea_folder"] == "edited/outside"
+        assert state["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+        assert self._read_file(workflow_dir, sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_flush_waits_for_workflow_lock(self, workflow_service, sample_workflow, workflow_dir):
+        import fcntl
+        import threading
+        import x_ipe.services.workflow_manager_service as wms
+        wms._state_cache.flush()
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+
+        lock_fd = os.open(os.path.join(workflow_dir, f"workflow-{sample_workflow}.lock"), os.O_CREAT | os.O_RDWR)
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        flusher = threading.Thread(target=wms._state_cache.flush)
+        try:
+            flusher.start()
+            flusher.join(0.3)
+            assert flusher.is_alive()
+            assert self._read_file(workflow_dir, sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "pending"
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+        flusher.join(5)
+        assert self._read_file(workflow_dir, sample_workflow)["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+
+    def test_flush_drops_updates_of_removed_project_quietly(self, workflow_service, sample_workflow,
+                                                           workflow_dir, caplog):
+        import x_ipe.services.workflow_manager_service as wms
+        wms._state_cache.flush()
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        shutil.rmtree(workflow_dir)
+
+        with caplog.at_level(logging.WARNING, logger=wms.__name__):
+            wms._state_cache.flush()
+        assert caplog.records == []
+        assert not os.path.exists(workflow_dir)
+
+    def test_held_workflow_lock_does_not_block_other_workflows(self, workflow_service, sample_workflow, workflow_dir):
+        import fcntl
+        import threading
+        import x_ipe.services.workflow_manager_service as wms
+        workflow_service.create_workflow("other")
+        wms._state_cache.flush()
+
+        lock_fd = os.open(os.path.join(workflow_dir, f"workflow-{sample_workflow}.lock"), os.O_CREAT | os.O_RDWR)
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        blocked = threading.Thread(target=workflow_service.update_action_status,
+                                   args=(sample_workflow, "compose_idea", "done"))
+        try:
+            blocked.start()
+            blocked.join(0.3)
+            assert blocked.is_alive()
+            assert workflow_service.update_action_status("other", "compose_idea", "done")["success"]
+            wms._state_cache.flush()
+            assert self._read_file(workflow_dir, "other")["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+        blocked.join(5)
+        assert not blocked.is_alive()
+
+    def test_list_sees_pending_updates(self, workflow_service, workflow_with_features):
+        listed = {w["name"]: w for w in workflow_service.list_workflows()}
+        assert listed[workflow_with_features]["feature_count"] == 3
+
+    def test_template_and_config_are_cached(self, temp_project_dir):
+        import x_ipe.services.workflow_manager_service as wms
+        config_dir = Path(temp_project_dir) / "x-ipe-docs" / "config"
+        config_dir.mkdir(parents=True)
+        template_path = config_dir / "workflow-template.json"
+        template = {"stages": {"only": {"type": "shared", "actions": {"compose_idea": {}}}}}
+        template_path.write_text(json.dumps(template))
+
+        assert wms._init_config(temp_project_dir) is wms._init_config(temp_project_dir)
+        assert wms._init_config(temp_project_dir)[1] == ["only"]
+
+        template["stages"]["second"] = {"type": "shared", "actions": {}}
+        template_path.write_text(json.dumps(template))
+        assert wms._init_config(temp_project_dir)[1] == ["only", "second"]
+
+
+class TestOptimisticConcurrency:
+    """Action updates commit with a compare-and-swap on the state revision."""
+
+    def test_revision_increments_on_each_update(self, workflow_service, sample_workflow):
+        revision = workflow_service.get_workflow(sample_workflow)["revision"]
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "in_progress")
+        workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        assert workflow_service.get_workflow(sample_workflow)["revision"] == revision + 2
+
+    def test_update_that_loses_the_race_is_retried(self, workflow_service, sample_workflow, monkeypatch):
+        from x_ipe.services.workflow_manager_service import WorkflowManagerService
+        original = WorkflowManagerService._swap_state
+        raced = []
+
+        def swap_after_concurrent_update(self, name, state, base_revision, **kwargs):
+            if not raced:
+                raced.append(True)
+                self.update_settings(name, {"process_preference": {"interaction_mode": "dao-represent-human-to-interact"}})
+            return original(self, name, state, base_revision, **kwargs)
+
+        monkeypatch.setattr(WorkflowManagerService, "_swap_state", swap_after_concurrent_update)
+        result = workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+
+        assert result["success"] is True
+        state = workflow_service.get_workflow(sample_workflow)
+        assert state["shared"]["ideation"]["actions"]["compose_idea"]["status"] == "done"
+        assert state["global"]["process_preference"]["interaction_mode"] == "dao-represent-human-to-interact"
+
+    def test_gives_up_after_max_attempts(self, workflow_service, sample_workflow, monkeypatch):
+        from x_ipe.services.workflow_manager_service import WorkflowManagerService
+        monkeypatch.setattr(WorkflowManagerService, "_swap_state", lambda *a, **k: False)
+        result = workflow_service.update_action_status(sample_workflow, "compose_idea", "done")
+        assert result["success"] is False
+        assert result["error"] == "CONFLICT"
+
+    def test_concurrent_feature_updates_are_not_lost(self, workflow_service, sample_workflow):
+        import threading
+        import x_ipe.services.workflow_manager_service as wms
+        feature_ids = [f"FEATURE-{i:03d}-A" for i in range(8)]
+        for action in ("compose_idea", "refine_idea", "requirement_gathering", "feature_breakdown"):
+            workflow_service.update_action_status(sample_workflow, action, "done")
+        workflow_service.add_features(
+            sample_workflow, [{"id": fid, "name": fid, "depends_on": []} for fid in feature_ids])
+        start = threading.Barrier(len(feature_ids))
+
+        def update(fid):
+            start.wait()
+            for status in ("in_progress", "failed", "in_progress", "done"):
+                assert workflow_service.update_action_status(
+                    sample_workflow, "feature_refinement", status, feature_id=fid)["success"]
+
+        threads = [threading.Thread(target=update, args=(fid,)) for fid in feature_ids]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wms._state_cache.flush()
+
+        with open(workflow_service._get_workflow_path(sample_workflow)) as f:
+            features = {feat["feature_id"]: feat for feat in json.load(f)["features"]}
+        for fid in feature_ids:
+            assert features[fid]["implement"]["actions"]["feature_refinement"]["status"] == "done"
+
+
+class TestOutOfProcessWriter:
+    """Updates race with the app-interactor script writing the same file from another process."""
+
+    SCRIPT = Path(__file__).resolve().parent.parent / ".github" / "skills" / \
+        "x-ipe-tool-x-ipe-app-interactor" / "scripts" / "workflow_update_action.py"
+
+    @pytest.fixture
+    def project(self, temp_project_dir):
+        config_dir = Path(temp_project_dir) / "x-ipe-docs" / "config"
+        config_dir.mkdir(parents=True)
+        shutil.copy(Path(__file__).resolve().parent.parent / "x-ipe-docs" / "config" / "workflow-template.json",
+                    config_dir / "workflow-template.json")
+        return temp_project_dir
+
+    def _run_script(self, project, action, status):
+        import subprocess
+        import sys
+        return subprocess.Popen(
+            [sys.executable, str(self.SCRIPT), "--workflow", "wf", "--action", action, "--status", status],
+            cwd=project, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    @staticmethod
+    def _statuses(project):
+        with open(os.path.join(project, "x-ipe-docs", "engineering-workflow", "workflow-wf.json")) as f:
+            actions = json.load(f)["shared"]["ideation"]["actions"]
+        return actions["compose_idea"]["status"], actions["refine_idea"]["status"]
+
+    def test_external_write_before_flush_keeps_both_updates(self, project):
+        import x_ipe.services.workflow_manager_service as wms
+        service = wms.WorkflowManagerService(project)
+        service.create_workflow("wf")
+        wms._state_cache.flush()
+
+        assert service.update_action_status("wf", "compose_idea", "done")["success"]
+        script = self._run_script(project, "refine_idea", "done")
+        assert script.wait(30) == 0, script.stderr.read()
+        wms._state_cache.flush()
+
+        assert self._statuses(project) == ("done", "done")
+        state = service.get_workflow("wf")
+        assert state["shared"]["ideation"]["actions"]["refine_idea"]["status"] == "done"
+
+    def test_concurrent_external_writer_loses_no_updates(self, project):
+        import threading
+        import x_ipe.services.workflow_manager_service as wms
+        service = wms.WorkflowManagerService(project)
+        service.create_workflow("wf")
+        statuses = ("in_progress", "failed", "in_progress", "done")
+        scripts_done = threading.Event()
+
+        def external():
+            for status in statuses:
+                assert self._run_script(project, "refine_idea", status).wait(30) == 0
+            scripts_done.set()
+
+        writer = threading.Thread(target=external)
+        writer.start()
+        while not scripts_done.is_set():
+            for status in statuses:
+                assert service.update_action_status("wf", "compose_idea", status)["success"]
+                if status == "failed":
+                    wms._state_cache.flush()
+        writer.join()
+        wms._state_cache.flush()
+
+        assert self._statuses(project) == ("done", "done")
+
+
+class TestWorkflowSummaryIndex:
+    """list_workflows and archiving read the summary index, not full states."""
+
+    def test_list_parses_only_changed_files(self, workflow_service, workflow_dir, monkeypatch):
+        import x_ipe.services.workflow_manager_service as wms
+        workflow_service.create_workflow("wf-a")
+        workflow_service.create_workflow("wf-b")
+        workflow_service.list_workflows()
+
+        parsed = []
+        original = wms._SummaryIndex._parse
+        monkeypatch.setattr(wms._SummaryIndex, "_parse",
+                            staticmethod(lambda path, name: (parsed.append(name), original(path, name))[1]))
+        workflow_service.update_settings("wf-a", {"process_preference": {
+            "interaction_mode": "dao-represent-human-to-interact"}})
+        listed = {w["name"]: w for w in workflow_service.list_workflows()}
+        assert parsed == []
+        assert listed["wf-a"]["interaction_mode"] == "dao-represent-human-to-interact"
+
+        path = os.path.join(workflow_dir, "workflow-wf-b.json")
+        with open(path) as f:
+            state = json.load(f)
+        state["current_stage"] = "requirement"
+        with open(path, "w") as f:
+            json.dump(state, f)
+        listed = {w["name"]: w for w in workflow_service.list_workflows()}
+        assert parsed == ["workflow-wf-b.json"]
+        assert listed["wf-b"]["current_stage"] == "requirement"
+
+    def test_index_is_persisted(self, workflow_service, workflow_dir, monkeypatch):
+        import x_ipe.services.workflow_manager_service as wms
+        workflow_service.create_workflow("wf-a")
+        workflow_service.list_workflows()
+        assert os.path.exists(os.path.join(workflow_dir, wms.WORKFLOW_INDEX_FILE))
+
+        fresh = wms._SummaryIndex()
+        monkeypatch.setattr(wms._SummaryIndex, "_parse",
+                            staticmethod(lambda path, name: pytest.fail("workflow re-parsed")))
+        assert [w["name"] for w in fresh.summaries(workflow_dir)] == ["wf-a"]
+
+    def test_deleted_workflow_leaves_index(self, workflow_service):
+        workflow_service.create_workflow("wf-a")
+        workflow_service.create_workflow("wf-b")
+        workflow_service.list_workflows()
+        workflow_service.delete_workflow("wf-a")
+        assert [w["name"] for w in workflow_service.list_workflows()] == ["wf-b"]
+
+
 # ==============================================================================
 # Unit Tests: WorkflowManagerService — Next Action
 # ==============================================================================
@@ -635,6 +981,18 @@ class TestWorkflowAPI:
         })
         assert response.status_code == 200
 
+    def test_update_action_conflict_returns_409(self, client, monkeypatch):
+        """POST /api/workflow/{name}/action returns 409 when the update keeps losing the race."""
+        from x_ipe.services.workflow_manager_service import WorkflowManagerService
+        client.post("/api/workflow/create", json={"name": "conflict-test"})
+        monkeypatch.setattr(WorkflowManagerService, "_swap_state", lambda *a, **k: False)
+        response = client.post("/api/workflow/conflict-test/action", json={
+            "action": "compose_idea",
+            "status": "done"
+        })
+        assert response.status_code == 409
+        assert response.get_json()["error"] == "CONFLICT"
+
     def test_add_features_endpoint(self, client):
         """POST /api/workflow/{name}/features returns 200."""
         client.post("/api/workflow/create", json={"name": "feat-test"})